@@ -0,0 +1,213 @@
+"""script for comparing the JSON and MessagePack protocols on the CLI's requests.
+
+Responses to the requests the CLI sends are captured from the stand-in OBS
+at each collection size, plus a GetSourceScreenshot sized response with
+its base64 image. Each message is then encoded and decoded with both
+codecs, counting the UTF-8 validation websocket-client performs on text
+frames as part of receiving JSON. Round trips through the stand-in are
+also timed with each protocol. Results are written as JSON.
+"""
+
+# /// script
+# dependencies = [
+#   "obsws-cli[msgpack]",
+# ]
+#
+# [tool.uv.sources]
+# obsws-cli = { path = "../" }
+# ///
+
+import argparse
+import base64
+import json
+import os
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from run import AUDIO, SCENE, SIZES, seed, summarize
+from websocket._utils import validate_utf8
+
+from obsws_cli import client, codec
+from obsws_cli.__about__ import __version__
+from obsws_cli.fakeobs import FakeOBS
+
+# The requests behind the CLI's list and status commands.
+REQUESTS = [
+    ('GetVersion', None),
+    ('GetSceneList', None),
+    ('GetInputList', None),
+    ('GetInputKindList', None),
+    ('GetSceneItemList', {'sceneName': SCENE}),
+    ('GetSourceFilterList', {'sourceName': AUDIO}),
+    ('GetHotkeyList', None),
+    ('GetStats', None),
+]
+
+# A 1080p PNG screenshot is typically around a megabyte.
+SCREENSHOT_BYTES = 1024 * 1024
+
+
+def timed(fn: Callable[[], Any], repeat: int) -> list[float]:
+    """Time fn repeat times, returning the samples in ms."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def compare_codecs(name: str, message: dict, repeat: int) -> dict:
+    """Time encoding and receiving a message with each codec."""
+    result = {'message': name}
+    for c in (codec.get('json'), codec.get('msgpack')):
+        encoded = c.encode(message)
+        frame = encoded if c.binary else encoded.encode('utf-8')
+        if c.binary:
+            receive = lambda: c.decode(frame)  # noqa: E731
+        else:
+            # websocket-client validates text frames before they are decoded.
+            receive = lambda: validate_utf8(frame) and c.decode(frame.decode('utf-8'))  # noqa: E731
+        result[c.name] = {
+            'bytes': len(frame),
+            'encode_ms': summarize(timed(lambda: c.encode(message), repeat)),
+            'receive_ms': summarize(timed(receive, repeat)),
+        }
+    return result
+
+
+def capture(port: int) -> list[tuple[str, dict]]:
+    """Capture the response messages to the request mix."""
+    messages = []
+    with client.ReqClient(host='localhost', port=port, password='', timeout=30) as c:
+        for request_type, data in REQUESTS:
+            payload = {
+                'op': 6,
+                'd': {'requestType': request_type, 'requestId': request_type},
+            }
+            if data:
+                payload['d']['requestData'] = data
+            messages.append(
+                (request_type, {'op': 7, 'd': c._round_trip(request_type, 1, payload)})
+            )
+
+    image = base64.b64encode(os.urandom(SCREENSHOT_BYTES)).decode()
+    messages.append(
+        (
+            'GetSourceScreenshot',
+            {
+                'op': 7,
+                'd': {
+                    'requestType': 'GetSourceScreenshot',
+                    'requestId': 'GetSourceScreenshot',
+                    'requestStatus': {'result': True, 'code': 100},
+                    'responseData': {'imageData': f'data:image/png;base64,{image}'},
+                },
+            },
+        )
+    )
+    return messages
+
+
+def round_trips(port: int, repeat: int) -> list[dict]:
+    """Time each request end to end over each protocol."""
+    results = []
+    clients = {
+        name: client.ReqClient(
+            host='localhost', port=port, password='', timeout=30, protocol=name
+        )
+        for name in codec.PROTOCOLS
+    }
+    try:
+        for request_type, data in REQUESTS:
+            result = {'message': request_type}
+            for name, c in clients.items():
+                result[name] = {
+                    'round_trip_ms': summarize(
+                        timed(lambda: c.send(request_type, data, raw=True), repeat)
+                    )
+                }
+            results.append(result)
+    finally:
+        for c in clients.values():
+            c.disconnect()
+    return results
+
+
+def bench_size(size: int, repeat: int):
+    """Compare the protocols against a collection of the given size."""
+    with FakeOBS() as server:
+        seed(server.model, size)
+        codec_results = [
+            compare_codecs(name, message, repeat)
+            for name, message in capture(server.port)
+        ]
+        trip_results = round_trips(server.port, repeat)
+
+    for result in codec_results:
+        j, m = result['json'], result['msgpack']
+        print(
+            f'{size:>6} {result["message"]:<24} '
+            f'{j["bytes"]:>10} -> {m["bytes"]:>10} B  '
+            f'receive {j["receive_ms"]["median"]:>9.3f} -> '
+            f'{m["receive_ms"]["median"]:>9.3f} ms',
+            file=sys.stderr,
+        )
+    for result in trip_results:
+        print(
+            f'{size:>6} {result["message"]:<24} round trip '
+            f'{result["json"]["round_trip_ms"]["median"]:>9.3f} -> '
+            f'{result["msgpack"]["round_trip_ms"]["median"]:>9.3f} ms',
+            file=sys.stderr,
+        )
+    return {'size': size, 'codecs': codec_results, 'round_trips': trip_results}
+
+
+def main(sizes: list[int], repeat: int, output: str):
+    """Run the comparison and write the results."""
+    report = {
+        'obsws_cli_version': __version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'repeat': repeat,
+        'results': [bench_size(size, repeat) for size in sizes],
+    }
+    text = json.dumps(report, indent=2)
+    if output:
+        Path(output).write_text(text + '\n')
+    else:
+        print(text)
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description='Compare the JSON and MessagePack protocols on the CLI requests.'
+    )
+    parser.add_argument(
+        '--sizes',
+        type=int,
+        nargs='+',
+        default=list(SIZES),
+        help='Number of inputs and scene items in the benchmark collection',
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=5, help='Timed runs of each measurement'
+    )
+    parser.add_argument(
+        '--output',
+        type=str,
+        default='',
+        help='File to write the JSON results to, stdout by default',
+    )
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+
+    main(args.sizes, args.repeat, args.output)
@@ -0,0 +1,289 @@
+"""script for benchmarking command latency against the stand-in OBS.
+
+Each command is run against collections of increasing size, measuring the
+wall time of a fresh process, the time of an in-process invoke and the
+number of WebSocket round trips it makes. Results are written as JSON.
+"""
+
+# /// script
+# dependencies = [
+#   "obsws-cli",
+# ]
+#
+# [tool.uv.sources]
+# obsws-cli = { path = "../" }
+# ///
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from obsws_cli import app
+from obsws_cli.__about__ import __version__
+from obsws_cli.fakeobs import FakeOBS, Model
+from obsws_cli.fakeobs.model import Filter
+
+SIZES = (10, 100, 1_000, 10_000)
+
+SCENE = 'bench'
+GROUP = 'bench group'
+ITEM = 'bench input 0'
+AUDIO = 'bench audio'
+MEDIA = 'bench media'
+TEXT = 'bench text'
+FILTER = 'bench filter'
+
+SCREENSHOT = str(Path(tempfile.gettempdir()) / 'obsws-cli-bench.png')
+
+# Commands that change state are paired or toggled so every repeat runs
+# against the same state.
+COMMANDS = [
+    ['filter', 'list', AUDIO],
+    ['filter', 'status', AUDIO, FILTER],
+    ['filter', 'toggle', AUDIO, FILTER],
+    ['group', 'list', SCENE],
+    ['group', 'status', SCENE, GROUP],
+    ['group', 'toggle', SCENE, GROUP],
+    ['hotkey', 'list'],
+    ['input', 'list'],
+    ['input', 'list-kinds'],
+    ['input', 'mute', AUDIO],
+    ['input', 'unmute', AUDIO],
+    ['input', 'toggle', AUDIO],
+    ['input', 'volume', AUDIO, '--', '-6'],
+    ['input', 'show', AUDIO],
+    ['media', 'status', MEDIA],
+    ['profile', 'list'],
+    ['profile', 'current'],
+    ['projector', 'list-monitors'],
+    ['record', 'status'],
+    ['record', 'toggle'],
+    ['record', 'directory'],
+    ['replaybuffer', 'status'],
+    ['replaybuffer', 'toggle'],
+    ['scene', 'list'],
+    ['scene', 'current'],
+    ['scene', 'switch', SCENE],
+    ['scenecollection', 'list'],
+    ['scenecollection', 'current'],
+    ['sceneitem', 'list', SCENE],
+    ['sceneitem', 'hide', SCENE, ITEM],
+    ['sceneitem', 'show', SCENE, ITEM],
+    ['sceneitem', 'toggle', SCENE, ITEM],
+    ['sceneitem', 'visible', SCENE, ITEM],
+    ['sceneitem', 'transform', SCENE, ITEM, '--rotation=0'],
+    ['screenshot', 'save', SCENE, SCREENSHOT],
+    ['settings', 'show'],
+    ['settings', 'stream-service'],
+    ['settings', 'video'],
+    ['stream', 'status'],
+    ['stream', 'toggle'],
+    ['studiomode', 'status'],
+    ['studiomode', 'toggle'],
+    ['text', 'current', TEXT],
+    ['virtualcam', 'status'],
+    ['virtualcam', 'toggle'],
+]
+
+
+def seed(model: Model, size: int):
+    """Fill the model with a scene holding size inputs, plus one of each kind used."""
+    model.populate(SCENE, size)
+    with model.lock:
+        scene = model.find_scene(SCENE)
+        model.collection.program = scene
+        model.add_group(SCENE, GROUP)
+        audio, _ = model.add_input(scene, AUDIO, 'pulse_input_capture')
+        audio.filters.append(Filter(FILTER, 'gain_filter', {'db': 0.0}))
+        model.add_input(scene, MEDIA, 'ffmpeg_source')
+        model.add_input(scene, TEXT, 'text_ft2_source_v2', {'text': 'bench'})
+        model.profile.parameters[('SimpleOutput', 'RecRB')] = 'true'
+
+
+def measure_cold(argv: list[str], env: dict[str, str]) -> tuple[float, int]:
+    """Run a command in a fresh interpreter, returning its wall time in ms and exit code."""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, '-c', 'from obsws_cli import app; app()', *argv],
+        env=os.environ | env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return (time.perf_counter() - start) * 1000, proc.returncode
+
+
+def measure_in_process(
+    runner: CliRunner, argv: list[str], env: dict[str, str]
+) -> tuple[float, int]:
+    """Invoke a command in this process, returning its time in ms and exit code."""
+    start = time.perf_counter()
+    result = runner.invoke(app, argv, env=env)
+    return (time.perf_counter() - start) * 1000, result.exit_code
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Summarize timing samples in milliseconds."""
+    return {
+        'min': round(min(samples), 3),
+        'median': round(statistics.median(samples), 3),
+        'max': round(max(samples), 3),
+    }
+
+
+def bench_size(size: int, commands: list[list[str]], repeat: int, cold: bool):
+    """Benchmark every command against a collection of the given size."""
+    server = FakeOBS(password='bench').start()
+    try:
+        seed(server.model, size)
+        env = {
+            'OBSWS_CLI_HOST': 'localhost',
+            'OBSWS_CLI_PORT': str(server.port),
+            'OBSWS_CLI_PASSWORD': 'bench',
+            'OBSWS_CLI_STYLE': 'disabled',
+        }
+        runner = CliRunner()
+
+        for argv in commands:
+            # The first invoke warms imports and counts the round trips.
+            before = server.round_trips
+            _, exit_code = measure_in_process(runner, argv, env)
+            round_trips = server.round_trips - before
+
+            in_process = [
+                measure_in_process(runner, argv, env)[0] for _ in range(repeat)
+            ]
+            result = {
+                'command': ' '.join(argv),
+                'size': size,
+                'exit_code': exit_code,
+                'round_trips': round_trips,
+                'in_process_ms': summarize(in_process),
+            }
+            if cold:
+                result['cold_ms'] = summarize(
+                    [measure_cold(argv, env)[0] for _ in range(repeat)]
+                )
+
+            print(
+                f'{size:>6} {result["command"]:<48} '
+                f'{result["in_process_ms"]["median"]:>10.2f} ms '
+                f'{round_trips:>6} round trips',
+                file=sys.stderr,
+            )
+            yield result
+    finally:
+        server.stop()
+
+
+def compare(baseline: dict, results: list[dict]):
+    """Print the change in median in-process time against a previous run."""
+    previous = {
+        (r['command'], r['size']): r['in_process_ms']['median']
+        for r in baseline['results']
+    }
+    print('\nchange in median in-process time against the baseline:', file=sys.stderr)
+    for result in results:
+        before = previous.get((result['command'], result['size']))
+        if not before:
+            continue
+        after = result['in_process_ms']['median']
+        print(
+            f'{result["size"]:>6} {result["command"]:<48} '
+            f'{before:>10.2f} -> {after:>10.2f} ms ({(after - before) / before:+.0%})',
+            file=sys.stderr,
+        )
+
+
+def main(
+    sizes: list[int],
+    match: str,
+    repeat: int,
+    cold: bool,
+    output: str,
+    baseline: str,
+):
+    """Run the benchmarks and write the results."""
+    commands = [argv for argv in COMMANDS if match in ' '.join(argv)]
+    results = [
+        result for size in sizes for result in bench_size(size, commands, repeat, cold)
+    ]
+
+    report = {
+        'obsws_cli_version': __version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'repeat': repeat,
+        'results': results,
+    }
+    text = json.dumps(report, indent=2)
+    if output:
+        Path(output).write_text(text + '\n')
+    else:
+        print(text)
+
+    if baseline:
+        compare(json.loads(Path(baseline).read_text()), results)
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description='Benchmark CLI commands against the stand-in OBS.'
+    )
+    parser.add_argument(
+        '--sizes',
+        type=int,
+        nargs='+',
+        default=list(SIZES),
+        help='Number of inputs and scene items in the benchmark collection',
+    )
+    parser.add_argument(
+        '--match',
+        type=str,
+        default='',
+        help='Only run commands containing this text, e.g. "sceneitem hide"',
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=5, help='Timed runs of each command'
+    )
+    parser.add_argument(
+        '--no-cold',
+        action='store_true',
+        help='Skip the fresh process measurements',
+    )
+    parser.add_argument(
+        '--output',
+        type=str,
+        default='',
+        help='File to write the JSON results to, stdout by default',
+    )
+    parser.add_argument(
+        '--baseline',
+        type=str,
+        default='',
+        help='Results of a previous run to compare against',
+    )
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+
+    main(
+        args.sizes,
+        args.match,
+        args.repeat,
+        not args.no_cold,
+        args.output,
+        args.baseline,
+    )
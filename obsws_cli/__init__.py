@@ -2,6 +2,17 @@
 #
 # SPDX-License-Identifier: MIT
 
-from .app import app
-
 __all__ = ['app']
+
+
+def __getattr__(name):
+    # The Typer app is imported on first use, so the launcher can run
+    # commands through the daemon without importing it at all.
+    if name == 'app':
+        from . import profiling  # noqa: F401 first, so the import of everything else can be timed
+        from .app import app
+
+        # importing the submodule bound it here, shadow it as an eager import did
+        globals()['app'] = app
+        return app
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -2,6 +2,28 @@
 
 import typer
 
+# short names for the command groups, also listed in the command manifest
+ALIASES = {
+    'f': 'filter',
+    'g': 'group',
+    'hk': 'hotkey',
+    'i': 'input',
+    'm': 'media',
+    'prf': 'profile',
+    'prj': 'projector',
+    'rc': 'record',
+    'rb': 'replaybuffer',
+    'sc': 'scene',
+    'scc': 'scenecollection',
+    'si': 'sceneitem',
+    'ss': 'screenshot',
+    'set': 'settings',
+    'st': 'stream',
+    'sm': 'studiomode',
+    't': 'text',
+    'vc': 'virtualcam',
+}
+
 
 class RootTyperAliasGroup(typer.core.TyperGroup):
     """A custom group class to handle command name aliases for the root typer."""
@@ -11,43 +33,11 @@ class RootTyperAliasGroup(typer.core.TyperGroup):
         super().__init__(*args, **kwargs)
         self.no_args_is_help = True
 
+    def invoke(self, ctx):
+        """Invoke the group, keeping the subcommand's arguments for --hosts."""
+        ctx.meta['command_args'] = [*ctx._protected_args, *ctx.args]
+        return super().invoke(ctx)
+
     def get_command(self, ctx, cmd_name):
         """Get a command by name."""
-        match cmd_name:
-            case 'f':
-                cmd_name = 'filter'
-            case 'g':
-                cmd_name = 'group'
-            case 'hk':
-                cmd_name = 'hotkey'
-            case 'i':
-                cmd_name = 'input'
-            case 'm':
-                cmd_name = 'media'
-            case 'prf':
-                cmd_name = 'profile'
-            case 'prj':
-                cmd_name = 'projector'
-            case 'rc':
-                cmd_name = 'record'
-            case 'rb':
-                cmd_name = 'replaybuffer'
-            case 'sc':
-                cmd_name = 'scene'
-            case 'scc':
-                cmd_name = 'scenecollection'
-            case 'si':
-                cmd_name = 'sceneitem'
-            case 'ss':
-                cmd_name = 'screenshot'
-            case 'set':
-                cmd_name = 'settings'
-            case 'st':
-                cmd_name = 'stream'
-            case 'sm':
-                cmd_name = 'studiomode'
-            case 't':
-                cmd_name = 'text'
-            case 'vc':
-                cmd_name = 'virtualcam'
-        return super().get_command(ctx, cmd_name)
+        return super().get_command(ctx, ALIASES.get(cmd_name, cmd_name))
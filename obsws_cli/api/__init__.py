@@ -0,0 +1,36 @@
+"""package exposing the CLI's operations as a Python API.
+
+Each module mirrors a command group. Its functions take a connected
+request client, raise APIError subclasses instead of printing, and
+return plain values or dataclasses, for example:
+
+    import obsws_python as obsws
+    from obsws_cli import api
+
+    with obsws.ReqClient(host='localhost', port=4455, password='') as client:
+        state = api.sceneitem.toggle(client, 'Scene', 'Webcam')
+        print(state.enabled)
+"""
+
+__all__ = [
+    'APIError',
+    'AlreadyExistsError',
+    'NotFoundError',
+    'StateError',
+    'input',
+    'requests',
+    'scene',
+    'sceneitem',
+]
+
+
+def __getattr__(name):
+    # Nothing is imported with the package, so the launcher can import
+    # api.requests without obsws-python, or typing, which the rest import.
+    import importlib
+
+    if name in ('input', 'requests', 'scene', 'sceneitem'):
+        return importlib.import_module(f'.{name}', __name__)
+    if name in ('APIError', 'AlreadyExistsError', 'NotFoundError', 'StateError'):
+        return getattr(importlib.import_module('.errors', __name__), name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
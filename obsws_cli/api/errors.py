@@ -0,0 +1,35 @@
+"""module containing the exceptions raised by the API."""
+
+from typing import Any, Callable
+
+
+class APIError(Exception):
+    """Base class for errors raised by the API.
+
+    The message is a template naming the scenes, inputs and items it is
+    about, so callers can render those names as they like with format.
+    """
+
+    def __init__(self, template: str, **names: Any):
+        """Initialize the APIError with a message template and the names it refers to."""
+        self.template = template
+        self.names = names
+        super().__init__(template.format(**names))
+
+    def format(self, highlight: Callable[[Any], str]) -> str:
+        """Render the message, passing each name through highlight."""
+        return self.template.format(
+            **{key: highlight(value) for key, value in self.names.items()}
+        )
+
+
+class NotFoundError(APIError):
+    """Raised when a scene, input, group or scene item does not exist."""
+
+
+class AlreadyExistsError(APIError):
+    """Raised when creating something whose name is already in use."""
+
+
+class StateError(APIError):
+    """Raised when OBS is not in a state that allows the operation."""
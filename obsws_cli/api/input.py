@@ -0,0 +1,270 @@
+"""module containing operations on OBS inputs."""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Optional
+
+import obsws_python as obsws
+
+from .. import inventory, metadata
+from . import requests
+from .errors import AlreadyExistsError, NotFoundError
+
+# obs-websocket request status for an input that does not support audio
+INVALID_RESOURCE_STATE = 604
+
+# the settings inputs store their device in, depending on the platform
+DEVICE_PROPERTIES = ('device', 'device_id')
+
+
+@dataclass
+class Input:
+    """An input, with its mute state or None if it has no audio."""
+
+    name: str
+    kind: str
+    uuid: Optional[str]
+    muted: Optional[bool] = None
+
+
+@dataclass
+class MuteState:
+    """The mute state of an input."""
+
+    input_name: str
+    muted: bool
+
+
+@dataclass
+class InputDevice:
+    """The device an input captures from, and the devices it could use."""
+
+    input_name: str
+    kind: str
+    device: str
+    devices: list[str] = field(default_factory=list)
+
+
+def ensure_exists(client: obsws.ReqClient, input_name: str):
+    """Raise NotFoundError if an input does not exist."""
+    if snapshot := inventory.usable(client):
+        exists = snapshot.find_input(input_name) is not None
+    else:
+        resp = client.get_input_list()
+        exists = any(input_.get('inputName') == input_name for input_ in resp.inputs)
+    if not exists:
+        raise NotFoundError('Input {input} does not exist.', input=input_name)
+
+
+def ensure_not_exists(client: obsws.ReqClient, input_name: str):
+    """Raise AlreadyExistsError if an input already exists."""
+    if snapshot := inventory.usable(client):
+        exists = snapshot.find_input(input_name) is not None
+    else:
+        resp = client.get_input_list()
+        exists = any(input_.get('inputName') == input_name for input_ in resp.inputs)
+    if exists:
+        raise AlreadyExistsError('Input {input} already exists.', input=input_name)
+
+
+def ensure_kind(client: obsws.ReqClient, input_kind: str):
+    """Raise NotFoundError if an input kind is not available."""
+    if input_kind in metadata.input_kinds(client):
+        return
+    # a plugin installed since the kinds were cached may offer it
+    if input_kind not in metadata.input_kinds(client, refresh=True):
+        raise NotFoundError('Input kind {kind} not found.', kind=input_kind)
+
+
+def create(client: obsws.ReqClient, input_name: str, input_kind: str) -> Input:
+    """Create an input in the current program scene."""
+    ensure_not_exists(client, input_name)
+    ensure_kind(client, input_kind)
+    current_scene = client.get_current_program_scene().current_program_scene_name
+    resp = client.create_input(
+        inputName=input_name,
+        inputKind=input_kind,
+        sceneItemEnabled=True,
+        sceneName=current_scene,
+        inputSettings={},
+    )
+    # obs-websocket only returns the UUID from 5.3
+    return Input(input_name, input_kind, getattr(resp, 'input_uuid', None))
+
+
+def remove(client: obsws.ReqClient, input_name: str):
+    """Remove an input."""
+    ensure_exists(client, input_name)
+    client.remove_input(name=input_name)
+
+
+def _get_inputs_muted(
+    client: obsws.ReqClient, input_names: list[str]
+) -> list[bool | None]:
+    """Get the mute states of inputs in a single round trip.
+
+    None is returned for inputs that do not support audio.
+    """
+    if not input_names:
+        return []
+
+    requests = [('GetInputMute', {'inputName': name}) for name in input_names]
+    if hasattr(client, 'send_batch'):
+        results = client.send_batch(requests)
+    else:
+        # A plain obsws-python client asks for each in turn, through its
+        # base client so the unsupported inputs do not raise and get logged.
+        results = [client.base_client.req(*request) for request in requests]
+
+    muted = []
+    for input_name, result in zip(input_names, results):
+        status = result['requestStatus']
+        if status['result']:
+            muted.append(result['responseData']['inputMuted'])
+        elif status['code'] == INVALID_RESOURCE_STATE:
+            muted.append(None)
+        else:
+            raise obsws.error.OBSSDKRequestError(
+                'GetInputMute', status['code'], status.get('comment')
+            )
+    return muted
+
+
+def list_(
+    client: obsws.ReqClient, kinds: Optional[Iterable[str]] = None
+) -> list[Input]:
+    """List the inputs whose kind contains any of kinds, sorted by name.
+
+    Without kinds, every input of a kind OBS currently offers is listed.
+    The mute states are fetched with a request batch when the request
+    client supports send_batch, otherwise one request at a time.
+    """
+    resp = client.get_input_list()
+    if kinds is None:
+        kinds = metadata.input_kinds(client)
+    kinds = list(kinds)
+
+    inputs = sorted(
+        (
+            Input(
+                input_.get('inputName'),
+                input_.get('inputKind'),
+                input_.get('inputUuid'),
+            )
+            for input_ in resp.inputs
+            if any(kind in input_.get('inputKind') for kind in kinds)
+        ),
+        key=lambda input_: input_.name,
+    )
+    for input_, muted in zip(
+        inputs, _get_inputs_muted(client, [input_.name for input_ in inputs])
+    ):
+        input_.muted = muted
+    return inputs
+
+
+def list_kinds(client: obsws.ReqClient) -> list[str]:
+    """List the input kinds OBS offers, sorted."""
+    return sorted(metadata.input_kinds(client))
+
+
+def _set_mute(client: obsws.ReqClient, input_name: str, muted: bool) -> MuteState:
+    """Set the mute state of an input."""
+    ensure_exists(client, input_name)
+    client.send(*requests.set_input_mute(input_name, muted))
+    return MuteState(input_name, muted)
+
+
+def mute(client: obsws.ReqClient, input_name: str) -> MuteState:
+    """Mute an input."""
+    return _set_mute(client, input_name, True)
+
+
+def unmute(client: obsws.ReqClient, input_name: str) -> MuteState:
+    """Unmute an input."""
+    return _set_mute(client, input_name, False)
+
+
+def toggle(client: obsws.ReqClient, input_name: str) -> MuteState:
+    """Toggle the mute state of an input."""
+    ensure_exists(client, input_name)
+    resp = client.send(*requests.toggle_input_mute(input_name))
+    return MuteState(input_name, resp.input_muted)
+
+
+def volume(client: obsws.ReqClient, input_name: str, volume_db: float) -> float:
+    """Set the volume of an input in dB, returning the volume set."""
+    ensure_exists(client, input_name)
+    client.send(*requests.set_input_volume(input_name, volume_db))
+    return volume_db
+
+
+def _device_items(client: obsws.ReqClient, input_name: str, prop: str) -> list[dict]:
+    """Get the devices an input's device property offers, if it has the property."""
+    try:
+        return client.get_input_properties_list_property_items(
+            input_name=input_name, prop_name=prop
+        ).property_items
+    except obsws.error.OBSSDKRequestError:
+        return []
+
+
+def device(client: obsws.ReqClient, input_name: str) -> InputDevice:
+    """Get the device an input captures from, and the devices it could use."""
+    if snapshot := inventory.usable(client):
+        entry = snapshot.find_input(input_name)
+        if entry is None:
+            raise NotFoundError('Input {input} does not exist.', input=input_name)
+        input_kind = entry.kind
+    else:
+        resp = client.get_input_list()
+        for input_ in resp.inputs:
+            if input_.get('inputName') == input_name:
+                input_kind = input_.get('inputKind')
+                break
+        else:
+            raise NotFoundError('Input {input} does not exist.', input=input_name)
+
+    for prop in DEVICE_PROPERTIES:
+        try:
+            device_id = client.get_input_settings(name=input_name).input_settings.get(
+                prop
+            )
+            if device_id:
+                break
+        except obsws.error.OBSSDKRequestError:
+            continue
+    else:
+        device_id = '(N/A)'
+
+    items = _device_items(client, input_name, prop)
+    device_name = next(
+        (item.get('itemName') for item in items if item.get('itemValue') == device_id),
+        device_id,
+    )
+    return InputDevice(
+        input_name, input_kind, device_name, [item.get('itemName') for item in items]
+    )
+
+
+def set_device(client: obsws.ReqClient, input_name: str, device_name: str) -> str:
+    """Set the device an input captures from by its name, returning its ID."""
+    ensure_exists(client, input_name)
+    for prop in DEVICE_PROPERTIES:
+        device_id = next(
+            (
+                item.get('itemValue')
+                for item in _device_items(client, input_name, prop)
+                if item.get('itemName') == device_name
+            ),
+            None,
+        )
+        if device_id:
+            break
+    else:
+        raise NotFoundError(
+            'Failed to find device ID for device {device}.', device=device_name
+        )
+
+    client.set_input_settings(name=input_name, settings={prop: device_id}, overlay=True)
+    return device_id
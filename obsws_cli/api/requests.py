@@ -0,0 +1,35 @@
+"""module building the obs-websocket requests behind the api's operations.
+
+Each function returns a (requestType, requestData) pair. Only the
+standard library is used, so the launcher can build the same requests
+without importing obsws-python, and the OSC bridge can batch them.
+"""
+
+# the range of an input's volume, in dB
+MIN_VOLUME_DB = -90
+MAX_VOLUME_DB = 0
+
+Request = tuple[str, dict]
+
+
+def switch_scene(scene_name: str, preview: bool = False) -> Request:
+    """Switch the program scene, or the preview scene, to a scene."""
+    return (
+        'SetCurrentPreviewScene' if preview else 'SetCurrentProgramScene',
+        {'sceneName': scene_name},
+    )
+
+
+def set_input_mute(input_name: str, muted: bool) -> Request:
+    """Set the mute state of an input."""
+    return 'SetInputMute', {'inputName': input_name, 'inputMuted': muted}
+
+
+def toggle_input_mute(input_name: str) -> Request:
+    """Toggle the mute state of an input."""
+    return 'ToggleInputMute', {'inputName': input_name}
+
+
+def set_input_volume(input_name: str, volume_db: float) -> Request:
+    """Set the volume of an input in dB."""
+    return 'SetInputVolume', {'inputName': input_name, 'inputVolumeDb': volume_db}
@@ -0,0 +1,79 @@
+"""module containing operations on OBS scenes."""
+
+from dataclasses import dataclass
+
+import obsws_python as obsws
+
+from .. import inventory
+from . import requests
+from .errors import NotFoundError, StateError
+
+
+@dataclass
+class Scene:
+    """A scene, and whether it is the current program scene."""
+
+    name: str
+    uuid: str
+    active: bool
+
+
+@dataclass
+class CurrentScene:
+    """The current program scene, or preview scene in studio mode."""
+
+    scene_name: str
+    preview: bool
+
+
+def ensure_exists(client: obsws.ReqClient, scene_name: str):
+    """Raise NotFoundError if a scene does not exist."""
+    if snapshot := inventory.usable(client):
+        exists = snapshot.find_scene(scene_name) is not None
+    else:
+        resp = client.get_scene_list()
+        exists = any(scene.get('sceneName') == scene_name for scene in resp.scenes)
+    if not exists:
+        raise NotFoundError('Scene {scene} not found.', scene=scene_name)
+
+
+def ensure_studio_mode(client: obsws.ReqClient):
+    """Raise StateError if studio mode is disabled."""
+    if not client.get_studio_mode_enabled().studio_mode_enabled:
+        raise StateError(
+            'Studio mode is disabled. This action requires it to be enabled.'
+        )
+
+
+def list_(client: obsws.ReqClient) -> list[Scene]:
+    """List the scenes, in the order OBS shows them."""
+    resp = client.get_scene_list()
+    return [
+        Scene(
+            scene.get('sceneName'),
+            scene.get('sceneUuid'),
+            scene.get('sceneName') == resp.current_program_scene_name,
+        )
+        for scene in reversed(resp.scenes)
+    ]
+
+
+def current(client: obsws.ReqClient, preview: bool = False) -> CurrentScene:
+    """Get the current program scene, or the preview scene."""
+    if preview:
+        ensure_studio_mode(client)
+        resp = client.get_current_preview_scene()
+        return CurrentScene(resp.current_preview_scene_name, True)
+    resp = client.get_current_program_scene()
+    return CurrentScene(resp.current_program_scene_name, False)
+
+
+def switch(
+    client: obsws.ReqClient, scene_name: str, preview: bool = False
+) -> CurrentScene:
+    """Switch the program scene, or the preview scene, to a scene."""
+    ensure_exists(client, scene_name)
+    if preview:
+        ensure_studio_mode(client)
+    client.send(*requests.switch_scene(scene_name, preview))
+    return CurrentScene(scene_name, preview)
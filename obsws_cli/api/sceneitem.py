@@ -0,0 +1,216 @@
+"""module containing operations on items in OBS scenes."""
+
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import obsws_python as obsws
+
+from .errors import NotFoundError
+from .scene import ensure_exists
+
+
+@dataclass
+class SceneItem:
+    """An item in a scene, or in a group in the scene.
+
+    An item in a group is only enabled if the group is too.
+    """
+
+    scene_name: str
+    item_id: int
+    source_name: str
+    group_name: Optional[str]
+    enabled: bool
+    source_uuid: str
+
+
+@dataclass
+class ItemState:
+    """Whether an item in a scene, or in a group in the scene, is enabled."""
+
+    scene_name: str
+    item_name: str
+    group: Optional[str]
+    enabled: bool
+
+
+@dataclass
+class ItemTransform:
+    """The transform fields set on an item in a scene."""
+
+    scene_name: str
+    item_name: str
+    group: Optional[str]
+    transform: dict[str, Any]
+
+
+def _scene_items(client: obsws.ReqClient, scene_name: str) -> list[dict]:
+    """Get the items in a scene, raising NotFoundError if there is no such scene.
+
+    The scene is looked up first rather than catching the failed request,
+    which the request client would log as an error.
+    """
+    ensure_exists(client, scene_name)
+    return client.get_scene_item_list(scene_name).scene_items
+
+
+def list_(client: obsws.ReqClient, scene_name: Optional[str] = None) -> list[SceneItem]:
+    """List the items in a scene, the current program scene by default.
+
+    Groups are expanded into their items, which are all looked up at
+    once with gather when the request client supports it.
+    """
+    if scene_name is None:
+        scene_name = client.get_current_program_scene().scene_name
+
+    items = sorted(_scene_items(client, scene_name), key=lambda i: i['sceneItemId'])
+    groups = [item.get('sourceName') for item in items if item.get('isGroup')]
+    requests = [('GetGroupSceneItemList', {'sceneName': group}) for group in groups]
+    if hasattr(client, 'gather'):
+        responses = client.gather(requests)
+    else:
+        responses = [client.send(*request) for request in requests]
+    group_items = {group: resp.scene_items for group, resp in zip(groups, responses)}
+
+    listed = []
+    for item in items:
+        if not item.get('isGroup'):
+            listed.append(
+                SceneItem(
+                    scene_name,
+                    item.get('sceneItemId'),
+                    item.get('sourceName'),
+                    None,
+                    item.get('sceneItemEnabled'),
+                    item.get('sourceUuid', 'N/A'),
+                )
+            )
+            continue
+
+        group = item.get('sourceName')
+        for group_item in sorted(
+            group_items[group], key=lambda gi: gi.get('sceneItemId')
+        ):
+            listed.append(
+                SceneItem(
+                    scene_name,
+                    group_item.get('sceneItemId'),
+                    group_item.get('sourceName'),
+                    group,
+                    item.get('sceneItemEnabled') and group_item.get('sceneItemEnabled'),
+                    group_item.get('sourceUuid', 'N/A'),
+                )
+            )
+    return listed
+
+
+def resolve(
+    client: obsws.ReqClient,
+    scene_name: str,
+    item_name: str,
+    group: Optional[str] = None,
+) -> tuple[str, int, bool]:
+    """Find an item in a scene, or in a group in the scene.
+
+    Returns the scene name to address the item by, which is the group's
+    name for an item in a group, the item's ID and whether it is enabled.
+    """
+    items = _scene_items(client, scene_name)
+    if group is not None:
+        if not any(item.get('sourceName') == group for item in items):
+            raise NotFoundError(
+                'Group {group} not found in scene {scene}.',
+                group=group,
+                scene=scene_name,
+            )
+        items = client.get_group_scene_item_list(group).scene_items
+        scene_name = group
+
+    for item in items:
+        if item.get('sourceName') == item_name:
+            return scene_name, item.get('sceneItemId'), item.get('sceneItemEnabled')
+
+    if group is not None:
+        raise NotFoundError(
+            'Item {item} not found in group {group}.', item=item_name, group=group
+        )
+    raise NotFoundError(
+        'Item {item} not found in scene {scene}. Is the item in a group? '
+        'If so use the {option} option to specify the parent group.\n'
+        'Use {command} for a list of items in the scene.',
+        item=item_name,
+        scene=scene_name,
+        option='--group',
+        command='obsws-cli sceneitem ls',
+    )
+
+
+def _set_enabled(
+    client: obsws.ReqClient,
+    scene_name: str,
+    item_name: str,
+    group: Optional[str],
+    enabled: Optional[bool],
+) -> ItemState:
+    """Show or hide an item, or toggle it when enabled is None."""
+    target, item_id, current = resolve(client, scene_name, item_name, group)
+    if enabled is None:
+        enabled = not current
+    client.set_scene_item_enabled(scene_name=target, item_id=item_id, enabled=enabled)
+    return ItemState(scene_name, item_name, group, enabled)
+
+
+def show(
+    client: obsws.ReqClient,
+    scene_name: str,
+    item_name: str,
+    group: Optional[str] = None,
+) -> ItemState:
+    """Show an item in a scene."""
+    return _set_enabled(client, scene_name, item_name, group, True)
+
+
+def hide(
+    client: obsws.ReqClient,
+    scene_name: str,
+    item_name: str,
+    group: Optional[str] = None,
+) -> ItemState:
+    """Hide an item in a scene."""
+    return _set_enabled(client, scene_name, item_name, group, False)
+
+
+def toggle(
+    client: obsws.ReqClient,
+    scene_name: str,
+    item_name: str,
+    group: Optional[str] = None,
+) -> ItemState:
+    """Toggle an item in a scene."""
+    return _set_enabled(client, scene_name, item_name, group, None)
+
+
+def visible(
+    client: obsws.ReqClient,
+    scene_name: str,
+    item_name: str,
+    group: Optional[str] = None,
+) -> ItemState:
+    """Check whether an item in a scene is enabled."""
+    _, _, enabled = resolve(client, scene_name, item_name, group)
+    return ItemState(scene_name, item_name, group, enabled)
+
+
+def transform(
+    client: obsws.ReqClient,
+    scene_name: str,
+    item_name: str,
+    transform: dict[str, Any],
+    group: Optional[str] = None,
+) -> ItemTransform:
+    """Set fields of an item's transform, such as positionX or rotation."""
+    target, item_id, _ = resolve(client, scene_name, item_name, group)
+    client.set_scene_item_transform(
+        scene_name=target, item_id=item_id, transform=transform
+    )
+    return ItemTransform(scene_name, item_name, group, transform)
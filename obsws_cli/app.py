@@ -3,16 +3,32 @@
 import importlib
 import logging
 import pkgutil
-from typing import Annotated
+from pathlib import Path
+from typing import Annotated, Optional
 
-import obsws_python as obsws
 import typer
 
 from obsws_cli.__about__ import __version__ as version
 
-from . import commands, console, envconfig, styles
+# fanout, inventory, reconnect and rules are imported by the code that
+# uses them, as most commands need none of them
+from . import (
+    client,
+    codec,
+    commands,
+    console,
+    envconfig,
+    profiling,
+    styles,
+    tracing,
+    util,
+)
 from .alias import RootTyperAliasGroup
 
+# commands run without connecting to OBS, cache warm connecting for itself
+# so that cache clear works while OBS is not running
+OFFLINE_COMMANDS = ('cache', 'completion')
+
 app = typer.Typer(cls=RootTyperAliasGroup)
 for importer, modname, ispkg in pkgutil.iter_modules(
     commands.__path__, commands.__name__ + '.'
@@ -56,6 +72,33 @@ def validate_style(value: str):
     return value
 
 
+def validate_output(value: str):
+    """Validate and return the output format."""
+    if value not in console.OUTPUT_FORMATS:
+        raise typer.BadParameter(
+            f'Invalid output format: {value}. Available formats: {", ".join(console.OUTPUT_FORMATS)}'
+        )
+    return value
+
+
+def validate_protocol(value: str):
+    """Validate and return the protocol, checking its encoder is installed."""
+    try:
+        codec.get(value)
+    except codec.CodecError as e:
+        raise typer.BadParameter(str(e)) from None
+    return value
+
+
+def validate_trace_format(value: str):
+    """Validate and return the trace file format."""
+    if value not in tracing.FORMATS:
+        raise typer.BadParameter(
+            f'Invalid trace format: {value}. Available formats: {", ".join(tracing.FORMATS)}'
+        )
+    return value
+
+
 @app.callback()
 def main(
     ctx: typer.Context,
@@ -120,6 +163,98 @@ def main(
             show_default=False,
         ),
     ] = envconfig.get('style_no_border'),
+    protocol: Annotated[
+        str,
+        typer.Option(
+            '--protocol',
+            envvar='OBSWS_CLI_PROTOCOL',
+            help='Encode requests as json or msgpack (MessagePack)',
+            show_default='json',
+            callback=validate_protocol,
+        ),
+    ] = envconfig.get('protocol'),
+    output: Annotated[
+        str,
+        typer.Option(
+            '--output',
+            '-o',
+            envvar='OBSWS_CLI_OUTPUT',
+            help='Output format for list and status commands: table, json, ndjson or tsv',
+            show_default='table',
+            callback=validate_output,
+        ),
+    ] = envconfig.get('output'),
+    stats: Annotated[
+        bool,
+        typer.Option(
+            '--stats',
+            envvar='OBSWS_CLI_STATS',
+            help='Print the requests sent to OBS, with their sizes and latencies, to stderr',
+            show_default=False,
+        ),
+    ] = envconfig.get('stats'),
+    hosts: Annotated[
+        Optional[str],
+        typer.Option(
+            '--hosts',
+            envvar='OBSWS_CLI_HOSTS',
+            help='Run the command against these comma separated targets from the hosts inventory',
+            show_default=False,
+        ),
+    ] = None,
+    all_hosts: Annotated[
+        bool,
+        typer.Option(
+            '--all-hosts',
+            help='Run the command against every target in the hosts inventory',
+            show_default=False,
+        ),
+    ] = False,
+    trace: Annotated[
+        str,
+        typer.Option(
+            '--trace',
+            envvar='OBSWS_CLI_TRACE',
+            help='Append a span for every request sent to OBS to this file',
+            show_default=False,
+        ),
+    ] = envconfig.get('trace'),
+    trace_format: Annotated[
+        str,
+        typer.Option(
+            '--trace-format',
+            envvar='OBSWS_CLI_TRACE_FORMAT',
+            help='Trace file format: ndjson or otlp (OTLP-JSON)',
+            show_default='ndjson',
+            callback=validate_trace_format,
+        ),
+    ] = envconfig.get('trace_format'),
+    trace_max_bytes: Annotated[
+        int,
+        typer.Option(
+            '--trace-max-bytes',
+            envvar='OBSWS_CLI_TRACE_MAX_BYTES',
+            help='Rotate the trace file once it grows past this size, 0 to never rotate',
+            show_default=tracing.MAX_BYTES,
+        ),
+    ] = envconfig.get('trace_max_bytes'),
+    profile: Annotated[
+        bool,
+        typer.Option(
+            '--profile',
+            help='Print a breakdown of where the command spent its time to stderr',
+            show_default=False,
+        ),
+    ] = False,
+    profile_output: Annotated[
+        Optional[Path],
+        typer.Option(
+            '--profile-output',
+            dir_okay=False,
+            help='With --profile, also write a Chrome trace (.json) or cProfile stats file',
+            show_default=False,
+        ),
+    ] = None,
     version: Annotated[
         bool,
         typer.Option(
@@ -146,10 +281,96 @@ def main(
 ):
     """obsws_cli is a command line interface for the OBS WebSocket API."""
     ctx.ensure_object(dict)
-    ctx.obj['obsws'] = ctx.with_resource(
-        obsws.ReqClient(host=host, port=port, password=password, timeout=timeout)
-    )
+    if 'obsws' in ctx.obj:
+        # Commands invoked in-process (by the rules engine) share the caller's session.
+        return
+
+    if profile or profile_output:
+        profiling.enable(profile_output)
+        # Registered first so it runs last, once the connection is closed.
+        ctx.call_on_close(lambda: print_profile(ctx.obj.get('obsws')))
+
+    if trace:
+        tracing.start(Path(trace), trace_format, trace_max_bytes)
+        ctx.call_on_close(tracing.stop)
+
+    if hosts or all_hosts:
+        from . import fanout
+
+        try:
+            targets = fanout.resolve(hosts, all_hosts, port, password)
+        except fanout.FanoutError as e:
+            raise typer.BadParameter(str(e)) from None
+        ctx.obj['style'] = styles.request_style_obj(style, no_border)
+        console.out.plain = style == 'disabled'
+        ctx.obj['output'] = output
+        ctx.obj['protocol'] = protocol
+        sync = fanout.Sync(len(targets))
+        results = fanout.run(ctx, targets, ctx.meta['command_args'], timeout, sync)
+        raise typer.Exit(fanout.report(ctx, results, sync))
+
+    ctx.obj['connection'] = {
+        'host': host,
+        'port': port,
+        'password': password,
+        'timeout': timeout,
+    }
+    ctx.obj['protocol'] = protocol
     ctx.obj['style'] = styles.request_style_obj(style, no_border)
+    console.out.plain = style == 'disabled'
+    ctx.obj['output'] = output
+    if ctx.invoked_subcommand in OFFLINE_COMMANDS:
+        return
+
+    with profiling.span('connect'):
+        ctx.obj['obsws'] = ctx.with_resource(
+            client.ReqClient(**ctx.obj['connection'], protocol=protocol)
+        )
+    # the daemon's snapshot is only mapped once a command looks a name up
+    ctx.obj['obsws'].inventory_source = (host, port)
+    if stats:
+        ctx.call_on_close(lambda: print_stats(ctx.obj['obsws'].records))
+    if profiling.recording:
+        ctx.call_on_close(profiling.begin('command'))
+
+
+def print_stats(records: list[client.RequestRecord]):
+    """Print the round trips a command made, totalled by request type, to stderr."""
+    totals = client.summarize(records)
+    width = max([len('Request'), *(len(t['requestType']) for t in totals)])
+    console.info.print(
+        f'{"Request":<{width}}  {"Round Trips":>11}  {"Requests":>8}  '
+        f'{"Sent":>10}  {"Received":>10}  {"Total ms":>9}  {"Max ms":>9}'
+    )
+    for total in totals:
+        console.info.print(
+            f'{total["requestType"]:<{width}}  {total["roundTrips"]:>11}  '
+            f'{total["requests"]:>8}  '
+            f'{util.format_bytes(total["sentBytes"]):>10}  '
+            f'{util.format_bytes(total["receivedBytes"]):>10}  '
+            f'{total["latency"] * 1000:>9.2f}  {total["maxLatency"] * 1000:>9.2f}'
+        )
+    console.info.print(
+        f'{sum(t["requests"] for t in totals)} requests in {len(records)} round trips, '
+        f'{util.format_bytes(sum(r.sent_bytes for r in records))} sent, '
+        f'{util.format_bytes(sum(r.received_bytes for r in records))} received, '
+        f'{sum(r.latency for r in records) * 1000:.2f} ms waiting on OBS.'
+    )
+
+
+def print_profile(obsws_client: Optional[client.ReqClient]):
+    """Print the time spent in each phase of the command to stderr."""
+    spans = profiling.finish(obsws_client.records if obsws_client else [])
+    if not spans:
+        return
+
+    rows = profiling.breakdown(spans)
+    width = max(len(label) + 2 * depth for label, depth, _ in rows)
+    console.info.print(f'{"Phase":<{width}}  {"ms":>9}')
+    for label, depth, duration in rows:
+        console.info.print(f'{"  " * depth + label:<{width}}  {duration * 1000:>9.2f}')
+    total = spans[-1].end - spans[0].start
+    console.info.print(f'{"total":<{width}}  {total * 1000:>9.2f}')
 
 
 @app.command()
@@ -160,3 +381,80 @@ def obs_version(ctx: typer.Context):
         f'OBS Client version: {console.highlight(ctx, resp.obs_version)}'
         f' with WebSocket version: {console.highlight(ctx, resp.obs_web_socket_version)}'
     )
+
+
+@app.command('rules')
+def rules_(
+    ctx: typer.Context,
+    rules_file: Annotated[
+        Path,
+        typer.Argument(
+            exists=True,
+            dir_okay=False,
+            show_default=False,
+            help='Path to a YAML or JSON rules file',
+        ),
+    ],
+    reconnect_: Annotated[
+        bool,
+        typer.Option(
+            '--reconnect/--no-reconnect',
+            help='Reconnect with backoff when the connection to OBS is lost',
+        ),
+    ] = True,
+    reconnect_attempts: Annotated[
+        int,
+        typer.Option(
+            min=0,
+            help='Give up after this many failed reconnect attempts, 0 to keep trying',
+        ),
+    ] = 0,
+):
+    """Run commands in-process in reaction to OBS events."""
+    from . import reconnect, rules
+
+    try:
+        loaded = rules.load(rules_file)
+    except rules.RulesError as e:
+        console.err.print(f'Failed to load [yellow]{rules_file}[/yellow]: {e}')
+        raise typer.Exit(1)
+
+    session = reconnect.Session(
+        ctx.obj['connection'],
+        rules.subscriptions(loaded),
+        ctx.obj['protocol'],
+        req_client=ctx.obj['obsws'],
+        max_attempts=reconnect_attempts,
+    )
+    ctx.call_on_close(session.close)
+    engine = rules.Engine(ctx, loaded)
+    session.register(engine.handlers())
+    session.connect()
+    console.out.print(
+        f'Loaded {console.highlight(ctx, len(loaded))} rules from '
+        f'{console.highlight(ctx, rules_file)}. Press Ctrl+C to stop.'
+    )
+    try:
+        while True:
+            engine.run(session)
+            if not reconnect_:
+                break
+            console.err.print('Lost the connection to OBS, reconnecting.')
+            try:
+                session.reconnect()
+            except reconnect.ReconnectError as e:
+                console.err.print(str(e))
+                raise typer.Exit(1)
+            ctx.obj['obsws'] = session.req_client
+            console.info.print(
+                f'Reconnected to OBS, {session.reconnects} reconnects with '
+                f'{session.downtime:.2f}s of downtime so far.'
+            )
+    except KeyboardInterrupt:
+        return
+
+    console.err.print('Lost the event connection to OBS.')
+    raise typer.Exit(1)
+
+
+profiling.imported()
@@ -0,0 +1,14 @@
+"""module locating the directory obsws-cli caches data in.
+
+It imports nothing of obsws-cli's own, so the api, through the metadata
+cache, and shell completion can both use it without importing the CLI.
+"""
+
+import os
+from pathlib import Path
+
+
+def cache_dir() -> Path:
+    """Get the directory obsws-cli caches data in."""
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'obsws-cli'
@@ -0,0 +1,357 @@
+"""module extending the obsws-python request client."""
+
+import logging
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from random import randint
+from typing import Any, Optional, Union
+
+import obsws_python as obsws
+import websocket
+from obsws_python import baseclient
+from obsws_python.util import as_dataclass
+from websocket import WebSocketTimeoutException
+
+from . import codec, framing, tracing
+from .codec import JSON, Codec
+
+logger = logging.getLogger(__name__)
+
+# RequestBatchExecutionType values
+SERIAL_REALTIME = 0
+SERIAL_FRAME = 1
+PARALLEL = 2
+
+# Called with the request type, request ID, number of requests, send time in ns,
+# perf_counter start, latency, bytes sent and received and the response data,
+# which is None on a timeout.
+ResponseHook = Callable[
+    [str, str, int, int, float, float, int, int, Optional[dict]], None
+]
+
+
+@dataclass
+class RequestRecord:
+    """A single round trip to OBS."""
+
+    request_type: str
+    requests: int
+    sent_bytes: int
+    received_bytes: int
+    latency: float
+    start: float
+
+
+_recorders: list[list[list[RequestRecord]]] = []
+
+
+@contextmanager
+def record_requests() -> Iterator[list[list[RequestRecord]]]:
+    """Collect the round trips of every ReqClient created in the block.
+
+    The yielded list holds one list of records per client, so each CLI
+    invocation in the block can be checked on its own.
+    """
+    clients: list[list[RequestRecord]] = []
+    _recorders.append(clients)
+    try:
+        yield clients
+    finally:
+        _recorders.remove(clients)
+
+
+class ObsClient(baseclient.ObsClient):
+    """obsws-python's connection, encoding messages in the negotiated subprotocol."""
+
+    def __init__(self, codec: Codec = JSON, **kwargs):
+        """Initialize the ObsClient, connecting and reading the server's Hello."""
+        self.codec = codec
+        if codec is JSON:
+            super().__init__(**kwargs)
+            return
+
+        # obsws-python connects without a subprotocol, so OBS would speak JSON.
+        self.logger = logger.getChild(type(self).__name__)
+        kwargs = {
+            'host': 'localhost',
+            'port': 4455,
+            'password': '',
+            'subs': 0,
+            'timeout': None,
+        } | kwargs
+        for attr, val in kwargs.items():
+            setattr(self, attr, val)
+
+        try:
+            self.ws = websocket.WebSocket()
+            self.ws.connect(
+                f'ws://{self.host}:{self.port}',
+                timeout=self.timeout,
+                subprotocols=[codec.subprotocol],
+            )
+            self.server_hello = codec.decode(self.ws.recv())
+        except ValueError as e:
+            self.logger.error(f'{type(e).__name__}: {e}')
+            raise
+        except (ConnectionRefusedError, TimeoutError, WebSocketTimeoutException) as e:
+            self.logger.exception(f'{type(e).__name__}: {e}')
+            raise
+
+    def send_message(self, message: Union[str, bytes]):
+        """Send an encoded message in a text or binary frame to suit the codec."""
+        if self.codec.binary:
+            self.ws.send_binary(message)
+        else:
+            self.ws.send(message)
+
+    def authenticate(self) -> dict[str, Any]:
+        """Identify with the server, answering its authentication challenge."""
+        payload = framing.identify_payload(self.server_hello, self.password, self.subs)
+        self.send_message(self.codec.encode(payload))
+        try:
+            response = self.codec.decode(self.ws.recv())
+        except ValueError:
+            raise obsws.error.OBSSDKError(
+                'failed to identify client with the server, please check connection settings'
+            ) from None
+        if response['op'] != 2:
+            raise obsws.error.OBSSDKError(
+                'failed to identify client with the server, expected response with OpCode 2'
+            )
+        return response['d']
+
+
+class ReqClient(obsws.ReqClient):
+    """A request client that records its round trips and supports request batches.
+
+    Pass protocol='msgpack' to encode messages with MessagePack rather than JSON.
+    Attach a fresh inventory.Snapshot as inventory to look names up in it
+    rather than asking OBS, or set inventory_source to the (host, port)
+    a daemon publishes one for to map it on first use.
+    """
+
+    inventory = None
+    inventory_source = None
+
+    def __init__(self, protocol: str = 'json', **kwargs):
+        """Initialize the ReqClient, connecting and identifying with OBS."""
+        # obsws-python's constructor always builds its own ObsClient, so it
+        # cannot be reused to connect with this module's.
+        self.logger = logger.getChild(type(self).__name__)
+        self.base_client = ObsClient(codec.get(protocol), **kwargs)
+        try:
+            success = self.base_client.authenticate()
+            self.logger.info(
+                f'Successfully identified {self} with the server using RPC version:{success["negotiatedRpcVersion"]}'
+            )
+        except obsws.error.OBSSDKError as e:
+            self.logger.error(f'{type(e).__name__}: {e}')
+            raise
+        self.records: list[RequestRecord] = []
+        for clients in _recorders:
+            clients.append(self.records)
+
+    def _record(
+        self,
+        request_type: str,
+        request_id: str,
+        requests: int,
+        send_time: int,
+        start: float,
+        latency: float,
+        sent_bytes: int,
+        received_bytes: int,
+        data: Optional[dict[str, Any]],
+    ):
+        """Record a round trip, and trace it when tracing. data is None on a timeout."""
+        if data is not None:
+            self.records.append(
+                RequestRecord(
+                    request_type,
+                    requests,
+                    sent_bytes,
+                    received_bytes,
+                    latency,
+                    start,
+                )
+            )
+        if tracing.tracer:
+            tracing.tracer.record(
+                request_type,
+                request_id,
+                requests,
+                send_time,
+                latency,
+                sent_bytes,
+                received_bytes,
+                data,
+            )
+
+    def _round_trip(
+        self, request_type: str, requests: int, payload: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Send a message and wait for its response, recording the round trip."""
+        message = self.base_client.codec.encode(payload)
+        send_time = time.time_ns() if tracing.tracer else 0
+        start = time.perf_counter()
+        try:
+            self.base_client.send_message(message)
+            response = self.base_client.ws.recv()
+        except WebSocketTimeoutException as e:
+            self._record(
+                request_type,
+                payload['d']['requestId'],
+                requests,
+                send_time,
+                start,
+                time.perf_counter() - start,
+                len(message),
+                0,
+                None,
+            )
+            raise obsws.error.OBSSDKTimeoutError(
+                f'Timeout while waiting for a response to {request_type}'
+            ) from e
+        latency = time.perf_counter() - start
+        data = self.base_client.codec.decode(response)['d']
+        self._record(
+            request_type,
+            payload['d']['requestId'],
+            requests,
+            send_time,
+            start,
+            latency,
+            len(message),
+            len(response),
+            data,
+        )
+        return data
+
+    def _response_data(self, response: dict[str, Any], raw: bool):
+        """Get the data of a raw response, raising OBSSDKRequestError if it failed."""
+        if not response['requestStatus']['result']:
+            e = obsws.error.OBSSDKRequestError(
+                response['requestType'],
+                response['requestStatus']['code'],
+                response['requestStatus'].get('comment'),
+            )
+            self.logger.exception(f'{type(e).__name__}: {e}')
+            raise e
+        if 'responseData' in response:
+            if raw:
+                return response['responseData']
+            return as_dataclass(response['requestType'], response['responseData'])
+
+    def send(self, param: str, data: Optional[dict] = None, raw: bool = False):
+        """Send a single request, as obsws-python does, recording the round trip."""
+        payload = {
+            'op': 6,
+            'd': {'requestType': param, 'requestId': str(randint(1, 1000))},
+        }
+        if data:
+            payload['d']['requestData'] = data
+        logger.debug('Sending request %s', payload)
+        response = self._round_trip(param, 1, payload)
+        logger.debug('Response received %s', response)
+        return self._response_data(response, raw)
+
+    def gather(self, requests: list[tuple[str, Optional[dict]]], raw: bool = False):
+        """Send several independent requests at once, returning their responses in order.
+
+        The requests are sent as a single request batch for OBS to run in
+        parallel, so the whole set takes one round trip. Each response is
+        returned as send would return it, and as with send the first
+        failed request, in order, raises OBSSDKRequestError.
+
+        Args:
+        ----
+            requests (list): (requestType, requestData) pairs
+            raw (bool): Return the response data as dicts rather than dataclasses
+
+        Returns:
+        -------
+            list: The response to each request, in the order they were given
+
+        """
+        if not requests:
+            return []
+        results = self.send_batch(requests, execution_type=PARALLEL)
+        # OBS may finish parallel requests, and list their results, in any order.
+        results.sort(key=lambda result: int(result['requestId']))
+        return [self._response_data(result, raw) for result in results]
+
+    def send_batch(
+        self,
+        requests: list[tuple[str, Optional[dict]]],
+        halt_on_failure: bool = False,
+        execution_type: int = SERIAL_REALTIME,
+    ) -> list[dict[str, Any]]:
+        """Send several requests in a single round trip.
+
+        Args:
+        ----
+            requests (list): (requestType, requestData) pairs
+            halt_on_failure (bool): Stop processing the batch on the first failure
+            execution_type (int): One of SERIAL_REALTIME, SERIAL_FRAME or PARALLEL
+
+        Returns:
+        -------
+            list: The raw request results, in the order they were sent.
+            Failed requests are returned rather than raised, check their requestStatus.
+
+        """
+        payload = {
+            'op': 8,
+            'd': {
+                'requestId': str(randint(1, 1000)),
+                'haltOnFailure': halt_on_failure,
+                'executionType': execution_type,
+                'requests': [
+                    {'requestType': req_type, 'requestId': str(i)}
+                    | ({'requestData': req_data} if req_data else {})
+                    for i, (req_type, req_data) in enumerate(requests)
+                ],
+            },
+        }
+        logger.debug('Sending request batch %s', payload)
+        response = self._round_trip('RequestBatch', len(requests), payload)
+        logger.debug('Batch response received %s', response)
+        return response['results']
+
+
+def summarize(records: list[RequestRecord]) -> list[dict[str, Any]]:
+    """Total the round trips by request type, in the order each type was first sent.
+
+    Args:
+    ----
+        records (list): The round trips made by a client
+
+    Returns:
+    -------
+        list: One dict per request type with its round trips, requests,
+        bytes sent and received, and total and slowest latency in seconds
+
+    """
+    totals: dict[str, dict[str, Any]] = {}
+    for record in records:
+        total = totals.setdefault(
+            record.request_type,
+            {
+                'requestType': record.request_type,
+                'roundTrips': 0,
+                'requests': 0,
+                'sentBytes': 0,
+                'receivedBytes': 0,
+                'latency': 0.0,
+                'maxLatency': 0.0,
+            },
+        )
+        total['roundTrips'] += 1
+        total['requests'] += record.requests
+        total['sentBytes'] += record.sent_bytes
+        total['receivedBytes'] += record.received_bytes
+        total['latency'] += record.latency
+        total['maxLatency'] = max(total['maxLatency'], record.latency)
+    return list(totals.values())
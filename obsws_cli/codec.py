@@ -0,0 +1,74 @@
+"""module for encoding obs-websocket messages in the negotiated subprotocol.
+
+obs-websocket v5 speaks JSON in text frames, or MessagePack in binary
+frames when the client asks for the obswebsocket.msgpack subprotocol.
+MessagePack is optional, it needs the msgpack package installed.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Any, Callable
+
+PROTOCOLS = ('json', 'msgpack')
+
+
+class CodecError(Exception):
+    """Raised when a protocol is unknown or its encoder is not installed."""
+
+
+@dataclass(frozen=True)
+class Codec:
+    """How messages are encoded for a subprotocol."""
+
+    name: str
+    subprotocol: str
+    binary: bool
+    encode: Callable[[Any], Any]
+    decode: Callable[[Any], Any]
+
+
+JSON = Codec('json', 'obswebsocket.json', False, json.dumps, json.loads)
+
+
+def get(name: str) -> Codec:
+    """Get the codec for a protocol.
+
+    Args:
+    ----
+        name (str): One of PROTOCOLS
+
+    Returns:
+    -------
+        Codec: The codec
+
+    Raises:
+    ------
+        CodecError: If the protocol is unknown or msgpack is not installed
+
+    """
+    match name:
+        case 'json':
+            return JSON
+        case 'msgpack':
+            try:
+                import msgpack
+            except ImportError:
+                raise CodecError(
+                    'The msgpack protocol requires msgpack, install it with '
+                    "'pip install obsws-cli[msgpack]'"
+                ) from None
+            return Codec(
+                'msgpack', 'obswebsocket.msgpack', True, msgpack.packb, msgpack.unpackb
+            )
+    raise CodecError(f'Unknown protocol: {name}. Available: {", ".join(PROTOCOLS)}')
+
+
+def available() -> list[Codec]:
+    """Get the codecs that can be used here, JSON first."""
+    codecs = []
+    for name in PROTOCOLS:
+        try:
+            codecs.append(get(name))
+        except CodecError:
+            pass
+    return codecs
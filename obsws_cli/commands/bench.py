@@ -0,0 +1,183 @@
+"""module containing commands for benchmarking OBS."""
+
+import json
+from typing import Annotated, Optional
+
+import obsws_python as obsws
+import typer
+
+from obsws_cli import console, loadgen
+
+app = typer.Typer()
+
+
+@app.callback()
+def main():
+    """Measure how OBS performs under request load."""
+
+
+def _parse_data(value: Optional[str]) -> Optional[dict]:
+    """Parse the request data as a JSON object."""
+    if value is None:
+        return None
+    try:
+        data = json.loads(value)
+    except json.JSONDecodeError as e:
+        raise typer.BadParameter(f'Invalid JSON: {e}') from None
+    if not isinstance(data, dict):
+        raise typer.BadParameter('Request data must be a JSON object.')
+    return data
+
+
+@app.command('load')
+@app.command('ld', hidden=True)
+def load(
+    ctx: typer.Context,
+    request: Annotated[
+        str,
+        typer.Option(
+            '--request',
+            '-R',
+            help='The request type to send, e.g. GetVersion or SetInputVolume',
+        ),
+    ] = 'GetVersion',
+    data: Annotated[
+        Optional[str],
+        typer.Option(
+            '--data',
+            show_default=False,
+            help='The request data as a JSON object, e.g. \'{"inputName": "Mic/Aux", "inputVolumeDb": -6}\'',
+        ),
+    ] = None,
+    concurrency: Annotated[
+        int,
+        typer.Option(
+            '--concurrency',
+            '-c',
+            min=1,
+            help='Number of connections, or requests in flight with --pipeline',
+        ),
+    ] = 1,
+    rate: Annotated[
+        float,
+        typer.Option(
+            '--rate',
+            '-r',
+            min=0,
+            help='Total requests per second, 0 to send as fast as possible',
+        ),
+    ] = 0,
+    duration: Annotated[
+        float,
+        typer.Option('--duration', '-d', min=0, help='Seconds to send requests for'),
+    ] = 10,
+    pipeline: Annotated[
+        bool,
+        typer.Option(
+            '--pipeline',
+            help='Keep --concurrency requests in flight on a single connection',
+        ),
+    ] = False,
+    sample_interval: Annotated[
+        float,
+        typer.Option(
+            min=0.1, help='Seconds between GetStats samples of the frame counters'
+        ),
+    ] = 1,
+):
+    """Send requests at a fixed rate or concurrency and report latency and frame drops."""
+    request_data = _parse_data(data)
+    try:
+        result = loadgen.run(
+            ctx.obj['obsws'],
+            ctx.obj['connection'] | {'protocol': ctx.obj['protocol']},
+            request,
+            request_data,
+            concurrency,
+            rate,
+            duration,
+            pipeline,
+            sample_interval,
+        )
+    except obsws.error.OBSSDKError as e:
+        console.err.print(f'Load connection failed: {e}')
+        raise typer.Exit(1)
+
+    p50, p95, p99, p100 = (
+        round(seconds * 1000, 3) for seconds in result.percentiles(50, 95, 99, 100)
+    )
+    first, last = result.samples[0], result.samples[-1]
+    summary = {
+        'requestType': request,
+        'requests': len(result.responses),
+        'errors': result.errors,
+        'duration': round(result.elapsed, 3),
+        'throughput': round(result.throughput, 1),
+        'p50': p50,
+        'p95': p95,
+        'p99': p99,
+        'max': p100,
+        'renderSkippedFrames': last.render_skipped_frames - first.render_skipped_frames,
+        'renderTotalFrames': last.render_total_frames - first.render_total_frames,
+        'outputSkippedFrames': last.output_skipped_frames - first.output_skipped_frames,
+        'outputTotalFrames': last.output_total_frames - first.output_total_frames,
+    }
+
+    intervals = []
+    for previous, sample in zip(result.samples, result.samples[1:]):
+        completed = sum(
+            previous.elapsed < r.completed <= sample.elapsed for r in result.responses
+        )
+        seconds = sample.elapsed - previous.elapsed
+        intervals.append(
+            {
+                'elapsed': round(sample.elapsed, 3),
+                'throughput': round(completed / seconds, 1) if seconds else 0.0,
+                'renderSkippedFrames': sample.render_skipped_frames
+                - previous.render_skipped_frames,
+                'outputSkippedFrames': sample.output_skipped_frames
+                - previous.output_skipped_frames,
+                'activeFps': round(sample.active_fps, 2),
+            }
+        )
+
+    if console.raw_output(ctx):
+        console.write_records(
+            ctx,
+            (*summary, 'samples'),
+            [summary | {'samples': intervals}],
+        )
+        return
+
+    columns = [
+        ('Time (s)', 'right', ctx.obj['style'].column),
+        ('Requests/s', 'right', ctx.obj['style'].column),
+        ('Render Skipped', 'right', ctx.obj['style'].column),
+        ('Output Skipped', 'right', ctx.obj['style'].column),
+        ('FPS', 'right', ctx.obj['style'].column),
+    ]
+    table = console.table(ctx, f'{request} Load', columns)
+    for i, interval in enumerate(intervals):
+        table.add_row(
+            f'{interval["elapsed"]:.1f}',
+            f'{interval["throughput"]:.1f}',
+            str(interval['renderSkippedFrames']),
+            str(interval['outputSkippedFrames']),
+            f'{interval["activeFps"]:.2f}',
+            style='' if i % 2 == 0 else 'dim',
+        )
+    console.out.print(table)
+
+    console.out.print(
+        f'{summary["requests"]} requests, {summary["errors"]} failed, '
+        f'in {summary["duration"]:.2f}s: '
+        f'{console.highlight(ctx, f"{result.throughput:.1f}")} requests/s'
+    )
+    console.out.print(
+        f'latency ms  p50 {p50:.3f}  p95 {p95:.3f}  p99 {p99:.3f}  max {p100:.3f}'
+    )
+    console.out.print(
+        f'render skipped {summary["renderSkippedFrames"]} of '
+        f'{summary["renderTotalFrames"]} frames, output skipped '
+        f'{summary["outputSkippedFrames"]} of {summary["outputTotalFrames"]} frames'
+    )
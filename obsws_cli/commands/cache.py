@@ -0,0 +1,48 @@
+"""module containing commands for managing the on-disk caches."""
+
+from typing import Annotated
+
+import typer
+
+from obsws_cli import client, console, metadata
+
+app = typer.Typer()
+
+
+@app.callback()
+def main():
+    """Manage the cached OBS metadata and names."""
+
+
+@app.command('clear')
+@app.command('c', hidden=True)
+def clear(
+    ctx: typer.Context,
+    all_hosts: Annotated[
+        bool,
+        typer.Option(
+            '--all',
+            help='Clear the caches of every host, not only the one connected to',
+        ),
+    ] = False,
+):
+    """Clear the cached metadata and names."""
+    if all_hosts:
+        removed = metadata.clear()
+    else:
+        connection = ctx.obj['connection']
+        removed = metadata.clear(connection['host'], connection['port'])
+    console.out.print(f'Removed {len(removed)} cache files.')
+
+
+@app.command('warm')
+@app.command('w', hidden=True)
+def warm(ctx: typer.Context):
+    """Fetch the metadata OBS offers into the cache, replacing what is there."""
+    with client.ReqClient(
+        **ctx.obj['connection'], protocol=ctx.obj['protocol']
+    ) as req_client:
+        count = metadata.warm(req_client)
+    console.out.print(
+        f'Cached {count} responses from {console.highlight(ctx, req_client.base_client.host)}.'
+    )
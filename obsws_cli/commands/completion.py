@@ -0,0 +1,67 @@
+"""module containing commands for generating shell completion scripts."""
+
+import os
+import sys
+from pathlib import Path
+from typing import Annotated, Optional
+
+import typer
+
+from obsws_cli import completion, console, launcher
+
+app = typer.Typer()
+
+
+@app.callback()
+def main():
+    """Generate shell completion scripts."""
+
+
+def _default_shell() -> str:
+    """Get the user's shell if a script can be generated for it, else bash."""
+    shell = Path(os.environ.get('SHELL', '')).name
+    return shell if shell in completion.SHELLS else 'bash'
+
+
+def validate_shell(value: str):
+    """Validate and return the shell."""
+    if value not in completion.SHELLS:
+        raise typer.BadParameter(
+            f'Invalid shell: {value}. Available shells: {", ".join(completion.SHELLS)}'
+        )
+    return value
+
+
+@app.command('generate')
+@app.command('gen', hidden=True)
+def generate(
+    ctx: typer.Context,
+    shell: Annotated[
+        str,
+        typer.Option(
+            show_default='$SHELL',
+            help='Shell to generate the script for: bash, zsh or fish',
+            callback=validate_shell,
+        ),
+    ] = _default_shell(),
+    output: Annotated[
+        Optional[Path],
+        typer.Option(
+            '--output',
+            '-O',
+            dir_okay=False,
+            show_default=False,
+            help='Write the script to this file instead of stdout',
+        ),
+    ] = None,
+):
+    """Generate a static completion script for the command tree."""
+    script = completion.generate(launcher.load_manifest(), shell)
+    if output is None:
+        sys.stdout.write(script)
+        return
+
+    output.write_text(script)
+    console.out.print(
+        f'{shell} completion written to {console.highlight(ctx, output)}.'
+    )
@@ -4,10 +4,8 @@ from typing import Annotated, Optional
 
 import obsws_python as obsws
 import typer
-from rich.table import Table
-from rich.text import Text
 
-from obsws_cli import console, util
+from obsws_cli import console, metadata, names, util
 
 app = typer.Typer()
 
@@ -24,6 +22,7 @@ def list_(
     source_name: Annotated[
         Optional[str],
         typer.Argument(
+            autocompletion=names.complete_sources,
             show_default='The current scene',
             help='The source to list filters for',
         ),
@@ -44,30 +43,52 @@ def list_(
         else:
             raise
 
+    # Look up the defaults of each kind of filter at once, if not cached.
+    kinds = list(dict.fromkeys(filter['filterKind'] for filter in resp.filters))
+    defaults = {
+        kind: resp['defaultFilterSettings']
+        for kind, resp in zip(
+            kinds,
+            metadata.request_many(
+                ctx.obj['obsws'],
+                [('GetSourceFilterDefaultSettings', {'filterKind': k}) for k in kinds],
+            ),
+        )
+    }
+
+    if console.raw_output(ctx):
+        console.write_records(
+            ctx,
+            ('filterName', 'filterKind', 'filterEnabled', 'filterSettings'),
+            (
+                {
+                    'filterName': filter['filterName'],
+                    'filterKind': filter['filterKind'],
+                    'filterEnabled': filter['filterEnabled'],
+                    'filterSettings': defaults[filter['filterKind']]
+                    | filter['filterSettings'],
+                }
+                for filter in resp.filters
+            ),
+        )
+        return
+
     if not resp.filters:
         console.out.print(
             f'No filters found for source {console.highlight(ctx, source_name)}'
         )
         raise typer.Exit()
 
-    table = Table(
-        title=f'Filters for Source: {source_name}',
-        padding=(0, 2),
-        border_style=ctx.obj['style'].border,
-    )
-
     columns = [
-        (Text('Filter Name', justify='center'), 'left', ctx.obj['style'].column),
-        (Text('Kind', justify='center'), 'left', ctx.obj['style'].column),
-        (Text('Enabled', justify='center'), 'center', None),
-        (Text('Settings', justify='center'), 'center', ctx.obj['style'].column),
+        ('Filter Name', 'left', ctx.obj['style'].column),
+        ('Kind', 'left', ctx.obj['style'].column),
+        ('Enabled', 'center', None),
+        ('Settings', 'center', ctx.obj['style'].column),
     ]
-    for heading, justify, style in columns:
-        table.add_column(heading, justify=justify, style=style)
+    table = console.table(ctx, f'Filters for Source: {source_name}', columns)
 
     for filter in resp.filters:
-        resp = ctx.obj['obsws'].get_source_filter_default_settings(filter['filterKind'])
-        settings = resp.default_filter_settings | filter['filterSettings']
+        settings = defaults[filter['filterKind']] | filter['filterSettings']
 
         table.add_row(
             filter['filterName'],
@@ -97,13 +118,19 @@ def enable(
     source_name: Annotated[
         str,
         typer.Argument(
-            ..., show_default=False, help='The source to enable the filter for'
+            ...,
+            autocompletion=names.complete_sources,
+            show_default=False,
+            help='The source to enable the filter for',
         ),
     ],
     filter_name: Annotated[
         str,
         typer.Argument(
-            ..., show_default=False, help='The name of the filter to enable'
+            ...,
+            autocompletion=names.complete_filters,
+            show_default=False,
+            help='The name of the filter to enable',
         ),
     ],
 ):
@@ -127,13 +154,19 @@ def disable(
     source_name: Annotated[
         str,
         typer.Argument(
-            ..., show_default=False, help='The source to disable the filter for'
+            ...,
+            autocompletion=names.complete_sources,
+            show_default=False,
+            help='The source to disable the filter for',
         ),
     ],
     filter_name: Annotated[
         str,
         typer.Argument(
-            ..., show_default=False, help='The name of the filter to disable'
+            ...,
+            autocompletion=names.complete_filters,
+            show_default=False,
+            help='The name of the filter to disable',
         ),
     ],
 ):
@@ -157,13 +190,19 @@ def toggle(
     source_name: Annotated[
         str,
         typer.Argument(
-            ..., show_default=False, help='The source to toggle the filter for'
+            ...,
+            autocompletion=names.complete_sources,
+            show_default=False,
+            help='The source to toggle the filter for',
         ),
     ],
     filter_name: Annotated[
         str,
         typer.Argument(
-            ..., show_default=False, help='The name of the filter to toggle'
+            ...,
+            autocompletion=names.complete_filters,
+            show_default=False,
+            help='The name of the filter to toggle',
         ),
     ],
 ):
@@ -191,18 +230,38 @@ def status(
     source_name: Annotated[
         str,
         typer.Argument(
-            ..., show_default=False, help='The source to get the filter status for'
+            ...,
+            autocompletion=names.complete_sources,
+            show_default=False,
+            help='The source to get the filter status for',
         ),
     ],
     filter_name: Annotated[
         str,
         typer.Argument(
-            ..., show_default=False, help='The name of the filter to get the status for'
+            ...,
+            autocompletion=names.complete_filters,
+            show_default=False,
+            help='The name of the filter to get the status for',
         ),
     ],
 ):
     """Get the status of a filter for a source."""
     is_enabled = _get_filter_enabled(ctx, source_name, filter_name)
+    if console.raw_output(ctx):
+        console.write_records(
+            ctx,
+            ('sourceName', 'filterName', 'filterEnabled'),
+            [
+                {
+                    'sourceName': source_name,
+                    'filterName': filter_name,
+                    'filterEnabled': is_enabled,
+                }
+            ],
+        )
+        return
+
     if is_enabled:
         console.out.print(
             f'Filter {console.highlight(ctx, filter_name)} is enabled for source {console.highlight(ctx, source_name)}'
@@ -3,10 +3,8 @@
 from typing import Annotated, Optional
 
 import typer
-from rich.table import Table
-from rich.text import Text
 
-from obsws_cli import console, util, validate
+from obsws_cli import console, names, util, validate
 from obsws_cli.protocols import DataclassProtocol
 
 app = typer.Typer()
@@ -24,6 +22,7 @@ def list_(
     scene_name: Annotated[
         Optional[str],
         typer.Argument(
+            autocompletion=names.complete_scenes,
             show_default='The current scene',
             help='Scene name to list groups for',
             callback=validate.scene_in_scenes,
@@ -41,25 +40,33 @@ def list_(
         if item.get('isGroup')
     ]
 
+    if console.raw_output(ctx):
+        console.write_records(
+            ctx,
+            ('sceneItemId', 'groupName', 'sceneItemEnabled'),
+            (
+                {
+                    'sceneItemId': item_id,
+                    'groupName': group_name,
+                    'sceneItemEnabled': is_enabled,
+                }
+                for item_id, group_name, is_enabled in groups
+            ),
+        )
+        return
+
     if not groups:
         console.out.print(
             f'No groups found in scene {console.highlight(ctx, scene_name)}.'
         )
         raise typer.Exit()
 
-    table = Table(
-        title=f'Groups in Scene: {scene_name}',
-        padding=(0, 2),
-        border_style=ctx.obj['style'].border,
-    )
-
     columns = [
-        (Text('ID', justify='center'), 'center', ctx.obj['style'].column),
-        (Text('Group Name', justify='center'), 'left', ctx.obj['style'].column),
-        (Text('Enabled', justify='center'), 'center', None),
+        ('ID', 'center', ctx.obj['style'].column),
+        ('Group Name', 'left', ctx.obj['style'].column),
+        ('Enabled', 'center', None),
     ]
-    for heading, justify, style in columns:
-        table.add_column(heading, justify=justify, style=style)
+    table = console.table(ctx, f'Groups in Scene: {scene_name}', columns)
 
     for item_id, group_name, is_enabled in groups:
         table.add_row(
@@ -92,13 +99,20 @@ def show(
         str,
         typer.Argument(
             ...,
+            autocompletion=names.complete_scenes,
             show_default=False,
             help='Scene name the group is in',
             callback=validate.scene_in_scenes,
         ),
     ],
     group_name: Annotated[
-        str, typer.Argument(..., show_default=False, help='Group name to show')
+        str,
+        typer.Argument(
+            ...,
+            autocompletion=names.complete_groups,
+            show_default=False,
+            help='Group name to show',
+        ),
     ],
 ):
     """Show a group in a scene."""
@@ -126,13 +140,20 @@ def hide(
         str,
         typer.Argument(
             ...,
+            autocompletion=names.complete_scenes,
             show_default=False,
             help='Scene name the group is in',
             callback=validate.scene_in_scenes,
         ),
     ],
     group_name: Annotated[
-        str, typer.Argument(..., show_default=False, help='Group name to hide')
+        str,
+        typer.Argument(
+            ...,
+            autocompletion=names.complete_groups,
+            show_default=False,
+            help='Group name to hide',
+        ),
     ],
 ):
     """Hide a group in a scene."""
@@ -160,13 +181,20 @@ def toggle(
         str,
         typer.Argument(
             ...,
+            autocompletion=names.complete_scenes,
             show_default=False,
             help='Scene name the group is in',
             callback=validate.scene_in_scenes,
         ),
     ],
     group_name: Annotated[
-        str, typer.Argument(..., show_default=False, help='Group name to toggle')
+        str,
+        typer.Argument(
+            ...,
+            autocompletion=names.complete_groups,
+            show_default=False,
+            help='Group name to toggle',
+        ),
     ],
 ):
     """Toggle a group in a scene."""
@@ -198,13 +226,20 @@ def status(
         str,
         typer.Argument(
             ...,
+            autocompletion=names.complete_scenes,
             show_default=False,
             help='Scene name the group is in',
             callback=validate.scene_in_scenes,
         ),
     ],
     group_name: Annotated[
-        str, typer.Argument(..., show_default=False, help='Group name to check status')
+        str,
+        typer.Argument(
+            ...,
+            autocompletion=names.complete_groups,
+            show_default=False,
+            help='Group name to check status',
+        ),
     ],
 ):
     """Get the status of a group in a scene."""
@@ -220,6 +255,20 @@ def status(
         item_id=int(group.get('sceneItemId')),
     )
 
+    if console.raw_output(ctx):
+        console.write_records(
+            ctx,
+            ('sceneName', 'groupName', 'sceneItemEnabled'),
+            [
+                {
+                    'sceneName': scene_name,
+                    'groupName': group_name,
+                    'sceneItemEnabled': enabled.scene_item_enabled,
+                }
+            ],
+        )
+        return
+
     if enabled.scene_item_enabled:
         console.out.print(f'Group {console.highlight(ctx, group_name)} is now visible.')
     else:
@@ -3,10 +3,8 @@
 from typing import Annotated
 
 import typer
-from rich.table import Table
-from rich.text import Text
 
-from obsws_cli import console
+from obsws_cli import console, metadata
 
 app = typer.Typer()
 
@@ -22,24 +20,25 @@ def list_(
     ctx: typer.Context,
 ):
     """List all hotkeys."""
-    resp = ctx.obj['obsws'].get_hotkey_list()
+    hotkeys = metadata.request(ctx.obj['obsws'], 'GetHotkeyList')['hotkeys']
 
-    if not resp.hotkeys:
+    if console.raw_output(ctx):
+        console.write_records(
+            ctx,
+            ('hotkeyName',),
+            ({'hotkeyName': hotkey} for hotkey in hotkeys),
+        )
+        return
+
+    if not hotkeys:
         console.out.print('No hotkeys found.')
         raise typer.Exit()
 
-    table = Table(
-        title='Hotkeys',
-        padding=(0, 2),
-        border_style=ctx.obj['style'].border,
-    )
-    table.add_column(
-        Text('Hotkey Name', justify='center'),
-        justify='left',
-        style=ctx.obj['style'].column,
+    table = console.table(
+        ctx, 'Hotkeys', [('Hotkey Name', 'left', ctx.obj['style'].column)]
     )
 
-    for i, hotkey in enumerate(resp.hotkeys):
+    for i, hotkey in enumerate(hotkeys):
         table.add_row(hotkey, style='' if i % 2 == 0 else 'dim')
 
     console.out.print(table)
@@ -4,10 +4,8 @@ from typing import Annotated
 
 import obsws_python as obsws
 import typer
-from rich.table import Table
-from rich.text import Text
 
-from obsws_cli import console, util, validate
+from obsws_cli import api, console, names, util
 
 app = typer.Typer()
 
@@ -27,7 +25,6 @@ def create(
             ...,
             show_default=False,
             help='Name of the input to create.',
-            callback=validate.input_not_in_inputs,
         ),
     ],
     input_kind: Annotated[
@@ -36,22 +33,15 @@ def create(
             ...,
             show_default=False,
             help='Kind of the input to create.',
-            callback=validate.kind_in_input_kinds,
         ),
     ],
 ):
     """Create a new input."""
-    current_scene = (
-        ctx.obj['obsws'].get_current_program_scene().current_program_scene_name
-    )
     try:
-        ctx.obj['obsws'].create_input(
-            inputName=input_name,
-            inputKind=input_kind,
-            sceneItemEnabled=True,
-            sceneName=current_scene,
-            inputSettings={},
-        )
+        api.input.create(ctx.obj['obsws'], input_name, input_kind)
+    except api.APIError as e:
+        console.api_error(e)
+        raise typer.Exit(1)
     except obsws.error.OBSSDKRequestError as e:
         console.err.print(f'Failed to create input: [yellow]{e}[/yellow]')
         raise typer.Exit(1)
@@ -70,14 +60,18 @@ def remove(
         str,
         typer.Argument(
             ...,
+            autocompletion=names.complete_inputs,
             show_default=False,
             help='Name of the input to remove.',
-            callback=validate.input_in_inputs,
         ),
     ],
 ):
     """Remove an input."""
-    ctx.obj['obsws'].remove_input(name=input_name)
+    try:
+        api.input.remove(ctx.obj['obsws'], input_name)
+    except api.APIError as e:
+        console.api_error(e)
+        raise typer.Exit(1)
 
     console.out.print(f'Input {console.highlight(ctx, input_name)} removed.')
 
@@ -94,8 +88,6 @@ def list_(
     uuid: Annotated[bool, typer.Option(help='Show UUIDs of inputs.')] = False,
 ):
     """List all inputs."""
-    resp = ctx.obj['obsws'].get_input_list()
-
     kinds = []
     if input:
         kinds.append('input')
@@ -107,63 +99,58 @@ def list_(
         kinds.append('ffmpeg')
     if vlc:
         kinds.append('vlc')
-    if not any([input, output, colour, ffmpeg, vlc]):
-        kinds = ctx.obj['obsws'].get_input_kind_list(False).input_kinds
-
-    inputs = sorted(
-        (
-            (input_.get('inputName'), input_.get('inputKind'), input_.get('inputUuid'))
-            for input_ in filter(
-                lambda input_: any(kind in input_.get('inputKind') for kind in kinds),
-                resp.inputs,
-            )
-        ),
-        key=lambda x: x[0],  # Sort by input name
-    )
+
+    inputs = api.input.list_(ctx.obj['obsws'], kinds or None)
+
+    if console.raw_output(ctx):
+        console.write_records(
+            ctx,
+            ('inputName', 'inputKind', 'inputMuted', 'inputUuid'),
+            (
+                {
+                    'inputName': input_.name,
+                    'inputKind': input_.kind,
+                    'inputMuted': input_.muted,
+                    'inputUuid': input_.uuid,
+                }
+                for input_ in inputs
+            ),
+        )
+        return
 
     if not inputs:
         console.out.print('No inputs found.')
         raise typer.Exit()
 
-    table = Table(title='Inputs', padding=(0, 2), border_style=ctx.obj['style'].border)
     if uuid:
         columns = [
-            (Text('Input Name', justify='center'), 'left', ctx.obj['style'].column),
-            (Text('Kind', justify='center'), 'center', ctx.obj['style'].column),
-            (Text('Muted', justify='center'), 'center', None),
-            (Text('UUID', justify='center'), 'left', ctx.obj['style'].column),
+            ('Input Name', 'left', ctx.obj['style'].column),
+            ('Kind', 'center', ctx.obj['style'].column),
+            ('Muted', 'center', None),
+            ('UUID', 'left', ctx.obj['style'].column),
         ]
     else:
         columns = [
-            (Text('Input Name', justify='center'), 'left', ctx.obj['style'].column),
-            (Text('Kind', justify='center'), 'center', ctx.obj['style'].column),
-            (Text('Muted', justify='center'), 'center', None),
+            ('Input Name', 'left', ctx.obj['style'].column),
+            ('Kind', 'center', ctx.obj['style'].column),
+            ('Muted', 'center', None),
         ]
-    for heading, justify, style in columns:
-        table.add_column(heading, justify=justify, style=style)
-
-    for input_name, input_kind, input_uuid in inputs:
-        input_mark = ''
-        try:
-            input_muted = ctx.obj['obsws'].get_input_mute(name=input_name).input_muted
-            input_mark = util.check_mark(input_muted)
-        except obsws.error.OBSSDKRequestError as e:
-            if e.code == 604:  # Input does not support audio
-                input_mark = 'N/A'
-            else:
-                raise
+    table = console.table(ctx, 'Inputs', columns)
+
+    for input_ in inputs:
+        input_mark = 'N/A' if input_.muted is None else util.check_mark(input_.muted)
 
         if uuid:
             table.add_row(
-                input_name,
-                util.snakecase_to_titlecase(input_kind),
+                input_.name,
+                util.snakecase_to_titlecase(input_.kind),
                 input_mark,
-                input_uuid,
+                input_.uuid,
             )
         else:
             table.add_row(
-                input_name,
-                util.snakecase_to_titlecase(input_kind),
+                input_.name,
+                util.snakecase_to_titlecase(input_.kind),
                 input_mark,
             )
 
@@ -176,20 +163,20 @@ def list_kinds(
     ctx: typer.Context,
 ):
     """List all input kinds."""
-    resp = ctx.obj['obsws'].get_input_kind_list(False)
-    kinds = sorted(resp.input_kinds)
+    kinds = api.input.list_kinds(ctx.obj['obsws'])
+
+    if console.raw_output(ctx):
+        console.write_records(
+            ctx, ('inputKind',), ({'inputKind': kind} for kind in kinds)
+        )
+        return
 
     if not kinds:
         console.out.print('No input kinds found.')
         raise typer.Exit()
 
-    table = Table(
-        title='Input Kinds', padding=(0, 2), border_style=ctx.obj['style'].border
-    )
-    table.add_column(
-        Text('Input Kind', justify='center'),
-        justify='left',
-        style=ctx.obj['style'].column,
+    table = console.table(
+        ctx, 'Input Kinds', [('Input Kind', 'left', ctx.obj['style'].column)]
     )
 
     for kind in kinds:
@@ -206,17 +193,18 @@ def mute(
         str,
         typer.Argument(
             ...,
+            autocompletion=names.complete_inputs,
             show_default=False,
             help='Name of the input to mute.',
-            callback=validate.input_in_inputs,
         ),
     ],
 ):
     """Mute an input."""
-    ctx.obj['obsws'].set_input_mute(
-        name=input_name,
-        muted=True,
-    )
+    try:
+        api.input.mute(ctx.obj['obsws'], input_name)
+    except api.APIError as e:
+        console.api_error(e)
+        raise typer.Exit(1)
 
     console.out.print(f'Input {console.highlight(ctx, input_name)} muted.')
 
@@ -229,17 +217,18 @@ def unmute(
         str,
         typer.Argument(
             ...,
+            autocompletion=names.complete_inputs,
             show_default=False,
             help='Name of the input to unmute.',
-            callback=validate.input_in_inputs,
         ),
     ],
 ):
     """Unmute an input."""
-    ctx.obj['obsws'].set_input_mute(
-        name=input_name,
-        muted=False,
-    )
+    try:
+        api.input.unmute(ctx.obj['obsws'], input_name)
+    except api.APIError as e:
+        console.api_error(e)
+        raise typer.Exit(1)
 
     console.out.print(f'Input {console.highlight(ctx, input_name)} unmuted.')
 
@@ -252,22 +241,20 @@ def toggle(
         str,
         typer.Argument(
             ...,
+            autocompletion=names.complete_inputs,
             show_default=False,
             help='Name of the input to toggle.',
-            callback=validate.input_in_inputs,
         ),
     ],
 ):
     """Toggle an input."""
-    resp = ctx.obj['obsws'].get_input_mute(name=input_name)
-    new_state = not resp.input_muted
-
-    ctx.obj['obsws'].set_input_mute(
-        name=input_name,
-        muted=new_state,
-    )
+    try:
+        state = api.input.toggle(ctx.obj['obsws'], input_name)
+    except api.APIError as e:
+        console.api_error(e)
+        raise typer.Exit(1)
 
-    if new_state:
+    if state.muted:
         console.out.print(
             f'Input {console.highlight(ctx, input_name)} muted.',
         )
@@ -285,9 +272,9 @@ def volume(
         str,
         typer.Argument(
             ...,
+            autocompletion=names.complete_inputs,
             show_default=False,
             help='Name of the input to set volume for.',
-            callback=validate.input_in_inputs,
         ),
     ],
     volume: Annotated[
@@ -296,16 +283,17 @@ def volume(
             ...,
             show_default=False,
             help='Volume level to set (-90 to 0).',
-            min=-90,
-            max=0,
+            min=api.requests.MIN_VOLUME_DB,
+            max=api.requests.MAX_VOLUME_DB,
         ),
     ],
 ):
     """Set the volume of an input."""
-    ctx.obj['obsws'].set_input_volume(
-        name=input_name,
-        vol_db=volume,
-    )
+    try:
+        api.input.volume(ctx.obj['obsws'], input_name, volume)
+    except api.APIError as e:
+        console.api_error(e)
+        raise typer.Exit(1)
 
     console.out.print(
         f'Input {console.highlight(ctx, input_name)} volume set to {console.highlight(ctx, volume)}.',
@@ -320,9 +308,9 @@ def show(
         str,
         typer.Argument(
             ...,
+            autocompletion=names.complete_inputs,
             show_default=False,
             help='Name of the input to show.',
-            callback=validate.input_in_inputs,
         ),
     ],
     verbose: Annotated[
@@ -330,76 +318,33 @@ def show(
     ] = False,
 ):
     """Show information for an input in the current scene."""
-    input_list = ctx.obj['obsws'].get_input_list()
-    for input_ in input_list.inputs:
-        if input_['inputName'] == input_name:
-            input_kind = input_['inputKind']
-            break
-
-    for prop in ['device', 'device_id']:
-        try:
-            device_id = (
-                ctx.obj['obsws']
-                .get_input_settings(
-                    name=input_name,
-                )
-                .input_settings.get(prop)
-            )
-            if device_id:
-                break
-        except obsws.error.OBSSDKRequestError:
-            continue
-    else:
-        device_id = '(N/A)'
+    try:
+        device = api.input.device(ctx.obj['obsws'], input_name)
+    except api.APIError as e:
+        console.api_error(e)
+        raise typer.Exit(1)
 
-    for device in (
-        ctx.obj['obsws']
-        .get_input_properties_list_property_items(
-            input_name=input_name,
-            prop_name=prop,
-        )
-        .property_items
-    ):
-        if device.get('itemValue') == device_id:
-            device_id = device.get('itemName')
-            break
-
-    table = Table(
-        title='Input Information', padding=(0, 2), border_style=ctx.obj['style'].border
-    )
     columns = [
-        (Text('Input Name', justify='center'), 'left', ctx.obj['style'].column),
-        (Text('Kind', justify='center'), 'left', ctx.obj['style'].column),
-        (Text('Device', justify='center'), 'left', ctx.obj['style'].column),
+        ('Input Name', 'left', ctx.obj['style'].column),
+        ('Kind', 'left', ctx.obj['style'].column),
+        ('Device', 'left', ctx.obj['style'].column),
     ]
-    for heading, justify, style in columns:
-        table.add_column(heading, justify=justify, style=style)
+    table = console.table(ctx, 'Input Information', columns)
     table.add_row(
         input_name,
-        util.snakecase_to_titlecase(input_kind),
-        device_id,
+        util.snakecase_to_titlecase(device.kind),
+        device.device,
     )
 
     console.out.print(table)
 
     if verbose:
-        resp = ctx.obj['obsws'].get_input_properties_list_property_items(
-            input_name=input_name,
-            prop_name=prop,
+        table = console.table(
+            ctx, 'Devices', [('Name', 'left', ctx.obj['style'].column)]
         )
-        table = Table(
-            title='Devices',
-            padding=(0, 2),
-            border_style=ctx.obj['style'].border,
-        )
-        columns = [
-            (Text('Name', justify='center'), 'left', ctx.obj['style'].column),
-        ]
-        for heading, justify, style in columns:
-            table.add_column(heading, justify=justify, style=style)
-        for i, item in enumerate(resp.property_items):
+        for i, name in enumerate(device.devices):
             table.add_row(
-                item.get('itemName'),
+                name,
                 style='' if i % 2 == 0 else 'dim',
             )
 
@@ -414,9 +359,9 @@ def update(
         str,
         typer.Argument(
             ...,
+            autocompletion=names.complete_inputs,
             show_default=False,
             help='Name of the input to update.',
-            callback=validate.input_in_inputs,
         ),
     ],
     device_name: Annotated[
@@ -429,36 +374,12 @@ def update(
     ],
 ):
     """Update a setting for an input."""
-    device_id = None
-    for prop in ['device', 'device_id']:
-        try:
-            for device in (
-                ctx.obj['obsws']
-                .get_input_properties_list_property_items(
-                    input_name=input_name,
-                    prop_name=prop,
-                )
-                .property_items
-            ):
-                if device.get('itemName') == device_name:
-                    device_id = device.get('itemValue')
-                    break
-        except obsws.error.OBSSDKRequestError:
-            continue
-        if device_id:
-            break
-
-    if not device_id:
-        console.err.print(
-            f'Failed to find device ID for device '
-            f'{console.highlight(ctx, device_name)}.',
-        )
+    try:
+        api.input.set_device(ctx.obj['obsws'], input_name, device_name)
+    except api.APIError as e:
+        console.api_error(e)
         raise typer.Exit(1)
 
-    ctx.obj['obsws'].set_input_settings(
-        name=input_name, settings={prop: device_id}, overlay=True
-    )
-
     console.out.print(
         f'Input {console.highlight(ctx, input_name)} updated to use device '
         f'{console.highlight(ctx, device_name)}.',
@@ -1,13 +1,24 @@
 """module containing commands for media inputs."""
 
+from enum import Enum
 from typing import Annotated, Optional
 
+import obsws_python as obsws
 import typer
 
-from obsws_cli import console, util, validate
+from obsws_cli import console, events, util, validate
 
 app = typer.Typer()
 
+MEDIA_INPUT_KINDS = ('ffmpeg_source', 'vlc_source')
+
+
+class PlaybackEvent(str, Enum):
+    """Media playback events that can be waited on."""
+
+    started = 'started'
+    ended = 'ended'
+
 
 @app.callback()
 def main():
@@ -103,3 +114,130 @@ def restart(
         input_name, 'OBS_WEBSOCKET_MEDIA_INPUT_ACTION_RESTART'
     )
     console.out.print(f'Restarted media input {console.highlight(ctx, input_name)}.')
+
+
+def _media_state(state: Optional[str]) -> str:
+    """Convert an OBS media state to a readable string."""
+    if not state:
+        return 'Unknown'
+    return util.snakecase_to_titlecase(state.removeprefix('OBS_MEDIA_STATE_').lower())
+
+
+@app.command('status')
+@app.command('ss', hidden=True)
+def status(
+    ctx: typer.Context,
+    input_name: Annotated[
+        Optional[str],
+        typer.Argument(
+            show_default=False,
+            help='The name of the media input.',
+        ),
+    ] = None,
+    all_: Annotated[
+        bool, typer.Option('--all', help='Show the status of all media inputs.')
+    ] = False,
+):
+    """Get the state, cursor and duration of media inputs."""
+    if all_:
+        input_names = sorted(
+            input_.get('inputName')
+            for input_ in ctx.obj['obsws'].get_input_list().inputs
+            if input_.get('inputKind') in MEDIA_INPUT_KINDS
+        )
+        if not input_names and not console.raw_output(ctx):
+            console.out.print('No media inputs found.')
+            raise typer.Exit()
+    elif input_name is not None:
+        input_names = [validate.input_in_inputs(ctx, input_name)]
+    else:
+        console.err.print(
+            'Pass an input name or use the [yellow]--all[/yellow] option.'
+        )
+        raise typer.Exit(1)
+
+    # Fetch every status in a single round trip.
+    results = (
+        ctx.obj['obsws'].send_batch(
+            [('GetMediaInputStatus', {'inputName': name}) for name in input_names]
+        )
+        if input_names
+        else []
+    )
+
+    if console.raw_output(ctx):
+        console.write_records(
+            ctx,
+            ('inputName', 'mediaState', 'mediaCursor', 'mediaDuration'),
+            (
+                {'inputName': name} | result.get('responseData', {})
+                for name, result in zip(input_names, results)
+            ),
+        )
+        return
+
+    columns = [
+        ('Input Name', 'left', ctx.obj['style'].column),
+        ('State', 'left', ctx.obj['style'].column),
+        ('Cursor', 'center', ctx.obj['style'].column),
+        ('Duration', 'center', ctx.obj['style'].column),
+    ]
+    table = console.table(ctx, 'Media Inputs', columns)
+
+    for name, result in zip(input_names, results):
+        if not result['requestStatus']['result']:
+            table.add_row(name, 'N/A', '', '')
+            continue
+
+        data = result['responseData']
+        table.add_row(
+            name,
+            _media_state(data.get('mediaState')),
+            util.milliseconds_to_timecode(data.get('mediaCursor') or 0),
+            util.milliseconds_to_timecode(data.get('mediaDuration') or 0),
+        )
+
+    console.out.print(table)
+
+
+@app.command('wait')
+@app.command('w', hidden=True)
+def wait(
+    ctx: typer.Context,
+    input_name: Annotated[
+        str,
+        typer.Argument(
+            ...,
+            show_default=False,
+            help='The name of the media input.',
+            callback=validate.input_in_inputs,
+        ),
+    ],
+    until: Annotated[
+        PlaybackEvent, typer.Option(help='The playback event to wait for.')
+    ] = PlaybackEvent.ended,
+    timeout: Annotated[
+        Optional[float],
+        typer.Option(
+            show_default='Wait indefinitely',
+            help='Seconds to wait for the playback event.',
+            min=0,
+        ),
+    ] = None,
+):
+    """Wait for a media input to start or finish playing."""
+    event = {
+        PlaybackEvent.started: 'MediaInputPlaybackStarted',
+        PlaybackEvent.ended: 'MediaInputPlaybackEnded',
+    }[until]
+    _, elapsed = events.wait_for_event(
+        ctx,
+        event,
+        obsws.Subs.MEDIAINPUTS,
+        predicate=lambda data: data.input_name == input_name,
+        timeout=timeout,
+    )
+    console.out.print(
+        f'Media input {console.highlight(ctx, input_name)} playback {until.value} '
+        f'after {console.highlight(ctx, f"{elapsed:.3f}")} seconds.'
+    )
@@ -3,8 +3,6 @@
 from typing import Annotated
 
 import typer
-from rich.table import Table
-from rich.text import Text
 
 from obsws_cli import console, util, validate
 
@@ -22,26 +20,34 @@ def list_(ctx: typer.Context):
     """List profiles."""
     resp = ctx.obj['obsws'].get_profile_list()
 
+    if console.raw_output(ctx):
+        console.write_records(
+            ctx,
+            ('profileName', 'current'),
+            (
+                {
+                    'profileName': profile,
+                    'current': profile == resp.current_profile_name,
+                }
+                for profile in resp.profiles
+            ),
+        )
+        return
+
     if not resp.profiles:
         console.out.print('No profiles found.')
         raise typer.Exit()
 
-    table = Table(
-        title='Profiles', padding=(0, 2), border_style=ctx.obj['style'].border
-    )
     columns = [
-        (Text('Profile Name', justify='center'), 'left', ctx.obj['style'].column),
-        (Text('Current', justify='center'), 'center', None),
+        ('Profile Name', 'left', ctx.obj['style'].column),
+        ('Current', 'center', None),
     ]
-    for heading, justify, style in columns:
-        table.add_column(heading, justify=justify, style=style)
+    table = console.table(ctx, 'Profiles', columns)
 
     for profile in resp.profiles:
         table.add_row(
             profile,
-            util.check_mark(
-                ctx, profile == resp.current_profile_name, empty_if_false=True
-            ),
+            util.check_mark(profile == resp.current_profile_name, empty_if_false=True),
         )
 
     console.out.print(table)
@@ -3,10 +3,8 @@
 from typing import Annotated
 
 import typer
-from rich.table import Table
-from rich.text import Text
 
-from obsws_cli import console
+from obsws_cli import console, metadata
 
 app = typer.Typer()
 
@@ -20,27 +18,32 @@ def main():
 @app.command('ls-m', hidden=True)
 def list_monitors(ctx: typer.Context):
     """List available monitors."""
-    resp = ctx.obj['obsws'].get_monitor_list()
+    resp = metadata.request(ctx.obj['obsws'], 'GetMonitorList')
     monitors = sorted(
-        ((m['monitorIndex'], m['monitorName']) for m in resp.monitors),
+        ((m['monitorIndex'], m['monitorName']) for m in resp['monitors']),
         key=lambda m: m[0],
     )
 
+    if console.raw_output(ctx):
+        console.write_records(
+            ctx,
+            ('monitorIndex', 'monitorName'),
+            (
+                {'monitorIndex': index, 'monitorName': monitor}
+                for index, monitor in monitors
+            ),
+        )
+        return
+
     if not monitors:
         console.out.print('No monitors found.')
         raise typer.Exit()
 
-    table = Table(
-        title='Available Monitors',
-        padding=(0, 2),
-        border_style=ctx.obj['style'].border,
-    )
-    table.add_column(
-        Text('Index', justify='center'), justify='center', style=ctx.obj['style'].column
-    )
-    table.add_column(
-        Text('Name', justify='center'), justify='left', style=ctx.obj['style'].column
-    )
+    columns = [
+        ('Index', 'center', ctx.obj['style'].column),
+        ('Name', 'left', ctx.obj['style'].column),
+    ]
+    table = console.table(ctx, 'Available Monitors', columns)
 
     for index, monitor in monitors:
         table.add_row(str(index), monitor)
@@ -1,14 +1,19 @@
 """module for controlling OBS recording functionality."""
 
+import threading
+import time
 from pathlib import Path
 from typing import Annotated, Optional
 
 import typer
 
-from obsws_cli import console
+from obsws_cli import console, events
 
 app = typer.Typer()
 
+WAIT_START, WAIT_START_TIMEOUT = events.wait_options('the recording', 'start')
+WAIT_STOP, WAIT_STOP_TIMEOUT = events.wait_options('the recording', 'stop')
+
 
 @app.callback()
 def main():
@@ -23,8 +28,24 @@ def _get_recording_status(ctx: typer.Context) -> tuple:
 
 @app.command('start')
 @app.command('s', hidden=True)
-def start(ctx: typer.Context):
+def start(
+    ctx: typer.Context,
+    wait: WAIT_START = False,
+    wait_timeout: WAIT_START_TIMEOUT = events.WAIT_TIMEOUT,
+    sync: Annotated[
+        bool,
+        typer.Option(
+            help='With --hosts, start recording on every host at the same moment and report the skew.'
+        ),
+    ] = False,
+):
     """Start recording."""
+    if sync and 'sync' not in ctx.obj:
+        console.err.print(
+            '[yellow]--sync[/yellow] requires [yellow]--hosts[/yellow] or [yellow]--all-hosts[/yellow].'
+        )
+        raise typer.Exit(1)
+
     active, paused = _get_recording_status(ctx)
     if active:
         err_msg = 'Recording is already in progress, cannot start.'
@@ -34,19 +55,89 @@ def start(ctx: typer.Context):
         console.err.print(err_msg)
         raise typer.Exit(1)
 
+    if sync:
+        _start_synchronised(ctx, wait_timeout)
+        return
+
+    if wait:
+        _, elapsed = events.wait_for_output_state(
+            ctx,
+            ctx.obj['obsws'].start_record,
+            'RecordStateChanged',
+            events.OUTPUT_STARTED,
+            wait_timeout,
+        )
+        console.out.print(
+            f'Recording started successfully after {console.highlight(ctx, f"{elapsed:.3f}")} seconds.'
+        )
+        return
+
     ctx.obj['obsws'].start_record()
     console.out.print('Recording started successfully.')
 
 
+def _start_synchronised(ctx: typer.Context, timeout: float):
+    """Start recording together with the other hosts, reporting this host's offset."""
+    from obsws_cli import fanout
+
+    rtt = fanout.measure_rtt(ctx.obj['obsws'])
+    sent = {}
+
+    def release():
+        # wait_for_event times from just before this call
+        sent['called'] = time.perf_counter()
+        ctx.obj['sync'].wait(ctx.obj['target'], rtt, timeout)
+        ctx.obj['obsws'].start_record()
+
+    try:
+        _, elapsed = events.wait_for_output_state(
+            ctx,
+            release,
+            'RecordStateChanged',
+            events.OUTPUT_STARTED,
+            timeout,
+        )
+    except threading.BrokenBarrierError:
+        console.err.print(
+            'Another host failed before the synchronised start, recording was not started.'
+        )
+        raise typer.Exit(1)
+
+    offset = ctx.obj['sync'].record(ctx.obj['target'], sent['called'] + elapsed)
+    console.out.print(
+        f'Recording started successfully {console.highlight(ctx, f"{offset * 1000:+.2f}")} ms '
+        f'from the release (round trip {rtt * 1000:.2f} ms).'
+    )
+
+
 @app.command('stop')
 @app.command('st', hidden=True)
-def stop(ctx: typer.Context):
+def stop(
+    ctx: typer.Context,
+    wait: WAIT_STOP = False,
+    wait_timeout: WAIT_STOP_TIMEOUT = events.WAIT_TIMEOUT,
+):
     """Stop recording."""
     active, _ = _get_recording_status(ctx)
     if not active:
         console.err.print('Recording is not in progress, cannot stop.')
         raise typer.Exit(1)
 
+    if wait:
+        # The event reports the path of the finalised file.
+        data, elapsed = events.wait_for_output_state(
+            ctx,
+            ctx.obj['obsws'].stop_record,
+            'RecordStateChanged',
+            events.OUTPUT_STOPPED,
+            wait_timeout,
+        )
+        console.out.print(
+            f'Recording stopped successfully after {console.highlight(ctx, f"{elapsed:.3f}")} seconds. '
+            f'Saved to: {console.highlight(ctx, data.output_path)}'
+        )
+        return
+
     resp = ctx.obj['obsws'].stop_record()
     console.out.print(
         f'Recording stopped successfully. Saved to: {console.highlight(ctx, resp.output_path)}'
@@ -69,6 +160,14 @@ def toggle(ctx: typer.Context):
 def status(ctx: typer.Context):
     """Get recording status."""
     active, paused = _get_recording_status(ctx)
+    if console.raw_output(ctx):
+        console.write_records(
+            ctx,
+            ('outputActive', 'outputPaused'),
+            [{'outputActive': active, 'outputPaused': paused}],
+        )
+        return
+
     if active:
         if paused:
             console.out.print('Recording is in progress and paused.')
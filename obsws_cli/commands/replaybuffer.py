@@ -2,10 +2,13 @@
 
 import typer
 
-from obsws_cli import console
+from obsws_cli import console, events
 
 app = typer.Typer()
 
+WAIT_START, WAIT_START_TIMEOUT = events.wait_options('the replay buffer', 'start')
+WAIT_STOP, WAIT_STOP_TIMEOUT = events.wait_options('the replay buffer', 'stop')
+
 
 @app.callback()
 def main():
@@ -14,26 +17,60 @@ def main():
 
 @app.command('start')
 @app.command('s', hidden=True)
-def start(ctx: typer.Context):
+def start(
+    ctx: typer.Context,
+    wait: WAIT_START = False,
+    wait_timeout: WAIT_START_TIMEOUT = events.WAIT_TIMEOUT,
+):
     """Start the replay buffer."""
     resp = ctx.obj['obsws'].get_replay_buffer_status()
     if resp.output_active:
         console.err.print('Replay buffer is already active.')
         raise typer.Exit(1)
 
+    if wait:
+        _, elapsed = events.wait_for_output_state(
+            ctx,
+            ctx.obj['obsws'].start_replay_buffer,
+            'ReplayBufferStateChanged',
+            events.OUTPUT_STARTED,
+            wait_timeout,
+        )
+        console.out.print(
+            f'Replay buffer started after {console.highlight(ctx, f"{elapsed:.3f}")} seconds.'
+        )
+        return
+
     ctx.obj['obsws'].start_replay_buffer()
     console.out.print('Replay buffer started.')
 
 
 @app.command('stop')
 @app.command('st', hidden=True)
-def stop(ctx: typer.Context):
+def stop(
+    ctx: typer.Context,
+    wait: WAIT_STOP = False,
+    wait_timeout: WAIT_STOP_TIMEOUT = events.WAIT_TIMEOUT,
+):
     """Stop the replay buffer."""
     resp = ctx.obj['obsws'].get_replay_buffer_status()
     if not resp.output_active:
         console.err.print('Replay buffer is not active.')
         raise typer.Exit(1)
 
+    if wait:
+        _, elapsed = events.wait_for_output_state(
+            ctx,
+            ctx.obj['obsws'].stop_replay_buffer,
+            'ReplayBufferStateChanged',
+            events.OUTPUT_STOPPED,
+            wait_timeout,
+        )
+        console.out.print(
+            f'Replay buffer stopped after {console.highlight(ctx, f"{elapsed:.3f}")} seconds.'
+        )
+        return
+
     ctx.obj['obsws'].stop_replay_buffer()
     console.out.print('Replay buffer stopped.')
 
@@ -54,6 +91,12 @@ def toggle(ctx: typer.Context):
 def status(ctx: typer.Context):
     """Get the status of the replay buffer."""
     resp = ctx.obj['obsws'].get_replay_buffer_status()
+    if console.raw_output(ctx):
+        console.write_records(
+            ctx, ('outputActive',), [{'outputActive': resp.output_active}]
+        )
+        return
+
     if resp.output_active:
         console.out.print('Replay buffer is active.')
     else:
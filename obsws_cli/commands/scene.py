@@ -3,10 +3,8 @@
 from typing import Annotated
 
 import typer
-from rich.table import Table
-from rich.text import Text
 
-from obsws_cli import console, util, validate
+from obsws_cli import api, console, names, util
 
 app = typer.Typer()
 
@@ -23,44 +21,51 @@ def list_(
     uuid: Annotated[bool, typer.Option(help='Show UUIDs of scenes')] = False,
 ):
     """List all scenes."""
-    resp = ctx.obj['obsws'].get_scene_list()
-    scenes = (
-        (scene.get('sceneName'), scene.get('sceneUuid'))
-        for scene in reversed(resp.scenes)
-    )
+    scenes = api.scene.list_(ctx.obj['obsws'])
+
+    if console.raw_output(ctx):
+        console.write_records(
+            ctx,
+            ('sceneName', 'active', 'sceneUuid'),
+            (
+                {
+                    'sceneName': scene.name,
+                    'active': scene.active,
+                    'sceneUuid': scene.uuid,
+                }
+                for scene in scenes
+            ),
+        )
+        return
 
     if not scenes:
         console.out.print('No scenes found.')
         raise typer.Exit()
 
-    active_scene = ctx.obj['obsws'].get_current_program_scene().scene_name
-
-    table = Table(title='Scenes', padding=(0, 2), border_style=ctx.obj['style'].border)
     if uuid:
         columns = [
-            (Text('Scene Name', justify='center'), 'left', ctx.obj['style'].column),
-            (Text('Active', justify='center'), 'center', None),
-            (Text('UUID', justify='center'), 'left', ctx.obj['style'].column),
+            ('Scene Name', 'left', ctx.obj['style'].column),
+            ('Active', 'center', None),
+            ('UUID', 'left', ctx.obj['style'].column),
         ]
     else:
         columns = [
-            (Text('Scene Name', justify='center'), 'left', ctx.obj['style'].column),
-            (Text('Active', justify='center'), 'center', None),
+            ('Scene Name', 'left', ctx.obj['style'].column),
+            ('Active', 'center', None),
         ]
-    for heading, justify, style in columns:
-        table.add_column(heading, justify=justify, style=style)
+    table = console.table(ctx, 'Scenes', columns)
 
-    for scene_name, scene_uuid in scenes:
+    for scene in scenes:
         if uuid:
             table.add_row(
-                scene_name,
-                util.check_mark(scene_name == active_scene, empty_if_false=True),
-                scene_uuid,
+                scene.name,
+                util.check_mark(scene.active, empty_if_false=True),
+                scene.uuid,
             )
         else:
             table.add_row(
-                scene_name,
-                util.check_mark(scene_name == active_scene, empty_if_false=True),
+                scene.name,
+                util.check_mark(scene.active, empty_if_false=True),
             )
 
     console.out.print(table)
@@ -72,23 +77,20 @@ def current(
     ctx: typer.Context,
     preview: Annotated[
         bool,
-        typer.Option(
-            help='Get the preview scene instead of the program scene',
-            callback=validate.studio_mode_enabled,
-        ),
+        typer.Option(help='Get the preview scene instead of the program scene'),
     ] = False,
 ):
     """Get the current program scene or preview scene."""
-    if preview:
-        resp = ctx.obj['obsws'].get_current_preview_scene()
-        console.out.print(
-            f'Current Preview Scene: {console.highlight(ctx, resp.current_preview_scene_name)}'
-        )
-    else:
-        resp = ctx.obj['obsws'].get_current_program_scene()
-        console.out.print(
-            f'Current Program Scene: {console.highlight(ctx, resp.current_program_scene_name)}'
-        )
+    try:
+        scene = api.scene.current(ctx.obj['obsws'], preview)
+    except api.APIError as e:
+        console.api_error(e)
+        raise typer.Exit(1)
+
+    console.out.print(
+        f'Current {"Preview" if scene.preview else "Program"} Scene: '
+        f'{console.highlight(ctx, scene.scene_name)}'
+    )
 
 
 @app.command('switch')
@@ -99,26 +101,23 @@ def switch(
         str,
         typer.Argument(
             ...,
+            autocompletion=names.complete_scenes,
             help='Name of the scene to switch to',
-            callback=validate.scene_in_scenes,
         ),
     ],
     preview: Annotated[
         bool,
-        typer.Option(
-            help='Switch to the preview scene instead of the program scene',
-            callback=validate.studio_mode_enabled,
-        ),
+        typer.Option(help='Switch to the preview scene instead of the program scene'),
     ] = False,
 ):
     """Switch to a scene."""
-    if preview:
-        ctx.obj['obsws'].set_current_preview_scene(scene_name)
-        console.out.print(
-            f'Switched to preview scene: {console.highlight(ctx, scene_name)}'
-        )
-    else:
-        ctx.obj['obsws'].set_current_program_scene(scene_name)
-        console.out.print(
-            f'Switched to program scene: {console.highlight(ctx, scene_name)}'
-        )
+    try:
+        scene = api.scene.switch(ctx.obj['obsws'], scene_name, preview)
+    except api.APIError as e:
+        console.api_error(e)
+        raise typer.Exit(1)
+
+    console.out.print(
+        f'Switched to {"preview" if scene.preview else "program"} scene: '
+        f'{console.highlight(ctx, scene.scene_name)}'
+    )
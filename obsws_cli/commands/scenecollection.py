@@ -3,7 +3,6 @@
 from typing import Annotated
 
 import typer
-from rich.table import Table
 
 from obsws_cli import console, validate
 
@@ -21,17 +20,29 @@ def list_(ctx: typer.Context):
     """List all scene collections."""
     resp = ctx.obj['obsws'].get_scene_collection_list()
 
+    if console.raw_output(ctx):
+        console.write_records(
+            ctx,
+            ('sceneCollectionName', 'current'),
+            (
+                {
+                    'sceneCollectionName': scene_collection_name,
+                    'current': scene_collection_name
+                    == resp.current_scene_collection_name,
+                }
+                for scene_collection_name in resp.scene_collections
+            ),
+        )
+        return
+
     if not resp.scene_collections:
         console.out.print('No scene collections found.')
         raise typer.Exit()
 
-    table = Table(
-        title='Scene Collections',
-        padding=(0, 2),
-        border_style=ctx.obj['style'].border,
-    )
-    table.add_column(
-        'Scene Collection Name', justify='left', style=ctx.obj['style'].column
+    table = console.table(
+        ctx,
+        'Scene Collections',
+        [('Scene Collection Name', 'left', ctx.obj['style'].column)],
     )
 
     for scene_collection_name in resp.scene_collections:
@@ -3,9 +3,8 @@
 from typing import Annotated, Optional
 
 import typer
-from rich.table import Table
 
-from obsws_cli import console, util, validate
+from obsws_cli import api, console, names, util
 
 app = typer.Typer()
 
@@ -22,31 +21,45 @@ def list_(
     scene_name: Annotated[
         Optional[str],
         typer.Argument(
+            autocompletion=names.complete_scenes,
             show_default='The current scene',
             help='Scene name to list items for',
-            callback=validate.scene_in_scenes,
         ),
     ] = None,
     uuid: Annotated[bool, typer.Option(help='Show UUIDs of scene items')] = False,
 ):
     """List all items in a scene."""
     if scene_name is None:
-        scene_name = ctx.obj['obsws'].get_current_program_scene().scene_name
+        scene_name = api.scene.current(ctx.obj['obsws']).scene_name
 
-    resp = ctx.obj['obsws'].get_scene_item_list(scene_name)
-    items = sorted(
-        (
+    try:
+        items = api.sceneitem.list_(ctx.obj['obsws'], scene_name)
+    except api.APIError as e:
+        console.api_error(e)
+        raise typer.Exit(1)
+
+    if console.raw_output(ctx):
+        console.write_records(
+            ctx,
             (
-                item.get('sceneItemId'),
-                item.get('sourceName'),
-                item.get('isGroup'),
-                item.get('sceneItemEnabled'),
-                item.get('sourceUuid', 'N/A'),  # Include source UUID
-            )
-            for item in resp.scene_items
-        ),
-        key=lambda x: x[0],  # Sort by sceneItemId
-    )
+                'sceneItemId',
+                'sourceName',
+                'groupName',
+                'sceneItemEnabled',
+                'sourceUuid',
+            ),
+            (
+                {
+                    'sceneItemId': item.item_id,
+                    'sourceName': item.source_name,
+                    'groupName': item.group_name,
+                    'sceneItemEnabled': item.enabled,
+                    'sourceUuid': item.source_uuid,
+                }
+                for item in items
+            ),
+        )
+        return
 
     if not items:
         console.out.print(
@@ -54,11 +67,6 @@ def list_(
         )
         raise typer.Exit()
 
-    table = Table(
-        title=f'Items in Scene: {scene_name}',
-        padding=(0, 2),
-        border_style=ctx.obj['style'].border,
-    )
     if uuid:
         columns = [
             ('Item ID', 'center', ctx.obj['style'].column),
@@ -74,116 +82,39 @@ def list_(
             ('In Group', 'left', ctx.obj['style'].column),
             ('Enabled', 'center', None),
         ]
-    # Add columns to the table
-    for heading, justify, style in columns:
-        table.add_column(heading, justify=justify, style=style)
-
-    for item_id, item_name, is_group, is_enabled, source_uuid in items:
-        if is_group:
-            resp = ctx.obj['obsws'].get_group_scene_item_list(item_name)
-            group_items = sorted(
-                (
-                    (
-                        gi.get('sceneItemId'),
-                        gi.get('sourceName'),
-                        gi.get('sceneItemEnabled'),
-                        gi.get('sourceUuid', 'N/A'),  # Include source UUID
-                    )
-                    for gi in resp.scene_items
-                ),
-                key=lambda x: x[0],  # Sort by sceneItemId
+    table = console.table(ctx, f'Items in Scene: {scene_name}', columns)
+
+    for item in items:
+        if uuid:
+            table.add_row(
+                str(item.item_id),
+                item.source_name,
+                item.group_name or '',
+                util.check_mark(item.enabled),
+                item.source_uuid,
             )
-            for (
-                group_item_id,
-                group_item_name,
-                group_item_enabled,
-                group_item_source_uuid,
-            ) in group_items:
-                if uuid:
-                    table.add_row(
-                        str(group_item_id),
-                        group_item_name,
-                        item_name,
-                        util.check_mark(is_enabled and group_item_enabled),
-                        group_item_source_uuid,
-                    )
-                else:
-                    table.add_row(
-                        str(group_item_id),
-                        group_item_name,
-                        item_name,
-                        util.check_mark(is_enabled and group_item_enabled),
-                    )
         else:
-            if uuid:
-                table.add_row(
-                    str(item_id),
-                    item_name,
-                    '',
-                    util.check_mark(is_enabled),
-                    source_uuid,
-                )
-            else:
-                table.add_row(
-                    str(item_id),
-                    item_name,
-                    '',
-                    util.check_mark(is_enabled),
-                )
-
-    console.out.print(table)
-
-
-def _validate_sources(
-    ctx: typer.Context,
-    scene_name: str,
-    item_name: str,
-    group: Optional[str] = None,
-) -> bool:
-    """Validate the scene name and item name."""
-    if not validate.scene_in_scenes(ctx, scene_name):
-        console.err.print(f'Scene [yellow]{scene_name}[/yellow] not found.')
-        return False
-
-    if group:
-        if not validate.item_in_scene_item_list(ctx, scene_name, group):
-            console.err.print(
-                f'Group [yellow]{group}[/yellow] not found in scene [yellow]{scene_name}[/yellow].'
+            table.add_row(
+                str(item.item_id),
+                item.source_name,
+                item.group_name or '',
+                util.check_mark(item.enabled),
             )
-            return False
-    else:
-        if not validate.item_in_scene_item_list(ctx, scene_name, item_name):
-            console.err.print(
-                f'Item [yellow]{item_name}[/yellow] not found in scene [yellow]{scene_name}[/yellow]. Is the item in a group? '
-                f'If so use the [yellow]--group[/yellow] option to specify the parent group.\n'
-                'Use [yellow]obsws-cli sceneitem ls[/yellow] for a list of items in the scene.'
-            )
-            return False
 
-    return True
+    console.out.print(table)
 
 
-def _get_scene_name_and_item_id(
-    ctx: typer.Context, scene_name: str, item_name: str, group: Optional[str] = None
-):
-    """Get the scene name and item ID for the given scene and item name."""
-    if group:
-        resp = ctx.obj['obsws'].get_group_scene_item_list(group)
-        for item in resp.scene_items:
-            if item.get('sourceName') == item_name:
-                scene_name = group
-                scene_item_id = item.get('sceneItemId')
-                break
-        else:
-            console.err.print(
-                f'Item [yellow]{item_name}[/yellow] not found in group [yellow]{group}[/yellow].'
-            )
-            raise typer.Exit(1)
-    else:
-        resp = ctx.obj['obsws'].get_scene_item_id(scene_name, item_name)
-        scene_item_id = resp.scene_item_id
-
-    return scene_name, scene_item_id
+def _describe(ctx: typer.Context, state) -> str:
+    """Describe where an item is, naming its group only if it is in one."""
+    if state.group:
+        return (
+            f'Item {console.highlight(ctx, state.item_name)} in group {console.highlight(ctx, state.group)} '
+            f'in scene {console.highlight(ctx, state.scene_name)}'
+        )
+    return (
+        f'Item {console.highlight(ctx, state.item_name)} in scene '
+        f'{console.highlight(ctx, state.scene_name)}'
+    )
 
 
 @app.command('show')
@@ -191,42 +122,36 @@ def _get_scene_name_and_item_id(
 def show(
     ctx: typer.Context,
     scene_name: Annotated[
-        str, typer.Argument(..., show_default=False, help='Scene name the item is in')
+        str,
+        typer.Argument(
+            ...,
+            autocompletion=names.complete_scenes,
+            show_default=False,
+            help='Scene name the item is in',
+        ),
     ],
     item_name: Annotated[
         str,
-        typer.Argument(..., show_default=False, help='Item name to show in the scene'),
+        typer.Argument(
+            ...,
+            autocompletion=names.complete_items,
+            show_default=False,
+            help='Item name to show in the scene',
+        ),
     ],
-    group: Annotated[Optional[str], typer.Option(help='Parent group name')] = None,
+    group: Annotated[
+        Optional[str],
+        typer.Option(autocompletion=names.complete_groups, help='Parent group name'),
+    ] = None,
 ):
     """Show an item in a scene."""
-    if not _validate_sources(ctx, scene_name, item_name, group):
+    try:
+        state = api.sceneitem.show(ctx.obj['obsws'], scene_name, item_name, group)
+    except api.APIError as e:
+        console.api_error(e)
         raise typer.Exit(1)
 
-    old_scene_name = scene_name
-    scene_name, scene_item_id = _get_scene_name_and_item_id(
-        ctx, scene_name, item_name, group
-    )
-
-    ctx.obj['obsws'].set_scene_item_enabled(
-        scene_name=scene_name,
-        item_id=int(scene_item_id),
-        enabled=True,
-    )
-
-    if group:
-        console.out.print(
-            f'Item {console.highlight(ctx, item_name)} in group {console.highlight(ctx, group)} '
-            f'in scene {console.highlight(ctx, old_scene_name)} has been shown.'
-        )
-    else:
-        # If not in a parent group, just show the scene name
-        # This is to avoid confusion with the parent group name
-        # which is not the same as the scene name
-        # and is not needed in this case
-        console.out.print(
-            f'Item {console.highlight(ctx, item_name)} in scene {console.highlight(ctx, scene_name)} has been shown.'
-        )
+    console.out.print(f'{_describe(ctx, state)} has been shown.')
 
 
 @app.command('hide')
@@ -234,41 +159,36 @@ def show(
 def hide(
     ctx: typer.Context,
     scene_name: Annotated[
-        str, typer.Argument(..., show_default=False, help='Scene name the item is in')
+        str,
+        typer.Argument(
+            ...,
+            autocompletion=names.complete_scenes,
+            show_default=False,
+            help='Scene name the item is in',
+        ),
     ],
     item_name: Annotated[
         str,
-        typer.Argument(..., show_default=False, help='Item name to hide in the scene'),
+        typer.Argument(
+            ...,
+            autocompletion=names.complete_items,
+            show_default=False,
+            help='Item name to hide in the scene',
+        ),
     ],
-    group: Annotated[Optional[str], typer.Option(help='Parent group name')] = None,
+    group: Annotated[
+        Optional[str],
+        typer.Option(autocompletion=names.complete_groups, help='Parent group name'),
+    ] = None,
 ):
     """Hide an item in a scene."""
-    if not _validate_sources(ctx, scene_name, item_name, group):
+    try:
+        state = api.sceneitem.hide(ctx.obj['obsws'], scene_name, item_name, group)
+    except api.APIError as e:
+        console.api_error(e)
         raise typer.Exit(1)
 
-    old_scene_name = scene_name
-    scene_name, scene_item_id = _get_scene_name_and_item_id(
-        ctx, scene_name, item_name, group
-    )
-
-    ctx.obj['obsws'].set_scene_item_enabled(
-        scene_name=scene_name,
-        item_id=int(scene_item_id),
-        enabled=False,
-    )
-
-    if group:
-        console.out.print(
-            f'Item {console.highlight(ctx, item_name)} in group {console.highlight(ctx, group)} in scene {console.highlight(ctx, old_scene_name)} has been hidden.'
-        )
-    else:
-        # If not in a parent group, just show the scene name
-        # This is to avoid confusion with the parent group name
-        # which is not the same as the scene name
-        # and is not needed in this case
-        console.out.print(
-            f'Item {console.highlight(ctx, item_name)} in scene {console.highlight(ctx, scene_name)} has been hidden.'
-        )
+    console.out.print(f'{_describe(ctx, state)} has been hidden.')
 
 
 @app.command('toggle')
@@ -276,122 +196,105 @@ def hide(
 def toggle(
     ctx: typer.Context,
     scene_name: Annotated[
-        str, typer.Argument(..., show_default=False, help='Scene name the item is in')
+        str,
+        typer.Argument(
+            ...,
+            autocompletion=names.complete_scenes,
+            show_default=False,
+            help='Scene name the item is in',
+        ),
     ],
     item_name: Annotated[
         str,
         typer.Argument(
-            ..., show_default=False, help='Item name to toggle in the scene'
+            ...,
+            autocompletion=names.complete_items,
+            show_default=False,
+            help='Item name to toggle in the scene',
         ),
     ],
-    group: Annotated[Optional[str], typer.Option(help='Parent group name')] = None,
+    group: Annotated[
+        Optional[str],
+        typer.Option(autocompletion=names.complete_groups, help='Parent group name'),
+    ] = None,
 ):
     """Toggle an item in a scene."""
-    if not _validate_sources(ctx, scene_name, item_name, group):
+    try:
+        state = api.sceneitem.toggle(ctx.obj['obsws'], scene_name, item_name, group)
+    except api.APIError as e:
+        console.api_error(e)
         raise typer.Exit(1)
 
-    old_scene_name = scene_name
-    scene_name, scene_item_id = _get_scene_name_and_item_id(
-        ctx, scene_name, item_name, group
-    )
-
-    enabled = ctx.obj['obsws'].get_scene_item_enabled(
-        scene_name=scene_name,
-        item_id=int(scene_item_id),
-    )
-    new_state = not enabled.scene_item_enabled
-
-    ctx.obj['obsws'].set_scene_item_enabled(
-        scene_name=scene_name,
-        item_id=int(scene_item_id),
-        enabled=new_state,
+    console.out.print(
+        f'{_describe(ctx, state)} has been {"shown" if state.enabled else "hidden"}.'
     )
 
-    if group:
-        if new_state:
-            console.out.print(
-                f'Item {console.highlight(ctx, item_name)} in group {console.highlight(ctx, group)} '
-                f'in scene {console.highlight(ctx, old_scene_name)} has been shown.'
-            )
-        else:
-            console.out.print(
-                f'Item {console.highlight(ctx, item_name)} in group {console.highlight(ctx, group)} '
-                f'in scene {console.highlight(ctx, old_scene_name)} has been hidden.'
-            )
-    else:
-        # If not in a parent group, just show the scene name
-        # This is to avoid confusion with the parent group name
-        # which is not the same as the scene name
-        # and is not needed in this case
-        if new_state:
-            console.out.print(
-                f'Item {console.highlight(ctx, item_name)} in scene {console.highlight(ctx, scene_name)} has been shown.'
-            )
-        else:
-            console.out.print(
-                f'Item {console.highlight(ctx, item_name)} in scene {console.highlight(ctx, scene_name)} has been hidden.'
-            )
-
 
 @app.command('visible')
 @app.command('v', hidden=True)
 def visible(
     ctx: typer.Context,
     scene_name: Annotated[
-        str, typer.Argument(..., show_default=False, help='Scene name the item is in')
+        str,
+        typer.Argument(
+            ...,
+            autocompletion=names.complete_scenes,
+            show_default=False,
+            help='Scene name the item is in',
+        ),
     ],
     item_name: Annotated[
         str,
         typer.Argument(
-            ..., show_default=False, help='Item name to check visibility in the scene'
+            ...,
+            autocompletion=names.complete_items,
+            show_default=False,
+            help='Item name to check visibility in the scene',
         ),
     ],
-    group: Annotated[Optional[str], typer.Option(help='Parent group name')] = None,
+    group: Annotated[
+        Optional[str],
+        typer.Option(autocompletion=names.complete_groups, help='Parent group name'),
+    ] = None,
 ):
     """Check if an item in a scene is visible."""
-    if not _validate_sources(ctx, scene_name, item_name, group):
+    try:
+        state = api.sceneitem.visible(ctx.obj['obsws'], scene_name, item_name, group)
+    except api.APIError as e:
+        console.api_error(e)
         raise typer.Exit(1)
 
-    old_scene_name = scene_name
-    scene_name, scene_item_id = _get_scene_name_and_item_id(
-        ctx, scene_name, item_name, group
+    console.out.print(
+        f'{_describe(ctx, state)} is currently {"visible" if state.enabled else "hidden"}.'
     )
 
-    enabled = ctx.obj['obsws'].get_scene_item_enabled(
-        scene_name=scene_name,
-        item_id=int(scene_item_id),
-    )
-
-    if group:
-        console.out.print(
-            f'Item {console.highlight(ctx, item_name)} in group {console.highlight(ctx, group)} '
-            f'in scene {console.highlight(ctx, old_scene_name)} is currently {"visible" if enabled.scene_item_enabled else "hidden"}.'
-        )
-    else:
-        # If not in a parent group, just show the scene name
-        # This is to avoid confusion with the parent group name
-        # which is not the same as the scene name
-        # and is not needed in this case
-        console.out.print(
-            f'Item {console.highlight(ctx, item_name)} in scene {console.highlight(ctx, scene_name)} '
-            f'is currently {"visible" if enabled.scene_item_enabled else "hidden"}.'
-        )
-
 
 @app.command('transform')
 @app.command('t', hidden=True)
 def transform(
     ctx: typer.Context,
     scene_name: Annotated[
-        str, typer.Argument(..., show_default=False, help='Scene name the item is in')
+        str,
+        typer.Argument(
+            ...,
+            autocompletion=names.complete_scenes,
+            show_default=False,
+            help='Scene name the item is in',
+        ),
     ],
     item_name: Annotated[
         str,
         typer.Argument(
-            ..., show_default=False, help='Item name to transform in the scene'
+            ...,
+            autocompletion=names.complete_items,
+            show_default=False,
+            help='Item name to transform in the scene',
         ),
     ],
-    group: Annotated[Optional[str], typer.Option(help='Parent group name')] = None,
+    group: Annotated[
+        Optional[str],
+        typer.Option(autocompletion=names.complete_groups, help='Parent group name'),
+    ] = None,
     alignment: Annotated[
         Optional[int], typer.Option(help='Alignment of the item in the scene')
     ] = None,
@@ -439,14 +342,6 @@ def transform(
     ] = None,
 ):
     """Set the transform of an item in a scene."""
-    if not _validate_sources(ctx, scene_name, item_name, group):
-        raise typer.Exit(1)
-
-    old_scene_name = scene_name
-    scene_name, scene_item_id = _get_scene_name_and_item_id(
-        ctx, scene_name, item_name, group
-    )
-
     transform = {}
     if alignment is not None:
         transform['alignment'] = alignment
@@ -483,22 +378,12 @@ def transform(
         console.err.print('No transform options provided.')
         raise typer.Exit(1)
 
-    transform = ctx.obj['obsws'].set_scene_item_transform(
-        scene_name=scene_name,
-        item_id=int(scene_item_id),
-        transform=transform,
-    )
-
-    if group:
-        console.out.print(
-            f'Item {console.highlight(ctx, item_name)} in group {console.highlight(ctx, group)} '
-            f'in scene {console.highlight(ctx, old_scene_name)} has been transformed.'
-        )
-    else:
-        # If not in a parent group, just show the scene name
-        # This is to avoid confusion with the parent group name
-        # which is not the same as the scene name
-        # and is not needed in this case
-        console.out.print(
-            f'Item {console.highlight(ctx, item_name)} in scene {console.highlight(ctx, scene_name)} has been transformed.'
+    try:
+        state = api.sceneitem.transform(
+            ctx.obj['obsws'], scene_name, item_name, transform, group
         )
+    except api.APIError as e:
+        console.api_error(e)
+        raise typer.Exit(1)
+
+    console.out.print(f'{_describe(ctx, state)} has been transformed.')
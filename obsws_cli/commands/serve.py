@@ -0,0 +1,249 @@
+"""module containing commands for serving OBS to other programs."""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated, Optional
+
+import obsws_python as obsws
+import typer
+
+# the servers are imported by the commands running them, so the CLI does
+# not import them for every other command
+from obsws_cli import console, launcher
+
+if TYPE_CHECKING:
+    from obsws_cli import reconnect
+
+app = typer.Typer()
+
+
+@app.callback()
+def main():
+    """Serve OBS to other programs over a single connection."""
+
+
+def _parse_bind(value: str) -> Optional[tuple[str, int]]:
+    """Parse a HOST:PORT address, an empty string disables listening."""
+    if not value:
+        return None
+    host, _, port = value.rpartition(':')
+    try:
+        return host or '127.0.0.1', int(port)
+    except ValueError:
+        raise typer.BadParameter(f'Expected HOST:PORT, got {value!r}') from None
+
+
+@app.command('daemon')
+@app.command('d', hidden=True)
+def daemon_(
+    ctx: typer.Context,
+    socket_path: Annotated[
+        Optional[str],
+        typer.Option(
+            '--socket',
+            envvar='OBSWS_CLI_SOCKET',
+            show_default=launcher.default_socket_path(),
+            help='Unix socket to listen on, an empty string to not listen on one',
+        ),
+    ] = None,
+    bind: Annotated[
+        str,
+        typer.Option(
+            help='HOST:PORT to accept WebSocket clients on, an empty string to not listen',
+        ),
+    ] = '127.0.0.1:4456',
+    password: Annotated[
+        Optional[str],
+        typer.Option(
+            show_default='The OBS password',
+            help='Password WebSocket clients must authenticate with',
+        ),
+    ] = None,
+    queue_size: Annotated[
+        int,
+        typer.Option(
+            min=1,
+            help='Messages queued for a client before its events are dropped',
+        ),
+    ] = 1024,
+    inventory_path: Annotated[
+        Optional[str],
+        typer.Option(
+            '--inventory',
+            envvar='OBSWS_CLI_INVENTORY',
+            show_default='Next to the default socket, named for the OBS host',
+            help='File to publish the scene and input snapshot to, an empty string to not publish one',
+        ),
+    ] = None,
+):
+    """Multiplex many local clients onto this connection to OBS."""
+    from obsws_cli import daemon, inventory
+
+    if socket_path is None:
+        socket_path = launcher.default_socket_path()
+    if inventory_path is None:
+        connection = ctx.obj['connection']
+        inventory_path = str(
+            inventory.default_path(connection['host'], connection['port'])
+        )
+    if not socket_path and not bind:
+        raise typer.BadParameter('Give a --socket or --bind address to listen on.')
+    mux = daemon.Daemon(
+        ctx.obj['connection'],
+        ctx.obj['protocol'],
+        Path(socket_path) if socket_path else None,
+        _parse_bind(bind),
+        password,
+        queue_size,
+        upstream=ctx.obj['obsws'].base_client,
+        inventory_path=Path(inventory_path) if inventory_path else None,
+        # forwarded requests are traced and counted for --stats as the client's own
+        on_response=ctx.obj['obsws']._record,
+    )
+    try:
+        mux.start()
+    except daemon.DaemonError as e:
+        console.err.print(str(e))
+        raise typer.Exit(1)
+
+    listening = []
+    if mux.socket_path is not None:
+        listening.append(console.highlight(ctx, mux.socket_path))
+    if mux.port is not None:
+        listening.append(console.highlight(ctx, f'ws://{mux.bind[0]}:{mux.port}'))
+    console.out.print(
+        f'Serving OBS on {" and ".join(listening)}. Press Ctrl+C to stop.'
+    )
+    try:
+        mux.wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        mux.stop()
+        console.info.print(f'Served {mux.requests} requests and {mux.events} events.')
+
+
+def _stay_connected(ctx: typer.Context, session: 'reconnect.Session'):
+    """Reconnect the session whenever the connection to OBS is lost, until interrupted."""
+    while True:
+        while session.alive:
+            session.event_client.worker.join(0.5)
+        console.err.print('Lost the connection to OBS, reconnecting.')
+        session.reconnect()
+        ctx.obj['obsws'] = session.req_client
+        console.info.print(
+            f'Reconnected to OBS, {session.reconnects} reconnects with '
+            f'{session.downtime:.2f}s of downtime so far.'
+        )
+
+
+@app.command('http')
+@app.command('h', hidden=True)
+def http(
+    ctx: typer.Context,
+    bind: Annotated[
+        str,
+        typer.Option(help='HOST:PORT to accept HTTP requests on'),
+    ] = '127.0.0.1:4457',
+    token: Annotated[
+        Optional[str],
+        typer.Option(
+            envvar='OBSWS_CLI_HTTP_TOKEN',
+            help='Require requests to send Authorization: Bearer TOKEN',
+        ),
+    ] = None,
+):
+    """Control OBS with HTTP requests over this connection."""
+    from obsws_cli import gateway, reconnect
+
+    address = _parse_bind(bind)
+    if address is None:
+        raise typer.BadParameter('Give a --bind address to listen on.')
+
+    session = reconnect.Session(
+        ctx.obj['connection'],
+        obsws.Subs.LOW_VOLUME,
+        ctx.obj['protocol'],
+        req_client=ctx.obj['obsws'],
+    )
+    ctx.call_on_close(session.close)
+    gw = gateway.Gateway(session)
+    session.connect()
+    try:
+        gw.start(address, token)
+    except OSError as e:
+        console.err.print(f'Could not listen on [yellow]{bind}[/yellow]: {e}')
+        raise typer.Exit(1)
+
+    console.out.print(
+        f'Serving OBS on {console.highlight(ctx, f"http://{address[0]}:{gw.port}")}. '
+        'Press Ctrl+C to stop.'
+    )
+    try:
+        _stay_connected(ctx, session)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        gw.stop()
+        console.info.print(f'Served {gw.requests} requests.')
+
+
+@app.command('osc')
+@app.command('o', hidden=True)
+def osc_(
+    ctx: typer.Context,
+    bind: Annotated[
+        str,
+        typer.Option(help='HOST:PORT to receive OSC messages on'),
+    ] = '127.0.0.1:9000',
+    feedback: Annotated[
+        Optional[str],
+        typer.Option(
+            show_default=False,
+            help='HOST:PORT to send volume, mute and scene changes to as OSC',
+        ),
+    ] = None,
+    meters: Annotated[
+        bool,
+        typer.Option(help='Also send the input meters to the feedback address'),
+    ] = False,
+):
+    """Control OBS with OSC messages over this connection."""
+    from obsws_cli import osc, reconnect
+
+    address = _parse_bind(bind)
+    if address is None:
+        raise typer.BadParameter('Give a --bind address to listen on.')
+    feedback_address = _parse_bind(feedback) if feedback else None
+    if meters and feedback_address is None:
+        raise typer.BadParameter('--meters requires a --feedback address.')
+
+    session = reconnect.Session(
+        ctx.obj['connection'],
+        osc.subscriptions(meters),
+        ctx.obj['protocol'],
+        req_client=ctx.obj['obsws'],
+    )
+    ctx.call_on_close(session.close)
+    bridge = osc.Bridge(session, feedback_address)
+    session.connect()
+    try:
+        bridge.start(address)
+    except OSError as e:
+        console.err.print(f'Could not listen on [yellow]{bind}[/yellow]: {e}')
+        raise typer.Exit(1)
+
+    console.out.print(
+        f'Receiving OSC on {console.highlight(ctx, f"udp://{address[0]}:{bridge.port}")}, '
+        f'sending once every {console.highlight(ctx, f"{bridge.frame_interval * 1000:.2f}")} ms. '
+        'Press Ctrl+C to stop.'
+    )
+    try:
+        _stay_connected(ctx, session)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        bridge.stop()
+        console.info.print(
+            f'Received {bridge.received} messages, coalesced {bridge.coalesced} '
+            f'and sent {bridge.sent} requests, {bridge.failed} failed.'
+        )
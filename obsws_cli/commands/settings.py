@@ -3,19 +3,74 @@
 from typing import Annotated, Optional
 
 import typer
-from rich.table import Table
-from rich.text import Text
 
 from obsws_cli import console, util
 
 app = typer.Typer()
 
+PROFILE_PARAMETERS = [
+    ('Output', 'Mode', 'Output Mode'),
+    ('SimpleOutput', 'StreamEncoder', 'Simple Streaming Encoder'),
+    ('SimpleOutput', 'RecEncoder', 'Simple Recording Encoder'),
+    ('SimpleOutput', 'RecFormat2', 'Simple Recording Video Format'),
+    ('SimpleOutput', 'RecAudioEncoder', 'Simple Recording Audio Format'),
+    ('SimpleOutput', 'RecQuality', 'Simple Recording Quality'),
+    ('AdvOut', 'Encoder', 'Advanced Streaming Encoder'),
+    ('AdvOut', 'RecEncoder', 'Advanced Recording Encoder'),
+    ('AdvOut', 'RecType', 'Advanced Recording Type'),
+    ('AdvOut', 'RecFormat2', 'Advanced Recording Video Format'),
+    ('AdvOut', 'RecAudioEncoder', 'Advanced Recording Audio Format'),
+]
+
 
 @app.callback()
 def main():
     """Manage OBS settings."""
 
 
+def _profile_parameters(ctx: typer.Context) -> list:
+    """Get the value of each of PROFILE_PARAMETERS, looking them up at once."""
+    responses = ctx.obj['obsws'].gather(
+        [
+            (
+                'GetProfileParameter',
+                {'parameterCategory': category, 'parameterName': name},
+            )
+            for category, name, _ in PROFILE_PARAMETERS
+        ]
+    )
+    return [
+        (category, name, display_name, resp.parameter_value)
+        for (category, name, display_name), resp in zip(PROFILE_PARAMETERS, responses)
+    ]
+
+
+def _settings_records(ctx: typer.Context, video: bool, record: bool, profile: bool):
+    """Yield raw records for the requested settings sections."""
+    if video:
+        for setting, value in (
+            ctx.obj['obsws'].send('GetVideoSettings', raw=True).items()
+        ):
+            yield {'section': 'video', 'setting': setting, 'value': value}
+
+    if record:
+        resp = ctx.obj['obsws'].get_record_directory()
+        yield {
+            'section': 'record',
+            'setting': 'recordDirectory',
+            'value': resp.record_directory,
+        }
+
+    if profile:
+        for category, name, _, value in _profile_parameters(ctx):
+            if value is not None:
+                yield {
+                    'section': 'profile',
+                    'setting': f'{category}.{name}',
+                    'value': value,
+                }
+
+
 @app.command('show')
 @app.command('sh', hidden=True)
 def show(
@@ -36,23 +91,20 @@ def show(
         record = True
         profile = True
 
+    if console.raw_output(ctx):
+        console.write_records(
+            ctx,
+            ('section', 'setting', 'value'),
+            _settings_records(ctx, video, record, profile),
+        )
+        return
+
     resp = ctx.obj['obsws'].get_video_settings()
-    video_table = Table(
-        title='Video Settings',
-        padding=(0, 2),
-        border_style=ctx.obj['style'].border,
-    )
     video_columns = (
         ('Setting', 'left', ctx.obj['style'].column),
         ('Value', 'left', ctx.obj['style'].column),
     )
-
-    for header_text, justify, style in video_columns:
-        video_table.add_column(
-            Text(header_text, justify='center'),
-            justify=justify,
-            style=style,
-        )
+    video_table = console.table(ctx, 'Video Settings', video_columns)
 
     for setting in resp.attrs():
         video_table.add_row(
@@ -65,21 +117,11 @@ def show(
         console.out.print(video_table)
 
     resp = ctx.obj['obsws'].get_record_directory()
-    record_table = Table(
-        title='Recording Settings',
-        padding=(0, 2),
-        border_style=ctx.obj['style'].border,
-    )
     record_columns = (
         ('Setting', 'left', ctx.obj['style'].column),
         ('Value', 'left', ctx.obj['style'].column),
     )
-    for header_text, justify, style in record_columns:
-        record_table.add_column(
-            Text(header_text, justify='center'),
-            justify=justify,
-            style=style,
-        )
+    record_table = console.table(ctx, 'Recording Settings', record_columns)
 
     record_table.add_row(
         'Directory',
@@ -90,45 +132,17 @@ def show(
     if record:
         console.out.print(record_table)
 
-    profile_table = Table(
-        title='Profile Settings',
-        padding=(0, 2),
-        border_style=ctx.obj['style'].border,
-    )
     profile_columns = (
         ('Setting', 'left', ctx.obj['style'].column),
         ('Value', 'left', ctx.obj['style'].column),
     )
-    for header_text, justify, style in profile_columns:
-        profile_table.add_column(
-            Text(header_text, justify='center'),
-            justify=justify,
-            style=style,
-        )
+    profile_table = console.table(ctx, 'Profile Settings', profile_columns)
 
-    params = [
-        ('Output', 'Mode', 'Output Mode'),
-        ('SimpleOutput', 'StreamEncoder', 'Simple Streaming Encoder'),
-        ('SimpleOutput', 'RecEncoder', 'Simple Recording Encoder'),
-        ('SimpleOutput', 'RecFormat2', 'Simple Recording Video Format'),
-        ('SimpleOutput', 'RecAudioEncoder', 'Simple Recording Audio Format'),
-        ('SimpleOutput', 'RecQuality', 'Simple Recording Quality'),
-        ('AdvOut', 'Encoder', 'Advanced Streaming Encoder'),
-        ('AdvOut', 'RecEncoder', 'Advanced Recording Encoder'),
-        ('AdvOut', 'RecType', 'Advanced Recording Type'),
-        ('AdvOut', 'RecFormat2', 'Advanced Recording Video Format'),
-        ('AdvOut', 'RecAudioEncoder', 'Advanced Recording Audio Format'),
-    ]
-
-    for category, name, display_name in params:
-        resp = ctx.obj['obsws'].get_profile_parameter(
-            category=category,
-            name=name,
-        )
-        if resp.parameter_value is not None:
+    for _, _, display_name, value in _profile_parameters(ctx):
+        if value is not None:
             profile_table.add_row(
                 display_name,
-                str(resp.parameter_value),
+                str(value),
                 style='' if profile_table.row_count % 2 == 0 else 'dim',
             )
 
@@ -206,21 +220,23 @@ def stream_service(
     """Get/set OBS stream service settings."""
     if type_ is None:
         resp = ctx.obj['obsws'].get_stream_service_settings()
-        table = Table(
-            title='Stream Service Settings',
-            padding=(0, 2),
-            border_style=ctx.obj['style'].border,
-        )
+        if console.raw_output(ctx):
+            console.write_records(
+                ctx,
+                ('setting', 'value'),
+                [{'setting': 'streamServiceType', 'value': resp.stream_service_type}]
+                + [
+                    {'setting': setting, 'value': value}
+                    for setting, value in resp.stream_service_settings.items()
+                ],
+            )
+            return
+
         columns = (
             ('Setting', 'left', ctx.obj['style'].column),
             ('Value', 'left', ctx.obj['style'].column),
         )
-        for header_text, justify, style in columns:
-            table.add_column(
-                Text(header_text, justify='center'),
-                justify=justify,
-                style=style,
-            )
+        table = console.table(ctx, 'Stream Service Settings', columns)
         table.add_row(
             'Type',
             resp.stream_service_type,
@@ -291,22 +307,25 @@ def video(
             fps_den,
         ]
     ):
+        if console.raw_output(ctx):
+            console.write_records(
+                ctx,
+                ('setting', 'value'),
+                (
+                    {'setting': setting, 'value': value}
+                    for setting, value in ctx.obj['obsws']
+                    .send('GetVideoSettings', raw=True)
+                    .items()
+                ),
+            )
+            return
+
         resp = ctx.obj['obsws'].get_video_settings()
-        table = Table(
-            title='Video Settings',
-            padding=(0, 2),
-            border_style=ctx.obj['style'].border,
-        )
         columns = (
             ('Setting', 'left', ctx.obj['style'].column),
             ('Value', 'left', ctx.obj['style'].column),
         )
-        for header_text, justify, style in columns:
-            table.add_column(
-                Text(header_text, justify='center'),
-                justify=justify,
-                style=style,
-            )
+        table = console.table(ctx, 'Video Settings', columns)
         for setting in resp.attrs():
             table.add_row(
                 util.snakecase_to_titlecase(setting),
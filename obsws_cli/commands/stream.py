@@ -2,10 +2,13 @@
 
 import typer
 
-from obsws_cli import console
+from obsws_cli import console, events
 
 app = typer.Typer()
 
+WAIT_START, WAIT_START_TIMEOUT = events.wait_options('the stream', 'start')
+WAIT_STOP, WAIT_STOP_TIMEOUT = events.wait_options('the stream', 'stop')
+
 
 @app.callback()
 def main():
@@ -20,26 +23,60 @@ def _get_streaming_status(ctx: typer.Context) -> tuple:
 
 @app.command('start')
 @app.command('s', hidden=True)
-def start(ctx: typer.Context):
+def start(
+    ctx: typer.Context,
+    wait: WAIT_START = False,
+    wait_timeout: WAIT_START_TIMEOUT = events.WAIT_TIMEOUT,
+):
     """Start streaming."""
     active, _ = _get_streaming_status(ctx)
     if active:
         console.err.print('Streaming is already in progress, cannot start.')
         raise typer.Exit(1)
 
+    if wait:
+        _, elapsed = events.wait_for_output_state(
+            ctx,
+            ctx.obj['obsws'].start_stream,
+            'StreamStateChanged',
+            events.OUTPUT_STARTED,
+            wait_timeout,
+        )
+        console.out.print(
+            f'Streaming started successfully after {console.highlight(ctx, f"{elapsed:.3f}")} seconds.'
+        )
+        return
+
     ctx.obj['obsws'].start_stream()
     console.out.print('Streaming started successfully.')
 
 
 @app.command('stop')
 @app.command('st', hidden=True)
-def stop(ctx: typer.Context):
+def stop(
+    ctx: typer.Context,
+    wait: WAIT_STOP = False,
+    wait_timeout: WAIT_STOP_TIMEOUT = events.WAIT_TIMEOUT,
+):
     """Stop streaming."""
     active, _ = _get_streaming_status(ctx)
     if not active:
         console.err.print('Streaming is not in progress, cannot stop.')
         raise typer.Exit(1)
 
+    if wait:
+        _, elapsed = events.wait_for_output_state(
+            ctx,
+            ctx.obj['obsws'].stop_stream,
+            'StreamStateChanged',
+            events.OUTPUT_STOPPED,
+            wait_timeout,
+        )
+        console.out.print(
+            f'Streaming stopped successfully after {console.highlight(ctx, f"{elapsed:.3f}")} seconds.'
+        )
+        return
+
     ctx.obj['obsws'].stop_stream()
     console.out.print('Streaming stopped successfully.')
 
@@ -60,6 +97,14 @@ def toggle(ctx: typer.Context):
 def status(ctx: typer.Context):
     """Get streaming status."""
     active, duration = _get_streaming_status(ctx)
+    if console.raw_output(ctx):
+        console.write_records(
+            ctx,
+            ('outputActive', 'outputDuration'),
+            [{'outputActive': active, 'outputDuration': duration}],
+        )
+        return
+
     if active:
         if duration > 0:
             seconds = duration / 1000
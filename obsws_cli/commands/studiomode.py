@@ -46,6 +46,14 @@ def toggle(ctx: typer.Context):
 def status(ctx: typer.Context):
     """Get the status of studio mode."""
     resp = ctx.obj['obsws'].get_studio_mode_enabled()
+    if console.raw_output(ctx):
+        console.write_records(
+            ctx,
+            ('studioModeEnabled',),
+            [{'studioModeEnabled': resp.studio_mode_enabled}],
+        )
+        return
+
     if resp.studio_mode_enabled:
         console.out.print('Studio mode is enabled.')
     else:
@@ -2,10 +2,13 @@
 
 import typer
 
-from obsws_cli import console
+from obsws_cli import console, events
 
 app = typer.Typer()
 
+WAIT_START, WAIT_START_TIMEOUT = events.wait_options('the virtual camera', 'start')
+WAIT_STOP, WAIT_STOP_TIMEOUT = events.wait_options('the virtual camera', 'stop')
+
 
 @app.callback()
 def main():
@@ -14,16 +17,50 @@ def main():
 
 @app.command('start')
 @app.command('s', hidden=True)
-def start(ctx: typer.Context):
+def start(
+    ctx: typer.Context,
+    wait: WAIT_START = False,
+    wait_timeout: WAIT_START_TIMEOUT = events.WAIT_TIMEOUT,
+):
     """Start the virtual camera."""
+    if wait:
+        _, elapsed = events.wait_for_output_state(
+            ctx,
+            ctx.obj['obsws'].start_virtual_cam,
+            'VirtualcamStateChanged',
+            events.OUTPUT_STARTED,
+            wait_timeout,
+        )
+        console.out.print(
+            f'Virtual camera started after {console.highlight(ctx, f"{elapsed:.3f}")} seconds.'
+        )
+        return
+
     ctx.obj['obsws'].start_virtual_cam()
     console.out.print('Virtual camera started.')
 
 
 @app.command('stop')
 @app.command('p', hidden=True)
-def stop(ctx: typer.Context):
+def stop(
+    ctx: typer.Context,
+    wait: WAIT_STOP = False,
+    wait_timeout: WAIT_STOP_TIMEOUT = events.WAIT_TIMEOUT,
+):
     """Stop the virtual camera."""
+    if wait:
+        _, elapsed = events.wait_for_output_state(
+            ctx,
+            ctx.obj['obsws'].stop_virtual_cam,
+            'VirtualcamStateChanged',
+            events.OUTPUT_STOPPED,
+            wait_timeout,
+        )
+        console.out.print(
+            f'Virtual camera stopped after {console.highlight(ctx, f"{elapsed:.3f}")} seconds.'
+        )
+        return
+
     ctx.obj['obsws'].stop_virtual_cam()
     console.out.print('Virtual camera stopped.')
 
@@ -44,6 +81,12 @@ def toggle(ctx: typer.Context):
 def status(ctx: typer.Context):
     """Get the status of the virtual camera."""
     resp = ctx.obj['obsws'].get_virtual_cam_status()
+    if console.raw_output(ctx):
+        console.write_records(
+            ctx, ('outputActive',), [{'outputActive': resp.output_active}]
+        )
+        return
+
     if resp.output_active:
         console.out.print('Virtual camera is enabled.')
     else:
@@ -0,0 +1,298 @@
+"""module generating static shell completion scripts from the command manifest.
+
+Typer's own completion runs the CLI on every TAB press, importing every
+command module to find the next word. The scripts generated here carry
+the whole command, option and alias tree with them, so completing a
+command or flag runs no Python at all.
+
+Each script walks the words typed so far from the root of the tree to
+the command being completed, skipping the values of options that take
+one, then offers that command's subcommands, or its flags when the word
+being completed starts with a dash.
+
+Scene, input, item, group and filter names cannot be known in advance,
+so for the arguments and options taking one the scripts run
+
+    python -m obsws_cli.names --complete KIND INCOMPLETE [CONTAINER]
+
+which reads the names cache without importing the Typer app. The first
+argument typed is passed as the scene or source the names are in, so the
+items of a group given with --group are completed as those of its scene.
+The OBS is the one the root connection flags typed name, or else the
+settings.
+"""
+
+import shlex
+import sys
+from collections.abc import Iterator
+from typing import Any
+
+SHELLS = ('bash', 'zsh', 'fish')
+
+ROOT = 'root'
+
+# the root options naming the OBS to complete names from
+CONNECTION = ('host', 'port', 'password', 'timeout')
+
+BASH = """\
+# bash completion for obsws-cli, generated by obsws-cli completion generate
+_obsws_cli() {{
+    local cur=${{COMP_WORDS[COMP_CWORD]}} prev=${{COMP_WORDS[COMP_CWORD-1]}}
+    local node={root} word options commands i
+    local -a args env
+    for ((i = 1; i < COMP_CWORD; i++)); do
+        word=${{COMP_WORDS[i]}}
+        case "$node:$word" in
+{walk}
+            *:-*) ;;
+            *) args+=("$word") ;;
+        esac
+    done
+    case "$node:$prev" in
+{values}
+    esac
+    case $node in
+{words}
+    esac
+    if [[ $cur == -* ]]; then
+        COMPREPLY=($(compgen -W "$options" -- "$cur"))
+    elif [[ -n $commands ]]; then
+        COMPREPLY=($(compgen -W "$commands" -- "$cur"))
+    else
+        case "$node:${{#args[@]}}" in
+{arguments}
+        esac
+    fi
+}}
+_obsws_cli_names() {{
+    local name
+    while IFS= read -r name; do
+        COMPREPLY+=("$(printf %q "$name")")
+    done < <(env "${{env[@]}}" {python} -m obsws_cli.names --complete "$1" "$cur" "${{args[@]:0:1}}" 2>/dev/null)
+}}
+complete -o default -F _obsws_cli obsws-cli
+"""
+
+ZSH = """\
+# zsh completion for obsws-cli, generated by obsws-cli completion generate
+autoload -U +X bashcompinit && bashcompinit
+"""
+
+FISH = """\
+# fish completion for obsws-cli, generated by obsws-cli completion generate
+function __obsws_cli_node
+    set -l node {root}
+    set -l skip 0
+    set -g __obsws_cli_args
+    set -g __obsws_cli_env
+    for word in (commandline -opc)[2..-1]
+        if test $skip != 0
+            test $skip = 1; or set -a __obsws_cli_env $skip=$word
+            set skip 0
+            continue
+        end
+        switch "$node:$word"
+{walk}
+            case '*:-*'
+            case '*'
+                set -a __obsws_cli_args $word
+        end
+    end
+    echo $node
+end
+
+function __obsws_cli_at
+    test (__obsws_cli_node) = $argv[1]
+end
+
+function __obsws_cli_names
+    test (__obsws_cli_node) = $argv[1]; or return
+    test -z "$argv[3]"; or test (count $__obsws_cli_args) = $argv[3]; or return
+    env $__obsws_cli_env {python} -m obsws_cli.names --complete $argv[2] (commandline -ct) $__obsws_cli_args[1] 2>/dev/null
+end
+
+complete -c obsws-cli -f
+{completions}
+"""
+
+
+def _nodes(manifest: dict[str, Any]) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Walk the command tree, yielding each group and command with its node name."""
+    pending = [
+        (ROOT, {'options': manifest['options'], 'commands': manifest['commands']})
+    ]
+    while pending:
+        node, command = pending.pop(0)
+        yield node, command
+        for name, child in command.get('commands', {}).items():
+            pending.append((name if node == ROOT else f'{node}.{name}', child))
+
+
+def _options(command: dict[str, Any]) -> list[dict[str, Any]]:
+    """Get the options of a command offered for completion."""
+    return [option for option in command['options'] if not option['hidden']]
+
+
+def _patterns(node: str, words: list[str]) -> str:
+    """Make the case patterns matching any of the words typed at a node."""
+    return '|'.join(shlex.quote(f'{node}:{word}') for word in words)
+
+
+def _connection(node: str, option: dict[str, Any]) -> str:
+    """Get the setting a root option naming the OBS overrides, if it is one."""
+    if node == ROOT and option['name'] in CONNECTION:
+        return f'OBSWS_CLI_{option["name"].upper()}'
+    return ''
+
+
+def bash(manifest: dict[str, Any]) -> str:
+    """Generate the bash completion script."""
+    walk, values, words, arguments = [], [], [], []
+    for node, command in _nodes(manifest):
+        options = _options(command)
+        for option in options:
+            if setting := _connection(node, option):
+                walk.append(
+                    f'            {_patterns(node, option["flags"])}) '
+                    f'env+=("{setting}=${{COMP_WORDS[i+1]}}"); ((i++)) ;;'
+                )
+        takes_value = [
+            f
+            for o in options
+            if not o['is_flag'] and not _connection(node, o)
+            for f in o['flags']
+        ]
+        if takes_value:
+            walk.append(f'            {_patterns(node, takes_value)}) ((i++)) ;;')
+        for name, child in command.get('commands', {}).items():
+            child_node = name if node == ROOT else f'{node}.{name}'
+            walk.append(
+                f'            {_patterns(node, [name, *child["aliases"]])}) '
+                f'node={child_node} ;;'
+            )
+
+        for position, argument in enumerate(command.get('arguments', [])):
+            if 'completes' in argument:
+                arguments.append(
+                    f'            {node}:{position}) '
+                    f'_obsws_cli_names {argument["completes"]} ;;'
+                )
+
+        for option in options:
+            if 'completes' in option:
+                values.append(
+                    f'        {_patterns(node, option["flags"])}) '
+                    f'_obsws_cli_names {option["completes"]}; return ;;'
+                )
+            elif not option['is_flag']:
+                choices = shlex.quote(' '.join(option.get('choices', [])))
+                values.append(
+                    f'        {_patterns(node, option["flags"])}) '
+                    f'COMPREPLY=($(compgen -W {choices} -- "$cur")); return ;;'
+                )
+
+        flags = [f for o in options for f in (*o['flags'], *o['secondary'])]
+        words.append(
+            f'        {node}) '
+            f'options={shlex.quote(" ".join([*flags, "--help"]))} '
+            f'commands={shlex.quote(" ".join(command.get("commands", {})))} ;;'
+        )
+
+    return BASH.format(
+        root=ROOT,
+        walk='\n'.join(walk),
+        values='\n'.join(values),
+        words='\n'.join(words),
+        arguments='\n'.join(arguments),
+        python=shlex.quote(sys.executable),
+    )
+
+
+def zsh(manifest: dict[str, Any]) -> str:
+    """Generate the zsh completion script, the bash script run by bashcompinit."""
+    return ZSH + bash(manifest).split('\n', 1)[1]
+
+
+def _fish_quote(text: str) -> str:
+    """Quote text for fish, which only escapes backslashes and quotes in single quotes."""
+    return "'" + text.replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+
+def _fish_flag(flag: str) -> str:
+    """Turn a flag into the complete switch declaring it."""
+    if flag.startswith('--'):
+        return f'-l {flag[2:]}'
+    if len(flag) == 2:
+        return f'-s {flag[1:]}'
+    return f'-o {flag[1:]}'
+
+
+def fish(manifest: dict[str, Any]) -> str:
+    """Generate the fish completion script."""
+    walk, completions = [], []
+    for node, command in _nodes(manifest):
+        condition = f"-n '__obsws_cli_at {node}'"
+        options = _options(command)
+        for option in options:
+            if setting := _connection(node, option):
+                patterns = ' '.join(_fish_quote(f'{node}:{f}') for f in option['flags'])
+                walk.append(
+                    f'            case {patterns}\n                set skip {setting}'
+                )
+        takes_value = [
+            f
+            for o in options
+            if not o['is_flag'] and not _connection(node, o)
+            for f in o['flags']
+        ]
+        if takes_value:
+            patterns = ' '.join(_fish_quote(f'{node}:{f}') for f in takes_value)
+            walk.append(f'            case {patterns}\n                set skip 1')
+        for name, child in command.get('commands', {}).items():
+            child_node = name if node == ROOT else f'{node}.{name}'
+            patterns = ' '.join(
+                _fish_quote(f'{node}:{word}') for word in [name, *child['aliases']]
+            )
+            walk.append(
+                f'            case {patterns}\n                set node {child_node}'
+            )
+            completions.append(
+                f'complete -c obsws-cli {condition} -a {name} '
+                f'-d {_fish_quote(child["help"])}'
+            )
+
+        for option in options:
+            flags = ' '.join(
+                _fish_flag(f) for f in (*option['flags'], *option['secondary'])
+            )
+            if option['is_flag']:
+                value = ''
+            elif 'completes' in option:
+                value = f" -x -a '(__obsws_cli_names {node} {option['completes']})'"
+            elif option.get('choices'):
+                value = f' -x -a {_fish_quote(" ".join(option["choices"]))}'
+            else:
+                value = ' -r -F'
+            completions.append(
+                f'complete -c obsws-cli {condition} {flags}{value} '
+                f'-d {_fish_quote(option["help"])}'
+            )
+
+        for position, argument in enumerate(command.get('arguments', [])):
+            if 'completes' in argument:
+                completions.append(
+                    f'complete -c obsws-cli -a '
+                    f"'(__obsws_cli_names {node} {argument['completes']} {position})'"
+                )
+
+    return FISH.format(
+        root=ROOT,
+        walk='\n'.join(walk),
+        completions='\n'.join(completions),
+        python=_fish_quote(sys.executable),
+    )
+
+
+def generate(manifest: dict[str, Any], shell: str) -> str:
+    """Generate the completion script for a shell."""
+    return {'bash': bash, 'zsh': zsh, 'fish': fish}[shell](manifest)
@@ -1,12 +1,206 @@
-"""module for console output handling in obsws_cli."""
+"""module for console output handling in obsws_cli.
+
+rich is imported, and its consoles built, only once something needs rendering.
+Plain messages are written directly when colour is disabled or the stream
+is not a terminal.
+"""
+
+import json
+import os
+import re
+import sys
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Any, Optional
 
 import typer
-from rich.console import Console
 
-out = Console()
-err = Console(stderr=True, style='bold red')
+from . import profiling
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+
+    from .api import APIError
+
+OUTPUT_FORMATS = ('table', 'json', 'ndjson', 'tsv')
+
+# The same tag pattern rich uses to parse console markup.
+_MARKUP_TAG = re.compile(r'(\\*)\[([a-z#/@][^[]*?)]')
+
+
+def _strip_markup(text: str) -> str:
+    """Remove rich console markup tags, honouring escaped tags."""
+
+    def replace(match: re.Match) -> str:
+        backslashes, escaped = divmod(len(match.group(1)), 2)
+        return '\\' * backslashes + (f'[{match.group(2)}]' if escaped else '')
+
+    return _MARKUP_TAG.sub(replace, text)
+
+
+def escape(text: str) -> str:
+    """Escape text such as a scene name so brackets in it are not read as markup.
+
+    The same escaping as rich.markup.escape, without importing rich.
+    """
+
+    def replace(match: re.Match) -> str:
+        return f'{match.group(1) * 2}\\[{match.group(2)}]'
+
+    text = _MARKUP_TAG.sub(replace, text)
+    if text.endswith('\\') and not text.endswith('\\\\'):
+        return text + '\\'
+    return text
+
+
+class LazyConsole:
+    """A console that prints plain strings directly and defers to rich otherwise.
+
+    Set plain to strip markup from strings even when writing to a terminal.
+    """
+
+    def __init__(self, stderr: bool = False, style: Optional[str] = None):
+        """Initialize the LazyConsole, no rich objects are created here."""
+        self._stderr = stderr
+        self._style = style
+        self._console = None
+        self.plain = False
+
+    @property
+    def rich(self) -> 'Console':
+        """The underlying rich console, created on first use."""
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console(stderr=self._stderr, style=self._style)
+        return self._console
+
+    def _plain(self, stream) -> bool:
+        """Check if output to the stream should skip rich rendering."""
+        if self.plain:
+            return True
+        if os.getenv('FORCE_COLOR', '') != '':
+            return False
+        return os.getenv('NO_COLOR', '') != '' or not stream.isatty()
+
+    def print(self, *objects: Any, **kwargs: Any):
+        """Print objects, rendering them with rich only when required."""
+        if profiling.recording:
+            with profiling.span('render'):
+                self._print(*objects, **kwargs)
+        else:
+            self._print(*objects, **kwargs)
+
+    def _print(self, *objects: Any, **kwargs: Any):
+        """Print objects, writing plain strings directly where possible."""
+        stream = sys.stderr if self._stderr else sys.stdout
+        if (
+            not kwargs
+            and all(isinstance(obj, str) for obj in objects)
+            and self._plain(stream)
+        ):
+            stream.write(' '.join(_strip_markup(obj) for obj in objects) + '\n')
+            stream.flush()
+            return
+
+        self.rich.print(*objects, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate anything else to the rich console."""
+        return getattr(self.rich, name)
+
+
+out = LazyConsole()
+err = LazyConsole(stderr=True, style='bold red')
+# Diagnostics such as --stats, kept off stdout without looking like errors.
+info = LazyConsole(stderr=True)
 
 
 def highlight(ctx: typer.Context, text: str) -> str:
     """Highlight text using the current context's style."""
-    return f'[{ctx.obj["style"].highlight}]{text}[/{ctx.obj["style"].highlight}]'
+    highlight = ctx.obj['style'].highlight
+    return f'[{highlight}]{escape(str(text))}[/{highlight}]'
+
+
+def api_error(e: 'APIError'):
+    """Print an API error to stderr, with the names it refers to in yellow."""
+    err.print(e.format(lambda name: f'[yellow]{escape(name)}[/yellow]'))
+
+
+def table(
+    ctx: typer.Context,
+    title: str,
+    columns: Sequence[tuple[str, str, Optional[str]]],
+) -> 'Table':
+    """Build a table in the current style.
+
+    Args:
+    ----
+        ctx (typer.Context): The current context
+        title (str): The table title
+        columns (Sequence): (heading, justify, style) for each column
+
+    Returns:
+    -------
+        Table: A rich table with the columns added
+
+    """
+    from rich.table import Table
+    from rich.text import Text
+
+    table = Table(title=title, padding=(0, 2), border_style=ctx.obj['style'].border)
+    for heading, justify, style in columns:
+        table.add_column(Text(heading, justify='center'), justify=justify, style=style)
+    return table
+
+
+def raw_output(ctx: typer.Context) -> bool:
+    """Check if records should be written raw instead of as a rich table."""
+    return ctx.obj['output'] != 'table'
+
+
+def _tsv_field(value: Any) -> str:
+    """Format a value as a single TSV field."""
+    match value:
+        case None:
+            return ''
+        case bool():
+            return 'true' if value else 'false'
+        case dict() | list():
+            value = json.dumps(value)
+    return str(value).replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n')
+
+
+def write_records(
+    ctx: typer.Context, fields: Sequence[str], records: Iterable[dict[str, Any]]
+):
+    """Write records straight to stdout in the selected output format.
+
+    Rows are written as the records iterable yields them, so a generator
+    is streamed rather than collected first.
+    """
+    if 'target' in ctx.obj:
+        # Tag each record with its host when running against several.
+        fields = ('host', *fields)
+        records = ({'host': ctx.obj['target']} | record for record in records)
+
+    stream = sys.stdout
+    match ctx.obj['output']:
+        case 'json':
+            stream.write('[')
+            for i, record in enumerate(records):
+                if i:
+                    stream.write(',')
+                stream.write(json.dumps(record))
+            stream.write(']\n')
+        case 'ndjson':
+            for record in records:
+                stream.write(json.dumps(record) + '\n')
+                stream.flush()
+        case 'tsv':
+            stream.write('\t'.join(fields) + '\n')
+            for record in records:
+                stream.write(
+                    '\t'.join(_tsv_field(record.get(field)) for field in fields) + '\n'
+                )
+    stream.flush()
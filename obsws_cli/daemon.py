@@ -0,0 +1,679 @@
+"""module multiplexing local clients onto a single OBS session.
+
+The daemon speaks obs-websocket v5 to its clients, over a Unix socket
+and a localhost WebSocket port, so a client connects to it as it would
+to OBS. Requests are sent upstream under request IDs of the daemon's own
+and each response is routed back to the client that sent the request.
+Events are received once and fanned out to every client subscribed to
+them. Each client's messages are written by its own thread from a
+bounded queue, so a slow client loses its events rather than holding up
+the others. The daemon can also publish an inventory snapshot of OBS's
+scenes and inputs for CLI processes to look names up in.
+"""
+
+import itertools
+import logging
+import os
+import queue
+import secrets
+import socket
+import socketserver
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import obsws_python as obsws
+from websocket import ABNF, WebSocketException
+
+from . import client, codec, framing, inventory, launcher, reconnect, tracing
+from .client import ResponseHook
+from .codec import Codec
+from .framing import (
+    CLOSE_ALREADY_IDENTIFIED,
+    CLOSE_AUTHENTICATION_FAILED,
+    CLOSE_MESSAGE_DECODE_ERROR,
+    CLOSE_MISSING_DATA_FIELD,
+    CLOSE_NOT_IDENTIFIED,
+    CLOSE_UNKNOWN_OP_CODE,
+    CLOSE_UNSUPPORTED_RPC_VERSION,
+    ProtocolError,
+    auth_response,
+)
+
+logger = logging.getLogger(__name__)
+
+RPC_VERSION = 1
+
+# The RequestStatus code for requests sent while OBS is not connected.
+NOT_READY = 207
+
+# serve daemon --queue-size defaults to the same
+QUEUE_SIZE = 1024
+
+
+class DaemonError(Exception):
+    """Raised when the daemon cannot listen on its socket or port."""
+
+
+def default_socket_path() -> Path:
+    """Get the Unix socket the daemon listens on unless told otherwise."""
+    return Path(launcher.default_socket_path())
+
+
+class Client:
+    """A local client of the daemon, with a bounded queue of messages to send it."""
+
+    def __init__(
+        self,
+        daemon: 'Daemon',
+        ws: framing.WebSocket,
+        codec: Codec,
+        name: str,
+        password: str,
+    ):
+        """Initialize the Client for an accepted WebSocket."""
+        self.daemon = daemon
+        self.ws = ws
+        self.codec = codec
+        self.name = name
+        self.password = password
+        self.identified = False
+        self.subscriptions = 0
+        self.dropped = 0
+        self.salt = secrets.token_urlsafe(32)
+        self.challenge = secrets.token_urlsafe(32)
+        self._queue: queue.Queue = queue.Queue(daemon.queue_size)
+        self._writer = threading.Thread(target=self._write, daemon=True)
+
+    def _write(self):
+        """Send queued messages until the client goes away."""
+        while (message := self._queue.get()) is not None:
+            try:
+                self.ws.send(message)
+            except (OSError, ValueError, framing.ConnectionClosed):
+                break
+
+    def send(self, op: int, data: dict[str, Any]):
+        """Queue a response, disconnecting the client if its queue is full."""
+        try:
+            self._queue.put_nowait(self.codec.encode({'op': op, 'd': data}))
+        except queue.Full:
+            logger.warning('Disconnecting %s, it is not reading its responses', self)
+            # Responses are sent from the thread reading OBS's messages, which
+            # must not wait on this client's writer, stuck on the full socket.
+            self.ws.abort()
+
+    def send_event(self, message: Union[str, bytes]):
+        """Queue an encoded event, dropping it if the client's queue is full."""
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self, code: int = framing.CLOSE_NORMAL, reason: str = ''):
+        """Close the connection and stop the writer."""
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            pass
+        try:
+            self.ws.close(code, reason)
+        except (OSError, ValueError):
+            pass
+
+    def run(self):
+        """Greet the client and serve its messages until it disconnects."""
+        self._writer.start()
+        hello = {
+            'obsWebSocketVersion': self.daemon.hello.get('obsWebSocketVersion', ''),
+            'rpcVersion': RPC_VERSION,
+            # not in OBS's Hello, for the launcher to check it has the right OBS
+            'upstream': {
+                'host': self.daemon.connection.get('host', 'localhost'),
+                'port': self.daemon.connection.get('port', 4455),
+            },
+        }
+        if self.password:
+            hello['authentication'] = {'challenge': self.challenge, 'salt': self.salt}
+        self.send(0, hello)
+
+        try:
+            while True:
+                message = self.ws.recv()
+                try:
+                    payload = self.codec.decode(message)
+                    op, data = payload['op'], payload['d']
+                except (ValueError, TypeError, KeyError):
+                    raise ProtocolError(
+                        CLOSE_MESSAGE_DECODE_ERROR, 'Unable to decode the message.'
+                    ) from None
+                if not isinstance(data, dict):
+                    raise ProtocolError(
+                        CLOSE_MISSING_DATA_FIELD, 'The message is missing its data.'
+                    )
+                self.dispatch(op, data)
+        except ProtocolError as e:
+            logger.debug('Closing %s: %s', self, e.reason)
+            self.close(e.code, e.reason)
+        except framing.ConnectionClosed:
+            self.close()
+
+    def dispatch(self, op: int, data: dict[str, Any]):
+        """Handle a single message from the client."""
+        match op:
+            case 1:
+                if self.identified:
+                    raise ProtocolError(
+                        CLOSE_ALREADY_IDENTIFIED, 'You are already identified.'
+                    )
+                if data.get('rpcVersion') != RPC_VERSION:
+                    raise ProtocolError(
+                        CLOSE_UNSUPPORTED_RPC_VERSION, 'Unsupported RPC version.'
+                    )
+                if self.password and data.get('authentication') != auth_response(
+                    self.password, self.salt, self.challenge
+                ):
+                    raise ProtocolError(
+                        CLOSE_AUTHENTICATION_FAILED, 'Authentication failed.'
+                    )
+                self.identified = True
+                self.subscriptions = data.get(
+                    'eventSubscriptions', obsws.Subs.LOW_VOLUME
+                )
+                self.send(2, {'negotiatedRpcVersion': RPC_VERSION})
+                self.daemon.update_subscriptions()
+            case 3:
+                self.require_identified()
+                self.subscriptions = data.get('eventSubscriptions', self.subscriptions)
+                self.send(2, {'negotiatedRpcVersion': RPC_VERSION})
+                self.daemon.update_subscriptions()
+            case 6:
+                self.require_identified()
+                if 'requestId' not in data or not isinstance(
+                    data.get('requestType'), str
+                ):
+                    raise ProtocolError(
+                        CLOSE_MISSING_DATA_FIELD,
+                        'Your request is missing a requestType or requestId.',
+                    )
+                self.daemon.forward(self, op, data)
+            case 8:
+                self.require_identified()
+                # OBS would close the shared session over a malformed batch.
+                requests = data.get('requests')
+                if (
+                    'requestId' not in data
+                    or not isinstance(requests, list)
+                    or not all(
+                        isinstance(r, dict) and isinstance(r.get('requestType'), str)
+                        for r in requests
+                    )
+                ):
+                    raise ProtocolError(
+                        CLOSE_MISSING_DATA_FIELD,
+                        'Your request batch is missing a requestId or requests.',
+                    )
+                self.daemon.forward(self, op, data)
+            case _:
+                raise ProtocolError(CLOSE_UNKNOWN_OP_CODE, f'Unknown OpCode: {op}')
+
+    def require_identified(self):
+        """Close the connection if the client has not identified yet."""
+        if not self.identified:
+            raise ProtocolError(
+                CLOSE_NOT_IDENTIFIED, 'You must identify before sending requests.'
+            )
+
+    def __str__(self) -> str:
+        """Name the client by its address."""
+        return f'client {self.name}'
+
+
+class _Pending:
+    """Stands in for a client to receive the response to the daemon's own request."""
+
+    def __init__(self):
+        self.response: Optional[dict[str, Any]] = None
+        self._done = threading.Event()
+
+    def send(self, op: int, data: dict[str, Any]):
+        """Take the response, as routed to a client."""
+        self.response = data
+        self._done.set()
+
+    def wait(self, timeout: float) -> dict[str, Any]:
+        """Wait for the response."""
+        if not self._done.wait(timeout):
+            raise TimeoutError('OBS did not answer in time')
+        return self.response
+
+
+@dataclass
+class _Route:
+    """A request sent upstream, and the client its response goes back to."""
+
+    local: Union[Client, _Pending]
+    op: int
+    data: dict[str, Any]
+    send_time: int
+    start: float
+    sent_bytes: int
+
+
+class _Handler(framing.Handler):
+    """Serve a Client on each accepted WebSocket."""
+
+    # Unix socket clients are trusted by the socket's permissions.
+    trusted = False
+
+    def serve(self, ws: framing.WebSocket, codec: Codec):
+        if self.trusted:
+            name, password = 'unix', ''
+        else:
+            name = f'{self.client_address[0]}:{self.client_address[1]}'
+            password = self.server.mux.password
+        local = Client(self.server.mux, ws, codec, name, password)
+        self.server.mux.add(local)
+        try:
+            local.run()
+        finally:
+            self.server.mux.remove(local)
+
+
+class _UnixHandler(_Handler):
+    disable_nagle_algorithm = False
+    trusted = True
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+if hasattr(socketserver, 'ThreadingUnixStreamServer'):
+
+    class _UnixServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+else:
+    _UnixServer = None
+
+
+class Daemon:
+    """Serve many local clients over a single upstream connection to OBS.
+
+    Clients on the WebSocket port must authenticate with the given
+    password, which defaults to the OBS password so existing clients
+    only need the port changing. Clients on the Unix socket need none.
+    Given an inventory path, the daemon keeps a snapshot of OBS's scenes
+    and inputs published there. on_response is called with each round
+    trip to OBS, as ReqClient records and traces its own.
+    """
+
+    def __init__(
+        self,
+        connection: dict[str, Any],
+        protocol: str = 'json',
+        socket_path: Optional[Path] = None,
+        bind: Optional[tuple[str, int]] = None,
+        password: Optional[str] = None,
+        queue_size: int = QUEUE_SIZE,
+        upstream: Optional[client.ObsClient] = None,
+        inventory_path: Optional[Path] = None,
+        on_response: Optional[ResponseHook] = None,
+    ):
+        """Initialize the Daemon, taking over an identified upstream connection if given."""
+        self.connection = connection
+        self.codec = codec.get(protocol)
+        self.socket_path = socket_path
+        self.bind = bind
+        self.password = connection['password'] if password is None else password
+        self.queue_size = queue_size
+        self.hello: dict[str, Any] = {}
+        self.clients: set[Client] = set()
+        self.requests = 0
+        self.events = 0
+        self.on_response = on_response
+        self._upstream = upstream
+        self._publisher = (
+            inventory.Publisher(inventory_path, self.call)
+            if inventory_path is not None
+            else None
+        )
+        # the events the daemon needs for itself, whichever clients are connected
+        self._own_subscriptions = (
+            inventory.SUBSCRIPTIONS if self._publisher is not None else 0
+        )
+        self._subscriptions = self._own_subscriptions
+        self._send_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._routes: dict[str, _Route] = {}
+        self._servers: list[socketserver.BaseServer] = []
+        self._stopped = threading.Event()
+
+    def _listen(self):
+        """Open the Unix socket and WebSocket port."""
+        if self.socket_path is not None:
+            if _UnixServer is None:
+                raise DaemonError('Unix sockets are not supported on this platform')
+            if self.socket_path.exists():
+                probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                try:
+                    probe.connect(str(self.socket_path))
+                except OSError:
+                    # left behind by a daemon that did not shut down cleanly
+                    self.socket_path.unlink()
+                else:
+                    raise DaemonError(
+                        f'A daemon is already listening on {self.socket_path}'
+                    )
+                finally:
+                    probe.close()
+            old_umask = os.umask(0o177)
+            try:
+                server = _UnixServer(str(self.socket_path), _UnixHandler)
+            finally:
+                os.umask(old_umask)
+            server.mux = self
+            self._servers.append(server)
+        if self.bind is not None:
+            try:
+                server = _TCPServer(self.bind, _Handler)
+            except OSError as e:
+                raise DaemonError(
+                    f'Cannot listen on {self.bind[0]}:{self.bind[1]}: {e}'
+                )
+            server.mux = self
+            self._servers.append(server)
+
+    @property
+    def port(self) -> Optional[int]:
+        """The WebSocket port being listened on, if any."""
+        for server in self._servers:
+            if isinstance(server, _TCPServer):
+                return server.server_address[1]
+        return None
+
+    def start(self) -> 'Daemon':
+        """Connect upstream if not already connected, then accept clients."""
+        if self._upstream is None:
+            self._connect()
+        self.hello = self._upstream.server_hello['d']
+        self._upstream.ws.settimeout(None)
+        self._listen()
+        threading.Thread(target=self._read_upstream, daemon=True).start()
+        for server in self._servers:
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+        if self._publisher is not None:
+            # an upstream taken over was identified without the events needed
+            self._send_upstream(
+                {'op': 3, 'd': {'eventSubscriptions': self._subscriptions}}
+            )
+            self._publisher.start()
+        return self
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the daemon is stopped, returning whether it was."""
+        return self._stopped.wait(timeout)
+
+    def stop(self):
+        """Stop accepting clients, disconnect those connected and close upstream."""
+        self._stopped.set()
+        if self._publisher is not None:
+            self._publisher.stop()
+        for server in self._servers:
+            server.shutdown()
+            server.server_close()
+        if self.socket_path is not None and self._servers:
+            self.socket_path.unlink(missing_ok=True)
+        self._servers.clear()
+        with self._lock:
+            clients = list(self.clients)
+        for local in clients:
+            local.close(framing.CLOSE_GOING_AWAY, 'Server stopping.')
+        if self._upstream is not None:
+            self._upstream.ws.close()
+
+    def __enter__(self) -> 'Daemon':
+        """Start serving on entering the context."""
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stop serving on leaving the context."""
+        self.stop()
+
+    def add(self, local: Client):
+        """Register a newly connected client."""
+        with self._lock:
+            self.clients.add(local)
+        logger.debug('%s connected', local)
+
+    def remove(self, local: Client):
+        """Forget a disconnected client and any events it alone needed."""
+        with self._lock:
+            self.clients.discard(local)
+        logger.debug('%s disconnected, %d events dropped', local, local.dropped)
+        self.update_subscriptions()
+
+    def _connect(self):
+        """Open and identify the upstream connection."""
+        upstream = client.ObsClient(
+            self.codec, **self.connection, subs=self._subscriptions
+        )
+        upstream.authenticate()
+        self._upstream = upstream
+
+    def _send_upstream(self, payload: dict[str, Any]) -> bool:
+        """Send a message to OBS, returning False if it is not connected."""
+        return self._send_encoded(self.codec.encode(payload))
+
+    def _send_encoded(self, message: Union[str, bytes]) -> bool:
+        """Send an encoded message to OBS, returning False if it is not connected."""
+        with self._send_lock:
+            if self._upstream is None:
+                return False
+            try:
+                self._upstream.send_message(message)
+            except (OSError, WebSocketException):
+                return False
+        return True
+
+    def update_subscriptions(self):
+        """Subscribe upstream to the events any identified client wants."""
+        with self._lock:
+            wanted = self._own_subscriptions
+            for local in self.clients:
+                if local.identified:
+                    wanted |= local.subscriptions
+            if wanted == self._subscriptions:
+                return
+            self._subscriptions = wanted
+        self._send_upstream({'op': 3, 'd': {'eventSubscriptions': wanted}})
+
+    def forward(self, local: Client, op: int, data: dict[str, Any]):
+        """Send a client's request or batch upstream under a request ID of our own."""
+        with self._lock:
+            self.requests += 1
+        self._route(local, op, data)
+
+    def _route(self, local: Union[Client, _Pending], op: int, data: dict[str, Any]):
+        """Send a request or batch upstream, routing its response back to local."""
+        upstream_id = str(next(self._ids))
+        message = self.codec.encode({'op': op, 'd': data | {'requestId': upstream_id}})
+        route = _Route(
+            local,
+            op,
+            data,
+            time.time_ns() if tracing.tracer else 0,
+            time.perf_counter(),
+            len(message),
+        )
+        with self._lock:
+            self._routes[upstream_id] = route
+        if not self._send_encoded(message):
+            with self._lock:
+                self._routes.pop(upstream_id, None)
+            self._fail(local, op, data)
+
+    def call(
+        self, requests: list[tuple[str, dict[str, Any]]], timeout: float = 5
+    ) -> list[dict[str, Any]]:
+        """Send a request batch of the daemon's own, returning its results.
+
+        The requests are not counted as served, and fail with NOT_READY
+        while OBS is not connected.
+        """
+        pending = _Pending()
+        self._route(
+            pending,
+            8,
+            {
+                'requestId': 'daemon',
+                'requests': [
+                    {
+                        'requestType': request_type,
+                        'requestId': str(i),
+                        'requestData': request_data,
+                    }
+                    for i, (request_type, request_data) in enumerate(requests)
+                ],
+            },
+        )
+        return pending.wait(timeout)['results']
+
+    def _record(
+        self,
+        route: '_Route',
+        upstream_id: str,
+        received_bytes: int,
+        data: Optional[dict[str, Any]],
+    ):
+        """Report a round trip to OBS to on_response. data is None if it was lost."""
+        if self.on_response is None:
+            return
+        if route.op == 6:
+            request_type, requests = route.data['requestType'], 1
+        else:
+            request_type, requests = 'RequestBatch', len(route.data['requests'])
+        self.on_response(
+            request_type,
+            upstream_id,
+            requests,
+            route.send_time,
+            route.start,
+            time.perf_counter() - route.start,
+            route.sent_bytes,
+            received_bytes,
+            data,
+        )
+
+    def _fail(self, local: Union[Client, _Pending], op: int, data: dict[str, Any]):
+        """Answer a request that could not be sent because OBS is not connected."""
+        status = {
+            'result': False,
+            'code': NOT_READY,
+            'comment': 'OBS is not connected.',
+        }
+        if op == 6:
+            local.send(
+                7,
+                {
+                    'requestType': data.get('requestType', ''),
+                    'requestId': data['requestId'],
+                    'requestStatus': status,
+                },
+            )
+        else:
+            local.send(
+                9,
+                {
+                    'requestId': data['requestId'],
+                    'results': [
+                        {
+                            'requestType': request.get('requestType', ''),
+                            'requestId': request.get('requestId', ''),
+                            'requestStatus': status,
+                        }
+                        for request in data.get('requests', [])
+                        if isinstance(request, dict)
+                    ],
+                },
+            )
+
+    def _dispatch(self, message: Union[str, bytes]):
+        """Route a message from OBS to the clients it is for."""
+        payload = self.codec.decode(message)
+        op, data = payload['op'], payload['d']
+        if op in (7, 9):
+            with self._lock:
+                route = self._routes.pop(data['requestId'], None)
+            if route is not None:
+                self._record(route, data['requestId'], len(message), data)
+                route.local.send(op, data | {'requestId': route.data['requestId']})
+        elif op == 5:
+            self.events += 1
+            if self._publisher is not None:
+                self._publisher.on_event(data.get('eventType', ''))
+            intent = data.get('eventIntent', 0)
+            # Clients speaking OBS's protocol get the event as it arrived.
+            encoded = {self.codec.name: message}
+            with self._lock:
+                clients = [
+                    c for c in self.clients if c.identified and c.subscriptions & intent
+                ]
+            for local in clients:
+                if local.codec.name not in encoded:
+                    encoded[local.codec.name] = local.codec.encode(payload)
+                local.send_event(encoded[local.codec.name])
+
+    def _read_upstream(self):
+        """Route messages from OBS until stopped, reconnecting when OBS goes away."""
+        backoff = reconnect.Backoff()
+        while not self._stopped.is_set():
+            try:
+                opcode, data = self._upstream.ws.recv_data()
+            except (OSError, WebSocketException):
+                opcode = ABNF.OPCODE_CLOSE
+            if opcode == ABNF.OPCODE_CLOSE:
+                if self._stopped.is_set():
+                    return
+                self._reconnect(backoff)
+                continue
+            message = data.decode('utf-8') if opcode == ABNF.OPCODE_TEXT else data
+            try:
+                self._dispatch(message)
+            except (ValueError, TypeError, KeyError):
+                logger.warning('Ignoring a message OBS sent that could not be decoded')
+
+    def _reconnect(self, backoff: reconnect.Backoff):
+        """Fail requests in flight, then reconnect to OBS with backoff."""
+        with self._send_lock:
+            self._upstream = None
+        if self._publisher is not None:
+            # the snapshot can not be kept current while OBS is away
+            self._publisher.invalidate()
+        with self._lock:
+            routes, self._routes = self._routes, {}
+        for upstream_id, route in routes.items():
+            self._record(route, upstream_id, 0, None)
+            self._fail(route.local, route.op, route.data)
+        logger.warning('Lost the connection to OBS, reconnecting')
+
+        attempt = 0
+        with reconnect.quiet_clients():
+            while not self._stopped.is_set():
+                try:
+                    self._connect()
+                except reconnect.CONNECTION_ERRORS:
+                    self._stopped.wait(backoff.delay(attempt))
+                    attempt += 1
+                    continue
+                self._upstream.ws.settimeout(None)
+                logger.warning('Reconnected to OBS after %d attempts', attempt + 1)
+                if self._publisher is not None:
+                    # and OBS may have changed anything while we were away
+                    self._publisher.invalidate()
+                return
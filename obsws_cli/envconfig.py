@@ -1,11 +1,14 @@
 """module for settings management for obsws-cli."""
 
+import os
 from collections import UserDict
 from pathlib import Path
 from typing import Any, Union
 
 from dotenv import dotenv_values
 
+from . import profiling
+
 ConfigValue = Union[str, int, bool]
 
 
@@ -119,15 +122,24 @@ class EnvConfig(UserDict):
         return normalised_key in self.data
 
 
-_envconfig = EnvConfig(
-    OBSWS_CLI_HOST='localhost',
-    OBSWS_CLI_PORT=4455,
-    OBSWS_CLI_PASSWORD='',
-    OBSWS_CLI_TIMEOUT=5,
-    OBSWS_CLI_LOGLEVEL='WARNING',
-    OBSWS_CLI_STYLE='disabled',
-    OBSWS_CLI_STYLE_NO_BORDER=False,
-)
+with profiling.span('envconfig'):
+    _envconfig = EnvConfig(
+        OBSWS_CLI_HOST='localhost',
+        OBSWS_CLI_PORT=4455,
+        OBSWS_CLI_PASSWORD='',
+        OBSWS_CLI_TIMEOUT=5,
+        OBSWS_CLI_LOGLEVEL='WARNING',
+        OBSWS_CLI_STYLE='disabled',
+        OBSWS_CLI_STYLE_NO_BORDER=False,
+        OBSWS_CLI_OUTPUT='table',
+        OBSWS_CLI_PROTOCOL='json',
+        OBSWS_CLI_STATS=False,
+        OBSWS_CLI_TRACE='',
+        OBSWS_CLI_TRACE_FORMAT='ndjson',
+        OBSWS_CLI_TRACE_MAX_BYTES=10 * 1024 * 1024,
+        OBSWS_CLI_COMPLETION_TTL=30,
+        OBSWS_CLI_COMPLETION_BUDGET=250,
+    )
 
 
 def get(key: str) -> ConfigValue:
@@ -144,3 +156,19 @@ def get(key: str) -> ConfigValue:
 
     """
     return _envconfig.get(key)
+
+
+def targets() -> dict[str, str]:
+    """Get the named OBS hosts from OBSWS_CLI_TARGET_<NAME> entries.
+
+    Returns the lowercased target names mapped to their host[:port[:password]]
+    specs. Entries in the environment take precedence over the .env files,
+    as they do for every other setting.
+    """
+    prefix = f'{EnvConfig.PREFIX}TARGET_'
+    found = {}
+    for source in (_envconfig.data, os.environ):
+        for key, value in source.items():
+            if key.startswith(prefix) and len(key) > len(prefix):
+                found[key[len(prefix) :].lower()] = str(value)
+    return found
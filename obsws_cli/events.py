@@ -0,0 +1,99 @@
+"""module for waiting on OBS events."""
+
+import threading
+import time
+from typing import Annotated, Any, Callable, Optional
+
+import obsws_python as obsws
+import typer
+from obsws_python.util import to_snake_case
+
+from . import console
+
+OUTPUT_STARTED = 'OBS_WEBSOCKET_OUTPUT_STARTED'
+OUTPUT_STOPPED = 'OBS_WEBSOCKET_OUTPUT_STOPPED'
+
+WAIT_TIMEOUT = 30
+
+
+def wait_options(output: str, action: str) -> tuple[Any, Any]:
+    """Build the --wait and --wait-timeout options of an output's start or stop command.
+
+    Args:
+    ----
+        output (str): The output, as named in the help, e.g. 'the stream'
+        action (str): 'start' or 'stop'
+
+    Returns:
+    -------
+        tuple: The annotated types of the wait and wait_timeout parameters
+
+    """
+    state = {'start': 'started', 'stop': 'stopped'}[action]
+    return (
+        Annotated[bool, typer.Option(help=f'Wait until {output} has {state}')],
+        Annotated[
+            float,
+            typer.Option(help=f'Seconds to wait for {output} to {action}', min=0),
+        ],
+    )
+
+
+def wait_for_event(
+    ctx: typer.Context,
+    event: str,
+    subs: int,
+    predicate: Callable[[Any], bool] = lambda _: True,
+    request: Optional[Callable[[], Any]] = None,
+    timeout: Optional[float] = None,
+) -> tuple[Any, float]:
+    """Block until an event matching the predicate is received.
+
+    If a request is given it is sent once the event connection has been
+    identified, so the event it causes cannot be missed.
+
+    Returns the event data and the seconds elapsed since the request was sent,
+    or since the event connection was identified if there was no request.
+    """
+    received = threading.Event()
+    result = {}
+
+    def handler(data):
+        if not received.is_set() and predicate(data):
+            result['data'] = data
+            result['at'] = time.perf_counter()
+            received.set()
+
+    # obsws-python dispatches callbacks by function name
+    handler.__name__ = f'on_{to_snake_case(event)}'
+
+    with obsws.EventClient(**ctx.obj['connection'], subs=subs) as event_client:
+        event_client.callback.register(handler)
+        sent = time.perf_counter()
+        if request is not None:
+            request()
+        if not received.wait(timeout):
+            console.err.print(
+                f'Timed out after {timeout} seconds waiting for [yellow]{event}[/yellow].'
+            )
+            raise typer.Exit(1)
+
+    return result['data'], result['at'] - sent
+
+
+def wait_for_output_state(
+    ctx: typer.Context,
+    request: Callable[[], Any],
+    event: str,
+    state: str,
+    timeout: float,
+) -> tuple[Any, float]:
+    """Send a request and block until an output reports the given state."""
+    return wait_for_event(
+        ctx,
+        event,
+        obsws.Subs.OUTPUTS,
+        predicate=lambda data: data.output_state == state,
+        request=request,
+        timeout=timeout,
+    )
@@ -0,0 +1,9 @@
+"""A stand-in OBS serving obs-websocket v5 from an in-memory model.
+
+It lets the test suite and benchmarks run without a real OBS instance.
+"""
+
+from .model import Model
+from .server import FakeOBS
+
+__all__ = ['FakeOBS', 'Model']
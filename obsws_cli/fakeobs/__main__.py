@@ -0,0 +1,62 @@
+"""module running the stand-in OBS as a standalone server.
+
+python -m obsws_cli.fakeobs --port 4455 --password secret
+"""
+
+from typing import Annotated
+
+import typer
+
+from obsws_cli import console
+
+from .server import FakeOBS
+
+app = typer.Typer()
+
+
+@app.command()
+def main(
+    host: Annotated[
+        str,
+        typer.Option('--host', '-H', envvar='OBSWS_CLI_HOST', help='Host to bind'),
+    ] = 'localhost',
+    port: Annotated[
+        int,
+        typer.Option(
+            '--port',
+            '-P',
+            envvar='OBSWS_CLI_PORT',
+            help='Port to listen on, 0 picks a free port',
+        ),
+    ] = 4455,
+    password: Annotated[
+        str,
+        typer.Option(
+            '--password',
+            '-p',
+            envvar='OBSWS_CLI_PASSWORD',
+            help='Password clients must authenticate with',
+            show_default=False,
+        ),
+    ] = '',
+    group: Annotated[
+        list[str],
+        typer.Option(help='Seed a group in the default scene, may be repeated.'),
+    ] = [],
+):
+    """Serve obs-websocket v5 from an in-memory OBS until interrupted."""
+    server = FakeOBS(host, port, password)
+    for name in group:
+        server.model.add_group('Scene', name)
+
+    console.out.print(f'Stand-in OBS listening on ws://{host}:{server.port}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    app()
@@ -0,0 +1,1449 @@
+"""module implementing the obs-websocket requests served by the stand-in OBS.
+
+Each handler takes the model and the requestData and returns the
+responseData, or None for requests that do not respond with data.
+"""
+
+import math
+import platform
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from . import model as m
+from .model import Model, RequestError, RequestStatus
+
+OBS_VERSION = '31.0.0'
+OBS_WEBSOCKET_VERSION = '5.5.4'
+IMAGE_FORMATS = ('bmp', 'jpeg', 'jpg', 'png', 'webp')
+
+Handler = Callable[[Model, dict[str, Any]], Optional[dict[str, Any]]]
+
+registry: dict[str, Handler] = {}
+
+_REQUIRED = object()
+
+
+def register(request_type: str):
+    """Register a request handler."""
+
+    def decorator(func: Handler) -> Handler:
+        registry[request_type] = func
+        return func
+
+    return decorator
+
+
+def _field(data: dict[str, Any], name: str, type_: type, default: Any = _REQUIRED):
+    """Get a field from the requestData, null values count as missing."""
+    value = data.get(name)
+    if value is None:
+        if default is _REQUIRED:
+            raise RequestError(
+                RequestStatus.MISSING_REQUEST_FIELD,
+                f'Your request is missing the `{name}` field.',
+            )
+        return default
+
+    accepted = (int, float) if type_ is float else type_
+    if not isinstance(value, accepted) or (
+        isinstance(value, bool) and type_ is not bool
+    ):
+        raise RequestError(
+            RequestStatus.INVALID_REQUEST_FIELD_TYPE,
+            f'The field value of `{name}` must be of type {type_.__name__}.',
+        )
+    if type_ is str and not value:
+        raise RequestError(
+            RequestStatus.REQUEST_FIELD_EMPTY,
+            f'The field value of `{name}` must not be empty.',
+        )
+    return value
+
+
+def _settings(data: dict[str, Any], name: str, default: Any = _REQUIRED):
+    """Get a settings object from the requestData, OBS drops null values from these."""
+    settings = _field(data, name, dict, default)
+    if settings is None:
+        return None
+    return {k: v for k, v in settings.items() if v is not None}
+
+
+def _names(
+    data: dict[str, Any], prefix: str, required: bool = True
+) -> tuple[Optional[str], Optional[str]]:
+    """Get the <prefix>Name and <prefix>Uuid fields, one of which must be present."""
+    name = _field(data, f'{prefix}Name', str, None)
+    uuid = _field(data, f'{prefix}Uuid', str, None)
+    if name is None and uuid is None and required:
+        raise RequestError(
+            RequestStatus.MISSING_REQUEST_FIELD,
+            f'Your request is missing the `{prefix}Name` field.',
+        )
+    return name, uuid
+
+
+def _scene(model: Model, data: dict[str, Any], groups: bool = False) -> m.Scene:
+    """Find the scene named by the request."""
+    return model.find_scene(*_names(data, 'scene'), groups=groups)
+
+
+def _input(model: Model, data: dict[str, Any]) -> m.Input:
+    """Find the input named by the request."""
+    return model.find_input(*_names(data, 'input'))
+
+
+def _audio_input(model: Model, data: dict[str, Any]) -> m.Input:
+    """Find the input named by the request, it must support audio."""
+    input_ = _input(model, data)
+    if not input_.has_audio:
+        raise RequestError(
+            RequestStatus.INVALID_RESOURCE_STATE,
+            'The specified input does not support audio.',
+        )
+    return input_
+
+
+def _media_input(model: Model, data: dict[str, Any]) -> m.Input:
+    """Find the input named by the request, it must be a media input."""
+    input_ = _input(model, data)
+    if input_.kind not in m.MEDIA_INPUT_KINDS:
+        raise RequestError(
+            RequestStatus.INVALID_RESOURCE_TYPE,
+            'The specified input is not a media input.',
+        )
+    return input_
+
+
+def _scene_item(model: Model, data: dict[str, Any]) -> tuple[m.Scene, m.SceneItem]:
+    """Find the scene item named by the request, groups count as scenes here."""
+    scene = _scene(model, data, groups=True)
+    item_id = _field(data, 'sceneItemId', int)
+    return scene, scene.find_item(item_id)
+
+
+def _item_json(index: int, item: m.SceneItem) -> dict[str, Any]:
+    """Serialize a scene item as in GetSceneItemList."""
+    source = item.source
+    is_input = isinstance(source, m.Input)
+    return {
+        'inputKind': source.kind if is_input else None,
+        'isGroup': source.is_group if not is_input else None,
+        'sceneItemBlendMode': 'OBS_BLEND_NORMAL',
+        'sceneItemEnabled': item.enabled,
+        'sceneItemId': item.id,
+        'sceneItemIndex': index,
+        'sceneItemLocked': item.locked,
+        'sceneItemTransform': item.transform,
+        'sourceName': source.name,
+        'sourceType': 'OBS_SOURCE_TYPE_INPUT' if is_input else 'OBS_SOURCE_TYPE_SCENE',
+        'sourceUuid': source.uuid,
+    }
+
+
+def _filter_json(source: m.Source, filter_: m.Filter) -> dict[str, Any]:
+    """Serialize a filter as in GetSourceFilterList."""
+    return {
+        'filterEnabled': filter_.enabled,
+        'filterIndex': source.filters.index(filter_),
+        'filterKind': filter_.kind,
+        'filterName': filter_.name,
+        'filterSettings': filter_.settings,
+    }
+
+
+def _output(model: Model, name: str, event: str, active: bool, **extra: Any):
+    """Change the state of an output, announcing it as OBS does."""
+    output = model.outputs[name]
+    if active == output.active:
+        raise RequestError(
+            RequestStatus.OUTPUT_RUNNING
+            if active
+            else RequestStatus.OUTPUT_NOT_RUNNING,
+            f'The {name} output is {"already" if active else "not"} active.',
+        )
+
+    transition, final = (
+        ('OBS_WEBSOCKET_OUTPUT_STARTING', 'OBS_WEBSOCKET_OUTPUT_STARTED')
+        if active
+        else ('OBS_WEBSOCKET_OUTPUT_STOPPING', 'OBS_WEBSOCKET_OUTPUT_STOPPED')
+    )
+    model.emit(event, {'outputActive': False, 'outputState': transition} | extra)
+    output.active = active
+    output.paused = False
+    output.started = time.monotonic()
+    model.emit(event, {'outputActive': active, 'outputState': final} | extra)
+
+
+def _record_path(model: Model) -> str:
+    """Return the path of a new recording."""
+    stamp = time.strftime('%Y-%m-%d %H-%M-%S')
+    return str(Path(model.profile.record_directory) / f'{stamp}.mkv')
+
+
+# General
+
+
+@register('GetVersion')
+def get_version(model: Model, data: dict[str, Any]):
+    """Get version information about OBS and obs-websocket."""
+    return {
+        'obsVersion': OBS_VERSION,
+        'obsWebSocketVersion': OBS_WEBSOCKET_VERSION,
+        'rpcVersion': 1,
+        'availableRequests': sorted([*registry, 'Sleep']),
+        'supportedImageFormats': list(IMAGE_FORMATS),
+        'platform': platform.system().lower(),
+        'platformDescription': platform.platform(),
+    }
+
+
+@register('GetStats')
+def get_stats(model: Model, data: dict[str, Any]):
+    """Get statistics about OBS, the stand-in renders nothing."""
+    return {
+        'cpuUsage': 0.0,
+        'memoryUsage': 0.0,
+        'availableDiskSpace': 0.0,
+        'activeFps': model.profile.video['fpsNumerator']
+        / model.profile.video['fpsDenominator'],
+        'averageFrameRenderTime': 0.0,
+        'renderSkippedFrames': 0,
+        'renderTotalFrames': 0,
+        'outputSkippedFrames': 0,
+        'outputTotalFrames': 0,
+    }
+
+
+@register('BroadcastCustomEvent')
+def broadcast_custom_event(model: Model, data: dict[str, Any]):
+    """Broadcast a CustomEvent to all subscribed clients."""
+    model.emit('CustomEvent', _field(data, 'eventData', dict))
+
+
+@register('GetHotkeyList')
+def get_hotkey_list(model: Model, data: dict[str, Any]):
+    """Get the names of all hotkeys."""
+    return {'hotkeys': list(m.HOTKEYS)}
+
+
+@register('TriggerHotkeyByName')
+def trigger_hotkey_by_name(model: Model, data: dict[str, Any]):
+    """Trigger a hotkey by name."""
+    if _field(data, 'hotkeyName', str) not in m.HOTKEYS:
+        raise RequestError(
+            RequestStatus.RESOURCE_NOT_FOUND, 'No hotkeys were found by that name.'
+        )
+
+
+@register('TriggerHotkeyByKeySequence')
+def trigger_hotkey_by_key_sequence(model: Model, data: dict[str, Any]):
+    """Trigger a hotkey by key sequence, nothing is bound in the stand-in."""
+    _field(data, 'keyId', str, None)
+    _field(data, 'keyModifiers', dict, None)
+
+
+# Config
+
+
+@register('GetSceneCollectionList')
+def get_scene_collection_list(model: Model, data: dict[str, Any]):
+    """Get the scene collections."""
+    return {
+        'currentSceneCollectionName': model.current_collection,
+        'sceneCollections': list(model.collections),
+    }
+
+
+def _switch_collection(model: Model, name: str):
+    """Switch the current scene collection."""
+    model.emit('CurrentSceneCollectionChanging', {'sceneCollectionName': name})
+    model.current_collection = name
+    model.emit('CurrentSceneCollectionChanged', {'sceneCollectionName': name})
+
+
+@register('SetCurrentSceneCollection')
+def set_current_scene_collection(model: Model, data: dict[str, Any]):
+    """Switch to a scene collection."""
+    name = _field(data, 'sceneCollectionName', str)
+    if name not in model.collections:
+        raise RequestError(
+            RequestStatus.RESOURCE_NOT_FOUND,
+            'No scene collection was found by that name.',
+        )
+    if name != model.current_collection:
+        _switch_collection(model, name)
+
+
+@register('CreateSceneCollection')
+def create_scene_collection(model: Model, data: dict[str, Any]):
+    """Create a scene collection and switch to it."""
+    name = _field(data, 'sceneCollectionName', str)
+    if name in model.collections:
+        raise RequestError(
+            RequestStatus.RESOURCE_ALREADY_EXISTS,
+            'A scene collection by that name already exists.',
+        )
+    model.collections[name] = m.Collection.default()
+    model.emit(
+        'SceneCollectionListChanged', {'sceneCollections': list(model.collections)}
+    )
+    _switch_collection(model, name)
+
+
+@register('GetProfileList')
+def get_profile_list(model: Model, data: dict[str, Any]):
+    """Get the profiles."""
+    return {
+        'currentProfileName': model.current_profile,
+        'profiles': list(model.profiles),
+    }
+
+
+def _switch_profile(model: Model, name: str):
+    """Switch the current profile."""
+    model.emit('CurrentProfileChanging', {'profileName': model.current_profile})
+    model.current_profile = name
+    model.emit('CurrentProfileChanged', {'profileName': name})
+
+
+@register('SetCurrentProfile')
+def set_current_profile(model: Model, data: dict[str, Any]):
+    """Switch to a profile."""
+    name = _field(data, 'profileName', str)
+    if name not in model.profiles:
+        raise RequestError(
+            RequestStatus.RESOURCE_NOT_FOUND, 'No profile was found by that name.'
+        )
+    if name != model.current_profile:
+        _switch_profile(model, name)
+
+
+@register('CreateProfile')
+def create_profile(model: Model, data: dict[str, Any]):
+    """Create a profile and switch to it."""
+    name = _field(data, 'profileName', str)
+    if name in model.profiles:
+        raise RequestError(
+            RequestStatus.RESOURCE_ALREADY_EXISTS,
+            'A profile already exists by that name.',
+        )
+    model.profiles[name] = m.Profile()
+    model.emit('ProfileListChanged', {'profiles': list(model.profiles)})
+    _switch_profile(model, name)
+
+
+@register('RemoveProfile')
+def remove_profile(model: Model, data: dict[str, Any]):
+    """Remove a profile, switching away from it first if it is current."""
+    name = _field(data, 'profileName', str)
+    if name not in model.profiles:
+        raise RequestError(
+            RequestStatus.RESOURCE_NOT_FOUND, 'No profile was found by that name.'
+        )
+    if len(model.profiles) == 1:
+        raise RequestError(
+            RequestStatus.NOT_ENOUGH_RESOURCES,
+            'There need to be at least two profiles to remove one.',
+        )
+    if name == model.current_profile:
+        _switch_profile(model, next(p for p in model.profiles if p != name))
+    del model.profiles[name]
+    model.emit('ProfileListChanged', {'profiles': list(model.profiles)})
+
+
+@register('GetProfileParameter')
+def get_profile_parameter(model: Model, data: dict[str, Any]):
+    """Get a parameter from the current profile's configuration."""
+    key = (_field(data, 'parameterCategory', str), _field(data, 'parameterName', str))
+    return {
+        'parameterValue': model.profile.parameters.get(key),
+        'defaultParameterValue': m.Profile().parameters.get(key),
+    }
+
+
+@register('SetProfileParameter')
+def set_profile_parameter(model: Model, data: dict[str, Any]):
+    """Set a parameter in the current profile's configuration, null removes it."""
+    key = (_field(data, 'parameterCategory', str), _field(data, 'parameterName', str))
+    value = data.get('parameterValue')
+    if value is None:
+        model.profile.parameters.pop(key, None)
+    elif not isinstance(value, str):
+        raise RequestError(
+            RequestStatus.INVALID_REQUEST_FIELD_TYPE,
+            'The field value of `parameterValue` must be of type str.',
+        )
+    else:
+        model.profile.parameters[key] = value
+
+
+@register('GetVideoSettings')
+def get_video_settings(model: Model, data: dict[str, Any]):
+    """Get the current video settings."""
+    return dict(model.profile.video)
+
+
+@register('SetVideoSettings')
+def set_video_settings(model: Model, data: dict[str, Any]):
+    """Set the current video settings, omitted fields are left unchanged."""
+    for key in model.profile.video:
+        value = _field(data, key, int, None)
+        if value is None:
+            continue
+        if value < 1:
+            raise RequestError(
+                RequestStatus.REQUEST_FIELD_OUT_OF_RANGE,
+                f'The field value of `{key}` is below the minimum of `1`',
+            )
+        model.profile.video[key] = value
+
+
+@register('GetStreamServiceSettings')
+def get_stream_service_settings(model: Model, data: dict[str, Any]):
+    """Get the current stream service settings."""
+    return {
+        'streamServiceType': model.profile.stream_service_type,
+        'streamServiceSettings': model.profile.stream_service_settings,
+    }
+
+
+@register('SetStreamServiceSettings')
+def set_stream_service_settings(model: Model, data: dict[str, Any]):
+    """Set the current stream service settings."""
+    if model.outputs['stream'].active:
+        raise RequestError(
+            RequestStatus.OUTPUT_RUNNING,
+            'You cannot change stream service settings while streaming.',
+        )
+    service_type = _field(data, 'streamServiceType', str)
+    settings = _field(data, 'streamServiceSettings', dict)
+    if service_type == model.profile.stream_service_type:
+        model.profile.stream_service_settings |= settings
+    else:
+        model.profile.stream_service_type = service_type
+        model.profile.stream_service_settings = dict(settings)
+
+
+@register('GetRecordDirectory')
+def get_record_directory(model: Model, data: dict[str, Any]):
+    """Get the current directory that recordings are saved to."""
+    return {'recordDirectory': model.profile.record_directory}
+
+
+@register('SetRecordDirectory')
+def set_record_directory(model: Model, data: dict[str, Any]):
+    """Set the directory that recordings are saved to."""
+    model.profile.record_directory = _field(data, 'recordDirectory', str)
+
+
+# Sources
+
+
+@register('GetSourceActive')
+def get_source_active(model: Model, data: dict[str, Any]):
+    """Get whether a source is showing in the program or the preview."""
+    source = model.find_source(*_names(data, 'source'))
+    collection = model.collection
+
+    def shows(scene: Optional[m.Scene]) -> bool:
+        if scene is None:
+            return False
+        if scene is source:
+            return True
+        return any(
+            item.enabled
+            and (
+                item.source is source
+                or (isinstance(item.source, m.Scene) and shows(item.source))
+            )
+            for item in scene.items
+        )
+
+    return {
+        'videoActive': shows(collection.program),
+        'videoShowing': shows(collection.program) or shows(collection.preview),
+    }
+
+
+@register('SaveSourceScreenshot')
+def save_source_screenshot(model: Model, data: dict[str, Any]):
+    """Accept a screenshot request, the stand-in renders nothing so no file is written."""
+    model.find_source(*_names(data, 'source'))
+    image_format = _field(data, 'imageFormat', str)
+    if image_format not in IMAGE_FORMATS:
+        raise RequestError(
+            RequestStatus.INVALID_REQUEST_FIELD_TYPE,
+            'Your specified image format is invalid or not supported by this system.',
+        )
+    path = Path(_field(data, 'imageFilePath', str))
+    if not path.is_absolute():
+        raise RequestError(
+            RequestStatus.REQUEST_FIELD_EMPTY, 'The file path must be absolute.'
+        )
+
+
+# Scenes
+
+
+@register('GetSceneList')
+def get_scene_list(model: Model, data: dict[str, Any]):
+    """Get the scenes, indexed from the bottom of the list as OBS does."""
+    collection = model.collection
+    preview = collection.preview if model.studio_mode else None
+    return {
+        'currentProgramSceneName': collection.program.name,
+        'currentProgramSceneUuid': collection.program.uuid,
+        'currentPreviewSceneName': preview.name if preview else None,
+        'currentPreviewSceneUuid': preview.uuid if preview else None,
+        'scenes': [
+            {'sceneIndex': i, 'sceneName': scene.name, 'sceneUuid': scene.uuid}
+            for i, scene in enumerate(reversed(collection.scenes))
+        ],
+    }
+
+
+@register('GetGroupList')
+def get_group_list(model: Model, data: dict[str, Any]):
+    """Get the names of all groups."""
+    return {'groups': list(model.collection.groups)}
+
+
+@register('GetCurrentProgramScene')
+def get_current_program_scene(model: Model, data: dict[str, Any]):
+    """Get the current program scene."""
+    scene = model.collection.program
+    return {
+        'sceneName': scene.name,
+        'sceneUuid': scene.uuid,
+        'currentProgramSceneName': scene.name,
+        'currentProgramSceneUuid': scene.uuid,
+    }
+
+
+@register('SetCurrentProgramScene')
+def set_current_program_scene(model: Model, data: dict[str, Any]):
+    """Set the current program scene."""
+    scene = _scene(model, data)
+    model.collection.program = scene
+    model.emit(
+        'CurrentProgramSceneChanged', {'sceneName': scene.name, 'sceneUuid': scene.uuid}
+    )
+
+
+def _require_studio_mode(model: Model):
+    """Fail the request unless studio mode is enabled."""
+    if not model.studio_mode:
+        raise RequestError(
+            RequestStatus.STUDIO_MODE_NOT_ACTIVE, 'Studio mode is not active.'
+        )
+
+
+@register('GetCurrentPreviewScene')
+def get_current_preview_scene(model: Model, data: dict[str, Any]):
+    """Get the current preview scene, only available in studio mode."""
+    _require_studio_mode(model)
+    scene = model.collection.preview
+    return {
+        'sceneName': scene.name,
+        'sceneUuid': scene.uuid,
+        'currentPreviewSceneName': scene.name,
+        'currentPreviewSceneUuid': scene.uuid,
+    }
+
+
+@register('SetCurrentPreviewScene')
+def set_current_preview_scene(model: Model, data: dict[str, Any]):
+    """Set the current preview scene, only available in studio mode."""
+    _require_studio_mode(model)
+    scene = _scene(model, data)
+    model.collection.preview = scene
+    model.emit(
+        'CurrentPreviewSceneChanged', {'sceneName': scene.name, 'sceneUuid': scene.uuid}
+    )
+
+
+@register('CreateScene')
+def create_scene(model: Model, data: dict[str, Any]):
+    """Create a scene."""
+    scene = model.add_scene(_field(data, 'sceneName', str))
+    return {'sceneUuid': scene.uuid}
+
+
+@register('RemoveScene')
+def remove_scene(model: Model, data: dict[str, Any]):
+    """Remove a scene, the last scene of a collection cannot be removed."""
+    scene = _scene(model, data)
+    collection = model.collection
+    if len(collection.scenes) == 1:
+        raise RequestError(
+            RequestStatus.NOT_ENOUGH_RESOURCES,
+            'You cannot remove the last scene in the collection.',
+        )
+
+    collection.scenes.remove(scene)
+    for other in [*collection.scenes, *collection.groups.values()]:
+        for item in [i for i in other.items if i.source is scene]:
+            other.items.remove(item)
+            model.emit_item_removed(other, item)
+    model.emit(
+        'SceneRemoved',
+        {'sceneName': scene.name, 'sceneUuid': scene.uuid, 'isGroup': False},
+    )
+    if collection.program is scene:
+        collection.program = collection.scenes[0]
+        model.emit(
+            'CurrentProgramSceneChanged',
+            {
+                'sceneName': collection.program.name,
+                'sceneUuid': collection.program.uuid,
+            },
+        )
+    if collection.preview is scene:
+        collection.preview = collection.program
+
+
+@register('SetSceneName')
+def set_scene_name(model: Model, data: dict[str, Any]):
+    """Rename a scene."""
+    scene = _scene(model, data)
+    new_name = _field(data, 'newSceneName', str)
+    if model.name_in_use(new_name):
+        raise RequestError(
+            RequestStatus.RESOURCE_ALREADY_EXISTS,
+            'A source already exists by that new scene name.',
+        )
+    old_name, scene.name = scene.name, new_name
+    model.emit(
+        'SceneNameChanged',
+        {'sceneUuid': scene.uuid, 'oldSceneName': old_name, 'sceneName': new_name},
+    )
+
+
+# Inputs
+
+
+@register('GetInputList')
+def get_input_list(model: Model, data: dict[str, Any]):
+    """Get the inputs, optionally of a single kind."""
+    kind = _field(data, 'inputKind', str, None)
+    return {
+        'inputs': [
+            {
+                'inputKind': input_.kind,
+                'inputName': input_.name,
+                'inputUuid': input_.uuid,
+                'unversionedInputKind': m.unversioned_kind(input_.kind),
+            }
+            for input_ in model.collection.inputs.values()
+            if kind is None or input_.kind == kind
+        ]
+    }
+
+
+@register('GetInputKindList')
+def get_input_kind_list(model: Model, data: dict[str, Any]):
+    """Get the available input kinds."""
+    kinds = list(m.INPUT_KINDS)
+    if _field(data, 'unversioned', bool, False):
+        kinds = list(dict.fromkeys(m.unversioned_kind(kind) for kind in kinds))
+    return {'inputKinds': kinds}
+
+
+@register('GetSpecialInputs')
+def get_special_inputs(model: Model, data: dict[str, Any]):
+    """Get the names of the global audio inputs, none are configured in the stand-in."""
+    return {
+        'desktop1': None,
+        'desktop2': None,
+        'mic1': None,
+        'mic2': None,
+        'mic3': None,
+        'mic4': None,
+    }
+
+
+@register('CreateInput')
+def create_input(model: Model, data: dict[str, Any]):
+    """Create an input and add it to a scene."""
+    scene = _scene(model, data)
+    input_, item = model.add_input(
+        scene,
+        _field(data, 'inputName', str),
+        _field(data, 'inputKind', str),
+        _settings(data, 'inputSettings', None),
+        _field(data, 'sceneItemEnabled', bool, True),
+    )
+    return {'inputUuid': input_.uuid, 'sceneItemId': item.id}
+
+
+@register('RemoveInput')
+def remove_input(model: Model, data: dict[str, Any]):
+    """Remove an input and its scene items."""
+    model.remove_input(_input(model, data))
+
+
+@register('GetInputDefaultSettings')
+def get_input_default_settings(model: Model, data: dict[str, Any]):
+    """Get the default settings of an input kind."""
+    kind = _field(data, 'inputKind', str)
+    if kind not in m.INPUT_KINDS:
+        raise RequestError(
+            RequestStatus.INVALID_INPUT_KIND, 'The specified input kind is invalid.'
+        )
+    return {'defaultInputSettings': m.INPUT_KINDS[kind][1]}
+
+
+@register('GetInputSettings')
+def get_input_settings(model: Model, data: dict[str, Any]):
+    """Get the settings of an input, excluding unchanged defaults as OBS does."""
+    input_ = _input(model, data)
+    return {'inputSettings': input_.settings, 'inputKind': input_.kind}
+
+
+@register('SetInputSettings')
+def set_input_settings(model: Model, data: dict[str, Any]):
+    """Set the settings of an input, merged with the existing ones by default."""
+    input_ = _input(model, data)
+    settings = _settings(data, 'inputSettings')
+    if _field(data, 'overlay', bool, True):
+        input_.settings |= settings
+    else:
+        input_.settings = dict(settings)
+    model.emit(
+        'InputSettingsChanged',
+        {
+            'inputName': input_.name,
+            'inputUuid': input_.uuid,
+            'inputSettings': input_.settings,
+        },
+    )
+
+
+@register('GetInputPropertiesListPropertyItems')
+def get_input_properties_list_property_items(model: Model, data: dict[str, Any]):
+    """Get the items of a list property, only audio devices exist in the stand-in."""
+    input_ = _input(model, data)
+    prop = _field(data, 'propertyName', str)
+    if not (input_.kind.endswith('_capture') and prop == 'device_id'):
+        raise RequestError(
+            RequestStatus.RESOURCE_NOT_FOUND,
+            'Unable to find a property by that name.',
+        )
+    return {
+        'propertyItems': [
+            {'itemEnabled': True, 'itemName': name, 'itemValue': value}
+            for name, value in m.AUDIO_DEVICES
+        ]
+    }
+
+
+@register('GetInputMute')
+def get_input_mute(model: Model, data: dict[str, Any]):
+    """Get the mute state of an audio input."""
+    return {'inputMuted': _audio_input(model, data).muted}
+
+
+def _set_mute(model: Model, input_: m.Input, muted: bool):
+    """Set the mute state of an input, announcing it."""
+    input_.muted = muted
+    model.emit(
+        'InputMuteStateChanged',
+        {'inputName': input_.name, 'inputUuid': input_.uuid, 'inputMuted': muted},
+    )
+
+
+@register('SetInputMute')
+def set_input_mute(model: Model, data: dict[str, Any]):
+    """Set the mute state of an audio input."""
+    _set_mute(model, _audio_input(model, data), _field(data, 'inputMuted', bool))
+
+
+@register('ToggleInputMute')
+def toggle_input_mute(model: Model, data: dict[str, Any]):
+    """Toggle the mute state of an audio input."""
+    input_ = _audio_input(model, data)
+    _set_mute(model, input_, not input_.muted)
+    return {'inputMuted': input_.muted}
+
+
+def _volume_db(mul: float) -> float:
+    """Convert a volume multiplier to decibels."""
+    return 20 * math.log10(mul) if mul > 0 else -100.0
+
+
+@register('GetInputVolume')
+def get_input_volume(model: Model, data: dict[str, Any]):
+    """Get the volume of an audio input."""
+    input_ = _audio_input(model, data)
+    return {
+        'inputVolumeMul': input_.volume_mul,
+        'inputVolumeDb': _volume_db(input_.volume_mul),
+    }
+
+
+@register('SetInputVolume')
+def set_input_volume(model: Model, data: dict[str, Any]):
+    """Set the volume of an audio input, as a multiplier or in decibels."""
+    input_ = _audio_input(model, data)
+    mul = _field(data, 'inputVolumeMul', float, None)
+    db = _field(data, 'inputVolumeDb', float, None)
+    if mul is None and db is None:
+        raise RequestError(
+            RequestStatus.MISSING_REQUEST_FIELD,
+            'You must specify one of `inputVolumeMul` or `inputVolumeDb`.',
+        )
+    if mul is not None and not 0 <= mul <= 20:
+        raise RequestError(
+            RequestStatus.REQUEST_FIELD_OUT_OF_RANGE,
+            'The field value of `inputVolumeMul` is out of range.',
+        )
+    if db is not None and not -100 <= db <= 26:
+        raise RequestError(
+            RequestStatus.REQUEST_FIELD_OUT_OF_RANGE,
+            'The field value of `inputVolumeDb` is out of range.',
+        )
+
+    input_.volume_mul = mul if mul is not None else 10 ** (db / 20)
+    model.emit(
+        'InputVolumeChanged',
+        {
+            'inputName': input_.name,
+            'inputUuid': input_.uuid,
+            'inputVolumeMul': input_.volume_mul,
+            'inputVolumeDb': _volume_db(input_.volume_mul),
+        },
+    )
+
+
+# Filters
+
+
+@register('GetSourceFilterKindList')
+def get_source_filter_kind_list(model: Model, data: dict[str, Any]):
+    """Get the available filter kinds."""
+    return {'sourceFilterKinds': list(m.FILTER_KINDS)}
+
+
+@register('GetSourceFilterList')
+def get_source_filter_list(model: Model, data: dict[str, Any]):
+    """Get the filters of a source."""
+    source = model.find_source(*_names(data, 'source'))
+    return {'filters': [_filter_json(source, f) for f in source.filters]}
+
+
+@register('GetSourceFilterDefaultSettings')
+def get_source_filter_default_settings(model: Model, data: dict[str, Any]):
+    """Get the default settings of a filter kind."""
+    kind = _field(data, 'filterKind', str)
+    if kind not in m.FILTER_KINDS:
+        raise RequestError(
+            RequestStatus.INVALID_FILTER_KIND,
+            'Your specified filter kind is not supported by OBS.',
+        )
+    return {'defaultFilterSettings': m.FILTER_KINDS[kind]}
+
+
+@register('CreateSourceFilter')
+def create_source_filter(model: Model, data: dict[str, Any]):
+    """Create a filter on a source."""
+    source = model.find_source(*_names(data, 'source'))
+    name = _field(data, 'filterName', str)
+    kind = _field(data, 'filterKind', str)
+    if any(f.name == name for f in source.filters):
+        raise RequestError(
+            RequestStatus.RESOURCE_ALREADY_EXISTS,
+            'A filter already exists by that name.',
+        )
+    if kind not in m.FILTER_KINDS:
+        raise RequestError(
+            RequestStatus.INVALID_FILTER_KIND,
+            'Your specified filter kind is not supported by OBS.',
+        )
+
+    filter_ = m.Filter(name, kind, dict(_settings(data, 'filterSettings', {})))
+    source.filters.append(filter_)
+    model.emit(
+        'SourceFilterCreated',
+        {
+            'sourceName': source.name,
+            'filterName': name,
+            'filterKind': kind,
+            'filterIndex': source.filters.index(filter_),
+            'filterSettings': filter_.settings,
+            'defaultFilterSettings': m.FILTER_KINDS[kind],
+        },
+    )
+
+
+@register('RemoveSourceFilter')
+def remove_source_filter(model: Model, data: dict[str, Any]):
+    """Remove a filter from a source."""
+    source = model.find_source(*_names(data, 'source'))
+    filter_ = source.find_filter(_field(data, 'filterName', str))
+    source.filters.remove(filter_)
+    model.emit(
+        'SourceFilterRemoved', {'sourceName': source.name, 'filterName': filter_.name}
+    )
+
+
+@register('GetSourceFilter')
+def get_source_filter(model: Model, data: dict[str, Any]):
+    """Get the state of a filter."""
+    source = model.find_source(*_names(data, 'source'))
+    filter_ = source.find_filter(_field(data, 'filterName', str))
+    response = _filter_json(source, filter_)
+    del response['filterName']
+    return response
+
+
+@register('SetSourceFilterSettings')
+def set_source_filter_settings(model: Model, data: dict[str, Any]):
+    """Set the settings of a filter, merged with the existing ones by default."""
+    source = model.find_source(*_names(data, 'source'))
+    filter_ = source.find_filter(_field(data, 'filterName', str))
+    settings = _settings(data, 'filterSettings')
+    if _field(data, 'overlay', bool, True):
+        filter_.settings |= settings
+    else:
+        filter_.settings = dict(settings)
+
+
+@register('SetSourceFilterEnabled')
+def set_source_filter_enabled(model: Model, data: dict[str, Any]):
+    """Enable or disable a filter."""
+    source = model.find_source(*_names(data, 'source'))
+    filter_ = source.find_filter(_field(data, 'filterName', str))
+    filter_.enabled = _field(data, 'filterEnabled', bool)
+    model.emit(
+        'SourceFilterEnableStateChanged',
+        {
+            'sourceName': source.name,
+            'filterName': filter_.name,
+            'filterEnabled': filter_.enabled,
+        },
+    )
+
+
+# Scene Items
+
+
+@register('GetSceneItemList')
+def get_scene_item_list(model: Model, data: dict[str, Any]):
+    """Get the items in a scene."""
+    scene = _scene(model, data)
+    return {'sceneItems': [_item_json(i, item) for i, item in enumerate(scene.items)]}
+
+
+@register('GetGroupSceneItemList')
+def get_group_scene_item_list(model: Model, data: dict[str, Any]):
+    """Get the items in a group."""
+    name, uuid = _names(data, 'scene')
+    group = next(
+        (
+            g
+            for g in model.collection.groups.values()
+            if (g.name == name if name is not None else g.uuid == uuid)
+        ),
+        None,
+    )
+    if group is None:
+        raise RequestError(
+            RequestStatus.RESOURCE_NOT_FOUND,
+            f'No group was found by the name of `{name or uuid}`.',
+        )
+    return {'sceneItems': [_item_json(i, item) for i, item in enumerate(group.items)]}
+
+
+@register('GetSceneItemId')
+def get_scene_item_id(model: Model, data: dict[str, Any]):
+    """Search a scene for a source, an offset of -1 searches from the top."""
+    scene = _scene(model, data, groups=True)
+    source_name = _field(data, 'sourceName', str)
+    offset = _field(data, 'searchOffset', int, 0)
+    matches = [item for item in scene.items if item.source.name == source_name]
+    if offset < -1:
+        raise RequestError(
+            RequestStatus.REQUEST_FIELD_OUT_OF_RANGE,
+            'The field value of `searchOffset` is below the minimum of `-1`',
+        )
+    try:
+        item = matches[offset]
+    except IndexError:
+        raise RequestError(
+            RequestStatus.RESOURCE_NOT_FOUND,
+            'No scene items were found in the specified scene by that name or offset.',
+        ) from None
+    return {'sceneItemId': item.id}
+
+
+@register('CreateSceneItem')
+def create_scene_item(model: Model, data: dict[str, Any]):
+    """Add an existing source to a scene."""
+    scene = _scene(model, data, groups=True)
+    source = model.find_source(*_names(data, 'source'))
+    if source is scene:
+        raise RequestError(
+            RequestStatus.CANNOT_ACT,
+            'You cannot create scene item of a scene within itself.',
+        )
+    item = scene.add_item(source, _field(data, 'sceneItemEnabled', bool, True))
+    model.emit_item_created(scene, item)
+    return {'sceneItemId': item.id}
+
+
+@register('RemoveSceneItem')
+def remove_scene_item(model: Model, data: dict[str, Any]):
+    """Remove a scene item."""
+    scene, item = _scene_item(model, data)
+    scene.items.remove(item)
+    model.emit_item_removed(scene, item)
+
+
+@register('GetSceneItemEnabled')
+def get_scene_item_enabled(model: Model, data: dict[str, Any]):
+    """Get the enable state of a scene item."""
+    return {'sceneItemEnabled': _scene_item(model, data)[1].enabled}
+
+
+@register('SetSceneItemEnabled')
+def set_scene_item_enabled(model: Model, data: dict[str, Any]):
+    """Set the enable state of a scene item."""
+    scene, item = _scene_item(model, data)
+    item.enabled = _field(data, 'sceneItemEnabled', bool)
+    model.emit(
+        'SceneItemEnableStateChanged',
+        {
+            'sceneName': scene.name,
+            'sceneUuid': scene.uuid,
+            'sceneItemId': item.id,
+            'sceneItemEnabled': item.enabled,
+        },
+    )
+
+
+@register('GetSceneItemLocked')
+def get_scene_item_locked(model: Model, data: dict[str, Any]):
+    """Get the lock state of a scene item."""
+    return {'sceneItemLocked': _scene_item(model, data)[1].locked}
+
+
+@register('SetSceneItemLocked')
+def set_scene_item_locked(model: Model, data: dict[str, Any]):
+    """Set the lock state of a scene item."""
+    _scene_item(model, data)[1].locked = _field(data, 'sceneItemLocked', bool)
+
+
+@register('GetSceneItemIndex')
+def get_scene_item_index(model: Model, data: dict[str, Any]):
+    """Get the index of a scene item, 0 being the bottom."""
+    scene, item = _scene_item(model, data)
+    return {'sceneItemIndex': scene.items.index(item)}
+
+
+@register('GetSceneItemTransform')
+def get_scene_item_transform(model: Model, data: dict[str, Any]):
+    """Get the transform of a scene item."""
+    return {'sceneItemTransform': _scene_item(model, data)[1].transform}
+
+
+@register('SetSceneItemTransform')
+def set_scene_item_transform(model: Model, data: dict[str, Any]):
+    """Update the transform of a scene item, unknown keys are ignored as in OBS."""
+    scene, item = _scene_item(model, data)
+    transform = _field(data, 'sceneItemTransform', dict)
+    item.transform |= {k: v for k, v in transform.items() if k in item.transform}
+    model.emit(
+        'SceneItemTransformChanged',
+        {
+            'sceneName': scene.name,
+            'sceneUuid': scene.uuid,
+            'sceneItemId': item.id,
+            'sceneItemTransform': item.transform,
+        },
+    )
+
+
+# Outputs
+
+
+@register('GetVirtualCamStatus')
+def get_virtual_cam_status(model: Model, data: dict[str, Any]):
+    """Get the status of the virtual camera."""
+    return {'outputActive': model.outputs['virtualcam'].active}
+
+
+@register('StartVirtualCam')
+def start_virtual_cam(model: Model, data: dict[str, Any]):
+    """Start the virtual camera."""
+    _output(model, 'virtualcam', 'VirtualcamStateChanged', True)
+
+
+@register('StopVirtualCam')
+def stop_virtual_cam(model: Model, data: dict[str, Any]):
+    """Stop the virtual camera."""
+    _output(model, 'virtualcam', 'VirtualcamStateChanged', False)
+
+
+@register('ToggleVirtualCam')
+def toggle_virtual_cam(model: Model, data: dict[str, Any]):
+    """Toggle the virtual camera."""
+    active = not model.outputs['virtualcam'].active
+    _output(model, 'virtualcam', 'VirtualcamStateChanged', active)
+    return {'outputActive': active}
+
+
+def _require_replay_buffer(model: Model):
+    """Fail the request unless the replay buffer is enabled in the profile."""
+    mode = model.profile.parameters.get(('Output', 'Mode'), 'Simple')
+    enabled = model.profile.parameters.get((f'{mode}Output', 'RecRB'), 'false')
+    if enabled.lower() != 'true':
+        raise RequestError(
+            RequestStatus.OUTPUT_DISABLED, 'Replay buffer is not available.'
+        )
+
+
+@register('GetReplayBufferStatus')
+def get_replay_buffer_status(model: Model, data: dict[str, Any]):
+    """Get the status of the replay buffer."""
+    _require_replay_buffer(model)
+    return {'outputActive': model.outputs['replaybuffer'].active}
+
+
+@register('StartReplayBuffer')
+def start_replay_buffer(model: Model, data: dict[str, Any]):
+    """Start the replay buffer."""
+    _require_replay_buffer(model)
+    _output(model, 'replaybuffer', 'ReplayBufferStateChanged', True)
+
+
+@register('StopReplayBuffer')
+def stop_replay_buffer(model: Model, data: dict[str, Any]):
+    """Stop the replay buffer."""
+    _require_replay_buffer(model)
+    _output(model, 'replaybuffer', 'ReplayBufferStateChanged', False)
+
+
+@register('ToggleReplayBuffer')
+def toggle_replay_buffer(model: Model, data: dict[str, Any]):
+    """Toggle the replay buffer."""
+    _require_replay_buffer(model)
+    active = not model.outputs['replaybuffer'].active
+    _output(model, 'replaybuffer', 'ReplayBufferStateChanged', active)
+    return {'outputActive': active}
+
+
+@register('SaveReplayBuffer')
+def save_replay_buffer(model: Model, data: dict[str, Any]):
+    """Save the replay buffer."""
+    _require_replay_buffer(model)
+    if not model.outputs['replaybuffer'].active:
+        raise RequestError(
+            RequestStatus.OUTPUT_NOT_RUNNING, 'The replay buffer output is not active.'
+        )
+    model.last_replay = _record_path(model).replace('.mkv', ' replay.mkv')
+    model.emit('ReplayBufferSaved', {'savedReplayPath': model.last_replay})
+
+
+@register('GetLastReplayBufferReplay')
+def get_last_replay_buffer_replay(model: Model, data: dict[str, Any]):
+    """Get the path of the last saved replay."""
+    _require_replay_buffer(model)
+    return {'savedReplayPath': model.last_replay}
+
+
+@register('GetStreamStatus')
+def get_stream_status(model: Model, data: dict[str, Any]):
+    """Get the status of the stream output."""
+    output = model.outputs['stream']
+    return {
+        'outputActive': output.active,
+        'outputReconnecting': False,
+        'outputTimecode': output.timecode,
+        'outputDuration': output.duration,
+        'outputCongestion': 0.0,
+        'outputBytes': 0,
+        'outputSkippedFrames': 0,
+        'outputTotalFrames': 0,
+    }
+
+
+@register('StartStream')
+def start_stream(model: Model, data: dict[str, Any]):
+    """Start the stream output."""
+    _output(model, 'stream', 'StreamStateChanged', True)
+
+
+@register('StopStream')
+def stop_stream(model: Model, data: dict[str, Any]):
+    """Stop the stream output."""
+    _output(model, 'stream', 'StreamStateChanged', False)
+
+
+@register('ToggleStream')
+def toggle_stream(model: Model, data: dict[str, Any]):
+    """Toggle the stream output."""
+    active = not model.outputs['stream'].active
+    _output(model, 'stream', 'StreamStateChanged', active)
+    return {'outputActive': active}
+
+
+@register('SendStreamCaption')
+def send_stream_caption(model: Model, data: dict[str, Any]):
+    """Accept a caption for the stream."""
+    _field(data, 'captionText', str)
+    if not model.outputs['stream'].active:
+        raise RequestError(
+            RequestStatus.OUTPUT_NOT_RUNNING, 'The stream output is not active.'
+        )
+
+
+@register('GetRecordStatus')
+def get_record_status(model: Model, data: dict[str, Any]):
+    """Get the status of the record output."""
+    output = model.outputs['record']
+    return {
+        'outputActive': output.active,
+        'outputPaused': output.paused,
+        'outputTimecode': output.timecode,
+        'outputDuration': output.duration,
+        'outputBytes': 0,
+    }
+
+
+@register('StartRecord')
+def start_record(model: Model, data: dict[str, Any]):
+    """Start the record output."""
+    model.outputs['record'].path = _record_path(model)
+    _output(model, 'record', 'RecordStateChanged', True, outputPath=None)
+
+
+@register('StopRecord')
+def stop_record(model: Model, data: dict[str, Any]):
+    """Stop the record output, responding with the path of the recording."""
+    path = model.outputs['record'].path
+    _output(model, 'record', 'RecordStateChanged', False, outputPath=path)
+    return {'outputPath': path}
+
+
+@register('ToggleRecord')
+def toggle_record(model: Model, data: dict[str, Any]):
+    """Toggle the record output."""
+    if model.outputs['record'].active:
+        stop_record(model, data)
+    else:
+        start_record(model, data)
+    return {'outputActive': model.outputs['record'].active}
+
+
+def _pause_record(model: Model, paused: bool):
+    """Pause or resume the record output."""
+    output = model.outputs['record']
+    if not output.active:
+        raise RequestError(
+            RequestStatus.OUTPUT_NOT_RUNNING, 'The record output is not active.'
+        )
+    if output.paused == paused:
+        raise RequestError(
+            RequestStatus.OUTPUT_PAUSED if paused else RequestStatus.OUTPUT_NOT_PAUSED,
+            f'The record output is {"already" if paused else "not"} paused.',
+        )
+    output.paused = paused
+    model.emit(
+        'RecordStateChanged',
+        {
+            'outputActive': True,
+            'outputState': 'OBS_WEBSOCKET_OUTPUT_PAUSED'
+            if paused
+            else 'OBS_WEBSOCKET_OUTPUT_RESUMED',
+            'outputPath': None,
+        },
+    )
+
+
+@register('PauseRecord')
+def pause_record(model: Model, data: dict[str, Any]):
+    """Pause the record output."""
+    _pause_record(model, True)
+
+
+@register('ResumeRecord')
+def resume_record(model: Model, data: dict[str, Any]):
+    """Resume the record output."""
+    _pause_record(model, False)
+
+
+@register('ToggleRecordPause')
+def toggle_record_pause(model: Model, data: dict[str, Any]):
+    """Toggle pause on the record output."""
+    _pause_record(model, not model.outputs['record'].paused)
+
+
+@register('SplitRecordFile')
+def split_record_file(model: Model, data: dict[str, Any]):
+    """Split the current recording into a new file."""
+    output = model.outputs['record']
+    if not output.active:
+        raise RequestError(
+            RequestStatus.OUTPUT_NOT_RUNNING, 'The record output is not active.'
+        )
+    output.path = _record_path(model)
+    model.emit('RecordFileChanged', {'newOutputPath': output.path})
+
+
+@register('CreateRecordChapter')
+def create_record_chapter(model: Model, data: dict[str, Any]):
+    """Add a chapter marker to the current recording."""
+    _field(data, 'chapterName', str, None)
+    if not model.outputs['record'].active:
+        raise RequestError(
+            RequestStatus.OUTPUT_NOT_RUNNING, 'The record output is not active.'
+        )
+
+
+# Media Inputs
+
+
+@register('GetMediaInputStatus')
+def get_media_input_status(model: Model, data: dict[str, Any]):
+    """Get the playback status of a media input."""
+    input_ = _media_input(model, data)
+    playing = input_.media_state not in (
+        'OBS_MEDIA_STATE_NONE',
+        'OBS_MEDIA_STATE_STOPPED',
+    )
+    return {
+        'mediaState': input_.media_state,
+        'mediaDuration': input_.media_duration if playing else None,
+        'mediaCursor': input_.cursor if playing else None,
+    }
+
+
+@register('SetMediaInputCursor')
+def set_media_input_cursor(model: Model, data: dict[str, Any]):
+    """Set the playback position of a media input."""
+    input_ = _media_input(model, data)
+    cursor = _field(data, 'mediaCursor', float)
+    if cursor < 0:
+        raise RequestError(
+            RequestStatus.REQUEST_FIELD_OUT_OF_RANGE,
+            'The field value of `mediaCursor` is below the minimum of `0`',
+        )
+    _play(model, input_, min(int(cursor), input_.media_duration), resume=False)
+
+
+@register('OffsetMediaInputCursor')
+def offset_media_input_cursor(model: Model, data: dict[str, Any]):
+    """Move the playback position of a media input."""
+    input_ = _media_input(model, data)
+    offset = _field(data, 'mediaCursorOffset', float)
+    cursor = max(0, min(input_.cursor + int(offset), input_.media_duration))
+    _play(model, input_, cursor, resume=False)
+
+
+def _play(model: Model, input_: m.Input, cursor: int, resume: bool = True):
+    """Move the media cursor, resuming playback if requested."""
+    playing = input_.media_state == 'OBS_MEDIA_STATE_PLAYING'
+    input_.media_cursor = cursor
+    input_.media_started = None
+    if resume or playing:
+        input_.media_state = 'OBS_MEDIA_STATE_PLAYING'
+        input_.media_started = time.monotonic()
+        started = input_.media_started
+
+        def ended():
+            if input_.media_started == started:
+                input_.media_cursor = input_.media_duration
+                input_.media_started = None
+                input_.media_state = 'OBS_MEDIA_STATE_ENDED'
+                model.emit(
+                    'MediaInputPlaybackEnded',
+                    {'inputName': input_.name, 'inputUuid': input_.uuid},
+                )
+
+        model.schedule((input_.media_duration - cursor) / 1000, ended)
+
+
+@register('TriggerMediaInputAction')
+def trigger_media_input_action(model: Model, data: dict[str, Any]):
+    """Play, pause, stop or restart a media input."""
+    input_ = _media_input(model, data)
+    action = _field(data, 'mediaAction', str)
+    match action.removeprefix('OBS_WEBSOCKET_MEDIA_INPUT_ACTION_'):
+        case 'PLAY':
+            if input_.media_state != 'OBS_MEDIA_STATE_PLAYING':
+                ended = input_.media_state in (
+                    'OBS_MEDIA_STATE_ENDED',
+                    'OBS_MEDIA_STATE_STOPPED',
+                )
+                _play(model, input_, 0 if ended else input_.cursor)
+                if ended:
+                    model.emit(
+                        'MediaInputPlaybackStarted',
+                        {'inputName': input_.name, 'inputUuid': input_.uuid},
+                    )
+        case 'PAUSE':
+            if input_.media_state == 'OBS_MEDIA_STATE_PLAYING':
+                input_.media_cursor = input_.cursor
+                input_.media_started = None
+                input_.media_state = 'OBS_MEDIA_STATE_PAUSED'
+        case 'STOP':
+            input_.media_cursor = 0
+            input_.media_started = None
+            input_.media_state = 'OBS_MEDIA_STATE_STOPPED'
+        case 'RESTART':
+            _play(model, input_, 0)
+            model.emit(
+                'MediaInputPlaybackStarted',
+                {'inputName': input_.name, 'inputUuid': input_.uuid},
+            )
+        case 'NONE' | 'NEXT' | 'PREVIOUS':
+            pass
+        case _:
+            raise RequestError(
+                RequestStatus.INVALID_REQUEST_FIELD_TYPE,
+                'The field value of `mediaAction` is not a valid media action.',
+            )
+    model.emit(
+        'MediaInputActionTriggered',
+        {'inputName': input_.name, 'inputUuid': input_.uuid, 'mediaAction': action},
+    )
+
+
+# Ui
+
+
+@register('GetStudioModeEnabled')
+def get_studio_mode_enabled(model: Model, data: dict[str, Any]):
+    """Get whether studio mode is enabled."""
+    return {'studioModeEnabled': model.studio_mode}
+
+
+@register('SetStudioModeEnabled')
+def set_studio_mode_enabled(model: Model, data: dict[str, Any]):
+    """Enable or disable studio mode, the preview starts as the program scene."""
+    enabled = _field(data, 'studioModeEnabled', bool)
+    if enabled == model.studio_mode:
+        return
+    model.studio_mode = enabled
+    if enabled:
+        model.collection.preview = model.collection.program
+    model.emit('StudioModeStateChanged', {'studioModeEnabled': enabled})
+
+
+@register('GetMonitorList')
+def get_monitor_list(model: Model, data: dict[str, Any]):
+    """Get the monitors that projectors can be opened on."""
+    return {'monitors': list(m.MONITORS)}
+
+
+@register('OpenSourceProjector')
+def open_source_projector(model: Model, data: dict[str, Any]):
+    """Accept a projector request, no window is opened by the stand-in."""
+    model.find_source(*_names(data, 'source'))
+    index = _field(data, 'monitorIndex', int, -1)
+    if index != -1 and not 0 <= index < len(m.MONITORS):
+        raise RequestError(
+            RequestStatus.REQUEST_FIELD_OUT_OF_RANGE,
+            'The specified monitor index does not exist.',
+        )
@@ -0,0 +1,325 @@
+"""module serving the obs-websocket v5 protocol from an in-memory model."""
+
+import logging
+import secrets
+import socketserver
+import threading
+import time
+from typing import Any, Optional
+
+from obsws_cli import framing
+from obsws_cli.codec import JSON, Codec
+from obsws_cli.framing import (
+    CLOSE_ALREADY_IDENTIFIED,
+    CLOSE_AUTHENTICATION_FAILED,
+    CLOSE_INVALID_DATA_FIELD_VALUE,
+    CLOSE_MESSAGE_DECODE_ERROR,
+    CLOSE_MISSING_DATA_FIELD,
+    CLOSE_NOT_IDENTIFIED,
+    CLOSE_UNKNOWN_OP_CODE,
+    CLOSE_UNSUPPORTED_RPC_VERSION,
+    ProtocolError,
+    auth_response,
+)
+
+from .handlers import registry
+from .model import Model, RequestError, RequestStatus
+
+logger = logging.getLogger(__name__)
+
+RPC_VERSION = 1
+
+# RequestBatchExecutionType values
+SERIAL_REALTIME = 0
+SERIAL_FRAME = 1
+PARALLEL = 2
+
+
+class Session:
+    """A single client connection."""
+
+    def __init__(self, server: 'FakeOBS', ws: framing.WebSocket, codec: Codec = JSON):
+        """Initialize the Session for an accepted WebSocket."""
+        self.server = server
+        self.ws = ws
+        self.codec = codec
+        self.identified = False
+        self.in_batch = False
+        self.subscriptions = 0
+        self.received = 0
+        self.sent = 0
+        self.salt = secrets.token_urlsafe(32)
+        self.challenge = secrets.token_urlsafe(32)
+
+    def send(self, op: int, data: dict[str, Any]):
+        """Send a message to the client."""
+        self.sent += 1
+        self.ws.send(self.codec.encode({'op': op, 'd': data}))
+
+    def on_event(self, event: str, intent: int, data: dict[str, Any]):
+        """Forward a model event if the client subscribed to it."""
+        if not self.identified or not self.subscriptions & intent:
+            return
+        try:
+            self.send(5, {'eventType': event, 'eventIntent': intent, 'eventData': data})
+        except (OSError, framing.ConnectionClosed):
+            pass
+
+    def run(self):
+        """Greet the client and serve its messages until it disconnects."""
+        hello = {'obsWebSocketVersion': '5.5.4', 'rpcVersion': RPC_VERSION}
+        if self.server.password:
+            hello['authentication'] = {
+                'challenge': self.challenge,
+                'salt': self.salt,
+            }
+        self.send(0, hello)
+
+        try:
+            while True:
+                message = self.ws.recv()
+                self.received += 1
+                try:
+                    payload = self.codec.decode(message)
+                    op, data = payload['op'], payload['d']
+                except (ValueError, TypeError, KeyError):
+                    raise ProtocolError(
+                        CLOSE_MESSAGE_DECODE_ERROR, 'Unable to decode the message.'
+                    ) from None
+                if not isinstance(data, dict):
+                    raise ProtocolError(
+                        CLOSE_MISSING_DATA_FIELD, 'The message is missing its data.'
+                    )
+                self.dispatch(op, data)
+        except ProtocolError as e:
+            logger.debug('closing session: %s', e.reason)
+            self.ws.close(e.code, e.reason)
+        except framing.ConnectionClosed:
+            pass
+
+    def dispatch(self, op: int, data: dict[str, Any]):
+        """Handle a single message from the client."""
+        with self.server.model.lock:
+            self.server.round_trips += 1
+        match op:
+            case 1:
+                if self.identified:
+                    raise ProtocolError(
+                        CLOSE_ALREADY_IDENTIFIED, 'You are already identified.'
+                    )
+                self.identify(data)
+            case 3:
+                self.require_identified()
+                self.subscriptions = data.get('eventSubscriptions', self.subscriptions)
+                self.send(2, {'negotiatedRpcVersion': RPC_VERSION})
+            case 6:
+                self.require_identified()
+                self.send(7, self.request(data))
+            case 8:
+                self.require_identified()
+                self.send(9, self.request_batch(data))
+            case _:
+                raise ProtocolError(CLOSE_UNKNOWN_OP_CODE, f'Unknown OpCode: {op}')
+
+    def require_identified(self):
+        """Close the session if the client has not identified yet."""
+        if not self.identified:
+            raise ProtocolError(
+                CLOSE_NOT_IDENTIFIED, 'You must identify before sending requests.'
+            )
+
+    def identify(self, data: dict[str, Any]):
+        """Check the client's rpcVersion and authentication, then identify it."""
+        if data.get('rpcVersion') != RPC_VERSION:
+            raise ProtocolError(
+                CLOSE_UNSUPPORTED_RPC_VERSION, 'Unsupported RPC version.'
+            )
+        if self.server.password and data.get('authentication') != auth_response(
+            self.server.password, self.salt, self.challenge
+        ):
+            raise ProtocolError(CLOSE_AUTHENTICATION_FAILED, 'Authentication failed.')
+        self.subscriptions = data.get('eventSubscriptions', 2047)
+        self.identified = True
+        self.send(2, {'negotiatedRpcVersion': RPC_VERSION})
+
+    def request(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Run a single request and build its response."""
+        request_type = data.get('requestType')
+        if 'requestId' not in data or not isinstance(request_type, str):
+            raise ProtocolError(
+                CLOSE_MISSING_DATA_FIELD,
+                'Your request is missing a requestType or requestId.',
+            )
+        response = {
+            'requestType': request_type,
+            'requestId': data['requestId'],
+            'requestStatus': {'result': True, 'code': int(RequestStatus.SUCCESS)},
+        }
+
+        request_data = data.get('requestData') or {}
+        try:
+            if request_type == 'Sleep':
+                self.sleep(request_data)
+                response_data = None
+            elif request_type not in registry:
+                raise RequestError(
+                    RequestStatus.UNKNOWN_REQUEST_TYPE,
+                    'Your request type is not valid.',
+                )
+            else:
+                with self.server.model.lock:
+                    response_data = registry[request_type](
+                        self.server.model, request_data
+                    )
+                if request_type == 'GetStats':
+                    response_data |= {
+                        'webSocketSessionIncomingMessages': self.received,
+                        'webSocketSessionOutgoingMessages': self.sent,
+                    }
+        except RequestError as e:
+            response['requestStatus'] = {
+                'result': False,
+                'code': int(e.code),
+                'comment': e.comment,
+            }
+        except Exception as e:
+            logger.exception('request %s failed', request_type)
+            response['requestStatus'] = {
+                'result': False,
+                'code': int(RequestStatus.REQUEST_PROCESSING_FAILED),
+                'comment': f'Request processing failed: {e}',
+            }
+        else:
+            if response_data is not None:
+                response['responseData'] = response_data
+        return response
+
+    def sleep(self, data: dict[str, Any]):
+        """Handle the Sleep request, which OBS only allows in batches."""
+        if not self.in_batch:
+            raise RequestError(
+                RequestStatus.UNKNOWN_REQUEST_TYPE,
+                'The Sleep request is only available in request batches.',
+            )
+        if 'sleepMillis' in data:
+            time.sleep(data['sleepMillis'] / 1000)
+        elif 'sleepFrames' in data:
+            fps = self.server.model.profile.video
+            time.sleep(
+                data['sleepFrames'] * fps['fpsDenominator'] / fps['fpsNumerator']
+            )
+        else:
+            raise RequestError(
+                RequestStatus.MISSING_REQUEST_FIELD,
+                'Your request is missing the `sleepMillis` field.',
+            )
+
+    def request_batch(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Run a request batch and build its response."""
+        if 'requestId' not in data or not isinstance(data.get('requests'), list):
+            raise ProtocolError(
+                CLOSE_MISSING_DATA_FIELD,
+                'Your request batch is missing a requestId or requests.',
+            )
+        execution_type = data.get('executionType', SERIAL_REALTIME)
+        if execution_type not in (SERIAL_REALTIME, SERIAL_FRAME, PARALLEL):
+            raise ProtocolError(
+                CLOSE_INVALID_DATA_FIELD_VALUE, 'Invalid executionType.'
+            )
+        halt = data.get('haltOnFailure', False) and execution_type != PARALLEL
+
+        results = []
+        self.in_batch = execution_type != PARALLEL
+        try:
+            for request in data['requests']:
+                result = self.request(request if isinstance(request, dict) else {})
+                results.append(result)
+                if halt and not result['requestStatus']['result']:
+                    break
+        finally:
+            self.in_batch = False
+        return {'requestId': data['requestId'], 'results': results}
+
+
+class _Handler(framing.Handler):
+    """Serve a Session on each accepted WebSocket."""
+
+    server: 'FakeOBS'
+
+    def serve(self, ws: framing.WebSocket, codec: Codec):
+        session = Session(self.server, ws, codec)
+        with self.server.model.lock:
+            self.server.model.listeners.append(session.on_event)
+            self.server.sessions.add(session)
+        try:
+            session.run()
+        finally:
+            with self.server.model.lock:
+                self.server.model.listeners.remove(session.on_event)
+                self.server.sessions.discard(session)
+
+
+class FakeOBS(socketserver.ThreadingTCPServer):
+    """A stand-in OBS serving obs-websocket v5 from an in-memory model.
+
+    Nothing is rendered, recorded or streamed, but requests change the
+    model the way they would change OBS and the matching events are sent.
+    Port 0 picks a free port, read it back from the port attribute.
+    round_trips counts the messages received from clients, across sessions.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(
+        self,
+        host: str = 'localhost',
+        port: int = 0,
+        password: str = '',
+        model: Optional[Model] = None,
+    ):
+        """Initialize the FakeOBS and bind its socket."""
+        super().__init__((host, port), _Handler)
+        self.password = password
+        self.model = model or Model()
+        self.round_trips = 0
+        self.sessions: set[Session] = set()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        """The port the server is listening on."""
+        return self.server_address[1]
+
+    def start(self) -> 'FakeOBS':
+        """Serve in a background thread."""
+        self._thread = threading.Thread(
+            target=self.serve_forever, name='fakeobs', daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving, closing every client connection as OBS does when it exits."""
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()
+        with self.model.lock:
+            sessions = list(self.sessions)
+        for session in sessions:
+            try:
+                session.ws.close(framing.CLOSE_GOING_AWAY, 'Server stopping.')
+            except (OSError, ValueError):
+                # the client disconnected while the server was stopping
+                pass
+        self.model.close()
+
+    def __enter__(self) -> 'FakeOBS':
+        """Start serving on entering the context."""
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """Stop serving on leaving the context."""
+        self.stop()
@@ -0,0 +1,378 @@
+"""module for running a command against several OBS hosts at once.
+
+Each host gets its own connection and thread, and the command is run
+in-process against it as the rules engine does. Output is captured per
+thread and written once every host has finished, grouped by host.
+"""
+
+import io
+import json
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import typer
+
+from . import client, console, envconfig
+
+
+class FanoutError(Exception):
+    """Raised when the hosts to run against cannot be resolved."""
+
+
+@dataclass
+class Target:
+    """A named OBS host."""
+
+    name: str
+    host: str
+    port: int
+    password: str
+
+    @property
+    def address(self) -> str:
+        """The host and port of the target."""
+        return f'{self.host}:{self.port}'
+
+
+@dataclass
+class Result:
+    """The outcome of running a command against a target."""
+
+    target: Target
+    exit_code: int
+    stdout: str
+    stderr: str
+    elapsed: float
+    error: Optional[str] = None
+
+
+def parse_target(name: str, spec: str, port: int, password: str) -> Target:
+    """Parse a host[:port[:password]] spec, defaulting to the given port and password."""
+    host, _, rest = spec.partition(':')
+    port_str, _, target_password = rest.partition(':')
+    if not host:
+        raise FanoutError(f'Target {name} has no host: {spec!r}')
+    try:
+        target_port = int(port_str) if port_str else port
+    except ValueError:
+        raise FanoutError(f'Target {name} has an invalid port: {port_str!r}') from None
+    return Target(name, host, target_port, target_password or password)
+
+
+def resolve(
+    hosts: Optional[str], all_hosts: bool, port: int, password: str
+) -> list[Target]:
+    """Resolve the targets named by --hosts or --all-hosts from the inventory.
+
+    Args:
+    ----
+        hosts (str | None): Comma separated target names
+        all_hosts (bool): Use every target in the inventory
+        port (int): The port of targets that do not set one
+        password (str): The password of targets that do not set one
+
+    Returns:
+    -------
+        list: The targets, in the order they were named
+
+    Raises:
+    ------
+        FanoutError: If a name is not in the inventory, or there are no targets
+
+    """
+    inventory = envconfig.targets()
+    if all_hosts:
+        names = sorted(inventory)
+    else:
+        names = list(dict.fromkeys(n.strip().lower() for n in hosts.split(',')))
+        names = [n for n in names if n]
+
+    unknown = [n for n in names if n not in inventory]
+    if unknown:
+        raise FanoutError(
+            f'Unknown hosts: {", ".join(unknown)}. Define them as OBSWS_CLI_TARGET_<NAME>=host[:port[:password]]'
+        )
+    if not names:
+        raise FanoutError(
+            'No hosts defined. Define them as OBSWS_CLI_TARGET_<NAME>=host[:port[:password]]'
+        )
+    return [parse_target(n, inventory[n], port, password) for n in names]
+
+
+class Sync:
+    """Release a request on every host of a fan-out at the same moment.
+
+    Each host measures its round trip time and waits for the others. Once
+    every host is ready they share a release time, and each sends its
+    request half a round trip early so the requests arrive together.
+    """
+
+    MARGIN = 0.05
+    # how long before its send time a host stops sleeping and spins
+    SPIN = 0.002
+    # the GIL switch interval while any host spins, so none holds the
+    # others past their send time for the default 5 ms
+    SWITCH_INTERVAL = 0.0001
+
+    def __init__(self, parties: int):
+        """Initialize the Sync for the given number of hosts."""
+        self._barrier = threading.Barrier(parties, action=self._schedule)
+        self._lock = threading.Lock()
+        self._spinning = 0
+        self._switch_interval = 0.0
+        self.release_at = 0.0
+        self.rtts: dict[str, float] = {}
+        self.offsets: dict[str, float] = {}
+
+    def _schedule(self):
+        """Set the release time, once every host is ready."""
+        self.release_at = time.perf_counter() + self.MARGIN + max(self.rtts.values())
+
+    def wait(self, name: str, rtt: float, timeout: float) -> float:
+        """Block until it is time for this host to send, returning the send time.
+
+        Raises threading.BrokenBarrierError if another host failed before the release.
+        """
+        with self._lock:
+            self.rtts[name] = rtt
+        self._barrier.wait(timeout)
+
+        send_at = self.release_at - rtt / 2
+        # sleep is too coarse to hit the release time, spin for the last stretch
+        remaining = send_at - time.perf_counter()
+        if remaining > self.SPIN:
+            time.sleep(remaining - self.SPIN)
+        self._spin_until(send_at)
+        return send_at
+
+    def _spin_until(self, deadline: float):
+        """Spin until a deadline, lowering the switch interval while any host spins."""
+        with self._lock:
+            if not self._spinning:
+                self._switch_interval = sys.getswitchinterval()
+                sys.setswitchinterval(self.SWITCH_INTERVAL)
+            self._spinning += 1
+        try:
+            while time.perf_counter() < deadline:
+                pass
+        finally:
+            with self._lock:
+                self._spinning -= 1
+                if not self._spinning:
+                    sys.setswitchinterval(self._switch_interval)
+
+    def record(self, name: str, received: float) -> float:
+        """Record when a host's event was received, returning its offset from the release.
+
+        The event is assumed to have taken half the host's round trip to arrive.
+        """
+        offset = received - self.rtts[name] / 2 - self.release_at
+        with self._lock:
+            self.offsets[name] = offset
+        return offset
+
+    def abort(self):
+        """Break the barrier so hosts waiting for this one give up."""
+        self._barrier.abort()
+
+    @property
+    def skew(self) -> float:
+        """The spread of the recorded offsets in seconds."""
+        return max(self.offsets.values()) - min(self.offsets.values())
+
+
+def measure_rtt(obsws_client: client.ReqClient, samples: int = 5) -> float:
+    """Measure the round trip time to OBS as the fastest of several GetVersion requests."""
+    rtts = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        obsws_client.send('GetVersion', raw=True)
+        rtts.append(time.perf_counter() - start)
+    return min(rtts)
+
+
+class _Router(io.TextIOBase):
+    """A stream writing to the current thread's capture buffer, if it has one."""
+
+    def __init__(self, stream, name: str, local: threading.local):
+        self._stream = stream
+        self._name = name
+        self._local = local
+
+    @property
+    def _target(self):
+        return getattr(self._local, self._name, None) or self._stream
+
+    def write(self, s: str) -> int:
+        return self._target.write(s)
+
+    def flush(self):
+        self._target.flush()
+
+    def isatty(self) -> bool:
+        return self._target.isatty()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._target, name)
+
+
+def run(
+    ctx: typer.Context,
+    targets: list[Target],
+    args: list[str],
+    timeout: int,
+    sync: Sync,
+) -> list[Result]:
+    """Run the command given by args against every target concurrently.
+
+    Args:
+    ----
+        ctx (typer.Context): The root context, its style and output are shared
+        targets (list): The hosts to run against
+        args (list): The command and its arguments
+        timeout (int): The connection timeout
+        sync (Sync): Shared with every host, for commands that synchronise them
+
+    Returns:
+    -------
+        list: A result per target, in the order given
+
+    """
+    cli = ctx.find_root().command
+    local = threading.local()
+    results: list[Optional[Result]] = [None] * len(targets)
+
+    def worker(i: int, target: Target):
+        local.stdout, local.stderr = io.StringIO(), io.StringIO()
+        start = time.perf_counter()
+        exit_code, error = 1, None
+        connection = {
+            'host': target.host,
+            'port': target.port,
+            'password': target.password,
+            'timeout': timeout,
+        }
+        try:
+            with client.ReqClient(
+                **connection, protocol=ctx.obj['protocol']
+            ) as obsws_client:
+                exit_code = (
+                    cli.main(
+                        args=args,
+                        prog_name='obsws-cli',
+                        obj={
+                            'connection': connection,
+                            'obsws': obsws_client,
+                            'style': ctx.obj['style'],
+                            'output': ctx.obj['output'],
+                            'protocol': ctx.obj['protocol'],
+                            'target': target.name,
+                            'sync': sync,
+                        },
+                        standalone_mode=False,
+                    )
+                    or 0
+                )
+        except Exception as e:
+            format_message = getattr(e, 'format_message', None)
+            error = format_message() if format_message else str(e) or type(e).__name__
+        finally:
+            # Hosts still waiting to synchronise with this one would wait forever.
+            sync.abort()
+        results[i] = Result(
+            target,
+            exit_code,
+            local.stdout.getvalue(),
+            local.stderr.getvalue(),
+            time.perf_counter() - start,
+            error,
+        )
+
+    stdout, stderr = sys.stdout, sys.stderr
+    sys.stdout = _Router(stdout, 'stdout', local)
+    sys.stderr = _Router(stderr, 'stderr', local)
+    try:
+        threads = [
+            threading.Thread(target=worker, args=(i, target), daemon=True)
+            for i, target in enumerate(targets)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
+    return results
+
+
+def merge_output(output: str, results: list[Result]) -> str:
+    """Merge the stdout of every host into one document in the output format.
+
+    Records written in a raw format are already tagged with their host, so
+    JSON arrays are concatenated and repeated TSV headers dropped. Tables
+    and messages are grouped under a header per host.
+    """
+    outputs = [r.stdout for r in results if r.stdout]
+    match output:
+        case 'json':
+            try:
+                merged = [record for out in outputs for record in json.loads(out)]
+            except (ValueError, TypeError):
+                pass
+            else:
+                return json.dumps(merged) + '\n'
+        case 'ndjson':
+            return ''.join(outputs)
+        case 'tsv':
+            header = outputs[0].partition('\n')[0] if outputs else ''
+            return ''.join(
+                out
+                if i == 0 or not out.startswith(header + '\n')
+                else out.partition('\n')[2]
+                for i, out in enumerate(outputs)
+            )
+
+    return '\n'.join(
+        f'==> {r.target.name} ({r.target.address}) <==\n{r.stdout}'
+        for r in results
+        if r.stdout
+    )
+
+
+def report(ctx: typer.Context, results: list[Result], sync: Sync) -> int:
+    """Write the merged output and a per-host summary, returning the exit code."""
+    sys.stdout.write(merge_output(ctx.obj['output'], results))
+    sys.stdout.flush()
+    for result in results:
+        for line in result.stderr.splitlines():
+            sys.stderr.write(f'{result.target.name}: {line}\n')
+    sys.stderr.flush()
+
+    failed = [r for r in results if r.error or r.exit_code]
+    name_width = max(len(r.target.name) for r in results)
+    address_width = max(len(r.target.address) for r in results)
+    for result in results:
+        if result.error:
+            status = f'failed: {result.error}'
+        elif result.exit_code:
+            status = f'exited with code {result.exit_code}'
+        else:
+            status = 'ok'
+        console.info.print(
+            f'{result.target.name:<{name_width}}  '
+            f'{result.target.address:<{address_width}}  '
+            f'{result.elapsed * 1000:>9.2f} ms  {status}'
+        )
+    console.info.print(
+        f'{len(results) - len(failed)} of {len(results)} hosts succeeded in '
+        f'{max((r.elapsed for r in results), default=0) * 1000:.2f} ms'
+    )
+    if sync.offsets:
+        console.info.print(
+            f'{len(sync.offsets)} hosts synchronised with a skew of '
+            f'{sync.skew * 1000:.2f} ms'
+        )
+    return 1 if failed else 0
@@ -0,0 +1,335 @@
+"""module implementing the server side of the WebSocket protocol (RFC 6455).
+
+Only what the bundled servers need is supported: the opening handshake,
+text and binary messages (fragmented or not), ping/pong and the closing
+handshake. Extensions such as permessage-deflate are never negotiated.
+
+The parts of obs-websocket v5 both the stand-in OBS and the serve daemon
+speak are here too: its close codes, authentication and a request
+handler accepting clients in any of the codecs. The Identify message
+a client answers with is built here as well, for the request client.
+"""
+
+import base64
+import hashlib
+import socket
+import socketserver
+import struct
+import threading
+from typing import Any, BinaryIO, Optional, Sequence
+
+import obsws_python as obsws
+
+from . import codec
+from .codec import JSON, Codec
+
+GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+OP_CONTINUATION = 0x0
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+CLOSE_NORMAL = 1000
+CLOSE_GOING_AWAY = 1001
+CLOSE_PROTOCOL_ERROR = 1002
+CLOSE_NO_STATUS = 1005
+CLOSE_ABNORMAL = 1006
+CLOSE_TOO_BIG = 1009
+CLOSE_TRY_AGAIN_LATER = 1013
+
+# WebSocketCloseCode values, as OBS sends them
+CLOSE_MESSAGE_DECODE_ERROR = 4002
+CLOSE_MISSING_DATA_FIELD = 4003
+CLOSE_INVALID_DATA_FIELD_VALUE = 4005
+CLOSE_UNKNOWN_OP_CODE = 4006
+CLOSE_NOT_IDENTIFIED = 4007
+CLOSE_ALREADY_IDENTIFIED = 4008
+CLOSE_AUTHENTICATION_FAILED = 4009
+CLOSE_UNSUPPORTED_RPC_VERSION = 4010
+
+MAX_HEADER_LINES = 100
+MAX_MESSAGE_SIZE = 64 * 1024 * 1024
+
+
+class ConnectionClosed(Exception):
+    """Exception raised when the connection has been closed."""
+
+    def __init__(self, code: int = CLOSE_NO_STATUS, reason: str = ''):
+        """Initialize the exception with the close code and reason."""
+        super().__init__(f'connection closed with code {code} {reason}'.strip())
+        self.code = code
+        self.reason = reason
+
+
+class HandshakeError(Exception):
+    """Exception raised when a client does not send a valid upgrade request."""
+
+
+class ProtocolError(Exception):
+    """Exception raised when a client breaks obs-websocket's protocol, it is disconnected."""
+
+    def __init__(self, code: int, reason: str):
+        """Initialize the ProtocolError with a WebSocket close code and reason."""
+        super().__init__(reason)
+        self.code = code
+        self.reason = reason
+
+
+def auth_response(password: str, salt: str, challenge: str) -> str:
+    """Compute the authentication string a client sends for a password."""
+    secret = base64.b64encode(hashlib.sha256((password + salt).encode()).digest())
+    return base64.b64encode(
+        hashlib.sha256(secret + challenge.encode()).digest()
+    ).decode()
+
+
+def identify_payload(hello: dict[str, Any], password: str, subs: int) -> dict:
+    """Build the Identify message answering a server's Hello.
+
+    Raises obsws.error.OBSSDKError if the server wants a password and none was given.
+    """
+    payload = {'op': 1, 'd': {'rpcVersion': 1, 'eventSubscriptions': subs}}
+
+    if 'authentication' in hello['d']:
+        if not password:
+            raise obsws.error.OBSSDKError(
+                'authentication enabled but no password provided'
+            )
+        auth = hello['d']['authentication']
+        payload['d']['authentication'] = auth_response(
+            password, auth['salt'], auth['challenge']
+        )
+    return payload
+
+
+def apply_mask(payload: bytes, mask: bytes) -> bytes:
+    """Apply a masking key to a frame payload, masking and unmasking alike."""
+    length = len(payload)
+    key = (mask * (length // 4 + 1))[:length]
+    return (int.from_bytes(payload, 'big') ^ int.from_bytes(key, 'big')).to_bytes(
+        length, 'big'
+    )
+
+
+class WebSocket:
+    """The server end of a WebSocket connection over buffered socket files.
+
+    recv() must only be called from one thread, send() may be called from any.
+    """
+
+    def __init__(
+        self,
+        rfile: BinaryIO,
+        wfile: BinaryIO,
+        sock: Optional[socket.socket] = None,
+    ):
+        """Initialize the WebSocket with the connection's read and write files."""
+        self._rfile = rfile
+        self._wfile = wfile
+        self._sock = sock
+        self._send_lock = threading.Lock()
+        self.closed = False
+        self.headers: dict[str, str] = {}
+        self.path = ''
+        self.subprotocol: Optional[str] = None
+
+    def _read(self, n: int) -> bytes:
+        """Read exactly n bytes from the connection."""
+        data = self._rfile.read(n)
+        if len(data) < n:
+            self.closed = True
+            raise ConnectionClosed(CLOSE_ABNORMAL, 'connection lost')
+        return data
+
+    def accept(self, subprotocols: Sequence[str] = ()) -> Optional[str]:
+        """Perform the opening handshake.
+
+        Args:
+        ----
+            subprotocols (Sequence): Subprotocols the server supports, in order of preference
+
+        Returns:
+        -------
+            str | None: The negotiated subprotocol, None if the client offered none we support
+
+        """
+        request_line = self._rfile.readline(65537).decode('latin-1').rstrip('\r\n')
+        for _ in range(MAX_HEADER_LINES):
+            line = self._rfile.readline(65537).decode('latin-1').rstrip('\r\n')
+            if not line:
+                break
+            name, _, value = line.partition(':')
+            self.headers[name.strip().lower()] = value.strip()
+        else:
+            raise HandshakeError('too many request headers')
+
+        method, _, rest = request_line.partition(' ')
+        self.path = rest.partition(' ')[0]
+        key = self.headers.get('sec-websocket-key')
+        if (
+            method != 'GET'
+            or 'websocket' not in self.headers.get('upgrade', '').lower()
+            or not key
+        ):
+            self._wfile.write(
+                b'HTTP/1.1 400 Bad Request\r\n'
+                b'Content-Length: 0\r\nConnection: close\r\n\r\n'
+            )
+            raise HandshakeError('not a WebSocket upgrade request')
+
+        offered = [
+            p.strip()
+            for p in self.headers.get('sec-websocket-protocol', '').split(',')
+            if p.strip()
+        ]
+        self.subprotocol = next((p for p in subprotocols if p in offered), None)
+
+        accept_key = base64.b64encode(
+            hashlib.sha1((key + GUID).encode()).digest()
+        ).decode()
+        response = [
+            'HTTP/1.1 101 Switching Protocols',
+            'Upgrade: websocket',
+            'Connection: Upgrade',
+            f'Sec-WebSocket-Accept: {accept_key}',
+        ]
+        if self.subprotocol:
+            response.append(f'Sec-WebSocket-Protocol: {self.subprotocol}')
+        self._wfile.write(('\r\n'.join(response) + '\r\n\r\n').encode('latin-1'))
+        self._wfile.flush()
+        return self.subprotocol
+
+    def _read_frame(self) -> tuple[bool, int, bytes]:
+        """Read a single frame, returning its FIN bit, opcode and payload."""
+        first, second = self._read(2)
+        length = second & 0x7F
+        if length == 126:
+            (length,) = struct.unpack('!H', self._read(2))
+        elif length == 127:
+            (length,) = struct.unpack('!Q', self._read(8))
+        if length > MAX_MESSAGE_SIZE:
+            self.close(CLOSE_TOO_BIG)
+            raise ConnectionClosed(CLOSE_TOO_BIG, 'frame too large')
+
+        mask = self._read(4) if second & 0x80 else None
+        payload = self._read(length)
+        if mask is not None and payload:
+            payload = apply_mask(payload, mask)
+        return bool(first & 0x80), first & 0x0F, payload
+
+    def _write_frame(self, opcode: int, payload: bytes):
+        """Write a single unmasked frame."""
+        length = len(payload)
+        if length < 126:
+            header = struct.pack('!BB', 0x80 | opcode, length)
+        elif length < 1 << 16:
+            header = struct.pack('!BBH', 0x80 | opcode, 126, length)
+        else:
+            header = struct.pack('!BBQ', 0x80 | opcode, 127, length)
+        with self._send_lock:
+            self._wfile.write(header + payload)
+            self._wfile.flush()
+
+    def recv(self) -> str | bytes:
+        """Receive the next message, answering pings along the way.
+
+        Text messages are returned as str, binary messages as bytes.
+        """
+        message = bytearray()
+        message_opcode = None
+        while True:
+            fin, opcode, payload = self._read_frame()
+            if opcode == OP_CLOSE:
+                code = CLOSE_NO_STATUS
+                if len(payload) >= 2:
+                    (code,) = struct.unpack('!H', payload[:2])
+                self.close(CLOSE_NORMAL if code == CLOSE_NO_STATUS else code)
+                raise ConnectionClosed(code, payload[2:].decode('utf-8', 'replace'))
+            if opcode == OP_PING:
+                self._write_frame(OP_PONG, payload)
+                continue
+            if opcode == OP_PONG:
+                continue
+
+            if opcode in (OP_TEXT, OP_BINARY) and message_opcode is None:
+                message_opcode = opcode
+            elif opcode != OP_CONTINUATION or message_opcode is None:
+                self.close(CLOSE_PROTOCOL_ERROR)
+                raise ConnectionClosed(
+                    CLOSE_PROTOCOL_ERROR, f'unexpected opcode {opcode}'
+                )
+
+            message += payload
+            if len(message) > MAX_MESSAGE_SIZE:
+                self.close(CLOSE_TOO_BIG)
+                raise ConnectionClosed(CLOSE_TOO_BIG, 'message too large')
+            if fin:
+                break
+
+        if message_opcode == OP_TEXT:
+            return message.decode('utf-8')
+        return bytes(message)
+
+    def send(self, message: str | bytes):
+        """Send a text message if given a str, otherwise a binary message."""
+        if self.closed:
+            raise ConnectionClosed(CLOSE_ABNORMAL, 'connection already closed')
+        if isinstance(message, str):
+            self._write_frame(OP_TEXT, message.encode('utf-8'))
+        else:
+            self._write_frame(OP_BINARY, message)
+
+    def close(self, code: int = CLOSE_NORMAL, reason: str = ''):
+        """Start or complete the closing handshake, at most once."""
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self._write_frame(OP_CLOSE, struct.pack('!H', code) + reason.encode())
+        except OSError:
+            pass
+
+    def abort(self):
+        """Drop the connection without the closing handshake.
+
+        Unlike close, this never waits on a send in progress, so it is safe
+        from a thread that must not block on a client that stopped reading.
+        """
+        self.closed = True
+        if self._sock is not None:
+            try:
+                self._sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+class Handler(socketserver.StreamRequestHandler):
+    """Upgrade each connection to a WebSocket and serve it in the codec negotiated.
+
+    Subclasses implement serve, which is given the accepted WebSocket and
+    the codec of the subprotocol the client asked for.
+    """
+
+    disable_nagle_algorithm = True
+
+    def handle(self):
+        """Perform the opening handshake and serve the connection."""
+        ws = WebSocket(self.rfile, self.wfile, self.connection)
+        codecs = {c.subprotocol: c for c in codec.available()}
+        try:
+            subprotocol = ws.accept(list(codecs))
+        except HandshakeError:
+            return
+
+        # Clients that ask for no subprotocol get JSON, as OBS does.
+        try:
+            self.serve(ws, codecs.get(subprotocol, JSON))
+        except OSError:
+            pass
+
+    def serve(self, ws: WebSocket, codec: Codec):
+        """Serve an accepted WebSocket until the client disconnects."""
+        raise NotImplementedError
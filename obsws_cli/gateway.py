@@ -0,0 +1,487 @@
+"""module implementing the HTTP gateway, controlling OBS with plain HTTP requests.
+
+Hardware controllers and web dashboards that can only make HTTP requests
+POST to endpoints such as /scene/switch?scene_name=BRB on a long-running
+gateway instead of starting the CLI for every button press. The gateway holds a
+single session with OBS and runs the same api operations as the CLI,
+answering their name lookups from a cache that events keep current, so
+once a name has been seen a request costs one round trip to OBS.
+"""
+
+import hmac
+import ipaddress
+import json
+import logging
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+import obsws_python as obsws
+
+from . import api, reconnect
+
+logger = logging.getLogger(__name__)
+
+# obsws-python request status for a resource that does not exist
+RESOURCE_NOT_FOUND = 600
+
+# path: (gateway method, required parameters, optional parameters)
+ROUTES = {
+    '/scene/switch': ('switch_scene', ('scene_name',), ('preview',)),
+    '/input/mute': ('mute_input', ('input_name',), ()),
+    '/input/unmute': ('unmute_input', ('input_name',), ()),
+    '/input/toggle': ('toggle_input', ('input_name',), ()),
+    '/sceneitem/show': ('show_item', ('scene_name', 'item_name'), ('group',)),
+    '/sceneitem/hide': ('hide_item', ('scene_name', 'item_name'), ('group',)),
+    '/sceneitem/toggle': ('toggle_item', ('scene_name', 'item_name'), ('group',)),
+}
+
+# the largest request body accepted, parameters are only ever a few names
+MAX_BODY = 64 * 1024
+
+# names a loopback address is also reached by
+LOOPBACK_NAMES = {'localhost', '127.0.0.1', '::1'}
+
+
+class GatewayError(Exception):
+    """Raised when a request cannot be carried out, with the HTTP status to reply with."""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        """Initialize the GatewayError with an HTTP status and message."""
+        super().__init__(message)
+        self.status = status
+
+
+def _flag(value: Any) -> bool:
+    """Parse a boolean parameter from a JSON body or a query string."""
+    if isinstance(value, bool):
+        return value
+    if str(value).lower() in ('1', 'true', 'yes', 'on'):
+        return True
+    if str(value).lower() in ('', '0', 'false', 'no', 'off'):
+        return False
+    raise GatewayError(HTTPStatus.BAD_REQUEST, f'Expected a boolean, got {value!r}.')
+
+
+class _CachedClient:
+    """A request client answering the name lookups of the api from the gateway's cache.
+
+    The scene, input and scene item lists are answered from the cache,
+    every other request is sent with the session's request client.
+    """
+
+    def __init__(self, gateway: 'Gateway', req_client: obsws.ReqClient):
+        self._gateway = gateway
+        self._req_client = req_client
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._req_client, name)
+
+    def get_scene_list(self):
+        return self._gateway._cached(
+            ('scenes', None), lambda: self._req_client.get_scene_list()
+        )
+
+    def get_input_list(self, kind: Optional[str] = None):
+        if kind is not None:
+            return self._req_client.get_input_list(kind)
+        return self._gateway._cached(
+            ('inputs', None), lambda: self._req_client.get_input_list()
+        )
+
+    def get_scene_item_list(self, name: str):
+        return self._gateway._cached(
+            ('items', name), lambda: self._req_client.get_scene_item_list(name)
+        )
+
+    def get_group_scene_item_list(self, name: str):
+        return self._gateway._cached(
+            ('items', name), lambda: self._req_client.get_group_scene_item_list(name)
+        )
+
+    def set_scene_item_enabled(self, scene_name: str, item_id: int, enabled: bool):
+        self._req_client.set_scene_item_enabled(scene_name, item_id, enabled)
+        # the event confirming it may arrive after the next request
+        self._gateway._set_item_enabled(scene_name, item_id, enabled)
+
+
+class Gateway:
+    """Carry out api operations over a session, resolving names from a cache.
+
+    The scene and input lists are fetched once and the items of each
+    scene or group once, then kept current from events. The cache is
+    dropped whenever the session reconnects.
+    """
+
+    def __init__(self, session: reconnect.Session):
+        """Initialize the Gateway, registering its event callbacks on the session."""
+        self.session = session
+        self.requests = 0
+        self._server: Optional[ThreadingHTTPServer] = None
+        # the request client is not thread safe
+        self._lock = threading.Lock()
+        self._cache_lock = threading.Lock()
+        self._generation = 0
+        # responses to the name lookups, by (kind, scene or group name)
+        self._lists: dict[tuple[str, Optional[str]], Any] = {}
+        session.on_resync.append(self.invalidate)
+        session.register(
+            [
+                self.on_scene_created,
+                self.on_scene_removed,
+                self.on_scene_name_changed,
+                self.on_input_created,
+                self.on_input_removed,
+                self.on_input_name_changed,
+                self.on_scene_item_created,
+                self.on_scene_item_removed,
+                self.on_scene_item_enable_state_changed,
+            ]
+        )
+
+    @property
+    def port(self) -> Optional[int]:
+        """The port being listened on, once started."""
+        return self._server.server_address[1] if self._server is not None else None
+
+    def start(self, bind: tuple[str, int], token: Optional[str] = None) -> 'Gateway':
+        """Accept HTTP requests on the given address.
+
+        With a token, requests must carry it as an Authorization: Bearer header.
+        """
+        self._server = _Server(bind, _Handler)
+        self._server.gateway = self
+        self._server.token = token or None
+        self._server.hosts = _allowed_hosts(bind[0])
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        """Stop accepting HTTP requests."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    # cache
+
+    def invalidate(self):
+        """Drop every cached name."""
+        self._invalidate('scenes', 'inputs')
+
+    def _invalidate(self, *kinds: str):
+        """Drop the given cached lists along with the scene items."""
+        with self._cache_lock:
+            self._generation += 1
+            for key in list(self._lists):
+                if key[0] in kinds or key[0] == 'items':
+                    del self._lists[key]
+
+    def _cached(self, key: tuple[str, Optional[str]], fetch: Callable[[], Any]) -> Any:
+        """Get a cached list, fetching it from OBS if it is not cached.
+
+        A list fetched while an event invalidated the cache is returned
+        but not stored, since it may predate the change.
+        """
+        with self._cache_lock:
+            value = self._lists.get(key)
+            generation = self._generation
+        if value is None:
+            value = fetch()
+            with self._cache_lock:
+                if self._generation == generation:
+                    self._lists[key] = value
+        return value
+
+    def _set_item_enabled(self, scene_name: str, item_id: int, enabled: bool):
+        """Update the enable state of an item in the cached scene or group."""
+        with self._cache_lock:
+            resp = self._lists.get(('items', scene_name))
+            for item in resp.scene_items if resp is not None else ():
+                if item.get('sceneItemId') == item_id:
+                    item['sceneItemEnabled'] = enabled
+
+    def on_scene_created(self, data):
+        """Drop the cached scene names."""
+        self._invalidate('scenes')
+
+    def on_scene_removed(self, data):
+        """Drop the cached scene names."""
+        self._invalidate('scenes')
+
+    def on_scene_name_changed(self, data):
+        """Drop the cached scene names."""
+        self._invalidate('scenes')
+
+    def on_input_created(self, data):
+        """Drop the cached input names."""
+        self._invalidate('inputs')
+
+    def on_input_removed(self, data):
+        """Drop the cached input names."""
+        self._invalidate('inputs')
+
+    def on_input_name_changed(self, data):
+        """Drop the cached input names."""
+        self._invalidate('inputs')
+
+    def on_scene_item_created(self, data):
+        """Drop the cached scene items."""
+        self._invalidate()
+
+    def on_scene_item_removed(self, data):
+        """Drop the cached scene items."""
+        self._invalidate()
+
+    def on_scene_item_enable_state_changed(self, data):
+        """Update the cached enable state of a scene item."""
+        self._set_item_enabled(
+            data.scene_name, data.scene_item_id, data.scene_item_enabled
+        )
+
+    # requests
+
+    def _call(self, operation: Callable[[Any], Any]) -> Any:
+        """Run an api operation with the session's request client, mapping its errors."""
+        req_client = self.session.req_client
+        if req_client is None:
+            raise GatewayError(HTTPStatus.SERVICE_UNAVAILABLE, 'Not connected to OBS.')
+        try:
+            return operation(_CachedClient(self, req_client))
+        except api.NotFoundError as e:
+            raise GatewayError(HTTPStatus.NOT_FOUND, str(e)) from e
+        except api.APIError as e:
+            raise GatewayError(HTTPStatus.CONFLICT, str(e)) from e
+        except obsws.error.OBSSDKRequestError as e:
+            if e.code == RESOURCE_NOT_FOUND:
+                self.invalidate()
+                raise GatewayError(HTTPStatus.NOT_FOUND, str(e)) from e
+            raise GatewayError(HTTPStatus.BAD_GATEWAY, str(e)) from e
+        except reconnect.CONNECTION_ERRORS as e:
+            raise GatewayError(
+                HTTPStatus.SERVICE_UNAVAILABLE, f'Lost the connection to OBS: {e}'
+            ) from e
+
+    def handle(self, path: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Carry out the operation routed to by path with the given parameters."""
+        if path not in ROUTES:
+            raise GatewayError(HTTPStatus.NOT_FOUND, f'No endpoint at {path}.')
+        method, required, optional = ROUTES[path]
+        missing = [name for name in required if not params.get(name)]
+        if missing:
+            raise GatewayError(
+                HTTPStatus.BAD_REQUEST, f'Missing parameters: {", ".join(missing)}.'
+            )
+        kwargs = {name: params[name] for name in required + optional if name in params}
+        with self._lock:
+            self.requests += 1
+            return getattr(self, method)(**kwargs)
+
+    def switch_scene(self, scene_name: str, preview: Any = False) -> dict[str, Any]:
+        """Switch to a scene."""
+        preview = _flag(preview)
+        self._call(lambda client: api.scene.switch(client, scene_name, preview))
+        return {
+            'scene_name': scene_name,
+            'preview': preview,
+            'message': f'Switched to {"preview" if preview else "program"} scene: {scene_name}',
+        }
+
+    def _mute_result(self, state: api.input.MuteState) -> dict[str, Any]:
+        """Describe the mute state of an input."""
+        return {
+            'input_name': state.input_name,
+            'muted': state.muted,
+            'message': f'Input {state.input_name} {"muted" if state.muted else "unmuted"}.',
+        }
+
+    def mute_input(self, input_name: str) -> dict[str, Any]:
+        """Mute an input."""
+        return self._mute_result(
+            self._call(lambda client: api.input.mute(client, input_name))
+        )
+
+    def unmute_input(self, input_name: str) -> dict[str, Any]:
+        """Unmute an input."""
+        return self._mute_result(
+            self._call(lambda client: api.input.unmute(client, input_name))
+        )
+
+    def toggle_input(self, input_name: str) -> dict[str, Any]:
+        """Toggle the mute state of an input."""
+        return self._mute_result(
+            self._call(lambda client: api.input.toggle(client, input_name))
+        )
+
+    def _item_result(self, state: api.sceneitem.ItemState) -> dict[str, Any]:
+        """Describe whether an item is shown."""
+        where = (
+            f'group {state.group} in scene {state.scene_name}'
+            if state.group
+            else f'scene {state.scene_name}'
+        )
+        return {
+            'scene_name': state.scene_name,
+            'item_name': state.item_name,
+            'group': state.group,
+            'enabled': state.enabled,
+            'message': f'Item {state.item_name} in {where} has been {"shown" if state.enabled else "hidden"}.',
+        }
+
+    def show_item(
+        self, scene_name: str, item_name: str, group: Optional[str] = None
+    ) -> dict[str, Any]:
+        """Show an item in a scene."""
+        return self._item_result(
+            self._call(
+                lambda client: api.sceneitem.show(client, scene_name, item_name, group)
+            )
+        )
+
+    def hide_item(
+        self, scene_name: str, item_name: str, group: Optional[str] = None
+    ) -> dict[str, Any]:
+        """Hide an item in a scene."""
+        return self._item_result(
+            self._call(
+                lambda client: api.sceneitem.hide(client, scene_name, item_name, group)
+            )
+        )
+
+    def toggle_item(
+        self, scene_name: str, item_name: str, group: Optional[str] = None
+    ) -> dict[str, Any]:
+        """Toggle an item in a scene."""
+        return self._item_result(
+            self._call(
+                lambda client: api.sceneitem.toggle(
+                    client, scene_name, item_name, group
+                )
+            )
+        )
+
+
+def _allowed_hosts(host: str) -> Optional[set[str]]:
+    """Return the names a request's Host header may give for the bound address.
+
+    None when bound to every interface, where any name may reach it.
+    """
+    host = host.strip('[]')
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return {host.lower()}
+    if address.is_unspecified:
+        return None
+    if address.is_loopback:
+        return LOOPBACK_NAMES | {host}
+    return {host}
+
+
+def _hostname(netloc: str) -> str:
+    """Return the host name of a Host header or URL authority, without its port."""
+    return urlsplit(f'//{netloc}').hostname or ''
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Route a controller's HTTP requests to the gateway.
+
+    Operations change OBS, so they are only carried out for POST, which a
+    web page can not send to another origin without its Origin header.
+    Requests are refused when their Host is not the bound address, so a
+    page can not reach the gateway through a name it rebinds to it, or
+    when they come from another origin. Parameters come from the query
+    string and a JSON object body.
+    """
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def _reply(self, status: HTTPStatus, body: dict[str, Any], **headers: str):
+        """Send a JSON response."""
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _params(self) -> dict[str, Any]:
+        """Collect the request's parameters."""
+        url = urlsplit(self.path)
+        params: dict[str, Any] = dict(parse_qsl(url.query, keep_blank_values=True))
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_BODY:
+            raise GatewayError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, 'Body too large.')
+        if length:
+            try:
+                body = json.loads(self.rfile.read(length))
+            except ValueError:
+                raise GatewayError(
+                    HTTPStatus.BAD_REQUEST, 'Body is not valid JSON.'
+                ) from None
+            if not isinstance(body, dict):
+                raise GatewayError(HTTPStatus.BAD_REQUEST, 'Body is not a JSON object.')
+            params.update(body)
+        return params
+
+    def _check(self):
+        """Refuse requests from another host or origin, or without the token."""
+        host = self.headers.get('Host', '')
+        hosts = self.server.hosts
+        if hosts is not None and _hostname(host) not in hosts:
+            raise GatewayError(HTTPStatus.FORBIDDEN, f'Unknown host {host}.')
+        origin = self.headers.get('Origin')
+        if origin is not None and urlsplit(origin).netloc != host:
+            raise GatewayError(HTTPStatus.FORBIDDEN, f'Foreign origin {origin}.')
+        token = self.server.token
+        if token is not None and not hmac.compare_digest(
+            self.headers.get('Authorization', ''), f'Bearer {token}'
+        ):
+            raise GatewayError(HTTPStatus.UNAUTHORIZED, 'Missing or wrong token.')
+
+    def _route(self, post: bool):
+        """Carry out a request and reply with its result."""
+        path = urlsplit(self.path).path.rstrip('/') or '/'
+        try:
+            self._check()
+            params = self._params()
+            if path == '/':
+                self._reply(HTTPStatus.OK, {'ok': True, 'endpoints': sorted(ROUTES)})
+                return
+            if not post and path in ROUTES:
+                self._reply(
+                    HTTPStatus.METHOD_NOT_ALLOWED,
+                    {'ok': False, 'error': f'Send a POST to {path}.'},
+                    Allow='POST',
+                )
+                return
+            result = self.server.gateway.handle(path, params)
+        except GatewayError as e:
+            self._reply(e.status, {'ok': False, 'error': str(e)})
+            return
+        self._reply(HTTPStatus.OK, {'ok': True, **result})
+
+    def do_GET(self):
+        """List the endpoints, refusing to carry out operations."""
+        self._route(post=False)
+
+    def do_POST(self):
+        """Carry out an operation."""
+        self._route(post=True)
+
+    def log_message(self, format, *args):
+        """Log requests at debug level instead of writing them to stderr."""
+        logger.debug('%s %s', self.address_string(), format % args)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    gateway: Gateway
+    token: Optional[str]
+    hosts: Optional[set[str]]
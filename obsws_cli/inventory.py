@@ -0,0 +1,337 @@
+"""module publishing OBS's scenes and inputs as a memory-mapped snapshot.
+
+The serve daemon writes a snapshot of the scenes and inputs in the
+current scene collection to a file next to its socket. CLI processes map
+the file read-only and look names up with a binary search, rather than
+each fetching and parsing the scene and input lists.
+
+The file starts with a header, followed by a table of scenes and a table
+of inputs, each sorted by name, and the strings they refer to:
+
+    header  magic, format, generation, current, scene and input counts
+    table   (name, uuid, kind) as (offset, length) pairs into the strings
+    strings UTF-8
+
+The header holds two counters. generation is the generation of the data
+in the file. current is bumped in place by the daemon when an event
+changes the scenes or inputs, so a process holding the old mapping sees
+the snapshot is stale at once. A new snapshot is then written and moved
+over the old file, never changing one a reader has mapped.
+"""
+
+import bisect
+import logging
+import mmap
+import os
+import struct
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+from urllib.parse import quote
+
+from obsws_python import Subs
+
+from . import launcher
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'OBSI'
+FORMAT = 1
+
+# magic, format, reserved, generation, current, scenes, inputs
+HEADER = struct.Struct('<4sHHQQII')
+CURRENT_OFFSET = 16
+# (offset, length) of the name, uuid and kind
+RECORD = struct.Struct('<IIIIII')
+
+# the events after which the snapshot no longer matches OBS
+EVENTS = frozenset(
+    {
+        'SceneCreated',
+        'SceneRemoved',
+        'SceneNameChanged',
+        'InputCreated',
+        'InputRemoved',
+        'InputNameChanged',
+        'CurrentSceneCollectionChanged',
+    }
+)
+SUBSCRIPTIONS = Subs.CONFIG | Subs.SCENES | Subs.INPUTS
+
+# how long to let a burst of events settle before fetching, in seconds
+SETTLE = 0.05
+
+
+class InventoryError(Exception):
+    """Raised when a snapshot file is not one this version can read."""
+
+
+@dataclass
+class Entry:
+    """A scene or input in the snapshot, scenes having no kind."""
+
+    name: str
+    uuid: str
+    kind: str
+
+
+def default_path(host: str, port: int) -> Path:
+    """Get the snapshot file for a host, next to the daemon's default socket."""
+    socket_path = Path(launcher.default_socket_path())
+    return socket_path.with_name(
+        f'{socket_path.stem}-{quote(str(host), safe="")}_{port}.inventory'
+    )
+
+
+def encode(generation: int, scenes: list[Entry], inputs: list[Entry]) -> bytes:
+    """Encode a snapshot of the scenes and inputs."""
+    strings = bytearray()
+    offsets: dict[str, tuple[int, int]] = {}
+
+    def string(text: str) -> tuple[int, int]:
+        if text not in offsets:
+            data = text.encode()
+            offsets[text] = (len(strings), len(data))
+            strings.extend(data)
+        return offsets[text]
+
+    table = bytearray()
+    for entries in (scenes, inputs):
+        for entry in sorted(entries, key=lambda e: e.name.encode()):
+            table += RECORD.pack(
+                *string(entry.name), *string(entry.uuid), *string(entry.kind)
+            )
+    header = HEADER.pack(
+        MAGIC, FORMAT, 0, generation, generation, len(scenes), len(inputs)
+    )
+    return header + table + strings
+
+
+class _Names:
+    """A sorted table of names in a snapshot, as a sequence bisect can search."""
+
+    def __init__(self, snapshot: 'Snapshot', start: int, count: int):
+        self.snapshot = snapshot
+        self.start = start
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> bytes:
+        return self.snapshot._string(self.snapshot._record(self.start + index)[0:2])
+
+
+class Snapshot:
+    """A snapshot file mapped read-only."""
+
+    def __init__(self, path: Path):
+        """Map a snapshot file, raising OSError or InventoryError if it cannot be read."""
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, fmt, _, self.generation, _, scenes, inputs = HEADER.unpack_from(
+                self._map
+            )
+        except struct.error:
+            self._map.close()
+            raise InventoryError(f'{path} is not an inventory snapshot') from None
+        if magic != MAGIC or fmt != FORMAT:
+            self._map.close()
+            raise InventoryError(
+                f'{path} is not an inventory snapshot of format {FORMAT}'
+            )
+        self._strings = HEADER.size + (scenes + inputs) * RECORD.size
+        self._scenes = _Names(self, 0, scenes)
+        self._inputs = _Names(self, scenes, inputs)
+
+    @property
+    def fresh(self) -> bool:
+        """Whether OBS has not changed its scenes or inputs since the snapshot."""
+        (current,) = struct.unpack_from('<Q', self._map, CURRENT_OFFSET)
+        return current == self.generation
+
+    def _record(self, index: int) -> tuple[int, ...]:
+        return RECORD.unpack_from(self._map, HEADER.size + index * RECORD.size)
+
+    def _string(self, field: tuple[int, ...]) -> bytes:
+        offset, length = field
+        return self._map[self._strings + offset : self._strings + offset + length]
+
+    def _entry(self, index: int) -> Entry:
+        record = self._record(index)
+        name, uuid, kind = (
+            self._string(record[i : i + 2]).decode() for i in range(0, 6, 2)
+        )
+        return Entry(name, uuid, kind)
+
+    def _find(self, names: _Names, name: str) -> Optional[Entry]:
+        key = name.encode()
+        index = bisect.bisect_left(names, key)
+        if index < len(names) and names[index] == key:
+            return self._entry(names.start + index)
+        return None
+
+    def find_scene(self, name: str) -> Optional[Entry]:
+        """Look up a scene by name."""
+        return self._find(self._scenes, name)
+
+    def find_input(self, name: str) -> Optional[Entry]:
+        """Look up an input by name."""
+        return self._find(self._inputs, name)
+
+    def scenes(self) -> list[Entry]:
+        """List the scenes, sorted by name."""
+        return [self._entry(i) for i in range(len(self._scenes))]
+
+    def inputs(self) -> list[Entry]:
+        """List the inputs, sorted by name."""
+        return [self._entry(self._inputs.start + i) for i in range(len(self._inputs))]
+
+    def close(self):
+        """Unmap the snapshot."""
+        self._map.close()
+
+
+def open_fresh(path: Path) -> Optional[Snapshot]:
+    """Map a snapshot if there is one and it is fresh, else return None."""
+    try:
+        snapshot = Snapshot(path)
+    except (OSError, ValueError, InventoryError):
+        return None
+    if not snapshot.fresh:
+        snapshot.close()
+        return None
+    return snapshot
+
+
+def open_published(host: str, port: int) -> Optional[Snapshot]:
+    """Map the fresh snapshot a daemon publishes for a host, if there is one.
+
+    OBSWS_CLI_INVENTORY names the file when the daemon was given one,
+    an empty string to never use a snapshot.
+    """
+    path = os.environ.get('OBSWS_CLI_INVENTORY')
+    if path is None:
+        return open_fresh(default_path(host, port))
+    return open_fresh(Path(path)) if path else None
+
+
+def usable(req_client: Any) -> Optional[Snapshot]:
+    """Get the fresh snapshot attached to a request client, if it has one.
+
+    A client with an inventory_source maps the published snapshot the
+    first time it is asked for.
+    """
+    snapshot = getattr(req_client, 'inventory', None)
+    source = getattr(req_client, 'inventory_source', None)
+    if snapshot is None and source is not None:
+        req_client.inventory_source = None
+        snapshot = req_client.inventory = open_published(*source)
+    if snapshot is not None and snapshot.fresh:
+        return snapshot
+    return None
+
+
+class Publisher:
+    """Keep a snapshot file in step with OBS, republishing after each change.
+
+    Requests are made through a callable taking (requestType, requestData)
+    pairs and returning their results, as a request batch returns them.
+    """
+
+    def __init__(
+        self, path: Path, request: Callable[[list[tuple[str, dict]]], list[dict]]
+    ):
+        """Initialize the Publisher, which publishes once started."""
+        self.path = path
+        self.request = request
+        self.generation = 0
+        self.published = 0
+        self._map: Optional[mmap.mmap] = None
+        self._lock = threading.Lock()
+        self._dirty = threading.Event()
+        self._stopped = threading.Event()
+
+    def start(self) -> 'Publisher':
+        """Publish the first snapshot and keep publishing as OBS changes."""
+        self.invalidate()
+        threading.Thread(target=self._run, daemon=True).start()
+        return self
+
+    def stop(self):
+        """Stop publishing, marking the snapshot stale and removing it."""
+        self._stopped.set()
+        self._dirty.set()
+        self.invalidate()
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+        self.path.unlink(missing_ok=True)
+
+    def invalidate(self):
+        """Mark the published snapshot stale and schedule a new one."""
+        with self._lock:
+            self.generation += 1
+            if self._map is not None:
+                struct.pack_into('<Q', self._map, CURRENT_OFFSET, self.generation)
+        self._dirty.set()
+
+    def on_event(self, event_type: str):
+        """Invalidate the snapshot after an event that changes it."""
+        if event_type in EVENTS:
+            self.invalidate()
+
+    def _run(self):
+        """Publish whenever the snapshot is stale, until stopped."""
+        while True:
+            self._dirty.wait()
+            if self._stopped.wait(SETTLE):
+                return
+            self._dirty.clear()
+            try:
+                self.publish()
+            except (OSError, TimeoutError, KeyError) as e:
+                logger.warning('Could not publish the inventory: %s', e)
+                # retried after the next change, or the next reconnect
+
+    def publish(self):
+        """Fetch the scenes and inputs and publish them as the current generation."""
+        with self._lock:
+            generation = self.generation
+        scene_list, input_list = self.request(
+            [('GetSceneList', {}), ('GetInputList', {})]
+        )
+        if not (
+            scene_list['requestStatus']['result']
+            and input_list['requestStatus']['result']
+        ):
+            raise KeyError('the scene or input list request failed')
+        scenes = [
+            Entry(scene['sceneName'], scene.get('sceneUuid', ''), '')
+            for scene in scene_list['responseData']['scenes']
+        ]
+        inputs = [
+            Entry(input_['inputName'], input_.get('inputUuid', ''), input_['inputKind'])
+            for input_ in input_list['responseData']['inputs']
+        ]
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(f'.{os.getpid()}.tmp')
+        # created readable by the owner only, not relying on the umask
+        tmp.unlink(missing_ok=True)
+        fd = os.open(tmp, os.O_CREAT | os.O_EXCL | os.O_RDWR, 0o600)
+        with open(fd, 'r+b') as f:
+            f.write(encode(generation, scenes, inputs))
+            f.flush()
+            snapshot_map = mmap.mmap(f.fileno(), 0)
+        with self._lock:
+            # an event may have arrived while fetching
+            struct.pack_into('<Q', snapshot_map, CURRENT_OFFSET, self.generation)
+            os.replace(tmp, self.path)
+            if self._map is not None:
+                self._map.close()
+            self._map = snapshot_map
+            self.published += 1
@@ -0,0 +1,406 @@
+"""module for the obsws-cli entry point, which skips the Typer app when it can.
+
+Importing the Typer app and every command module takes far longer than a
+command spends talking to OBS. When a serve daemon is listening on its
+Unix socket, the commands in FAST are parsed against the command
+manifest, which describes the command tree without importing it, and
+sent to the daemon as a single request, built as api.requests builds it.
+The daemon's Hello names the OBS it is connected to, and the request is
+only sent when that is the OBS the settings name, read from the
+environment and the same .env files the Typer app reads.
+Only the standard library is imported on that path. Any other command
+line, including one with root options, is handed to the Typer app.
+"""
+
+import json
+import os
+import socket
+import sys
+from collections.abc import Callable
+
+from .api import requests
+
+MANIFEST = os.path.join(os.path.dirname(__file__), 'manifest.json')
+
+RPC_VERSION = 1
+
+# RequestStatus codes the fast commands explain as the Typer app does
+STUDIO_MODE_NOT_ACTIVE = 506
+RESOURCE_NOT_FOUND = 600
+
+# settings that change how a command runs, which only the Typer app handles
+TYPER_ONLY = ('OBSWS_CLI_HOSTS', 'OBSWS_CLI_STATS', 'OBSWS_CLI_TRACE')
+
+# the .env files the Typer app reads settings from, the later taking precedence
+DOTENV_FILES = (
+    os.path.join(os.path.expanduser('~'), '.config', 'obsws-cli', 'obsws.env'),
+    '.env',
+)
+
+# (requestType, requestData, describe the response, message for a missing resource)
+Request = tuple[str, dict, Callable[[dict], str], str]
+
+
+def default_socket_path() -> str:
+    """Get the Unix socket the daemon listens on unless told otherwise."""
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return os.path.join(runtime_dir, 'obsws-cli.sock')
+
+    import tempfile
+
+    if hasattr(os, 'getuid'):
+        return os.path.join(tempfile.gettempdir(), f'obsws-cli-{os.getuid()}.sock')
+    return os.path.join(tempfile.gettempdir(), 'obsws-cli.sock')
+
+
+def _dotenv(path: str) -> dict[str, str]:
+    """Read the KEY=VALUE lines of a .env file, empty if there is no such file."""
+    values = {}
+    try:
+        with open(path, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return values
+    for line in lines:
+        key, sep, value = line.strip().removeprefix('export ').partition('=')
+        if not sep or key.startswith('#'):
+            continue
+        value = value.strip()
+        if value[:1] in ('"', "'"):
+            value = value[1:].partition(value[0])[0]
+        else:
+            value = value.partition(' #')[0].rstrip()
+        values[key.strip()] = value
+    return values
+
+
+def settings() -> dict[str, str]:
+    """Get the settings from the .env files and the environment, as the Typer app does."""
+    found = {}
+    for path in DOTENV_FILES:
+        found |= _dotenv(path)
+    found |= {
+        key: value for key, value in os.environ.items() if key.startswith('OBSWS_CLI_')
+    }
+    return found
+
+
+def _enabled(value: str | None) -> bool:
+    """Whether a setting is set to anything but false."""
+    return bool(value) and value.strip().lower() not in ('0', 'false', 'no', 'off')
+
+
+def _scene_switch(params: dict) -> Request:
+    """Switch to a scene."""
+    scene_name, preview = params['scene_name'], params['preview']
+    return (
+        *requests.switch_scene(scene_name, preview),
+        lambda _: (
+            f'Switched to {"preview" if preview else "program"} scene: {scene_name}'
+        ),
+        f'Scene {scene_name} not found.',
+    )
+
+
+def _input_mute(params: dict) -> Request:
+    """Mute an input."""
+    input_name = params['input_name']
+    return (
+        *requests.set_input_mute(input_name, True),
+        lambda _: f'Input {input_name} muted.',
+        f'Input {input_name} does not exist.',
+    )
+
+
+def _input_unmute(params: dict) -> Request:
+    """Unmute an input."""
+    input_name = params['input_name']
+    return (
+        *requests.set_input_mute(input_name, False),
+        lambda _: f'Input {input_name} unmuted.',
+        f'Input {input_name} does not exist.',
+    )
+
+
+def _input_toggle(params: dict) -> Request:
+    """Toggle an input."""
+    input_name = params['input_name']
+    return (
+        *requests.toggle_input_mute(input_name),
+        lambda resp: (
+            f'Input {input_name} {"muted" if resp.get("inputMuted") else "unmuted"}.'
+        ),
+        f'Input {input_name} does not exist.',
+    )
+
+
+def _input_volume(params: dict) -> Request | None:
+    """Set the volume of an input, within the range the Typer app accepts."""
+    input_name = params['input_name']
+    try:
+        volume = float(params['volume'])
+    except ValueError:
+        return None
+    if not requests.MIN_VOLUME_DB <= volume <= requests.MAX_VOLUME_DB:
+        return None
+    return (
+        *requests.set_input_volume(input_name, volume),
+        lambda _: f'Input {input_name} volume set to {volume}.',
+        f'Input {input_name} does not exist.',
+    )
+
+
+# commands run through the daemon, by group and command name, each mapping
+# its parameters to a request or to None to leave a command line to Typer
+FAST: dict[str, Callable[[dict], Request | None]] = {
+    'scene switch': _scene_switch,
+    'input mute': _input_mute,
+    'input unmute': _input_unmute,
+    'input toggle': _input_toggle,
+    'input volume': _input_volume,
+}
+
+
+def load_manifest() -> dict:
+    """Load the command manifest."""
+    with open(MANIFEST, 'rb') as f:
+        return json.load(f)
+
+
+def _find(commands: dict, name: str) -> str | None:
+    """Find a command in the manifest by its name or one of its aliases."""
+    if name in commands:
+        return name
+    return next((n for n, c in commands.items() if name in c['aliases']), None)
+
+
+def parse(manifest: dict, argv: list[str]) -> Request | None:
+    """Parse a command line into the request for a fast command.
+
+    None is returned for anything else, or for any argument the Typer
+    app would reject or treat differently, such as --help.
+    """
+    if len(argv) < 2:
+        return None
+    group = _find(manifest['commands'], argv[0])
+    if group is None or 'commands' not in manifest['commands'][group]:
+        return None
+    commands = manifest['commands'][group]['commands']
+    name = _find(commands, argv[1])
+    if name is None or f'{group} {name}' not in FAST:
+        return None
+    command = commands[name]
+
+    flags = {}
+    for option in command['options']:
+        flags |= {flag: (option, True) for flag in option['flags']}
+        flags |= {flag: (option, False) for flag in option['secondary']}
+    params = {option['name']: option['default'] for option in command['options']}
+    positional = []
+    args = iter(argv[2:])
+    for arg in args:
+        if arg == '--':
+            positional.extend(args)
+            break
+        if not arg.startswith('-') or arg == '-':
+            positional.append(arg)
+            continue
+        flag, has_value, value = arg.partition('=')
+        if flag not in flags:
+            return None
+        option, enabled = flags[flag]
+        if option['is_flag']:
+            if has_value:
+                return None
+            params[option['name']] = enabled
+            continue
+        if not has_value:
+            value = next(args, None)
+            if value is None:
+                return None
+        params[option['name']] = value
+
+    if len(positional) != len(command['arguments']):
+        return None
+    params |= {
+        arg['name']: value for arg, value in zip(command['arguments'], positional)
+    }
+    return FAST[f'{group} {name}'](params)
+
+
+class _DaemonConnection:
+    """The client end of a WebSocket connection to the daemon's Unix socket.
+
+    The daemon trusts clients on its Unix socket, so there is no
+    authentication, and its responses are never fragmented.
+    """
+
+    def __init__(self, path: str, timeout: float):
+        """Connect to the daemon and identify, raising OSError on failure."""
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        try:
+            self.sock.connect(path)
+            self.rfile = self.sock.makefile('rb')
+            self.sock.sendall(
+                b'GET / HTTP/1.1\r\n'
+                b'Host: localhost\r\n'
+                b'Upgrade: websocket\r\n'
+                b'Connection: Upgrade\r\n'
+                b'Sec-WebSocket-Key: ' + _key() + b'\r\n'
+                b'Sec-WebSocket-Version: 13\r\n'
+                b'Sec-WebSocket-Protocol: obswebsocket.json\r\n\r\n'
+            )
+            if b' 101 ' not in self.rfile.readline():
+                raise ConnectionError('the daemon refused the WebSocket upgrade')
+            while self.rfile.readline() not in (b'\r\n', b''):
+                pass
+            self.hello = self.recv(0)
+            self.send(1, {'rpcVersion': RPC_VERSION, 'eventSubscriptions': 0})
+            self.recv(2)
+        except BaseException:
+            self.sock.close()
+            raise
+
+    def _read(self, n: int) -> bytes:
+        """Read exactly n bytes."""
+        data = self.rfile.read(n)
+        if len(data) < n:
+            raise ConnectionError('the daemon closed the connection')
+        return data
+
+    def send(self, op: int, data: dict):
+        """Send a message in a masked text frame, as clients must."""
+        payload = json.dumps({'op': op, 'd': data}).encode()
+        length = len(payload)
+        if length < 126:
+            header = bytes((0x81, 0x80 | length))
+        elif length < 1 << 16:
+            header = bytes((0x81, 0x80 | 126)) + length.to_bytes(2, 'big')
+        else:
+            header = bytes((0x81, 0x80 | 127)) + length.to_bytes(8, 'big')
+        mask = os.urandom(4)
+        key = (mask * (length // 4 + 1))[:length]
+        masked = (int.from_bytes(payload, 'big') ^ int.from_bytes(key, 'big')).to_bytes(
+            length, 'big'
+        )
+        self.sock.sendall(header + mask + masked)
+
+    def recv(self, op: int) -> dict:
+        """Receive messages until one with the given op code, returning its data."""
+        while True:
+            first, second = self._read(2)
+            length = second & 0x7F
+            if length == 126:
+                length = int.from_bytes(self._read(2), 'big')
+            elif length == 127:
+                length = int.from_bytes(self._read(8), 'big')
+            payload = self._read(length)
+            opcode = first & 0x0F
+            if opcode == 0x8:
+                reason = payload[2:].decode('utf-8', 'replace')
+                raise ConnectionError(reason or 'the daemon closed the connection')
+            if opcode != 0x1:
+                continue
+            message = json.loads(payload)
+            if message.get('op') == op:
+                return message['d']
+
+    def request(self, request_type: str, data: dict) -> dict:
+        """Send a request, returning its response."""
+        self.send(
+            6, {'requestType': request_type, 'requestId': '1', 'requestData': data}
+        )
+        return self.recv(7)
+
+    def close(self):
+        """Close the connection without waiting for the daemon."""
+        try:
+            self.sock.sendall(bytes((0x88, 0x80)) + os.urandom(4))
+        except OSError:
+            pass
+        self.sock.close()
+
+
+def _key() -> bytes:
+    """Make a Sec-WebSocket-Key, which only needs to be 16 base64 encoded bytes."""
+    import base64
+
+    return base64.b64encode(os.urandom(16))
+
+
+def run(argv: list[str]) -> int | None:
+    """Run a fast command through the daemon, returning its exit code.
+
+    None is returned when the command line is not for a fast command, or
+    no daemon connected to the configured OBS is listening, leaving the
+    command to the Typer app.
+    """
+    if not argv or argv[0].startswith('-'):
+        return None
+    config = settings()
+    if any(_enabled(config.get(name)) for name in TYPER_ONLY):
+        return None
+    path = os.environ.get('OBSWS_CLI_SOCKET', default_socket_path())
+    if not path or not os.path.exists(path):
+        return None
+
+    try:
+        request = parse(load_manifest(), argv)
+    except (OSError, ValueError):
+        return None
+    if request is None:
+        return None
+    request_type, data, describe, not_found = request
+
+    try:
+        timeout = float(config.get('OBSWS_CLI_TIMEOUT', 5))
+        target = {
+            'host': config.get('OBSWS_CLI_HOST', 'localhost'),
+            'port': int(config.get('OBSWS_CLI_PORT', 4455)),
+        }
+    except ValueError:
+        return None
+    try:
+        conn = _DaemonConnection(path, timeout)
+    except (OSError, ValueError):
+        # a socket left behind by a daemon that is no longer running
+        return None
+    if conn.hello.get('upstream') != target:
+        # a daemon serving another OBS than the one the command is for
+        conn.close()
+        return None
+
+    try:
+        resp = conn.request(request_type, data)
+    except (OSError, ValueError) as e:
+        print(f'Lost the connection to the daemon: {e}', file=sys.stderr)
+        return 1
+    finally:
+        conn.close()
+
+    status = resp['requestStatus']
+    if status['result']:
+        print(describe(resp.get('responseData') or {}))
+        return 0
+    if status['code'] == RESOURCE_NOT_FOUND:
+        message = not_found
+    elif status['code'] == STUDIO_MODE_NOT_ACTIVE:
+        message = 'Studio mode is disabled. This action requires it to be enabled.'
+    else:
+        message = f'{request_type} failed: {status.get("comment")}'
+    print(message, file=sys.stderr)
+    return 1
+
+
+def main():
+    """Run obsws-cli, through the daemon for a fast command, else through Typer."""
+    code = run(sys.argv[1:])
+    if code is not None:
+        sys.exit(code)
+
+    from . import profiling  # noqa: F401 first, so the import of everything else can be timed
+    from .app import app
+
+    app()
@@ -0,0 +1,256 @@
+"""module for generating request load against OBS, used by bench load.
+
+Each connection has a sender thread that sends requests on schedule, and
+a receiver thread that matches the responses by request ID, so a
+connection can keep several requests in flight. When a rate is set the
+latency is measured from when a request was scheduled, not when it was
+sent, so a slow OBS is not hidden by the generator falling behind.
+"""
+
+import math
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from . import client
+
+
+@dataclass
+class Response:
+    """A completed request."""
+
+    completed: float
+    latency: float
+    ok: bool
+
+
+@dataclass
+class Sample:
+    """The OBS frame counters at a point in the run."""
+
+    elapsed: float
+    render_skipped_frames: int
+    render_total_frames: int
+    output_skipped_frames: int
+    output_total_frames: int
+    active_fps: float
+
+
+@dataclass
+class LoadResult:
+    """The responses to a load run and the frame counters sampled during it."""
+
+    elapsed: float
+    responses: list[Response] = field(default_factory=list)
+    samples: list[Sample] = field(default_factory=list)
+
+    @property
+    def errors(self) -> int:
+        """The number of requests OBS failed."""
+        return sum(not r.ok for r in self.responses)
+
+    @property
+    def throughput(self) -> float:
+        """Completed requests per second."""
+        return len(self.responses) / self.elapsed if self.elapsed else 0.0
+
+    def percentiles(self, *ps: float) -> list[float]:
+        """Get latency percentiles in seconds, by the nearest rank method."""
+        latencies = sorted(r.latency for r in self.responses)
+        if not latencies:
+            return [0.0 for _ in ps]
+        return [latencies[max(math.ceil(p / 100 * len(latencies)) - 1, 0)] for p in ps]
+
+
+class _Connection:
+    """A connection to OBS sending requests on schedule with a window in flight."""
+
+    def __init__(
+        self,
+        connection: dict[str, Any],
+        request_type: str,
+        request_data: Optional[dict[str, Any]],
+        window: int,
+        interval: float,
+        offset: float,
+    ):
+        self.client = client.ReqClient(**connection)
+        self.request_type = request_type
+        self.request_data = request_data
+        self.interval = interval
+        self.offset = offset
+        self.start_at = self.deadline = 0.0
+        self.responses: list[Response] = []
+        self.error: Optional[BaseException] = None
+        self._window = threading.Semaphore(window)
+        self._sent: dict[str, float] = {}
+        self._pending: queue.SimpleQueue = queue.SimpleQueue()
+        self._threads = [
+            threading.Thread(target=self._guard(self._send), daemon=True),
+            threading.Thread(target=self._guard(self._receive), daemon=True),
+        ]
+
+    def _guard(self, target: Callable[[], None]) -> Callable[[], None]:
+        """Keep the first error raised by either thread, unblocking the other."""
+
+        def run():
+            try:
+                target()
+            except Exception as e:
+                if self.error is None:
+                    self.error = e
+                self._pending.put(None)
+                self._window.release()
+
+        return run
+
+    def start(self, start: float, deadline: float):
+        """Start sending at start until deadline."""
+        self.start_at = start
+        self.deadline = deadline
+        for thread in self._threads:
+            thread.start()
+
+    def join(self):
+        """Wait for every response, then disconnect."""
+        for thread in self._threads:
+            thread.join()
+        self.client.disconnect()
+
+    def _send(self):
+        """Send requests until the deadline, waiting for a free slot in the window."""
+        base_client = self.client.base_client
+        payload = {'op': 6, 'd': {'requestType': self.request_type, 'requestId': ''}}
+        if self.request_data:
+            payload['d']['requestData'] = self.request_data
+
+        i = 0
+        while self.error is None:
+            scheduled = self.start_at + self.offset + i * self.interval
+            if scheduled >= self.deadline:
+                break
+            self._window.acquire()
+            now = time.perf_counter()
+            if self.interval:
+                if scheduled > now:
+                    time.sleep(scheduled - now)
+            else:
+                scheduled = now
+            if scheduled >= self.deadline:
+                break
+
+            request_id = str(i)
+            payload['d']['requestId'] = request_id
+            self._sent[request_id] = scheduled
+            base_client.send_message(base_client.codec.encode(payload))
+            self._pending.put(request_id)
+            i += 1
+        self._pending.put(None)
+
+    def _receive(self):
+        """Record the response to each request sent."""
+        base_client = self.client.base_client
+        while self._pending.get() is not None:
+            data = base_client.codec.decode(base_client.ws.recv())['d']
+            completed = time.perf_counter()
+            self.responses.append(
+                Response(
+                    completed,
+                    completed - self._sent.pop(data['requestId']),
+                    data['requestStatus']['result'],
+                )
+            )
+            self._window.release()
+
+
+def _sample(obsws_client: client.ReqClient, elapsed: float) -> Sample:
+    """Get the frame counters from OBS."""
+    stats = obsws_client.send('GetStats', raw=True)
+    return Sample(
+        elapsed,
+        stats['renderSkippedFrames'],
+        stats['renderTotalFrames'],
+        stats['outputSkippedFrames'],
+        stats['outputTotalFrames'],
+        stats['activeFps'],
+    )
+
+
+def run(
+    obsws_client: client.ReqClient,
+    connection: dict[str, Any],
+    request_type: str,
+    request_data: Optional[dict[str, Any]],
+    concurrency: int,
+    rate: float,
+    duration: float,
+    pipeline: bool,
+    sample_interval: float,
+) -> LoadResult:
+    """Send requests for duration seconds, sampling GetStats on the given client.
+
+    Args:
+    ----
+        obsws_client (ReqClient): The client to sample the frame counters on
+        connection (dict): The arguments to open each load connection with
+        request_type (str): The request to send
+        request_data (dict | None): The data to send with each request
+        concurrency (int): The number of connections, or with pipeline the
+            number of requests kept in flight on a single connection
+        rate (float): The total requests per second, 0 to send as fast as possible
+        duration (float): Seconds to send requests for
+        pipeline (bool): Pipeline requests on one connection
+        sample_interval (float): Seconds between frame counter samples
+
+    Returns:
+    -------
+        LoadResult: The responses, in completion order, and the samples
+
+    Raises:
+    ------
+        Exception: The first error raised by a connection
+
+    """
+    connections_count, window = (1, concurrency) if pipeline else (concurrency, 1)
+    interval = connections_count / rate if rate else 0.0
+    connections = [
+        _Connection(
+            connection,
+            request_type,
+            request_data,
+            window,
+            interval,
+            i * interval / connections_count,
+        )
+        for i in range(connections_count)
+    ]
+
+    start = time.perf_counter()
+    deadline = start + duration
+    result = LoadResult(0.0)
+    result.samples.append(_sample(obsws_client, 0.0))
+    for conn in connections:
+        conn.start(start, deadline)
+
+    next_sample = start + sample_interval
+    while next_sample < deadline:
+        time.sleep(max(next_sample - time.perf_counter(), 0))
+        result.samples.append(_sample(obsws_client, next_sample - start))
+        next_sample += sample_interval
+
+    for conn in connections:
+        conn.join()
+    result.elapsed = time.perf_counter() - start
+    result.samples.append(_sample(obsws_client, result.elapsed))
+
+    for conn in connections:
+        if conn.error is not None:
+            raise conn.error
+    result.responses = sorted(
+        (r for conn in connections for r in conn.responses), key=lambda r: r.completed
+    )
+    for r in result.responses:
+        r.completed -= start
+    return result
@@ -0,0 +1,126 @@
+"""module generating the command manifest from the Typer app.
+
+The manifest describes every command group, command, argument and
+option, with their aliases, as JSON. It lets the launcher parse a
+command line without importing the Typer app. Regenerate it after
+changing a command with:
+
+    python -m obsws_cli.manifest
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Optional
+
+import typer
+
+from . import names
+from .alias import ALIASES
+from .app import app
+
+PATH = Path(__file__).with_name('manifest.json')
+
+
+def _default(param) -> Any:
+    """Get a parameter's default, if it can be written as JSON."""
+    default = param.default
+    if isinstance(default, (str, int, float, bool)) or default is None:
+        return default
+    return None
+
+
+def _completes(param) -> Optional[str]:
+    """Get the kind of name a parameter completes from the names cache, if any."""
+    # Typer keeps the autocompletion function, wrapped, in the closure of its own
+    complete = getattr(param, '_custom_shell_complete', None)
+    for cell in getattr(complete, '__closure__', None) or ():
+        function = getattr(cell.cell_contents, '__wrapped__', None)
+        if function in names.KINDS:
+            return names.KINDS[function]
+    return None
+
+
+def _param(param) -> dict[str, Any]:
+    """Describe an argument or option."""
+    described = {
+        'name': param.name,
+        'type': param.type.name,
+        'default': _default(param),
+    }
+    if hasattr(param.type, 'choices'):
+        described['choices'] = [str(choice) for choice in param.type.choices]
+    if kind := _completes(param):
+        described['completes'] = kind
+    if param.param_type_name == 'option':
+        described |= {
+            'flags': list(param.opts),
+            'secondary': list(param.secondary_opts),
+            'is_flag': param.is_flag,
+            'hidden': param.hidden,
+            'help': param.help or '',
+        }
+    else:
+        described['required'] = param.required
+    return described
+
+
+def _command(command, aliases: list[str]) -> dict[str, Any]:
+    """Describe a command, or a group and its commands."""
+    described = {
+        'aliases': aliases,
+        'help': (command.help or '').strip().split('\n')[0],
+        'arguments': [
+            _param(p) for p in command.params if p.param_type_name == 'argument'
+        ],
+        'options': [_param(p) for p in command.params if p.param_type_name == 'option'],
+    }
+    if hasattr(command, 'commands'):
+        described['commands'] = _commands(command.commands)
+    return described
+
+
+def _commands(
+    commands: dict[str, Any], group_aliases: Optional[dict[str, str]] = None
+) -> dict[str, Any]:
+    """Describe commands, folding each hidden alias into the command it repeats."""
+    canonical = {
+        getattr(command.callback, '__wrapped__', command.callback): name
+        for name, command in commands.items()
+        if not command.hidden
+    }
+    aliases: dict[str, list[str]] = {name: [] for name in canonical.values()}
+    for name, command in commands.items():
+        callback = getattr(command.callback, '__wrapped__', command.callback)
+        if command.hidden and callback in canonical:
+            aliases[canonical[callback]].append(name)
+    for alias, name in (group_aliases or {}).items():
+        if name in aliases:
+            aliases[name].append(alias)
+
+    return {
+        name: _command(commands[name], aliases[name])
+        for name in commands
+        if name in aliases
+    }
+
+
+def build() -> dict[str, Any]:
+    """Describe the command tree of the Typer app."""
+    cli = typer.main.get_command(app)
+    options = [_param(p) for p in cli.params]
+    for option in options:
+        # the root options default to the user's settings, which are not the manifest's
+        option['default'] = None
+    return {
+        'options': options,
+        'commands': _commands(cli.commands, ALIASES),
+    }
+
+
+def write(path: Path = PATH):
+    """Write the manifest to a file."""
+    path.write_text(json.dumps(build(), indent=2) + '\n')
+
+
+if __name__ == '__main__':
+    write()
@@ -0,0 +1,198 @@
+"""module caching OBS metadata that only changes when OBS or its plugins do.
+
+Input kinds, hotkeys, monitors and filter default settings are the same
+from one command to the next, so the responses to the requests for them
+are kept on disk, in a file per host, as zlib compressed JSON.
+
+The responses are kept for one obs-websocket version, which comes with
+the hello OBS sends on connecting, so its upgrade is noticed without a
+request. The OBS version is only checked when a request is not cached:
+GetVersion is sent in the same batch, costing no round trip of its own,
+and the responses are dropped if OBS was upgraded. Once the cache is
+warm these lookups send no requests at all, so an OBS upgrade that keeps
+the obs-websocket version, or a plugin installed since, goes unnoticed
+until a lookup misses or the cache is warmed or cleared.
+"""
+
+import json
+import logging
+import os
+import zlib
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import quote
+
+import obsws_python as obsws
+
+from .cachedir import cache_dir
+
+logger = logging.getLogger(__name__)
+
+# the cached responses, per cache file, loaded once per process
+_loaded: dict[Path, dict[str, Any]] = {}
+
+
+def cache_path(host: str, port: int) -> Path:
+    """Get the metadata cache file for a host."""
+    return cache_dir() / 'metadata' / f'{quote(str(host), safe="")}_{port}.z'
+
+
+def load(path: Path) -> dict[str, Any]:
+    """Load a metadata cache file, empty if it is missing or unreadable."""
+    try:
+        return json.loads(zlib.decompress(path.read_bytes()))
+    except (OSError, ValueError, zlib.error):
+        return {}
+
+
+def store(path: Path, cache: dict[str, Any]):
+    """Store a metadata cache, replacing the file atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f'.{os.getpid()}.tmp')
+    tmp.write_bytes(zlib.compress(json.dumps(cache, separators=(',', ':')).encode()))
+    os.replace(tmp, path)
+
+
+def _key(request_type: str, request_data: Optional[dict]) -> str:
+    """Key a request by its type and data."""
+    return f'{request_type} {json.dumps(request_data or {}, sort_keys=True)}'
+
+
+def _cache(req_client) -> tuple[Path, dict[str, Any]]:
+    """Get the cache for the host a client is connected to, for its obs-websocket version."""
+    base_client = req_client.base_client
+    path = cache_path(base_client.host, base_client.port)
+    cache = _loaded.get(path)
+    if cache is None:
+        cache = load(path)
+    version = base_client.server_hello['d'].get('obsWebSocketVersion')
+    if cache.get('obsWebSocketVersion') != version:
+        cache = {'obsWebSocketVersion': version, 'obsVersion': None, 'responses': {}}
+    _loaded[path] = cache
+    return path, cache
+
+
+def request_many(
+    req_client, requests: list[tuple[str, Optional[dict]]], refresh: bool = False
+) -> list[dict]:
+    """Get the response data of several requests, sending only those not cached.
+
+    Those not cached are sent in a single request batch. As with gather,
+    the first failed request, in order, raises OBSSDKRequestError.
+
+    Args:
+    ----
+        req_client: A connected request client
+        requests (list): (requestType, requestData) pairs
+        refresh (bool): Send every request, updating the cache
+
+    Returns:
+    -------
+        list: The response data of each request, as a dict, in the order given
+
+    """
+    if not hasattr(req_client, 'send_batch'):
+        # a plain obsws_python client, which cannot batch the version with them
+        return [
+            req_client.send(request_type, request_data, raw=True) or {}
+            for request_type, request_data in requests
+        ]
+
+    path, cache = _cache(req_client)
+    responses = cache['responses']
+    keys = [_key(request_type, request_data) for request_type, request_data in requests]
+    found = {} if refresh else {key: responses[key] for key in keys if key in responses}
+    missing = {key: request for key, request in zip(keys, requests) if key not in found}
+    if not missing:
+        return [found[key] for key in keys]
+
+    version, *results = req_client.send_batch([('GetVersion', None), *missing.values()])
+    if version['requestStatus']['result']:
+        obs_version = version['responseData']['obsVersion']
+        if cache['obsVersion'] not in (None, obs_version):
+            responses.clear()
+        cache['obsVersion'] = obs_version
+
+    failed = None
+    for key, result in zip(missing, results):
+        if result['requestStatus']['result']:
+            found[key] = responses[key] = result.get('responseData') or {}
+        elif failed is None:
+            failed = result
+    try:
+        store(path, cache)
+    except OSError as e:
+        logger.debug('Could not store the metadata cache: %s', e)
+    if failed is not None:
+        raise obsws.error.OBSSDKRequestError(
+            failed['requestType'],
+            failed['requestStatus']['code'],
+            failed['requestStatus'].get('comment'),
+        )
+    return [found[key] for key in keys]
+
+
+def request(
+    req_client,
+    request_type: str,
+    request_data: Optional[dict] = None,
+    refresh: bool = False,
+) -> dict:
+    """Get the response data of a request, sending it only if it is not cached."""
+    return request_many(req_client, [(request_type, request_data)], refresh)[0]
+
+
+def input_kinds(req_client, refresh: bool = False) -> list[str]:
+    """Get the input kinds OBS offers, asking OBS afresh if refresh is set."""
+    return request(req_client, 'GetInputKindList', {'unversioned': False}, refresh)[
+        'inputKinds'
+    ]
+
+
+def warm(req_client) -> int:
+    """Fetch all the metadata afresh, returning the number of responses cached."""
+    path, cache = _cache(req_client)
+    cache['responses'].clear()
+    try:
+        filter_kinds = request(req_client, 'GetSourceFilterKindList')[
+            'sourceFilterKinds'
+        ]
+    except obsws.error.OBSSDKRequestError:
+        # before obs-websocket 5.4, the filter kinds cannot be listed
+        filter_kinds = []
+    request_many(
+        req_client,
+        [
+            ('GetInputKindList', {'unversioned': False}),
+            ('GetHotkeyList', None),
+            ('GetMonitorList', None),
+            *(
+                ('GetSourceFilterDefaultSettings', {'filterKind': kind})
+                for kind in filter_kinds
+            ),
+        ],
+    )
+    return len(cache['responses'])
+
+
+def clear(host: Optional[str] = None, port: Optional[int] = None) -> list[Path]:
+    """Remove the cached metadata and names of a host, or of every host, returning the files removed."""
+    from . import names
+
+    if host is None:
+        paths = [
+            *(cache_dir() / 'metadata').glob('*'),
+            *(cache_dir() / 'names').glob('*'),
+        ]
+    else:
+        paths = [cache_path(host, port), names.cache_path(host, port)]
+    _loaded.clear()
+
+    removed = []
+    for path in paths:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            continue
+        removed.append(path)
+    return removed
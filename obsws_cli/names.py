@@ -0,0 +1,309 @@
+"""module caching scene, input, item and filter names for shell completion.
+
+Completing a name must not wait on OBS at every TAB press. Names are read
+from a cache file per host, holding an entry per scene collection, and
+an entry older than the TTL is refreshed by a detached process while the
+stale names are offered. Only when there is no entry at all does
+completion wait for the refresh, and never for longer than the budget.
+
+    python -m obsws_cli.names
+    python -m obsws_cli.names --complete KIND INCOMPLETE [CONTAINER]
+
+refreshes the cache for the host in the OBSWS_CLI_HOST, OBSWS_CLI_PORT
+and OBSWS_CLI_PASSWORD environment variables, or prints the names of a
+kind in it that start with INCOMPLETE, one per line, for the static
+completion scripts. CONTAINER is the scene or source the items, groups
+or filters are in.
+"""
+
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+from urllib.parse import quote
+
+from . import envconfig
+from .cachedir import cache_dir
+
+if TYPE_CHECKING:
+    from typer import Context
+else:
+    # Typer passes the context to a completion callback's ctx by name, so
+    # completing from the scripts need not import it
+    Context = Any
+
+logger = logging.getLogger(__name__)
+
+# a refresh lock older than this was left by a refresh that died, in seconds
+LOCK_TIMEOUT = 30.0
+
+# how often to look for the names while waiting on a refresh, in seconds
+POLL_INTERVAL = 0.01
+
+
+def cache_path(host: str, port: int) -> Path:
+    """Get the names cache file for a host."""
+    return cache_dir() / 'names' / f'{quote(str(host), safe="")}_{port}.json'
+
+
+def _setting(key: str) -> float:
+    """Get a completion setting, the environment overriding the config files."""
+    return float(os.environ.get(f'OBSWS_CLI_{key.upper()}', envconfig.get(key)))
+
+
+def load(path: Path) -> dict[str, Any]:
+    """Load a names cache file, empty if it is missing or unreadable."""
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _current(cache: dict[str, Any]) -> Optional[dict[str, Any]]:
+    """Get the entry for the scene collection OBS had open at the last refresh."""
+    return cache.get('collections', {}).get(cache.get('current'))
+
+
+def fetch(req_client) -> tuple[str, dict[str, Any]]:
+    """Fetch the names in OBS's current scene collection.
+
+    Scene items and filters are fetched with a request batch each, so a
+    refresh takes the same few round trips however many scenes there are.
+    """
+    collection = req_client.get_scene_collection_list().current_scene_collection_name
+    scenes = [
+        scene['sceneName'] for scene in reversed(req_client.get_scene_list().scenes)
+    ]
+    inputs = sorted(
+        input_['inputName'] for input_ in req_client.get_input_list().inputs
+    )
+    groups = req_client.get_group_list().groups
+
+    containers = [
+        *(('GetSceneItemList', scene) for scene in scenes),
+        *(('GetGroupSceneItemList', group) for group in groups),
+    ]
+    items = {}
+    for (_, name), result in zip(
+        containers,
+        req_client.send_batch(
+            [(request, {'sceneName': name}) for request, name in containers]
+        ),
+    ):
+        if result['requestStatus']['result']:
+            items[name] = [
+                item['sourceName'] for item in result['responseData']['sceneItems']
+            ]
+
+    sources = [*scenes, *inputs]
+    filters = {}
+    for source, result in zip(
+        sources,
+        req_client.send_batch(
+            [('GetSourceFilterList', {'sourceName': source}) for source in sources]
+        ),
+    ):
+        if result['requestStatus']['result']:
+            filters[source] = [
+                filter_['filterName'] for filter_ in result['responseData']['filters']
+            ]
+
+    return collection, {
+        'fetched': time.time(),
+        'scenes': scenes,
+        'inputs': inputs,
+        'groups': groups,
+        'items': items,
+        'filters': filters,
+    }
+
+
+def store(path: Path, collection: str, entry: dict[str, Any]):
+    """Store the names of a scene collection, replacing the cache file atomically."""
+    cache = load(path)
+    cache.setdefault('collections', {})[collection] = entry
+    cache['current'] = collection
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f'.{os.getpid()}.tmp')
+    tmp.write_text(json.dumps(cache))
+    os.replace(tmp, path)
+
+
+def refresh(connection: dict[str, Any]):
+    """Fetch the names from OBS and store them in the host's cache file."""
+    from . import client
+
+    with client.ReqClient(**connection) as req_client:
+        collection, entry = fetch(req_client)
+    store(cache_path(connection['host'], connection['port']), collection, entry)
+
+
+def _lock(path: Path) -> bool:
+    """Take the refresh lock for a cache file, False if a refresh holds it."""
+    lock = path.with_suffix('.lock')
+    lock.parent.mkdir(parents=True, exist_ok=True)
+    for _ in range(2):
+        try:
+            os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return True
+        except FileExistsError:
+            try:
+                if time.time() - lock.stat().st_mtime < LOCK_TIMEOUT:
+                    return False
+                lock.unlink()
+            except FileNotFoundError:
+                pass
+    return False
+
+
+def _spawn_refresh(connection: dict[str, Any], path: Path):
+    """Refresh the cache in a detached process, unless one is already refreshing it."""
+    if not _lock(path):
+        return
+    env = os.environ | {
+        'OBSWS_CLI_HOST': str(connection['host']),
+        'OBSWS_CLI_PORT': str(connection['port']),
+        'OBSWS_CLI_PASSWORD': str(connection['password']),
+        'OBSWS_CLI_TIMEOUT': str(connection['timeout']),
+    }
+    try:
+        subprocess.Popen(
+            [sys.executable, '-m', 'obsws_cli.names'],
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError as e:
+        logger.debug('Could not start a names refresh: %s', e)
+        path.with_suffix('.lock').unlink(missing_ok=True)
+
+
+def lookup(connection: dict[str, Any]) -> dict[str, Any]:
+    """Get the cached names for a host, starting a refresh if they are stale.
+
+    Stale names are returned at once. Without any names, this waits for
+    the refresh for up to the completion budget, then returns what is
+    there, which may be nothing.
+    """
+    path = cache_path(connection['host'], connection['port'])
+    entry = _current(load(path))
+    ttl = _setting('completion_ttl')
+    if entry is not None and time.time() - entry['fetched'] < ttl:
+        return entry
+
+    _spawn_refresh(connection, path)
+    if entry is not None:
+        return entry
+    deadline = time.perf_counter() + _setting('completion_budget') / 1000
+    while time.perf_counter() < deadline:
+        time.sleep(POLL_INTERVAL)
+        entry = _current(load(path))
+        if entry is not None:
+            return entry
+    return {}
+
+
+def _connection(ctx: Context) -> dict[str, Any]:
+    """Get the connection settings parsed from the command line being completed."""
+    params = ctx.find_root().params
+    return {
+        'host': params.get('host') or envconfig.get('host'),
+        'port': params.get('port') or envconfig.get('port'),
+        'password': params.get('password') or envconfig.get('password'),
+        'timeout': params.get('timeout') or envconfig.get('timeout'),
+    }
+
+
+def complete(
+    connection: dict[str, Any],
+    kind: str,
+    incomplete: str,
+    container: Optional[str] = None,
+) -> list[str]:
+    """Complete a name of a kind, in the scene, group or source given if it needs one.
+
+    The kinds are scenes, inputs, sources, which are scenes or inputs,
+    groups, of the scene given if there is one, items and filters.
+    """
+    entry = lookup(connection)
+    if kind == 'sources':
+        names = [*entry.get('scenes', []), *entry.get('inputs', [])]
+    elif kind in ('items', 'filters'):
+        names = entry.get(kind, {}).get(container, [])
+    else:
+        names = entry.get(kind, [])
+        if kind == 'groups' and container:
+            items = entry.get('items', {}).get(container, [])
+            names = [group for group in names if group in items]
+    return [name for name in names if name.startswith(incomplete)]
+
+
+def complete_scenes(ctx: Context, incomplete: str) -> list[str]:
+    """Complete a scene name."""
+    return complete(_connection(ctx), 'scenes', incomplete)
+
+
+def complete_inputs(ctx: Context, incomplete: str) -> list[str]:
+    """Complete an input name."""
+    return complete(_connection(ctx), 'inputs', incomplete)
+
+
+def complete_sources(ctx: Context, incomplete: str) -> list[str]:
+    """Complete a source name, a scene or an input."""
+    return complete(_connection(ctx), 'sources', incomplete)
+
+
+def complete_groups(ctx: Context, incomplete: str) -> list[str]:
+    """Complete a group name, of the groups in the scene given if there is one."""
+    return complete(
+        _connection(ctx), 'groups', incomplete, ctx.params.get('scene_name')
+    )
+
+
+def complete_items(ctx: Context, incomplete: str) -> list[str]:
+    """Complete an item name, in the group given or else in the scene given."""
+    container = ctx.params.get('group') or ctx.params.get('scene_name')
+    return complete(_connection(ctx), 'items', incomplete, container)
+
+
+def complete_filters(ctx: Context, incomplete: str) -> list[str]:
+    """Complete a filter name, of the source given."""
+    return complete(
+        _connection(ctx), 'filters', incomplete, ctx.params.get('source_name')
+    )
+
+
+# the kind of name each completion function completes, for the command manifest
+KINDS = {
+    complete_scenes: 'scenes',
+    complete_inputs: 'inputs',
+    complete_sources: 'sources',
+    complete_groups: 'groups',
+    complete_items: 'items',
+    complete_filters: 'filters',
+}
+
+
+if __name__ == '__main__':
+    connection = {
+        'host': os.environ.get('OBSWS_CLI_HOST', envconfig.get('host')),
+        'port': int(os.environ.get('OBSWS_CLI_PORT', envconfig.get('port'))),
+        'password': os.environ.get('OBSWS_CLI_PASSWORD', envconfig.get('password')),
+        'timeout': int(os.environ.get('OBSWS_CLI_TIMEOUT', envconfig.get('timeout'))),
+    }
+    if sys.argv[1:2] == ['--complete']:
+        for name in complete(connection, *sys.argv[2:5]):
+            print(name)
+        sys.exit()
+    try:
+        refresh(connection)
+    finally:
+        cache_path(connection['host'], connection['port']).with_suffix('.lock').unlink(
+            missing_ok=True
+        )
@@ -0,0 +1,370 @@
+"""module implementing the OSC bridge, controlling OBS from OSC over UDP.
+
+Audio desks and lighting consoles send OSC messages such as
+
+    /obs/input/Mic%2FAux/volume -12.0
+    /obs/scene/switch "BRB"
+
+which the bridge turns into requests on a single session with OBS. A
+fader sends far more messages than OBS can render frames, so the latest
+value for each target is held and everything pending is sent as one
+request batch per video frame. With a feedback address, volume, mute and
+scene changes, and optionally the input meters, are sent back as OSC so
+the desk can follow OBS without polling.
+"""
+
+import logging
+import socket
+import struct
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any, Optional
+from urllib.parse import quote, unquote
+
+import obsws_python as obsws
+
+from . import reconnect
+from .api import requests
+
+logger = logging.getLogger(__name__)
+
+# the frame interval used until OBS reports its video settings
+DEFAULT_FRAME_INTERVAL = 1 / 60
+
+# the largest datagram read, OSC messages from a desk are a few dozen bytes
+MAX_DATAGRAM = 65536
+
+BUNDLE = b'#bundle\0'
+
+
+class OSCError(Exception):
+    """Raised when an OSC packet cannot be decoded."""
+
+
+def _pad(data: bytes) -> bytes:
+    """Pad data with nulls to a multiple of four bytes."""
+    return data + b'\0' * (-len(data) % 4)
+
+
+def _string(packet: bytes, offset: int) -> tuple[str, int]:
+    """Read a null terminated, padded string, returning it and the next offset."""
+    end = packet.find(b'\0', offset)
+    if end < 0:
+        raise OSCError('unterminated string')
+    return packet[offset:end].decode('utf-8', 'replace'), end + 4 - (end % 4)
+
+
+def encode(address: str, *args: Any) -> bytes:
+    """Encode an OSC message, typing each argument from its Python type."""
+    tags, data = ',', b''
+    for arg in args:
+        match arg:
+            case bool():
+                tags += 'T' if arg else 'F'
+            case int():
+                tags += 'i'
+                data += struct.pack('>i', arg)
+            case float():
+                tags += 'f'
+                data += struct.pack('>f', arg)
+            case str():
+                tags += 's'
+                data += _pad(arg.encode() + b'\0')
+            case bytes():
+                tags += 'b'
+                data += struct.pack('>i', len(arg)) + _pad(arg)
+            case _:
+                raise TypeError(f'cannot encode {type(arg).__name__} as OSC')
+    return _pad(address.encode() + b'\0') + _pad(tags.encode() + b'\0') + data
+
+
+def decode(packet: bytes) -> Iterator[tuple[str, list[Any]]]:
+    """Decode an OSC packet into its messages, flattening bundles.
+
+    Bundle time tags are ignored, every message is acted on immediately.
+    """
+    if packet.startswith(BUNDLE):
+        offset = len(BUNDLE) + 8
+        while offset < len(packet):
+            if offset + 4 > len(packet):
+                raise OSCError('truncated bundle element')
+            (size,) = struct.unpack_from('>i', packet, offset)
+            offset += 4
+            if size < 0 or offset + size > len(packet):
+                raise OSCError('truncated bundle element')
+            yield from decode(packet[offset : offset + size])
+            offset += size
+        return
+
+    address, offset = _string(packet, 0)
+    if not address.startswith('/'):
+        raise OSCError(f'invalid address {address!r}')
+    if offset >= len(packet):
+        # a message from an old sender may omit the type tags
+        yield address, []
+        return
+    tags, offset = _string(packet, offset)
+    if not tags.startswith(','):
+        raise OSCError(f'invalid type tags {tags!r}')
+
+    args = []
+    try:
+        for tag in tags[1:]:
+            match tag:
+                case 'i':
+                    args.append(struct.unpack_from('>i', packet, offset)[0])
+                    offset += 4
+                case 'f':
+                    args.append(struct.unpack_from('>f', packet, offset)[0])
+                    offset += 4
+                case 'h':
+                    args.append(struct.unpack_from('>q', packet, offset)[0])
+                    offset += 8
+                case 'd':
+                    args.append(struct.unpack_from('>d', packet, offset)[0])
+                    offset += 8
+                case 's' | 'S':
+                    value, offset = _string(packet, offset)
+                    args.append(value)
+                case 'b':
+                    (size,) = struct.unpack_from('>i', packet, offset)
+                    offset += 4
+                    args.append(packet[offset : offset + size])
+                    offset += size + (-size % 4)
+                case 'T':
+                    args.append(True)
+                case 'F':
+                    args.append(False)
+                case 'N' | 'I':
+                    args.append(None)
+                case _:
+                    raise OSCError(f'unsupported type tag {tag!r}')
+    except struct.error:
+        raise OSCError('truncated arguments') from None
+    yield address, args
+
+
+class Bridge:
+    """Translate OSC messages into requests, coalesced per target per frame.
+
+    Messages are read on one thread and held in a pending table keyed by
+    their target, so a newer fader value replaces the one waiting to be
+    sent. Another thread sends the pending requests once per frame, and
+    refetches the frame interval when the session resyncs, so the request
+    client is only used by one thread at a time.
+    Toggles are never coalesced, since two toggles are not one.
+    """
+
+    def __init__(
+        self,
+        session: reconnect.Session,
+        feedback: Optional[tuple[str, int]] = None,
+    ):
+        """Initialize the Bridge, registering the feedback callbacks when given an address."""
+        self.session = session
+        self.feedback = feedback
+        self.frame_interval = DEFAULT_FRAME_INTERVAL
+        self.received = 0
+        self.coalesced = 0
+        self.sent = 0
+        self.failed = 0
+        self._sock: Optional[socket.socket] = None
+        self._pending: dict[Any, tuple[str, dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        # held while the request client is in use, as flush may be called from any thread
+        self._send_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._resynced = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        session.on_resync.append(self._resynced.set)
+        if feedback is not None:
+            session.register(
+                [
+                    self.on_current_program_scene_changed,
+                    self.on_input_volume_changed,
+                    self.on_input_mute_state_changed,
+                    self.on_input_volume_meters,
+                ]
+            )
+
+    @property
+    def port(self) -> Optional[int]:
+        """The UDP port being listened on, once started."""
+        return self._sock.getsockname()[1] if self._sock is not None else None
+
+    def start(self, bind: tuple[str, int]) -> 'Bridge':
+        """Receive OSC on the given address and start sending once per frame."""
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.bind(bind)
+        self._fetch_frame_interval()
+        threading.Thread(target=self._receive, daemon=True).start()
+        self._flusher = threading.Thread(target=self._flush_every_frame, daemon=True)
+        self._flusher.start()
+        return self
+
+    def stop(self):
+        """Stop receiving, sending anything still pending."""
+        self._stopped.set()
+        if self._sock is not None:
+            self._sock.close()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush()
+
+    def _fetch_frame_interval(self):
+        """Get the frame interval from OBS's video settings."""
+        req_client = self.session.req_client
+        if req_client is None:
+            return
+        try:
+            with self._send_lock:
+                resp = req_client.get_video_settings()
+        except reconnect.CONNECTION_ERRORS as e:
+            logger.debug('Could not get the video settings: %s', e)
+            return
+        self.frame_interval = resp.fps_denominator / resp.fps_numerator
+
+    # OSC to OBS
+
+    def _receive(self):
+        """Read datagrams until the socket is closed."""
+        while not self._stopped.is_set():
+            try:
+                packet, sender = self._sock.recvfrom(MAX_DATAGRAM)
+            except OSError:
+                return
+            try:
+                for address, args in decode(packet):
+                    self.handle(address, args)
+            except OSCError as e:
+                logger.debug('Ignoring a malformed packet from %s: %s', sender, e)
+
+    def handle(self, address: str, args: list[Any]):
+        """Queue the request an OSC message maps to, replacing any pending for its target."""
+        request = self._request(address, args)
+        if request is None:
+            logger.debug('Ignoring %s %s', address, args)
+            return
+        key, request_type, data = request
+        with self._lock:
+            self.received += 1
+            if key in self._pending:
+                self.coalesced += 1
+            # a replaced value keeps its target's place in the batch
+            self._pending[key] = (request_type, data)
+
+    def _request(
+        self, address: str, args: list[Any]
+    ) -> Optional[tuple[Any, str, dict[str, Any]]]:
+        """Map an OSC message to its coalescing key and request, if it maps to one."""
+        if address == '/obs/scene/switch':
+            if len(args) != 1 or not isinstance(args[0], str):
+                return None
+            return 'scene', *requests.switch_scene(args[0])
+
+        if not address.startswith('/obs/input/'):
+            return None
+        # input names may contain slashes, such as Mic/Aux
+        name, _, target = address.removeprefix('/obs/input/').rpartition('/')
+        if not name:
+            return None
+        name = unquote(name)
+        match target, args:
+            case 'volume', [int() | float() as db] if not isinstance(db, bool):
+                db = min(requests.MAX_VOLUME_DB, max(requests.MIN_VOLUME_DB, float(db)))
+                return ('volume', name), *requests.set_input_volume(name, db)
+            case 'mute', []:
+                return object(), *requests.toggle_input_mute(name)
+            case 'mute', [bool() | int() | float() as muted]:
+                return ('mute', name), *requests.set_input_mute(name, bool(muted))
+        return None
+
+    def _flush_every_frame(self):
+        """Send the pending requests at each frame boundary until stopped."""
+        deadline = time.perf_counter()
+        while True:
+            deadline += self.frame_interval
+            if self._stopped.wait(max(0.0, deadline - time.perf_counter())):
+                return
+            if self._resynced.is_set():
+                # after a reconnect, OBS may have restarted with other video settings
+                self._resynced.clear()
+                self._fetch_frame_interval()
+            self.flush()
+            # a stall is not caught up on, pending values are already the latest
+            deadline = max(deadline, time.perf_counter() - self.frame_interval)
+
+    def flush(self):
+        """Send the pending requests in one batch."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        req_client = self.session.req_client
+        if req_client is None:
+            self.failed += len(pending)
+            return
+        requests = list(pending.values())
+        try:
+            with self._send_lock:
+                results = req_client.send_batch(requests)
+        except reconnect.CONNECTION_ERRORS as e:
+            self.failed += len(requests)
+            logger.warning('Dropped %d requests: %s', len(requests), e)
+            return
+        for (request_type, data), result in zip(requests, results):
+            status = result['requestStatus']
+            if status['result']:
+                self.sent += 1
+            else:
+                self.failed += 1
+                logger.warning(
+                    '%s %s failed: %s', request_type, data, status.get('comment')
+                )
+
+    # OBS to OSC
+
+    def _send_feedback(self, address: str, *args: Any):
+        """Send a feedback message, dropping it if the socket is gone."""
+        try:
+            self._sock.sendto(encode(address, *args), self.feedback)
+        except (OSError, AttributeError) as e:
+            logger.debug('Could not send %s: %s', address, e)
+
+    def on_current_program_scene_changed(self, data):
+        """Send the new program scene."""
+        self._send_feedback('/obs/scene/current', data.scene_name)
+
+    def on_input_volume_changed(self, data):
+        """Send an input's new volume, so motorised faders follow it."""
+        self._send_feedback(
+            f'/obs/input/{quote(data.input_name, safe="")}/volume',
+            float(data.input_volume_db),
+        )
+
+    def on_input_mute_state_changed(self, data):
+        """Send an input's new mute state."""
+        self._send_feedback(
+            f'/obs/input/{quote(data.input_name, safe="")}/mute',
+            int(data.input_muted),
+        )
+
+    def on_input_volume_meters(self, data):
+        """Send the peak level of every input, as a multiplier."""
+        for input_ in data.inputs:
+            levels = input_.get('inputLevelsMul') or []
+            peak = max((channel[1] for channel in levels), default=0.0)
+            self._send_feedback(
+                f'/obs/input/{quote(input_["inputName"], safe="")}/meter',
+                float(peak),
+            )
+
+
+def subscriptions(meters: bool) -> int:
+    """Return the event subscriptions the bridge needs."""
+    subs = obsws.Subs.LOW_VOLUME
+    if meters:
+        subs |= obsws.Subs.INPUTVOLUMEMETERS
+    return subs
@@ -0,0 +1,193 @@
+"""module for timing the phases of a command, reported by --profile.
+
+The package imports this module first so the time spent importing the
+rest of the CLI can be measured. Spans are timed with a monotonic clock
+and only recorded during startup and while a command is being profiled.
+"""
+
+import json
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+STARTED = time.perf_counter()
+
+
+@dataclass
+class Span:
+    """A timed phase of a command."""
+
+    name: str
+    start: float
+    end: float
+    args: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        """The duration of the span in seconds."""
+        return self.end - self.start
+
+
+recording = True
+_spans: list[Span] = []
+_startup: list[Span] = []
+_profiler = None
+_output: Optional[Path] = None
+
+
+def add(name: str, start: float, end: float, **args: Any):
+    """Record a span if recording."""
+    if recording:
+        _spans.append(Span(name, start, end, args))
+
+
+@contextmanager
+def span(name: str, **args: Any) -> Iterator[None]:
+    """Time the enclosed block as a span."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        add(name, start, time.perf_counter(), **args)
+
+
+def begin(name: str) -> Callable[[], None]:
+    """Start a span, returning the function that ends it."""
+    start = time.perf_counter()
+    return lambda: add(name, start, time.perf_counter())
+
+
+def imported():
+    """Record the end of the package import, called once by the app module."""
+    global recording
+
+    add('import', STARTED, time.perf_counter())
+    _startup.extend(_spans)
+    _spans.clear()
+    recording = False
+
+
+def enable(output: Optional[Path] = None):
+    """Start profiling the current command.
+
+    Args:
+    ----
+        output (Path | None): Write a Chrome trace-event file if it ends in
+            .json, a cProfile stats file otherwise
+
+    """
+    global recording, _output, _profiler
+
+    now = time.perf_counter()
+    recording = True
+    _spans.clear()
+    if _startup:
+        # Only the first command in a process paid for the import.
+        _spans.extend(_startup)
+        add('setup', _startup[-1].end, now)
+        _startup.clear()
+
+    _output = output
+    if output is not None and output.suffix != '.json':
+        import cProfile
+
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+
+
+def finish(requests: list) -> list[Span]:
+    """Stop profiling and return the spans, the client's round trips included.
+
+    Anything after the last phase, such as disconnecting, is recorded as
+    teardown. The output file is written here if one was requested.
+    """
+    global recording, _profiler
+
+    if _spans:
+        add('teardown', max(s.end for s in _spans), time.perf_counter())
+    recording = False
+    if _profiler is not None:
+        _profiler.disable()
+        _profiler.dump_stats(_output)
+        _profiler = None
+
+    spans = list(_spans) + [
+        Span(
+            'request',
+            record.start,
+            record.start + record.latency,
+            {
+                'requestType': record.request_type,
+                'requests': record.requests,
+                'sentBytes': record.sent_bytes,
+                'receivedBytes': record.received_bytes,
+            },
+        )
+        for record in requests
+    ]
+    spans.sort(key=lambda s: (s.start, -s.end))
+    _spans.clear()
+
+    if _output is not None and _output.suffix == '.json':
+        write_trace(_output, spans)
+    return spans
+
+
+def breakdown(spans: list[Span]) -> list[tuple[str, int, float]]:
+    """Total the spans by phase for display.
+
+    Args:
+    ----
+        spans (list): Spans sorted by start time
+
+    Returns:
+    -------
+        list: (label, depth, seconds) rows. Nested phases such as requests
+        and rendering are totalled under the phase they ran in.
+
+    """
+    rows: list[list] = []
+    totals: dict[str, list] = {}
+    stack: list[Span] = []
+    for s in spans:
+        while stack and s.start >= stack[-1].end:
+            stack.pop()
+        if s.name in ('request', 'render'):
+            parent = stack[-1].name if stack else ''
+            key = f'{parent}/{s.name}'
+            if key not in totals:
+                totals[key] = [s.name, len(stack), 0.0, 0]
+                rows.append(totals[key])
+            totals[key][2] += s.duration
+            totals[key][3] += 1
+            continue
+        rows.append([s.name, len(stack), s.duration, None])
+        stack.append(s)
+
+    return [
+        (f'{name} ({count})' if count is not None else name, depth, duration)
+        for name, depth, duration, count in rows
+    ]
+
+
+def write_trace(path: Path, spans: list[Span]):
+    """Write the spans as Chrome trace events, viewable in chrome://tracing or Perfetto."""
+    pid = os.getpid()
+    events = [
+        {
+            'name': s.args.get('requestType', s.name),
+            'cat': s.name,
+            'ph': 'X',
+            'ts': round((s.start - STARTED) * 1_000_000, 3),
+            'dur': round(s.duration * 1_000_000, 3),
+            'pid': pid,
+            'tid': 0,
+            'args': s.args,
+        }
+        for s in spans
+    ]
+    path.write_text(json.dumps({'traceEvents': events, 'displayTimeUnit': 'ms'}))
@@ -0,0 +1,189 @@
+"""module for keeping long-running commands connected to OBS.
+
+A one-shot command exits when its connection drops, a long-running one
+such as rules should instead wait for OBS to come back. Session holds a
+request and an event connection, and when the event connection is lost
+it reconnects both with exponential backoff, identifying with the same
+event subscriptions and registering the same callbacks again.
+"""
+
+import logging
+import random
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+import obsws_python as obsws
+from obsws_python.util import to_snake_case
+from websocket import WebSocketException
+
+from . import client
+
+logger = logging.getLogger(__name__)
+
+# Errors raised while OBS is unreachable or shutting down.
+CONNECTION_ERRORS = (obsws.error.OBSSDKError, OSError, WebSocketException)
+
+# The clients log every failed connection, which is expected while OBS is down.
+CLIENT_LOGGERS = ('obsws_python', 'obsws_cli.client')
+
+
+@contextmanager
+def quiet_clients() -> Iterator[None]:
+    """Silence the connection errors the clients log, while OBS is expected to be down."""
+    loggers = [logging.getLogger(name) for name in CLIENT_LOGGERS]
+    levels = [log.level for log in loggers]
+    for log in loggers:
+        log.setLevel(logging.CRITICAL)
+    try:
+        yield
+    finally:
+        for log, level in zip(loggers, levels):
+            log.setLevel(level)
+
+
+class ReconnectError(Exception):
+    """Raised when OBS could not be reached within the allowed attempts."""
+
+
+@dataclass
+class Backoff:
+    """Exponential backoff with jitter between reconnect attempts.
+
+    Each delay is drawn from the upper half of the capped exponential
+    delay, so clients that lost OBS together do not retry in step.
+    """
+
+    initial: float = 0.5
+    maximum: float = 30.0
+    factor: float = 2.0
+
+    def delay(self, attempt: int) -> float:
+        """Get the seconds to wait before the given attempt, counting from 0."""
+        cap = min(self.maximum, self.initial * self.factor**attempt)
+        return cap / 2 + random.uniform(0, cap / 2)
+
+
+class Session:
+    """A request and event connection to OBS that is re-established when lost.
+
+    The request client is the one commands use, ctx.obj['obsws'] must be
+    updated from it after a reconnect. Callbacks in on_resync are called
+    after every reconnect and scene collection change, to invalidate or
+    resync anything cached from OBS.
+    """
+
+    def __init__(
+        self,
+        connection: dict[str, Any],
+        subs: int,
+        protocol: str = 'json',
+        req_client: Optional[client.ReqClient] = None,
+        backoff: Optional[Backoff] = None,
+        max_attempts: int = 0,
+    ):
+        """Initialize the Session, taking over an already connected request client if given."""
+        self.connection = connection
+        self.subs = subs
+        self.protocol = protocol
+        self.backoff = backoff or Backoff()
+        self.max_attempts = max_attempts
+        self.req_client = req_client
+        self.event_client: Optional[obsws.EventClient] = None
+        self.on_resync: list[Callable[[], None]] = []
+        self.reconnects = 0
+        self.downtime = 0.0
+        self._callbacks: list[Callable] = [self._make_collection_handler()]
+
+    def __enter__(self):
+        """Connect on entering the context."""
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Disconnect on leaving the context."""
+        self.close()
+
+    def _make_collection_handler(self) -> Callable:
+        """Create the callback that resyncs once a scene collection has loaded."""
+
+        def handler(data):
+            logger.debug('Scene collection changed to %s', data.scene_collection_name)
+            self.resync()
+
+        # obsws-python dispatches callbacks by function name
+        handler.__name__ = f'on_{to_snake_case("CurrentSceneCollectionChanged")}'
+        return handler
+
+    def register(self, callbacks: list[Callable]):
+        """Register event callbacks, on this and every later event connection."""
+        self._callbacks.extend(callbacks)
+        if self.event_client is not None:
+            self.event_client.callback.register(callbacks)
+
+    def connect(self):
+        """Open whichever of the request and event connections is not open."""
+        if self.req_client is None:
+            self.req_client = client.ReqClient(
+                **self.connection, protocol=self.protocol
+            )
+        if self.event_client is None:
+            self.event_client = obsws.EventClient(**self.connection, subs=self.subs)
+            self.event_client.callback.register(self._callbacks)
+
+    @property
+    def alive(self) -> bool:
+        """Whether the event connection is still receiving events."""
+        return self.event_client is not None and self.event_client.worker.is_alive()
+
+    def _drop(self):
+        """Close both connections, ignoring errors from a connection already gone."""
+        for conn in (self.event_client, self.req_client):
+            if conn is None:
+                continue
+            try:
+                conn.disconnect()
+            except CONNECTION_ERRORS:
+                pass
+        self.req_client = self.event_client = None
+
+    def reconnect(self):
+        """Reconnect after the connection was lost, waiting for OBS to come back.
+
+        Raises ReconnectError once max_attempts attempts have failed.
+        """
+        lost_at = time.perf_counter()
+        self._drop()
+        with quiet_clients():
+            attempt = 0
+            while True:
+                try:
+                    self.connect()
+                    break
+                except CONNECTION_ERRORS as e:
+                    self._drop()
+                    attempt += 1
+                    if self.max_attempts and attempt >= self.max_attempts:
+                        raise ReconnectError(
+                            f'OBS could not be reached after {attempt} attempts: {e}'
+                        ) from e
+                    delay = self.backoff.delay(attempt - 1)
+                    logger.debug(
+                        'Reconnect attempt %d failed, retrying in %.2fs', attempt, delay
+                    )
+                    time.sleep(delay)
+
+        self.reconnects += 1
+        self.downtime += time.perf_counter() - lost_at
+        self.resync()
+
+    def resync(self):
+        """Call every on_resync callback."""
+        for callback in self.on_resync:
+            callback()
+
+    def close(self):
+        """Close both connections."""
+        self._drop()
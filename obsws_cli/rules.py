@@ -0,0 +1,287 @@
+"""module implementing the in-process event rule engine.
+
+A rules file maps OBS events to CLI commands, for example:
+
+    rules:
+      - name: mute mic on brb
+        on: CurrentProgramSceneChanged
+        when:
+          sceneName: BRB
+        do:
+          - input mute "Mic/Aux"
+        debounce: 0.5
+
+Actions are run in-process against the engine's request connection, so a
+reaction costs only the requests the command itself makes.
+"""
+
+import json
+import logging
+import queue
+import re
+import shlex
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import obsws_python as obsws
+import typer
+from obsws_python.util import to_snake_case
+
+from . import console, reconnect
+
+logger = logging.getLogger(__name__)
+
+# a {field} placeholder, any other braces, such as those of JSON, are left alone
+PLACEHOLDER = re.compile(r'\{([a-z_][a-z0-9_]*)\}')
+
+# events which obs-websocket only sends to clients that explicitly subscribe to them
+HIGH_VOLUME_EVENTS = {
+    'InputVolumeMeters': obsws.Subs.INPUTVOLUMEMETERS,
+    'InputActiveStateChanged': obsws.Subs.INPUTACTIVESTATECHANGED,
+    'InputShowStateChanged': obsws.Subs.INPUTSHOWSTATECHANGED,
+    'SceneItemTransformChanged': obsws.Subs.SCENEITEMTRANSFORMCHANGED,
+}
+
+
+class RulesError(Exception):
+    """Exception raised when a rules file cannot be loaded."""
+
+
+@dataclass
+class Rule:
+    """A single rule, reacting to one event type."""
+
+    name: str
+    event: str
+    actions: list[list[str]]
+    when: dict[str, Any] = field(default_factory=dict)
+    debounce: float = 0.0
+
+    def __post_init__(self):
+        """Normalise predicate keys so both camelCase and snake_case may be used."""
+        self.when = {to_snake_case(k): v for k, v in self.when.items()}
+
+    def matches(self, data) -> bool:
+        """Check the event data against the rule's predicates.
+
+        A list of values matches if the event field equals any one of them.
+        """
+        for key, expected in self.when.items():
+            actual = getattr(data, key, None)
+            if isinstance(expected, list):
+                if actual not in expected:
+                    return False
+            elif actual != expected:
+                return False
+        return True
+
+    def render(self, data) -> list[list[str]]:
+        """Substitute {field} placeholders in the actions with event data.
+
+        Raises KeyError for a placeholder naming a field the event lacks.
+        """
+        fields = {k: getattr(data, k) for k in data.attrs()}
+        return [
+            [PLACEHOLDER.sub(lambda m: str(fields[m[1]]), arg) for arg in action]
+            for action in self.actions
+        ]
+
+
+def _parse_actions(name: str, actions: Any) -> list[list[str]]:
+    """Parse the 'do' entry of a rule into a list of argument lists.
+
+    Each action is either a command line string or a list of arguments.
+    """
+    if isinstance(actions, str):
+        actions = [actions]
+    if not isinstance(actions, list) or not actions:
+        raise RulesError(f'rule {name!r} has no actions')
+
+    parsed = []
+    for action in actions:
+        match action:
+            case str() if action.strip():
+                parsed.append(shlex.split(action))
+            case list() if all(isinstance(a, (str, int, float)) for a in action):
+                parsed.append([str(a) for a in action])
+            case _:
+                raise RulesError(f'rule {name!r} has an invalid action: {action!r}')
+    return parsed
+
+
+def load(path: Path) -> list[Rule]:
+    """Load rules from a YAML or JSON file."""
+    text = path.read_text(encoding='utf-8')
+    match path.suffix.lower():
+        case '.yaml' | '.yml':
+            try:
+                import yaml
+            except ImportError:
+                raise RulesError(
+                    'YAML rules files require PyYAML, install it with '
+                    "'pip install obsws-cli[rules]' or use a JSON rules file"
+                ) from None
+            try:
+                doc = yaml.safe_load(text)
+            except yaml.YAMLError as e:
+                raise RulesError(f'invalid YAML: {e}') from None
+        case '.json':
+            try:
+                doc = json.loads(text)
+            except json.JSONDecodeError as e:
+                raise RulesError(f'invalid JSON: {e}') from None
+        case _:
+            raise RulesError(f'unsupported rules file type: {path.suffix!r}')
+
+    if isinstance(doc, dict):
+        doc = doc.get('rules')
+    if not isinstance(doc, list) or not doc:
+        raise RulesError('expected a non-empty list of rules')
+
+    rules = []
+    for i, entry in enumerate(doc, start=1):
+        if not isinstance(entry, dict):
+            raise RulesError(f'rule {i} is not a mapping')
+        name = str(entry.get('name', f'rule {i}'))
+        # YAML 1.1 parses a bare 'on' key as the boolean True
+        event = entry.get('on', entry.get(True))
+        if not isinstance(event, str):
+            raise RulesError(f"rule {name!r} is missing an 'on' event")
+        when = entry.get('when') or {}
+        if not isinstance(when, dict):
+            raise RulesError(f"rule {name!r} has an invalid 'when' mapping")
+        try:
+            debounce = float(entry.get('debounce', 0))
+        except (TypeError, ValueError):
+            raise RulesError(f"rule {name!r} has an invalid 'debounce'") from None
+        rules.append(
+            Rule(
+                name=name,
+                event=event,
+                actions=_parse_actions(name, entry.get('do')),
+                when=when,
+                debounce=debounce,
+            )
+        )
+    return rules
+
+
+def subscriptions(rules: list[Rule]) -> int:
+    """Return the event subscriptions required by the rules."""
+    subs = obsws.Subs.LOW_VOLUME
+    for rule in rules:
+        subs |= HIGH_VOLUME_EVENTS.get(rule.event, 0)
+    return subs
+
+
+class Engine:
+    """Match events against rules and run their actions in-process.
+
+    Events are matched on the event client's thread, the actions are run
+    on the calling thread since the request client is not thread safe.
+    A rule with a debounce fires once its events stop arriving for that
+    many seconds, with the data of the last of them.
+    """
+
+    def __init__(self, ctx: typer.Context, rules: list[Rule]):
+        """Initialize the Engine with the root context's connection."""
+        self._ctx = ctx
+        self._cli = ctx.find_root().command
+        self._rules = rules
+        self._pending = queue.SimpleQueue()
+        # debounced rules waiting to fire, by id: (rule, data, received, due)
+        self._debounced: dict[int, tuple[Rule, Any, float, float]] = {}
+
+    def _make_handler(self, event: str):
+        """Create an event callback for all rules listening to an event."""
+        rules = [rule for rule in self._rules if rule.event == event]
+
+        def handler(data):
+            received = time.perf_counter()
+            for rule in rules:
+                if rule.matches(data):
+                    self._pending.put((rule, data, received))
+
+        # obsws-python dispatches callbacks by function name
+        handler.__name__ = f'on_{to_snake_case(event)}'
+        return handler
+
+    def handlers(self) -> list:
+        """Create an event callback for each event the rules listen to."""
+        return [self._make_handler(e) for e in {rule.event for rule in self._rules}]
+
+    def run(self, session: reconnect.Session):
+        """Process events until the session's event connection is lost."""
+        while session.alive:
+            timeout = 0.5
+            if self._debounced:
+                due = min(due for *_, due in self._debounced.values())
+                timeout = min(timeout, max(due - time.perf_counter(), 0))
+            try:
+                rule, data, received = self._pending.get(timeout=timeout)
+            except queue.Empty:
+                pass
+            else:
+                if rule.debounce > 0:
+                    if id(rule) in self._debounced:
+                        logger.debug('Rule %r debounced', rule.name)
+                    self._debounced[id(rule)] = (
+                        rule,
+                        data,
+                        received,
+                        received + rule.debounce,
+                    )
+                else:
+                    self._fire(rule, data, received)
+            self._fire_due()
+
+    def _fire_due(self):
+        """Fire the debounced rules whose events have settled."""
+        now = time.perf_counter()
+        for key, (rule, data, received, due) in list(self._debounced.items()):
+            if due <= now:
+                del self._debounced[key]
+                self._fire(rule, data, received)
+
+    def _fire(self, rule: Rule, data, received: float):
+        """Run a rule's actions with the event data."""
+        try:
+            actions = rule.render(data)
+        except (KeyError, IndexError, ValueError) as e:
+            console.err.print(
+                f'Rule [yellow]{rule.name}[/yellow] has an invalid placeholder: {e}'
+            )
+            return
+
+        started = time.perf_counter()
+        for args in actions:
+            self._invoke(args)
+        finished = time.perf_counter()
+
+        console.out.print(
+            f'Rule {console.highlight(self._ctx, rule.name)} reacted to '
+            f'{rule.event} in {(started - received) * 1000:.2f} ms '
+            f'(event to completion {(finished - received) * 1000:.2f} ms).'
+        )
+
+    def _invoke(self, args: list[str]):
+        """Run a CLI command in-process, sharing the engine's connection."""
+        logger.debug('Running action %s', args)
+        try:
+            exit_code = self._cli.main(
+                args=args,
+                prog_name='obsws-cli',
+                obj=self._ctx.obj,
+                standalone_mode=False,
+            )
+        # a failing action must not bring down the engine
+        except Exception as e:
+            console.err.print(f'Action [yellow]{shlex.join(args)}[/yellow] failed: {e}')
+            return
+
+        if exit_code:
+            console.err.print(
+                f'Action [yellow]{shlex.join(args)}[/yellow] exited with code {exit_code}.'
+            )
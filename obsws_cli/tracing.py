@@ -0,0 +1,293 @@
+"""module for tracing every request sent to OBS to a local file, enabled by --trace.
+
+The client hands each round trip to the tracer as a tuple. Building the
+span, encoding it and writing it is left to a background thread so the
+request path only pays for a queue put.
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+from .__about__ import __version__
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ('ndjson', 'otlp')
+MAX_BYTES = 10 * 1024 * 1024
+BACKUPS = 5
+
+# OTLP enum values
+SPAN_KIND_CLIENT = 3
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+TIMEOUT = 'timeout'
+
+
+class Tracer:
+    """Write a span per request to a rotating trace file from a background thread.
+
+    Args:
+    ----
+        path (Path): The trace file, rotated to path.1 ... path.N once it
+            grows past max_bytes
+        fmt (str): ndjson for one flat span per line, otlp for one
+            OTLP-JSON ExportTraceServiceRequest per line
+        max_bytes (int): The size at which the file is rotated, 0 disables rotation
+        backups (int): The number of rotated files to keep
+
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        fmt: str = 'ndjson',
+        max_bytes: int = MAX_BYTES,
+        backups: int = BACKUPS,
+    ):
+        """Initialize the Tracer, the file is opened by start()."""
+        self.path = path
+        self.fmt = fmt
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.trace_id = os.urandom(16).hex()
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._run, name='obsws-cli-tracer', daemon=True
+        )
+        self._file = None
+        self._failed = False
+
+    def start(self) -> 'Tracer':
+        """Open the trace file and start the writer thread."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open('a', encoding='utf-8')
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Write any queued spans and stop the writer thread."""
+        self._queue.put(None)
+        self._thread.join()
+        self._file.close()
+
+    def record(
+        self,
+        request_type: str,
+        request_id: str,
+        requests: int,
+        send_time: int,
+        latency: float,
+        sent_bytes: int,
+        received_bytes: int,
+        response: Optional[dict[str, Any]],
+    ):
+        """Queue a round trip to be written.
+
+        Args:
+        ----
+            request_type (str): The request type, RequestBatch for batches
+            request_id (str): The requestId sent with the request
+            requests (int): The number of requests sent in the round trip
+            send_time (int): When the request was sent, in nanoseconds since the epoch
+            latency (float): The time to the response in seconds
+            sent_bytes (int): The size of the request message
+            received_bytes (int): The size of the response message
+            response (dict | None): The response data, None if the request timed out
+
+        """
+        self._queue.put(
+            (
+                request_type,
+                request_id,
+                requests,
+                send_time,
+                latency,
+                sent_bytes,
+                received_bytes,
+                response,
+            )
+        )
+
+    def _run(self):
+        """Write spans as they are queued until stopped."""
+        stopping = False
+        while not stopping:
+            pending = [self._queue.get()]
+            while True:
+                try:
+                    pending.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in pending:
+                stopping = True
+                pending = [item for item in pending if item is not None]
+
+            if not pending or self._failed:
+                continue
+            try:
+                self._write_spans([_span(*item) for item in pending])
+            except (OSError, ValueError, TypeError) as e:
+                # keep draining the queue so stop() returns, dropping the spans
+                logger.error('Tracing stopped, could not write to %s: %s', self.path, e)
+                self._failed = True
+
+    def _write_spans(self, spans: list[dict[str, Any]]):
+        """Write a batch of spans in the trace format."""
+        if self.fmt == 'otlp':
+            self._write(json.dumps(self._otlp(spans), separators=(',', ':')))
+        else:
+            for span in spans:
+                self._write(json.dumps(span, separators=(',', ':')))
+        self._file.flush()
+
+    def _write(self, line: str):
+        """Write a line, rotating the file first if it would grow past max_bytes."""
+        if (
+            self.max_bytes
+            and self._file.tell()
+            and self._file.tell() + len(line.encode()) + 1 > self.max_bytes
+        ):
+            self._rotate()
+        self._file.write(line + '\n')
+
+    def _rotate(self):
+        """Shift path to path.1, path.1 to path.2 and so on, dropping the oldest."""
+        self._file.close()
+        for i in range(self.backups - 1, 0, -1):
+            source = self.path.with_name(f'{self.path.name}.{i}')
+            if source.exists():
+                source.replace(self.path.with_name(f'{self.path.name}.{i + 1}'))
+        if self.backups:
+            self.path.replace(self.path.with_name(f'{self.path.name}.1'))
+        else:
+            self.path.unlink()
+        self._file = self.path.open('a', encoding='utf-8')
+
+    def _otlp(self, spans: list[dict[str, Any]]) -> dict[str, Any]:
+        """Wrap spans in an OTLP-JSON ExportTraceServiceRequest."""
+        return {
+            'resourceSpans': [
+                {
+                    'resource': {
+                        'attributes': [
+                            _attribute('service.name', 'obsws-cli'),
+                            _attribute('service.version', __version__),
+                            _attribute('process.pid', os.getpid()),
+                        ]
+                    },
+                    'scopeSpans': [
+                        {
+                            'scope': {'name': 'obsws_cli', 'version': __version__},
+                            'spans': [
+                                {
+                                    'traceId': self.trace_id,
+                                    'spanId': os.urandom(8).hex(),
+                                    'name': span['requestType'],
+                                    'kind': SPAN_KIND_CLIENT,
+                                    'startTimeUnixNano': str(span['sendTimeUnixNano']),
+                                    'endTimeUnixNano': str(
+                                        span['responseTimeUnixNano']
+                                    ),
+                                    'attributes': [
+                                        _attribute(f'obsws.{key}', span[key])
+                                        for key in (
+                                            'requestId',
+                                            'requests',
+                                            'statusCode',
+                                            'sentBytes',
+                                            'receivedBytes',
+                                        )
+                                        if span[key] is not None
+                                    ],
+                                    'status': (
+                                        {'code': STATUS_OK}
+                                        if span['result']
+                                        else {
+                                            'code': STATUS_ERROR,
+                                            'message': span['comment'] or '',
+                                        }
+                                    ),
+                                }
+                                for span in spans
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+
+
+def _span(
+    request_type: str,
+    request_id: str,
+    requests: int,
+    send_time: int,
+    latency: float,
+    sent_bytes: int,
+    received_bytes: int,
+    response: Optional[dict[str, Any]],
+) -> dict[str, Any]:
+    """Build the flat span for a queued round trip.
+
+    A batch takes the status of its first failed request, or of its last
+    request if they all succeeded.
+    """
+    if response is None:
+        status: dict[str, Any] = {'result': False, 'code': None, 'comment': TIMEOUT}
+    elif 'results' in response:
+        statuses = [r['requestStatus'] for r in response['results']] or [
+            {'result': True, 'code': 100}
+        ]
+        status = next((s for s in statuses if not s['result']), statuses[-1])
+    else:
+        status = response['requestStatus']
+
+    return {
+        'requestType': request_type,
+        'requestId': request_id,
+        'requests': requests,
+        'sendTimeUnixNano': send_time,
+        'responseTimeUnixNano': send_time + round(latency * 1_000_000_000),
+        'latencyMs': round(latency * 1000, 3),
+        'statusCode': status['code'],
+        'result': status['result'],
+        'comment': status.get('comment'),
+        'sentBytes': sent_bytes,
+        'receivedBytes': received_bytes,
+    }
+
+
+def _attribute(key: str, value: Any) -> dict[str, Any]:
+    """Encode an OTLP-JSON attribute."""
+    if isinstance(value, bool):
+        encoded = {'boolValue': value}
+    elif isinstance(value, int):
+        encoded = {'intValue': str(value)}
+    else:
+        encoded = {'stringValue': str(value)}
+    return {'key': key, 'value': encoded}
+
+
+tracer: Optional[Tracer] = None
+
+
+def start(path: Path, fmt: str = 'ndjson', max_bytes: int = MAX_BYTES):
+    """Start tracing the requests of every client to path."""
+    global tracer
+
+    tracer = Tracer(path, fmt, max_bytes).start()
+
+
+def stop():
+    """Stop tracing, writing any queued spans."""
+    global tracer
+
+    if tracer is not None:
+        tracer.stop()
+        tracer = None
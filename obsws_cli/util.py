@@ -45,3 +45,12 @@ def milliseconds_to_timecode(milliseconds: int) -> str:
     if hours == 0:
         return f'{minutes:02}:{seconds:02}'
     return f'{hours:02}:{minutes:02}:{seconds:02}'
+
+
+def format_bytes(size: int) -> str:
+    """Format a byte count with a binary unit (B, KiB, MiB)."""
+    if size < 1024:
+        return f'{size} B'
+    if size < 1024 * 1024:
+        return f'{size / 1024:.1f} KiB'
+    return f'{size / (1024 * 1024):.1f} MiB'
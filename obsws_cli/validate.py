@@ -19,15 +19,6 @@ def input_in_inputs(ctx: typer.Context, input_name: str) -> str:
     return input_name
 
 
-def input_not_in_inputs(ctx: typer.Context, input_name: str) -> str:
-    """Ensure an input does not already exist in the list of inputs."""
-    resp = ctx.obj['obsws'].get_input_list()
-    if any(input.get('inputName') == input_name for input in resp.inputs):
-        console.err.print(f'Input [yellow]{input_name}[/yellow] already exists.')
-        raise typer.Exit(1)
-    return input_name
-
-
 def scene_in_scenes(ctx: typer.Context, scene_name: Optional[str]) -> str | None:
     """Check if a scene exists in the list of scenes."""
     if scene_name is None:
@@ -40,17 +31,6 @@ def scene_in_scenes(ctx: typer.Context, scene_name: Optional[str]) -> str | None
     return scene_name
 
 
-def studio_mode_enabled(ctx: typer.Context, preview: bool) -> bool:
-    """Ensure studio mode is enabled if preview option is used."""
-    resp = ctx.obj['obsws'].get_studio_mode_enabled()
-    if preview and not resp.studio_mode_enabled:
-        console.err.print(
-            'Studio mode is disabled. This action requires it to be enabled.'
-        )
-        raise typer.Exit(1)
-    return preview
-
-
 def scene_collection_in_scene_collections(
     ctx: typer.Context, scene_collection_name: str
 ) -> str:
@@ -81,14 +61,6 @@ def scene_collection_not_in_scene_collections(
     return scene_collection_name
 
 
-def item_in_scene_item_list(
-    ctx: typer.Context, scene_name: str, item_name: str
-) -> bool:
-    """Check if an item exists in a scene."""
-    resp = ctx.obj['obsws'].get_scene_item_list(scene_name)
-    return any(item.get('sourceName') == item_name for item in resp.scene_items)
-
-
 def profile_exists(ctx: typer.Context, profile_name: str) -> str:
     """Ensure a profile exists."""
     resp = ctx.obj['obsws'].get_profile_list()
@@ -107,15 +79,6 @@ def profile_not_exists(ctx: typer.Context, profile_name: str) -> str:
     return profile_name
 
 
-def kind_in_input_kinds(ctx: typer.Context, input_kind: str) -> str:
-    """Check if an input kind is valid."""
-    resp = ctx.obj['obsws'].get_input_kind_list(False)
-    if not any(kind == input_kind for kind in resp.input_kinds):
-        console.err.print(f'Input kind [yellow]{input_kind}[/yellow] not found.')
-        raise typer.Exit(1)
-    return input_kind
-
-
 def timecode_format(ctx: typer.Context, timecode: Optional[str]) -> str | None:
     """Validate that a timecode is in HH:MM:SS or MM:SS format."""
     if timecode is None:
@@ -1,9 +1,14 @@
 """pytest configuration file."""
 
 import os
+import tempfile
 import time
 
 import obsws_python as obsws
+import pytest
+
+from obsws_cli import client
+from obsws_cli.fakeobs import FakeOBS
 
 
 def pytest_configure(config):
@@ -11,6 +16,10 @@ def pytest_configure(config):
 
     All plugins and initial conftest files are loaded.
     """
+    config.addinivalue_line(
+        'markers',
+        'budget(n): fail if a command invoked by the test makes more than n round trips',
+    )
 
 
 def pytest_sessionstart(session):
@@ -18,6 +27,22 @@ def pytest_sessionstart(session):
 
     Before performing collection and entering the run test loop.
     """
+    # Without a live OBS to test against, serve the stand-in on a free port.
+    session.fake_obs = None
+    if 'OBSWS_CLI_HOST' not in os.environ:
+        session.fake_obs = FakeOBS(password='pytest').start()
+        session.fake_obs.model.add_group('Scene', 'test_group')
+        os.environ |= {
+            'OBSWS_CLI_HOST': 'localhost',
+            'OBSWS_CLI_PORT': str(session.fake_obs.port),
+            'OBSWS_CLI_PASSWORD': 'pytest',
+        }
+        os.environ.setdefault('OBSWS_CLI_TESTS_STREAM_KEY', 'pytest')
+        os.environ.setdefault('OBSWS_CLI_TESTS_PLATFORM', 'linux')
+
+    # Keep the metadata and names the commands cache out of the user's cache.
+    os.environ['XDG_CACHE_HOME'] = tempfile.mkdtemp(prefix='obsws-cli-tests-')
+
     # Initialize the OBS WebSocket client
     session.obsws = obsws.ReqClient(
         host=os.environ['OBSWS_CLI_HOST'],
@@ -197,6 +222,34 @@ def pytest_sessionfinish(session, exitstatus):
     # Close the OBS WebSocket client connection
     session.obsws.disconnect()
 
+    if session.fake_obs is not None:
+        session.fake_obs.stop()
+
+
+@pytest.fixture(autouse=True)
+def request_budget(request):
+    """Check each command invoked by a test marked with budget(n) against its budget."""
+    marker = request.node.get_closest_marker('budget')
+    if marker is None:
+        yield
+        return
+
+    with client.record_requests() as clients:
+        yield
+    for records in clients:
+        sent = ', '.join(record.request_type for record in records)
+        assert len(records) <= marker.args[0], (
+            f'{len(records)} round trips exceed the budget of {marker.args[0]}: {sent}'
+        )
+
+
+@pytest.fixture
+def fake_obs(request):
+    """Provide the stand-in OBS serving the session, skipping against a live OBS."""
+    if request.session.fake_obs is None:
+        pytest.skip('running against a live OBS')
+    return request.session.fake_obs
+
 
 def pytest_unconfigure(config):
     """Call before test process is exited."""
@@ -0,0 +1,91 @@
+"""Unit tests for the Python API of the OBS WebSocket CLI."""
+
+import os
+import subprocess
+import sys
+
+import obsws_python as obsws
+import pytest
+
+from obsws_cli import api, client
+
+
+@pytest.fixture
+def req_client():
+    """Provide a request client connected to the OBS the tests run against."""
+    with client.ReqClient(
+        host=os.environ['OBSWS_CLI_HOST'],
+        port=os.environ['OBSWS_CLI_PORT'],
+        password=os.environ['OBSWS_CLI_PASSWORD'],
+        timeout=5,
+    ) as req_client:
+        yield req_client
+
+
+def test_api_sceneitem_toggle(req_client):
+    """Test toggling a scene item twice, finding it in the scene then setting it."""
+    first = api.sceneitem.toggle(req_client, 'pytest_scene', 'pytest_input')
+    sent = len(req_client.records)
+    second = api.sceneitem.toggle(req_client, 'pytest_scene', 'pytest_input')
+    toggled = [record.request_type for record in req_client.records[sent:]]
+    assert first.enabled is not second.enabled
+    assert api.sceneitem.visible(req_client, 'pytest_scene', 'pytest_input') == second
+
+    # The enable state comes with the item list, it is never asked for alone.
+    assert toggled.count('SetSceneItemEnabled') == 1
+    assert 'GetSceneItemEnabled' not in toggled
+
+
+def test_api_sceneitem_not_found(req_client):
+    """Test a missing scene item raising NotFoundError."""
+    with pytest.raises(api.NotFoundError) as exc_info:
+        api.sceneitem.show(req_client, 'pytest_scene', 'pytest_missing')
+    assert str(exc_info.value).startswith(
+        'Item pytest_missing not found in scene pytest_scene.'
+    )
+    with pytest.raises(api.NotFoundError, match='Scene pytest_missing not found'):
+        api.sceneitem.list_(req_client, 'pytest_missing')
+
+
+def test_api_input_toggle(req_client):
+    """Test toggling the mute state of an input."""
+    first = api.input.toggle(req_client, 'Mic/Aux')
+    second = api.input.toggle(req_client, 'Mic/Aux')
+    assert (first.input_name, first.muted) == ('Mic/Aux', not second.muted)
+
+
+def test_api_input_list_plain_client():
+    """Test listing inputs with a plain obsws-python client, without send_batch."""
+    with obsws.ReqClient(
+        host=os.environ['OBSWS_CLI_HOST'],
+        port=os.environ['OBSWS_CLI_PORT'],
+        password=os.environ['OBSWS_CLI_PASSWORD'],
+        timeout=5,
+    ) as plain_client:
+        plain = api.input.list_(plain_client)
+    with client.ReqClient(
+        host=os.environ['OBSWS_CLI_HOST'],
+        port=os.environ['OBSWS_CLI_PORT'],
+        password=os.environ['OBSWS_CLI_PASSWORD'],
+        timeout=5,
+    ) as req_client:
+        batched = api.input.list_(req_client)
+    assert 'Mic/Aux' in [i.name for i in plain]
+    assert [(i.name, i.muted) for i in plain] == [(i.name, i.muted) for i in batched]
+
+
+def test_api_imports_no_typer():
+    """Test the API being importable without Typer, click or the settings files."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            '-c',
+            'import sys, obsws_cli.api.input, obsws_cli.api.scene, obsws_cli.api.sceneitem; '
+            'print(*sorted(m for m in sys.modules if m.split(".")[0] in '
+            '("typer", "click", "dotenv") or m == "obsws_cli.envconfig"))',
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.split() == []
@@ -0,0 +1,32 @@
+"""Unit tests for the bench commands in the OBS WebSocket CLI."""
+
+import json
+
+from typer.testing import CliRunner
+
+from obsws_cli.app import app
+
+runner = CliRunner()
+
+
+def test_bench_load():
+    """Test the bench load command at a fixed rate."""
+    result = runner.invoke(
+        app,
+        ['bench', 'load', '--duration', '0.5', '--concurrency', '2', '--rate', '40'],
+    )
+    assert result.exit_code == 0
+    assert 'p99' in result.stdout
+
+
+def test_bench_load_pipeline_json():
+    """Test the bench load command pipelining requests on one connection."""
+    result = runner.invoke(
+        app,
+        ['-o', 'json', 'bench', 'load', '-d', '0.5', '-c', '4', '--pipeline'],
+    )
+    assert result.exit_code == 0
+    summary = json.loads(result.stdout)[0]
+    assert summary['requests'] > 0
+    assert summary['errors'] == 0
+    assert summary['p50'] <= summary['p99'] <= summary['max']
@@ -0,0 +1,86 @@
+"""Unit tests for the cache command in the OBS WebSocket CLI."""
+
+import os
+
+from typer.testing import CliRunner
+
+from obsws_cli import client, metadata
+from obsws_cli.app import app
+
+runner = CliRunner()
+
+
+def test_cache_warm(tmp_path, monkeypatch):
+    """Test a warm cache answering the metadata lookups without any requests."""
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    result = runner.invoke(app, ['cache', 'warm'])
+    assert result.exit_code == 0
+    assert 'Cached' in result.stdout
+
+    with client.record_requests() as clients:
+        for args in (
+            ['hotkey', 'list'],
+            ['projector', 'list-monitors'],
+            ['filter', 'list', 'Mic/Aux'],
+            ['input', 'list'],
+        ):
+            result = runner.invoke(app, args)
+            assert result.exit_code == 0, result.output
+    sent = {record.request_type for records in clients for record in records}
+    assert not sent & {
+        'GetVersion',
+        'GetHotkeyList',
+        'GetMonitorList',
+        'GetSourceFilterDefaultSettings',
+        'GetInputKindList',
+    }
+
+
+def test_cache_clear(tmp_path, monkeypatch):
+    """Test the cache of the host being cleared."""
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    result = runner.invoke(app, ['hotkey', 'list'])
+    assert result.exit_code == 0
+    path = metadata.cache_path(
+        os.environ['OBSWS_CLI_HOST'], os.environ['OBSWS_CLI_PORT']
+    )
+    assert path.exists()
+
+    result = runner.invoke(app, ['cache', 'clear'])
+    assert result.exit_code == 0
+    assert result.stdout == 'Removed 1 cache files.\n'
+    assert not path.exists()
+
+
+def test_cache_input_kind_refetched(tmp_path, monkeypatch):
+    """Test an input kind missing from the cache being asked of OBS before it is rejected."""
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    result = runner.invoke(app, ['cache', 'warm'])
+    assert result.exit_code == 0
+    path = metadata.cache_path(
+        os.environ['OBSWS_CLI_HOST'], os.environ['OBSWS_CLI_PORT']
+    )
+    cache = metadata.load(path)
+    (key,) = (key for key in cache['responses'] if key.startswith('GetInputKindList'))
+    cache['responses'][key]['inputKinds'].remove('color_source_v3')
+    metadata.store(path, cache)
+    metadata._loaded.clear()
+
+    with client.record_requests() as clients:
+        result = runner.invoke(
+            app, ['input', 'create', 'pytest_kind_input', 'color_source_v3']
+        )
+    try:
+        assert result.exit_code == 0, result.output
+        sent = [record.request_type for records in clients for record in records]
+        # the kinds, refetched in a batch with GetVersion
+        assert sent.count('RequestBatch') == 1
+        assert 'color_source_v3' in metadata.load(path)['responses'][key]['inputKinds']
+
+        result = runner.invoke(
+            app, ['input', 'create', 'pytest_kind_input_2', 'pytest_no_such_kind']
+        )
+        assert result.exit_code != 0
+        assert 'Input kind pytest_no_such_kind not found.' in result.stderr
+    finally:
+        runner.invoke(app, ['input', 'remove', 'pytest_kind_input'])
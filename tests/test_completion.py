@@ -0,0 +1,126 @@
+"""Unit tests for the completion commands in the OBS WebSocket CLI."""
+
+import json
+import os
+import shutil
+import subprocess
+import time
+
+import pytest
+from typer.testing import CliRunner
+
+from obsws_cli import names
+from obsws_cli.app import app
+
+runner = CliRunner()
+
+
+def _complete(script: str, *words: str) -> list[str]:
+    """Run the bash completion function for the words, the last being completed."""
+    result = subprocess.run(
+        [
+            'bash',
+            '-c',
+            f'{script}\n'
+            'COMP_WORDS=(obsws-cli "$@"); COMP_CWORD=$#; _obsws_cli\n'
+            'printf "%s\\n" "${COMPREPLY[@]}"',
+            'bash',
+            *words,
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.split()
+
+
+@pytest.mark.skipif(shutil.which('bash') is None, reason='bash is not installed')
+def test_completion_generate_bash():
+    """Test the bash script completing commands, aliases, flags and choices without OBS."""
+    # An unreachable port, the command must not connect.
+    result = runner.invoke(
+        app, ['completion', 'generate', '--shell', 'bash'], env={'OBSWS_CLI_PORT': '1'}
+    )
+    assert result.exit_code == 0
+    script = result.stdout
+
+    assert _complete(script, 'sc', 'sw') == ['switch']
+    assert _complete(script, '--host', 'localhost', 'i', 'tog') == ['toggle']
+    assert _complete(script, 'scene', 'set', '--') == [
+        '--preview',
+        '--no-preview',
+        '--help',
+    ]
+    assert _complete(script, 'media', 'wait', 'Media', '--until', '') == [
+        'started',
+        'ended',
+    ]
+
+
+@pytest.mark.skipif(shutil.which('bash') is None, reason='bash is not installed')
+def test_completion_generate_bash_names(tmp_path, monkeypatch):
+    """Test the bash script completing names from the cache, in the scene typed."""
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    monkeypatch.setenv('OBSWS_CLI_COMPLETION_BUDGET', '10000')
+    result = runner.invoke(app, ['completion', 'generate', '--shell', 'bash'])
+    assert result.exit_code == 0
+    script = result.stdout
+
+    assert _complete(script, 'sc', 'switch', 'Sc') == ['Scene']
+    assert 'test_group' in _complete(script, 'si', 'show', 'Scene', '')
+    assert _complete(script, 'si', 'show', '--group', 'test_group', 'Sc', '') == []
+    monkeypatch.setenv('OBSWS_CLI_COMPLETION_BUDGET', '0')
+    assert _complete(script, '--port', '1', 'sc', 'switch', 'Sc') == []
+
+
+def test_completion_generate_fish():
+    """Test the fish script declaring the commands and flags of each node."""
+    result = runner.invoke(
+        app, ['completion', 'generate', '--shell', 'fish'], env={'OBSWS_CLI_PORT': '1'}
+    )
+    assert result.exit_code == 0
+    assert "case 'scene:switch' 'scene:set'" in result.stdout
+    assert (
+        "complete -c obsws-cli -n '__obsws_cli_at scene.switch' -l preview -l no-preview"
+        in result.stdout
+    )
+    assert (
+        "complete -c obsws-cli -a '(__obsws_cli_names filter.enable filters 1)'"
+        in result.stdout
+    )
+
+
+def _complete_names(*words: str) -> list[str]:
+    """Run Typer's completion for the words, the last being completed."""
+    result = runner.invoke(
+        app,
+        [],
+        prog_name='obsws-cli',
+        env={
+            '_OBSWS_CLI_COMPLETE': 'complete_bash',
+            'COMP_WORDS': ' '.join(['obsws-cli', *words]),
+            'COMP_CWORD': str(len(words)),
+        },
+    )
+    assert result.exit_code == 0
+    return result.stdout.split()
+
+
+def test_completion_names(tmp_path, monkeypatch):
+    """Test names being completed from the cache, and a stale cache refreshed in the background."""
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    monkeypatch.setenv('OBSWS_CLI_COMPLETION_BUDGET', '10000')
+    assert _complete_names('sc', 'switch', 'Sc') == ['Scene']
+    assert 'test_group' in _complete_names('si', 'show', 'Scene', '')
+
+    path = names.cache_path(os.environ['OBSWS_CLI_HOST'], os.environ['OBSWS_CLI_PORT'])
+    cache = json.loads(path.read_text())
+    cache['collections'][cache['current']]['fetched'] = 0
+    path.write_text(json.dumps(cache))
+    monkeypatch.setenv('OBSWS_CLI_COMPLETION_BUDGET', '0')
+    assert _complete_names('sc', 'switch', 'Sc') == ['Scene']
+
+    deadline = time.perf_counter() + 10
+    while names._current(names.load(path))['fetched'] == 0:
+        assert time.perf_counter() < deadline, 'the cache was not refreshed'
+        time.sleep(0.05)
@@ -0,0 +1,61 @@
+"""Unit tests for the console output of the OBS WebSocket CLI."""
+
+import re
+from types import SimpleNamespace
+
+import pytest
+from typer.testing import CliRunner
+
+from obsws_cli import console
+from obsws_cli.app import app
+
+runner = CliRunner()
+
+ANSI = re.compile(r'\x1b\[[0-9;]*m')
+CTX = SimpleNamespace(obj={'style': SimpleNamespace(highlight='green')})
+
+
+@pytest.fixture
+def colour(monkeypatch):
+    """Clear the colour settings, returning monkeypatch to set them."""
+    monkeypatch.delenv('NO_COLOR', raising=False)
+    monkeypatch.delenv('FORCE_COLOR', raising=False)
+    return monkeypatch
+
+
+@pytest.mark.parametrize('no_color', ['', '1'])
+def test_console_plain(colour, capsys, no_color):
+    """Test markup being stripped without rich when not writing to a terminal."""
+    colour.setenv('NO_COLOR', no_color)
+    out = console.LazyConsole()
+    out.print('[bold]Scene[/bold]', r'\[not a tag]', '[yellow]3[/yellow] of 4')
+    assert capsys.readouterr().out == 'Scene [not a tag] 3 of 4\n'
+    assert out._console is None
+
+
+def test_console_rich(colour, capsys):
+    """Test markup being rendered by rich when colour is forced."""
+    colour.setenv('FORCE_COLOR', '1')
+    out = console.LazyConsole()
+    out.print('[bold]Scene[/bold]', r'\[not a tag]')
+    written = capsys.readouterr().out
+    assert out._console is not None
+    assert '\x1b[' in written
+    assert ANSI.sub('', written) == 'Scene [not a tag]\n'
+
+
+@pytest.mark.parametrize('force_color', ['', '1'])
+def test_console_bracketed_names(colour, capsys, force_color):
+    """Test names with brackets in them being printed, not read as markup."""
+    colour.setenv('FORCE_COLOR', force_color)
+    out = console.LazyConsole()
+    for name in ('[live]', '[/live]', 'live \\'):
+        out.print(f'Switched to {console.highlight(CTX, name)}.')
+        assert ANSI.sub('', capsys.readouterr().out) == f'Switched to {name}.\n'
+
+
+def test_console_api_error_bracketed_name():
+    """Test an error naming a scene with brackets printing the name in full."""
+    result = runner.invoke(app, ['scene', 'switch', '[live]'])
+    assert result.exit_code != 0
+    assert '[live]' in result.stderr
@@ -0,0 +1,56 @@
+"""Unit tests for the stand-in OBS used by the test suite."""
+
+import obsws_python as obsws
+import pytest
+
+from obsws_cli.client import ReqClient
+
+
+def test_fakeobs_batch(fake_obs):
+    """Test a request batch halting on its first failure."""
+    with ReqClient(
+        host='localhost', port=fake_obs.port, password=fake_obs.password, timeout=5
+    ) as client:
+        results = client.send_batch(
+            [
+                ('GetCurrentProgramScene', None),
+                ('GetInputMute', {'inputName': 'pytest_missing_input'}),
+                ('GetVersion', None),
+            ],
+            halt_on_failure=True,
+        )
+
+    assert [r['requestStatus']['result'] for r in results] == [True, False]
+    assert results[0]['responseData']['sceneName']
+    assert results[1]['requestStatus']['code'] == 600
+
+
+def test_fakeobs_gather(fake_obs):
+    """Test gathering requests on a client, which remains usable afterwards."""
+    with ReqClient(
+        host='localhost', port=fake_obs.port, password=fake_obs.password, timeout=5
+    ) as client:
+        version, scene = client.gather(
+            [('GetVersion', None), ('GetCurrentProgramScene', None)]
+        )
+        assert version.obs_web_socket_version
+        assert scene.scene_name
+
+        with pytest.raises(obsws.error.OBSSDKRequestError) as excinfo:
+            client.gather(
+                [
+                    ('GetVersion', None),
+                    ('GetInputMute', {'inputName': 'pytest_missing_input'}),
+                ]
+            )
+        assert excinfo.value.code == 600
+
+        assert client.get_version().obs_web_socket_version
+
+
+def test_fakeobs_auth_failure(fake_obs):
+    """Test that the wrong password is rejected."""
+    with pytest.raises(obsws.error.OBSSDKError):
+        obsws.ReqClient(
+            host='localhost', port=fake_obs.port, password='wrong', timeout=5
+        )
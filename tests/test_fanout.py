@@ -0,0 +1,24 @@
+"""Unit tests for running commands against several hosts in the OBS WebSocket CLI."""
+
+import json
+import os
+
+from typer.testing import CliRunner
+
+from obsws_cli.app import app
+
+runner = CliRunner()
+
+
+def test_fanout_hosts():
+    """Test the scene list command against several hosts."""
+    target = f'{os.environ["OBSWS_CLI_HOST"]}:{os.environ["OBSWS_CLI_PORT"]}'
+    result = runner.invoke(
+        app,
+        ['--hosts', 'cam1,cam2', '-o', 'json', 'scene', 'list'],
+        env={'OBSWS_CLI_TARGET_CAM1': target, 'OBSWS_CLI_TARGET_CAM2': target},
+    )
+    assert result.exit_code == 0
+    scenes = json.loads(result.stdout)
+    assert {'cam1', 'cam2'} == {scene['host'] for scene in scenes}
+    assert '2 of 2 hosts succeeded' in result.stderr
@@ -1,5 +1,6 @@
 """Unit tests for the filter command in the OBS WebSocket CLI."""
 
+import pytest
 from typer.testing import CliRunner
 
 from obsws_cli.app import app
@@ -7,6 +8,7 @@ from obsws_cli.app import app
 runner = CliRunner()
 
 
+@pytest.mark.budget(2)
 def test_filter_list():
     """Test the filter list command on an audio source."""
     result = runner.invoke(app, ['filter', 'list', 'Mic/Aux'])
@@ -15,6 +17,7 @@ def test_filter_list():
     assert 'pytest filter' in result.stdout
 
 
+@pytest.mark.budget(2)
 def test_filter_list_scene():
     """Test the filter list command on a scene."""
     result = runner.invoke(app, ['filter', 'list', 'pytest_scene'])
@@ -15,6 +15,7 @@ if os.environ.get('OBSWS_CLI_TESTS_SKIP_GROUP_TESTS'):
     )
 
 
+@pytest.mark.budget(2)
 def test_group_list():
     """Test the group list command."""
     result = runner.invoke(app, ['group', 'list', 'Scene'])
@@ -43,6 +44,7 @@ def test_group_toggle():
         assert 'Group test_group is now visible.' in result.stdout
 
 
+@pytest.mark.budget(3)
 def test_group_status():
     """Test the group status command."""
     result = runner.invoke(app, ['group', 'show', 'Scene', 'test_group'])
@@ -1,5 +1,6 @@
 """Unit tests for the hotkey command in the OBS WebSocket CLI."""
 
+import pytest
 from typer.testing import CliRunner
 
 from obsws_cli.app import app
@@ -7,6 +8,7 @@ from obsws_cli.app import app
 runner = CliRunner()
 
 
+@pytest.mark.budget(1)
 def test_hotkey_list():
     """Test the hotkey list command."""
     result = runner.invoke(app, ['hotkey', 'list'])
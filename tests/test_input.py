@@ -1,5 +1,6 @@
 """Unit tests for the input command in the OBS WebSocket CLI."""
 
+import pytest
 from typer.testing import CliRunner
 
 from obsws_cli.app import app
@@ -7,6 +8,7 @@ from obsws_cli.app import app
 runner = CliRunner()
 
 
+@pytest.mark.budget(3)
 def test_input_list():
     """Test the input list command."""
     result = runner.invoke(app, ['input', 'list'])
@@ -16,6 +18,7 @@ def test_input_list():
     assert all(item in result.stdout for item in ('pytest_input', 'pytest_input_2'))
 
 
+@pytest.mark.budget(2)
 def test_input_list_filter_input():
     """Test the input list command with input filter."""
     result = runner.invoke(app, ['input', 'list', '--input'])
@@ -24,6 +27,7 @@ def test_input_list_filter_input():
     assert 'Mic/Aux' in result.stdout
 
 
+@pytest.mark.budget(2)
 def test_input_list_filter_output():
     """Test the input list command with output filter."""
     result = runner.invoke(app, ['input', 'list', '--output'])
@@ -32,6 +36,7 @@ def test_input_list_filter_output():
     assert 'Mic/Aux' not in result.stdout
 
 
+@pytest.mark.budget(2)
 def test_input_list_filter_colour():
     """Test the input list command with colour filter."""
     result = runner.invoke(app, ['input', 'list', '--colour'])
@@ -0,0 +1,73 @@
+"""Unit tests for the fast-path launcher in the OBS WebSocket CLI."""
+
+import json
+
+from obsws_cli import daemon, launcher, manifest
+from obsws_cli.fakeobs import FakeOBS
+
+
+def test_launcher_manifest():
+    """Test the committed command manifest describing the current command tree."""
+    assert json.loads(manifest.PATH.read_text()) == manifest.build()
+
+
+def test_launcher_fast(tmp_path, monkeypatch, capsys):
+    """Test a fast command being sent through the daemon and others being left to Typer."""
+    socket_path = tmp_path / 'obsws-cli.sock'
+    monkeypatch.setenv('OBSWS_CLI_SOCKET', str(socket_path))
+    assert launcher.run(['sc', 'switch', 'pytest_launcher']) is None
+
+    with FakeOBS() as server:
+        model = server.model
+        with model.lock:
+            model.add_input(model.find_scene('Scene'), 'Mic/Aux', 'pulse_input_capture')
+        monkeypatch.setenv('OBSWS_CLI_HOST', 'localhost')
+        monkeypatch.setenv('OBSWS_CLI_PORT', str(server.port))
+        connection = {'host': 'localhost', 'port': server.port, 'password': ''}
+        with daemon.Daemon(connection, socket_path=socket_path):
+            assert launcher.run(['sc', 'switch', 'Scene']) == 0
+            assert launcher.run(['i', 'tg', 'Mic/Aux']) == 0
+            assert launcher.run(['input', 'volume', 'Mic/Aux', '--', '-12']) == 0
+            assert launcher.run(['scene', 'switch', 'pytest_launcher']) == 1
+            out, err = capsys.readouterr()
+            assert out.splitlines() == [
+                'Switched to program scene: Scene',
+                'Input Mic/Aux muted.',
+                'Input Mic/Aux volume set to -12.0.',
+            ]
+            assert err == 'Scene pytest_launcher not found.\n'
+
+            assert launcher.run(['scene', 'switch', 'Scene', '--help']) is None
+            assert (
+                launcher.run(['--host', 'localhost', 'sc', 'switch', 'Scene']) is None
+            )
+            assert launcher.run(['input', 'volume', 'Mic/Aux', '--', '-100']) is None
+            assert launcher.run(['scene', 'list']) is None
+
+
+def test_launcher_settings(tmp_path, monkeypatch):
+    """Test commands being left to Typer when the daemon serves another OBS or Typer-only settings are set."""
+    socket_path = tmp_path / 'obsws-cli.sock'
+    monkeypatch.setenv('OBSWS_CLI_SOCKET', str(socket_path))
+    monkeypatch.chdir(tmp_path)
+    for name in launcher.TYPER_ONLY:
+        monkeypatch.delenv(name, raising=False)
+
+    with FakeOBS() as server:
+        monkeypatch.setenv('OBSWS_CLI_HOST', 'localhost')
+        monkeypatch.setenv('OBSWS_CLI_PORT', str(server.port))
+        connection = {'host': 'localhost', 'port': server.port, 'password': ''}
+        with daemon.Daemon(connection, socket_path=socket_path):
+            assert launcher.run(['sc', 'switch', 'Scene']) == 0
+
+            (tmp_path / '.env').write_text('OBSWS_CLI_STATS=false\n')
+            assert launcher.run(['sc', 'switch', 'Scene']) == 0
+            (tmp_path / '.env').write_text('export OBSWS_CLI_STATS="true"  # timings\n')
+            assert launcher.run(['sc', 'switch', 'Scene']) is None
+
+            (tmp_path / '.env').write_text(f'OBSWS_CLI_PORT={server.port + 1}\n')
+            monkeypatch.delenv('OBSWS_CLI_PORT')
+            assert launcher.run(['sc', 'switch', 'Scene']) is None
+            monkeypatch.setenv('OBSWS_CLI_HOST', 'obs.example')
+            monkeypatch.setenv('OBSWS_CLI_PORT', str(server.port))
+            assert launcher.run(['sc', 'switch', 'Scene']) is None
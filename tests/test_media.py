@@ -0,0 +1,73 @@
+"""Unit tests for the media commands in the OBS WebSocket CLI."""
+
+import json
+import threading
+
+import pytest
+from typer.testing import CliRunner
+
+from obsws_cli.app import app
+from obsws_cli.client import ReqClient
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def media_input(fake_obs):
+    """Provide a media input that plays for a fifth of a second."""
+    with fake_obs.model.lock:
+        input_, _ = fake_obs.model.add_input(
+            fake_obs.model.find_scene('Scene'), 'pytest_media', 'ffmpeg_source'
+        )
+        input_.media_duration = 200
+    yield input_.name
+    with fake_obs.model.lock:
+        fake_obs.model.remove_input(input_)
+
+
+def test_media_status_all(media_input):
+    """Test the media status command listing every media input."""
+    result = runner.invoke(app, ['media', 'status', '--all'])
+    assert result.exit_code == 0
+    assert media_input in result.stdout
+    assert 'Stopped' in result.stdout
+
+    result = runner.invoke(app, ['--output', 'ndjson', 'media', 'status', '--all'])
+    assert result.exit_code == 0
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert {
+        'inputName': media_input,
+        'mediaState': 'OBS_MEDIA_STATE_STOPPED',
+    }.items() <= records[0].items()
+
+
+def test_media_wait_ended(fake_obs, media_input):
+    """Test the media wait command returning once playback ends."""
+
+    def play():
+        with ReqClient(
+            host='localhost', port=fake_obs.port, password=fake_obs.password, timeout=5
+        ) as client:
+            client.trigger_media_input_action(
+                media_input, 'OBS_WEBSOCKET_MEDIA_INPUT_ACTION_PLAY'
+            )
+
+    timer = threading.Timer(0.5, play)
+    timer.start()
+    try:
+        result = runner.invoke(
+            app, ['media', 'wait', media_input, '--until', 'ended', '--timeout', '5']
+        )
+    finally:
+        timer.join()
+    assert result.exit_code == 0
+    assert f'Media input {media_input} playback ended after' in result.stdout
+
+
+def test_media_wait_timeout(media_input):
+    """Test the media wait command failing when playback does not end in time."""
+    result = runner.invoke(
+        app, ['media', 'wait', media_input, '--until', 'ended', '--timeout', '0.2']
+    )
+    assert result.exit_code == 1
+    assert 'Timed out after 0.2 seconds' in result.stderr
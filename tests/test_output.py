@@ -0,0 +1,19 @@
+"""Unit tests for the --output flag in the OBS WebSocket CLI."""
+
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from obsws_cli.app import app
+
+runner = CliRunner()
+
+
+@pytest.mark.budget(1)
+def test_output_json():
+    """Test the scene list command with JSON output."""
+    result = runner.invoke(app, ['--output', 'json', 'scene', 'list'])
+    assert result.exit_code == 0
+    scenes = json.loads(result.stdout)
+    assert 'pytest_scene' in (scene['sceneName'] for scene in scenes)
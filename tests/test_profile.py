@@ -0,0 +1,22 @@
+"""Unit tests for the --profile flag in the OBS WebSocket CLI."""
+
+import json
+
+from typer.testing import CliRunner
+
+from obsws_cli.app import app
+
+runner = CliRunner()
+
+
+def test_profile(tmp_path):
+    """Test the scene list command with a profile trace."""
+    trace = tmp_path / 'trace.json'
+    result = runner.invoke(
+        app, ['--profile', '--profile-output', str(trace), 'scene', 'list']
+    )
+    assert result.exit_code == 0
+    assert 'connect' in result.stderr
+    assert 'request (1)' in result.stderr
+    events = json.loads(trace.read_text())['traceEvents']
+    assert 'GetSceneList' in (event['name'] for event in events)
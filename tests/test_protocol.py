@@ -0,0 +1,20 @@
+"""Unit tests for the --protocol flag in the OBS WebSocket CLI."""
+
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from obsws_cli.app import app
+
+runner = CliRunner()
+
+
+def test_protocol_msgpack():
+    """Test the scene list command over the MessagePack protocol."""
+    pytest.importorskip('msgpack')
+    result = runner.invoke(
+        app, ['--protocol', 'msgpack', '-o', 'json', 'scene', 'list']
+    )
+    assert result.exit_code == 0
+    assert 'pytest_scene' in (scene['sceneName'] for scene in json.loads(result.stdout))
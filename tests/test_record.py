@@ -5,6 +5,7 @@ import time
 from typer.testing import CliRunner
 
 from obsws_cli.app import app
+from obsws_cli.fakeobs import FakeOBS
 
 runner = CliRunner()
 
@@ -56,3 +57,38 @@ def test_record_toggle():
         assert 'Recording stopped successfully.' in result.stdout
     else:
         assert 'Recording started successfully.' in result.stdout
+
+
+def test_record_wait():
+    """Test the record start and stop commands with the --wait flag."""
+    result = runner.invoke(app, ['record', 'status'])
+    assert result.exit_code == 0
+    if 'Recording is in progress' in result.stdout:
+        result = runner.invoke(app, ['record', 'stop', '--wait'])
+        assert result.exit_code == 0
+
+    result = runner.invoke(app, ['record', 'start', '--wait'])
+    assert result.exit_code == 0
+    assert 'Recording started successfully after' in result.stdout
+
+    result = runner.invoke(app, ['record', 'stop', '--wait'])
+    assert result.exit_code == 0
+    assert 'Recording stopped successfully after' in result.stdout
+    assert 'Saved to:' in result.stdout
+
+
+def test_record_start_sync(fake_obs):
+    """Test starting recording on several hosts at once."""
+    with FakeOBS() as iso1, FakeOBS() as iso2:
+        result = runner.invoke(
+            app,
+            ['--hosts', 'iso1,iso2', 'record', 'start', '--sync'],
+            env={
+                'OBSWS_CLI_TARGET_ISO1': f'localhost:{iso1.port}',
+                'OBSWS_CLI_TARGET_ISO2': f'localhost:{iso2.port}',
+                'OBSWS_CLI_PASSWORD': '',
+            },
+        )
+    assert result.exit_code == 0
+    assert result.stdout.count('from the release') == 2
+    assert '2 hosts synchronised with a skew of' in result.stderr
@@ -0,0 +1,136 @@
+"""Unit tests for the rules command in the OBS WebSocket CLI."""
+
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import obsws_python as obsws
+from obsws_python.util import as_dataclass
+from typer.testing import CliRunner
+
+from obsws_cli import reconnect, rules
+from obsws_cli.app import app
+from obsws_cli.fakeobs import FakeOBS
+
+runner = CliRunner()
+
+
+def test_rules_load(tmp_path):
+    """Test loading and matching a rules file."""
+    rules_file = tmp_path / 'rules.json'
+    rules_file.write_text(
+        json.dumps(
+            {
+                'rules': [
+                    {
+                        'name': 'mute on brb',
+                        'on': 'CurrentProgramSceneChanged',
+                        'when': {'sceneName': ['BRB', 'pytest_scene']},
+                        'do': ['input mute "Mic/Aux"', ['scene', 'current']],
+                        'debounce': 0.5,
+                    }
+                ]
+            }
+        )
+    )
+
+    (rule,) = rules.load(rules_file)
+    assert rule.actions == [['input', 'mute', 'Mic/Aux'], ['scene', 'current']]
+    assert rule.debounce == 0.5
+    assert rule.matches(
+        as_dataclass('CurrentProgramSceneChanged', {'sceneName': 'pytest_scene'})
+    )
+    assert not rule.matches(
+        as_dataclass('CurrentProgramSceneChanged', {'sceneName': 'LIVE'})
+    )
+
+
+def test_rules_render():
+    """Test placeholders being substituted while other braces are left alone."""
+    rule = rules.Rule(
+        'settings',
+        'InputCreated',
+        [['text', 'update', '{input_name}', '{"text": "{input_kind}"}']],
+    )
+    data = as_dataclass(
+        'InputCreated', {'inputName': 'pytest_text', 'inputKind': 'text_ft2_source'}
+    )
+    assert rule.render(data) == [
+        ['text', 'update', 'pytest_text', '{"text": "text_ft2_source"}']
+    ]
+
+
+def test_rules_debounce(monkeypatch):
+    """Test a debounced rule firing once, with the last event of a burst."""
+    rule = rules.Rule(
+        'burst', 'CurrentProgramSceneChanged', [['scene', 'current']], debounce=0.05
+    )
+    engine = rules.Engine(
+        SimpleNamespace(find_root=lambda: SimpleNamespace(command=None)), [rule]
+    )
+    fired = []
+    monkeypatch.setattr(
+        engine, '_fire', lambda rule, data, received: fired.append(data.scene_name)
+    )
+    (handler,) = engine.handlers()
+    for scene_name in ('A', 'B', 'C'):
+        handler(as_dataclass('CurrentProgramSceneChanged', {'sceneName': scene_name}))
+
+    session = SimpleNamespace(alive=True)
+    threading.Timer(0.3, lambda: setattr(session, 'alive', False)).start()
+    engine.run(session)
+    assert fired == ['C']
+
+
+def test_rules_invalid(tmp_path):
+    """Test the rules command with an invalid rules file."""
+    rules_file = tmp_path / 'rules.json'
+    rules_file.write_text(json.dumps({'rules': [{'do': 'scene current'}]}))
+
+    result = runner.invoke(app, ['rules', str(rules_file)])
+    assert result.exit_code != 0
+    assert "missing an 'on' event" in result.stderr
+
+
+def test_rules_reconnect():
+    """Test a session reconnecting and re-registering its callbacks after OBS restarts."""
+    server = FakeOBS().start()
+    port = server.port
+    session = reconnect.Session(
+        {'host': 'localhost', 'port': port, 'password': '', 'timeout': 5},
+        obsws.Subs.SCENES,
+        backoff=reconnect.Backoff(initial=0.01, maximum=0.05),
+    )
+    resyncs, scenes = [], []
+    session.on_resync.append(lambda: resyncs.append(True))
+
+    def on_current_program_scene_changed(data):
+        scenes.append(data.scene_name)
+
+    session.register([on_current_program_scene_changed])
+    session.connect()
+    server.stop()
+    deadline = time.perf_counter() + 5
+    while session.alive and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    assert not session.alive
+
+    # OBS comes back after a few failed attempts.
+    restarted = FakeOBS(port=port)
+    threading.Timer(0.2, restarted.start).start()
+    try:
+        session.reconnect()
+        assert session.alive
+        assert (session.reconnects, len(resyncs)) == (1, 1)
+        assert session.downtime >= 0.2
+
+        session.req_client.create_scene('pytest_reconnect')
+        session.req_client.set_current_program_scene('pytest_reconnect')
+        deadline = time.perf_counter() + 5
+        while not scenes and time.perf_counter() < deadline:
+            time.sleep(0.01)
+        assert scenes == ['pytest_reconnect']
+    finally:
+        session.close()
+        restarted.stop()
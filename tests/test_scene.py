@@ -1,5 +1,6 @@
 """Unit tests for the scene commands in the OBS WebSocket CLI."""
 
+import pytest
 from typer.testing import CliRunner
 
 from obsws_cli.app import app
@@ -7,6 +8,7 @@ from obsws_cli.app import app
 runner = CliRunner()
 
 
+@pytest.mark.budget(1)
 def test_scene_list():
     """Test the scene list command."""
     result = runner.invoke(app, ['scene', 'list'])
@@ -14,6 +16,7 @@ def test_scene_list():
     assert 'pytest_scene' in result.stdout
 
 
+@pytest.mark.budget(3)
 def test_scene_current():
     """Test the scene current command."""
     runner.invoke(app, ['scene', 'switch', 'pytest_scene'])
@@ -22,6 +25,7 @@ def test_scene_current():
     assert 'pytest_scene' in result.stdout
 
 
+@pytest.mark.budget(3)
 def test_scene_switch():
     """Test the scene switch command."""
     result = runner.invoke(app, ['studiomode', 'status'])
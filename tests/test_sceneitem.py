@@ -1,5 +1,8 @@
 """Unit tests for the item command in the OBS WebSocket CLI."""
 
+import json
+
+import pytest
 from typer.testing import CliRunner
 
 from obsws_cli.app import app
@@ -7,6 +10,7 @@ from obsws_cli.app import app
 runner = CliRunner()
 
 
+@pytest.mark.budget(2)
 def test_sceneitem_list():
     """Test the sceneitem list command."""
     result = runner.invoke(app, ['sceneitem', 'list', 'pytest_scene'])
@@ -15,6 +19,41 @@ def test_sceneitem_list():
     assert 'pytest_input_2' in result.stdout
 
 
+@pytest.mark.budget(2)
+def test_sceneitem_list_ndjson():
+    """Test the sceneitem list command with NDJSON output."""
+    result = runner.invoke(
+        app, ['--output', 'ndjson', 'sceneitem', 'list', 'pytest_scene']
+    )
+    assert result.exit_code == 0
+    items = [json.loads(line) for line in result.stdout.splitlines()]
+    assert {'pytest_input', 'pytest_input_2'} <= {item['sourceName'] for item in items}
+
+
+@pytest.mark.budget(3)
+def test_sceneitem_list_group(fake_obs):
+    """Test the sceneitem list command expanding the items in a group."""
+    with fake_obs.model.lock:
+        group_input, _ = fake_obs.model.add_input(
+            fake_obs.model.collection.groups['test_group'],
+            'pytest_group_input',
+            'color_source_v3',
+        )
+    try:
+        result = runner.invoke(
+            app, ['--output', 'ndjson', 'sceneitem', 'list', 'Scene']
+        )
+    finally:
+        with fake_obs.model.lock:
+            fake_obs.model.remove_input(group_input)
+    assert result.exit_code == 0
+    items = [json.loads(line) for line in result.stdout.splitlines()]
+    assert {'sourceName': 'pytest_group_input', 'groupName': 'test_group'}.items() <= (
+        items[0].items()
+    )
+
+
+@pytest.mark.budget(4)
 def test_sceneitem_transform():
     """Test the sceneitem transform command."""
     result = runner.invoke(
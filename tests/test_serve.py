@@ -0,0 +1,323 @@
+"""Unit tests for the serve command in the OBS WebSocket CLI."""
+
+import json
+import socket
+import time
+import urllib.error
+import urllib.request
+
+import obsws_python as obsws
+import pytest
+
+from obsws_cli import (
+    api,
+    client,
+    codec,
+    daemon,
+    gateway,
+    inventory,
+    launcher,
+    osc,
+    reconnect,
+)
+from obsws_cli.fakeobs import FakeOBS
+
+
+def test_serve_daemon():
+    """Test the daemon multiplexing clients onto a single session with OBS."""
+    with FakeOBS(password='pytest') as server:
+        connection = {
+            'host': 'localhost',
+            'port': server.port,
+            'password': 'pytest',
+            'timeout': 5,
+        }
+        forwarded = []
+        with daemon.Daemon(
+            connection,
+            bind=('127.0.0.1', 0),
+            on_response=lambda request_type, *_: forwarded.append(request_type),
+        ) as mux:
+            local = connection | {'host': '127.0.0.1', 'port': mux.port}
+            scenes = []
+
+            def on_current_program_scene_changed(data):
+                scenes.append(data.scene_name)
+
+            with (
+                obsws.ReqClient(**local) as first,
+                obsws.ReqClient(**local) as second,
+                obsws.EventClient(**local, subs=obsws.Subs.SCENES) as events,
+            ):
+                events.callback.register(on_current_program_scene_changed)
+                first.create_scene('pytest_daemon')
+                second.set_current_program_scene('pytest_daemon')
+                assert first.get_current_program_scene().scene_name == 'pytest_daemon'
+
+                deadline = time.perf_counter() + 5
+                while not scenes and time.perf_counter() < deadline:
+                    time.sleep(0.01)
+                assert scenes == ['pytest_daemon']
+                assert len(server.sessions) == 1
+                assert forwarded == [
+                    'CreateScene',
+                    'SetCurrentProgramScene',
+                    'GetCurrentProgramScene',
+                ]
+
+
+def test_serve_daemon_inventory(tmp_path, monkeypatch):
+    """Test the daemon publishing a snapshot and marking it stale on a change."""
+    path = tmp_path / 'pytest.inventory'
+
+    def published(generation: int) -> inventory.Snapshot:
+        deadline = time.perf_counter() + 5
+        while time.perf_counter() < deadline:
+            snapshot = inventory.open_fresh(path)
+            if snapshot is not None and snapshot.generation > generation:
+                return snapshot
+            time.sleep(0.01)
+        raise AssertionError('no snapshot was published')
+
+    with FakeOBS() as server:
+        model = server.model
+        with model.lock:
+            model.add_input(model.find_scene('Scene'), 'Mic/Aux', 'pulse_input_capture')
+        connection = {'host': 'localhost', 'port': server.port, 'password': ''}
+        with daemon.Daemon(connection, inventory_path=path) as mux:
+            snapshot = published(0)
+            assert path.stat().st_mode & 0o777 == 0o600
+            assert snapshot.find_input('Mic/Aux').kind == 'pulse_input_capture'
+            assert snapshot.find_scene('Scene') is not None
+            assert snapshot.find_input('pytest_inventory') is None
+
+            monkeypatch.setenv('OBSWS_CLI_INVENTORY', str(path))
+            with client.ReqClient(**connection, timeout=5) as req_client:
+                req_client.inventory_source = ('localhost', server.port)
+                # the snapshot is only mapped once a name is looked up
+                assert req_client.inventory is None
+                api.input.ensure_exists(req_client, 'Mic/Aux')
+                assert req_client.inventory is not None
+                api.scene.ensure_exists(req_client, 'Scene')
+                assert req_client.records == []
+
+                with model.lock:
+                    model.add_input(
+                        model.find_scene('Scene'), 'pytest_inventory', 'color_source_v3'
+                    )
+                deadline = time.perf_counter() + 5
+                while snapshot.fresh and time.perf_counter() < deadline:
+                    time.sleep(0.01)
+                assert not snapshot.fresh
+                # a stale snapshot is not trusted, OBS is asked instead
+                api.input.ensure_exists(req_client, 'pytest_inventory')
+                assert len(req_client.records) == 1
+
+            snapshot = published(snapshot.generation)
+            assert snapshot.find_input('pytest_inventory').kind == 'color_source_v3'
+            assert mux.requests == 0
+        assert not path.exists()
+
+
+def test_serve_daemon_inventory_reconnect(tmp_path):
+    """Test the snapshot going stale when OBS is lost and republished on its return."""
+    path = tmp_path / 'pytest.inventory'
+    server = FakeOBS().start()
+    port = server.port
+    with server.model.lock:
+        server.model.add_input(
+            server.model.find_scene('Scene'), 'Mic/Aux', 'pulse_input_capture'
+        )
+    connection = {'host': 'localhost', 'port': port, 'password': ''}
+    with daemon.Daemon(connection, inventory_path=path):
+        deadline = time.perf_counter() + 5
+        snapshot = None
+        while snapshot is None and time.perf_counter() < deadline:
+            snapshot = inventory.open_fresh(path)
+            time.sleep(0.01)
+        assert snapshot.find_input('Mic/Aux') is not None
+
+        # Nothing changed in OBS, but while it is away the snapshot can not be trusted.
+        server.stop()
+        deadline = time.perf_counter() + 5
+        while snapshot.fresh and time.perf_counter() < deadline:
+            time.sleep(0.01)
+        assert not snapshot.fresh
+
+        with FakeOBS(port=port):
+            deadline = time.perf_counter() + 5
+            while time.perf_counter() < deadline:
+                republished = inventory.open_fresh(path)
+                if republished is not None:
+                    break
+                time.sleep(0.01)
+            else:
+                raise AssertionError('no snapshot was published after reconnecting')
+            assert republished.generation > snapshot.generation
+            assert republished.find_input('Mic/Aux') is None
+
+
+def test_serve_daemon_slow_client():
+    """Test a client's events being dropped once its queue is full."""
+    mux = daemon.Daemon({'password': ''}, queue_size=2)
+    local = daemon.Client(mux, None, codec.JSON, 'pytest', '')
+    for _ in range(5):
+        local.send_event('{}')
+    assert local.dropped == 3
+
+
+def test_serve_daemon_unread_responses(tmp_path):
+    """Test a client that never reads being dropped without stalling the others."""
+    socket_path = tmp_path / 'obsws-cli.sock'
+    with FakeOBS() as server:
+        connection = {'host': 'localhost', 'port': server.port, 'password': ''}
+        with daemon.Daemon(connection, socket_path=socket_path, queue_size=4):
+            slow = launcher._DaemonConnection(str(socket_path), 5)
+            try:
+                # enough responses to fill the socket's buffer, then the queue
+                request = {'requestType': 'GetVersion', 'requestData': {}}
+                try:
+                    for i in range(5000):
+                        slow.send(6, request | {'requestId': str(i)})
+                except OSError:
+                    pass  # dropped already
+
+                conn = launcher._DaemonConnection(str(socket_path), 5)
+                try:
+                    resp = conn.request('GetCurrentProgramScene', {})
+                finally:
+                    conn.close()
+                assert resp['requestStatus']['result']
+
+                # the slow client was dropped, its unread responses end early
+                with pytest.raises(ConnectionError):
+                    while True:
+                        slow.recv(7)
+            finally:
+                slow.sock.close()
+
+
+def test_serve_http():
+    """Test the HTTP gateway resolving names once, then a round trip per request."""
+    with FakeOBS() as server:
+        model = server.model
+        model.add_group('Scene', 'pytest_group')
+        with model.lock:
+            model.add_input(model.find_scene('Scene'), 'Mic/Aux', 'pulse_input_capture')
+        session = reconnect.Session(
+            {'host': 'localhost', 'port': server.port, 'password': '', 'timeout': 5},
+            obsws.Subs.LOW_VOLUME,
+        )
+        gw = gateway.Gateway(session)
+        session.connect()
+        gw.start(('127.0.0.1', 0))
+        url = f'http://127.0.0.1:{gw.port}'
+
+        def call(path: str, body: dict | None = None, **headers: str) -> dict:
+            data = json.dumps(body).encode() if body is not None else b''
+            request = urllib.request.Request(f'{url}{path}', data, headers)
+            with urllib.request.urlopen(request) as resp:
+                return json.load(resp)
+
+        def refused(path: str, **kwargs) -> int:
+            try:
+                call(path, **kwargs)
+            except urllib.error.HTTPError as e:
+                assert json.load(e)['ok'] is False
+                return e.code
+            raise AssertionError(f'expected {path} to be refused')
+
+        try:
+            assert call('/scene/switch?scene_name=Scene')['ok']
+            assert call('/input/mute', {'input_name': 'Mic/Aux'})['muted'] is True
+            item = {'scene_name': 'Scene', 'item_name': 'pytest_group'}
+            assert call('/sceneitem/toggle', item)['enabled'] is False
+
+            # The names are now cached, each request is a single round trip.
+            records = session.req_client.records
+            sent = len(records)
+            assert call('/scene/switch', {'scene_name': 'Scene'})['ok']
+            assert call('/input/toggle?input_name=Mic/Aux')['muted'] is False
+            assert call('/sceneitem/toggle', item)['enabled'] is True
+            assert len(records) - sent == 3
+
+            assert refused('/input/mute', body={'input_name': 'pytest_missing'}) == 404
+
+            # Operations need a POST from the bound host and no other origin.
+            with urllib.request.urlopen(f'{url}/') as resp:
+                assert '/input/mute' in json.load(resp)['endpoints']
+            try:
+                urllib.request.urlopen(f'{url}/input/mute?input_name=Mic/Aux')
+            except urllib.error.HTTPError as e:
+                assert (e.code, e.headers['Allow']) == (405, 'POST')
+            else:
+                raise AssertionError('expected a 405 for a GET operation')
+            rebound = {'Host': f'attacker.example:{gw.port}'}
+            assert refused('/input/toggle?input_name=Mic/Aux', **rebound) == 403
+            foreign = {'Origin': 'http://attacker.example'}
+            assert refused('/input/toggle?input_name=Mic/Aux', **foreign) == 403
+            own = {'Origin': url}
+            assert call('/input/toggle?input_name=Mic/Aux', **own)['muted'] is True
+            gw.stop()
+
+            # With a token, requests must carry it.
+            gw.start(('127.0.0.1', 0), token='secret')
+            url = f'http://127.0.0.1:{gw.port}'
+            assert refused('/input/toggle?input_name=Mic/Aux') == 401
+            wrong = {'Authorization': 'Bearer wrong'}
+            assert refused('/input/toggle?input_name=Mic/Aux', **wrong) == 401
+            bearer = {'Authorization': 'Bearer secret'}
+            assert call('/input/toggle?input_name=Mic/Aux', **bearer)['muted'] is False
+        finally:
+            gw.stop()
+            session.close()
+
+
+def test_serve_osc():
+    """Test the OSC bridge coalescing fader moves and sending feedback."""
+    with (
+        FakeOBS() as server,
+        socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as desk,
+    ):
+        model = server.model
+        with model.lock:
+            model.add_input(model.find_scene('Scene'), 'Mic/Aux', 'pulse_input_capture')
+        desk.bind(('127.0.0.1', 0))
+        desk.settimeout(5)
+        session = reconnect.Session(
+            {'host': 'localhost', 'port': server.port, 'password': '', 'timeout': 5},
+            osc.subscriptions(meters=False),
+        )
+        bridge = osc.Bridge(session, desk.getsockname())
+        session.connect()
+        bridge.start(('127.0.0.1', 0))
+        try:
+            target = ('127.0.0.1', bridge.port)
+            for db in range(-50, 1):
+                desk.sendto(osc.encode('/obs/input/Mic/Aux/volume', float(db)), target)
+            desk.sendto(osc.encode('/obs/input/Mic%2FAux/mute', True), target)
+
+            feedback = {}
+            while '/obs/input/Mic%2FAux/mute' not in feedback:
+                address, args = next(osc.decode(desk.recv(osc.MAX_DATAGRAM)))
+                feedback[address] = args
+            assert feedback['/obs/input/Mic%2FAux/mute'] == [1]
+
+            bridge.flush()
+            assert bridge.sent + bridge.coalesced == bridge.received == 52
+            assert bridge.sent < bridge.received
+            resp = session.req_client.get_input_volume('Mic/Aux')
+            assert resp.input_volume_db == 0.0
+
+            # the frame interval is refetched on the frame thread after a resync
+            assert bridge.frame_interval == 1 / 60
+            with model.lock:
+                model.profile.video['fpsNumerator'] = 30
+            session.resync()
+            deadline = time.perf_counter() + 5
+            while bridge.frame_interval != 1 / 30:
+                assert time.perf_counter() < deadline, 'the frame interval was kept'
+                time.sleep(0.01)
+        finally:
+            bridge.stop()
+            session.close()
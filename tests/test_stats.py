@@ -0,0 +1,15 @@
+"""Unit tests for the --stats flag in the OBS WebSocket CLI."""
+
+from typer.testing import CliRunner
+
+from obsws_cli.app import app
+
+runner = CliRunner()
+
+
+def test_stats():
+    """Test the scene list command with request stats."""
+    result = runner.invoke(app, ['--stats', 'scene', 'list'])
+    assert result.exit_code == 0
+    assert 'GetSceneList' in result.stderr
+    assert '1 requests in 1 round trips' in result.stderr
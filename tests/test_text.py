@@ -1,5 +1,6 @@
 """Unit tests for the text command in the OBS WebSocket CLI."""
 
+import pytest
 from typer.testing import CliRunner
 
 from obsws_cli.app import app
@@ -7,6 +8,7 @@ from obsws_cli.app import app
 runner = CliRunner()
 
 
+@pytest.mark.budget(3)
 def test_text_update():
     """Test the text update command."""
     result = runner.invoke(app, ['text', 'current', 'pytest_text_input'])
@@ -0,0 +1,46 @@
+"""Unit tests for the --trace flag in the OBS WebSocket CLI."""
+
+import json
+import logging
+import time
+
+from typer.testing import CliRunner
+
+from obsws_cli import tracing
+from obsws_cli.app import app
+
+runner = CliRunner()
+
+
+def test_trace(tmp_path):
+    """Test the scene list command with request tracing."""
+    trace = tmp_path / 'trace.ndjson'
+    result = runner.invoke(app, ['--trace', str(trace), 'scene', 'list'])
+    assert result.exit_code == 0
+    spans = [json.loads(line) for line in trace.read_text().splitlines()]
+    assert [span['requestType'] for span in spans] == ['GetSceneList']
+    assert spans[0]['statusCode'] == 100
+    assert spans[0]['responseTimeUnixNano'] >= spans[0]['sendTimeUnixNano']
+
+
+def test_trace_rotate(tmp_path):
+    """Test the trace file being rotated before it grows past max_bytes."""
+    path = tmp_path / 'trace.ndjson'
+    tracer = tracing.Tracer(path, max_bytes=1024, backups=2).start()
+    for i in range(20):
+        tracer.record('GetInputMute', str(i), 1, time.time_ns(), 0.001, 50, 80, None)
+    tracer.stop()
+    files = [path, path.with_name('trace.ndjson.1'), path.with_name('trace.ndjson.2')]
+    assert all(0 < f.stat().st_size <= 1024 for f in files)
+    assert not path.with_name('trace.ndjson.3').exists()
+
+
+def test_trace_write_error(tmp_path, caplog):
+    """Test a failed write being logged, without stopping the tracer from stopping."""
+    tracer = tracing.Tracer(tmp_path / 'trace.ndjson').start()
+    tracer._file.close()
+    with caplog.at_level(logging.ERROR, logger='obsws_cli.tracing'):
+        tracer.record('GetVersion', '1', 1, time.time_ns(), 0.001, 50, 80, None)
+        tracer.record('GetVersion', '2', 1, time.time_ns(), 0.001, 50, 80, None)
+        tracer.stop()
+    assert 'Tracing stopped' in caplog.text
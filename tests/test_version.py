@@ -1,5 +1,6 @@
 """Unit tests for the root command in the OBS WebSocket CLI."""
 
+import pytest
 from typer.testing import CliRunner
 
 from obsws_cli.app import app
@@ -14,6 +15,7 @@ def test_version():
     assert 'obsws-cli version:' in result.stdout
 
 
+@pytest.mark.budget(1)
 def test_obs_version():
     """Test the obs-version command."""
     result = runner.invoke(app, ['obs-version'])